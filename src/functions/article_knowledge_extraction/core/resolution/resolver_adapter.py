@@ -1,7 +1,9 @@
 """Thin wrapper over the shared EntityResolver.
 
-Instantiates a request-scoped resolver (so caches don't leak across requests
-in a Cloud Function) and splits extracted entities into resolved vs unresolved.
+Wraps one resolver instance and splits extracted entities into resolved vs
+unresolved. The worker keeps instances warm across jobs for the same Supabase
+project (see ``core/worker/warm_resources.py``) so the player/team caches are
+loaded once per TTL rather than once per job.
 """
 
 from __future__ import annotations
@@ -18,7 +18,7 @@ from ..config import (
 )
 from ..contracts.job import JobStatus
 from ..db.job_store import JobStore
-from ..pipelines.article_extraction_pipeline import ArticleExtractionPipeline
+from .warm_resources import get_warm_registry
 
 logger = logging.getLogger(__name__)
 
@@ -64,7 +64,8 @@ def run_job(job_id: str, supabase_config: SupabaseConfig) -> Dict[str, Any]:
         return {"job_id": job_id, "status": "failed", "reason": "invalid_input"}
 
     try:
-        pipeline = ArticleExtractionPipeline.from_llm_config(
+        # Extractors and resolver caches survive across jobs in a warm instance.
+        pipeline = get_warm_registry().pipeline_for(
             llm, options, supabase=supabase_config
         )
         result = pipeline.run(article, options)
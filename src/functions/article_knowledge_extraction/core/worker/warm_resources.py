@@ -0,0 +1,157 @@
+"""Process-lifetime registry of warm pipeline resources for the worker.
+
+Building a pipeline per job creates new OpenAI HTTP clients and a new
+``EntityResolver`` whose first lookup pages the whole ``players`` table from
+Supabase. Warm worker instances keep those objects here instead:
+
+- LLM extractors keyed by (provider, model, API-key fingerprint, timeout, retries)
+- resolvers keyed by (Supabase URL, service-key fingerprint, confidence threshold)
+
+Entries are rebuilt once older than ``ttl_seconds`` so roster changes are picked
+up, and each kind is capped at ``max_entries`` (least recently used evicted).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from ..config import ExtractionOptions, LLMConfig, SupabaseConfig
+from ..pipelines.article_extraction_pipeline import ArticleExtractionPipeline, PipelineDeps
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 15 * 60
+DEFAULT_MAX_ENTRIES = 4
+
+
+def _fingerprint(secret: str) -> str:
+    return hashlib.sha256((secret or "").encode("utf-8")).hexdigest()[:16]
+
+
+class _ExpiringLRU:
+    """Small LRU whose entries expire ``ttl_seconds`` after being built."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int, clock: Callable[[], float]):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        built_at, value = entry
+        if self._clock() - built_at >= self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (self._clock(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class WarmResourceRegistry:
+    """Hands out pipelines assembled from cached extractors and resolvers."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._extractors = _ExpiringLRU(ttl_seconds, max_entries, clock)
+        self._resolvers = _ExpiringLRU(ttl_seconds, max_entries, clock)
+        self._lock = threading.Lock()
+        self._stats = {"extractor_hits": 0, "extractor_builds": 0, "resolver_hits": 0, "resolver_builds": 0}
+
+    def pipeline_for(
+        self,
+        llm: LLMConfig,
+        options: ExtractionOptions,
+        supabase: Optional[SupabaseConfig] = None,
+    ) -> ArticleExtractionPipeline:
+        topic, entity = self._get(
+            self._extractors,
+            (llm.provider, llm.model, _fingerprint(llm.api_key), llm.timeout_seconds, llm.max_retries),
+            lambda: ArticleExtractionPipeline.build_extractors(llm),
+            "extractor",
+        )
+        resolver = None
+        if options.resolve_entities:
+            resolver = self._get(
+                self._resolvers,
+                (
+                    supabase.url if supabase else None,
+                    _fingerprint(supabase.key) if supabase else None,
+                    options.confidence_threshold,
+                ),
+                lambda: ArticleExtractionPipeline.build_resolver(options, supabase),
+                "resolver",
+            )
+        return ArticleExtractionPipeline(
+            PipelineDeps(topic_extractor=topic, entity_extractor=entity, resolver=resolver)
+        )
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["extractors"] = len(self._extractors)
+            stats["resolvers"] = len(self._resolvers)
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._extractors.clear()
+            self._resolvers.clear()
+
+    def _get(self, cache: _ExpiringLRU, key: Hashable, build: Callable[[], Any], kind: str) -> Any:
+        with self._lock:
+            value = cache.get(key)
+            if value is not None:
+                self._stats[f"{kind}_hits"] += 1
+                return value
+        # Build outside the lock; a concurrent duplicate build is harmless.
+        value = build()
+        with self._lock:
+            cache.put(key, value)
+            self._stats[f"{kind}_builds"] += 1
+        logger.info("Built warm %s (cached for reuse across jobs)", kind)
+        return value
+
+
+_registry: Optional[WarmResourceRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_warm_registry() -> WarmResourceRegistry:
+    """Return the process-wide registry, configured from env on first use.
+
+    ``ARTICLE_KNOWLEDGE_WARM_TTL_SECONDS`` and ``ARTICLE_KNOWLEDGE_WARM_MAX_ENTRIES``
+    override the defaults; a TTL of 0 effectively disables reuse.
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = WarmResourceRegistry(
+                ttl_seconds=float(os.getenv("ARTICLE_KNOWLEDGE_WARM_TTL_SECONDS", DEFAULT_TTL_SECONDS)),
+                max_entries=int(os.getenv("ARTICLE_KNOWLEDGE_WARM_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+            )
+        return _registry
@@ -0,0 +1,16 @@
+-- Shared verdict cache for the article validation FactChecker.
+-- Enable by setting ARTICLE_VALIDATION_CLAIM_CACHE_TABLE=claim_verification_cache
+-- (the table must live in the schema configured for validation reports).
+
+CREATE TABLE IF NOT EXISTS claim_verification_cache (
+    cache_key text PRIMARY KEY,          -- sha256(normalised claim + context fingerprint)
+    result jsonb NOT NULL,               -- ClaimVerificationResult without raw_response
+    expires_at timestamptz NOT NULL,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS idx_claim_verification_cache_expires_at
+    ON claim_verification_cache (expires_at);
+
+-- Expired rows are ignored on read; purge them periodically:
+-- DELETE FROM claim_verification_cache WHERE expires_at < now();
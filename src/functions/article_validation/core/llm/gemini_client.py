@@ -91,7 +91,9 @@ class GeminiClient:
         self.config = config
         self._logger = get_logger(__name__)
         self._client = genai.Client(api_key=config.api_key)
-        self._rate_limiter = rate_limiter or RateLimiter(max_requests_per_minute=100)
+        self._rate_limiter = rate_limiter or RateLimiter(
+            max_requests_per_minute=100, model=config.model
+        )
         self._request_timeout = config.timeout_seconds
 
     async def verify_claim(
@@ -230,6 +232,7 @@ class GeminiClient:
                     ),
                     timeout=self._request_timeout,
                 )
+                self._rate_limiter.record_success()
 
                 # Log grounding metadata if present
                 finish_reason = None
@@ -273,11 +276,14 @@ class GeminiClient:
 
             except ResourceExhausted as exc:
                 self._logger.warning("Gemini rate limit reached: %s", exc)
-                self._rate_limiter.release()
+                # Slows every process sharing this model's budget, not just this call.
+                delay = self._rate_limiter.record_rate_limited(
+                    self._retry_delay_from_exception(exc, attempt), attempt
+                )
                 last_rate_exc = exc
                 if attempt >= max_attempts:
                     raise GeminiClientError("Gemini rate limit reached") from exc
-                await asyncio.sleep(self._retry_delay_from_exception(exc, attempt))
+                await asyncio.sleep(delay)
                 continue
             except GoogleAPIError as exc:
                 self._logger.warning("Gemini API error: %s", exc)
@@ -1,5 +1,6 @@
 """Processing components for the article validation module."""
 
+from .claim_cache import ClaimVerdictCache, SupabaseClaimVerdictStore
 from .fact_checker import FactChecker, FactCheckerConfig
 from .claim_extractor import ClaimCandidate, extract_claims
 from .context_validator import ContextValidator, ContextValidatorConfig
@@ -7,6 +8,8 @@ from .quality_validator import QualityValidator, QualityValidatorConfig, resolve
 from .decision_engine import DecisionEngine
 
 __all__ = [
+    "ClaimVerdictCache",
+    "SupabaseClaimVerdictStore",
     "FactChecker",
     "FactCheckerConfig",
     "ClaimCandidate",
@@ -0,0 +1,221 @@
+"""Verdict cache for fact-checked claims.
+
+Regenerated drafts and same-day team articles repeat many identical claims.
+Verdicts are cached under the normalised claim text plus a hash of the context
+the claim was checked against (model, source summaries and additional
+context), first in an in-process LRU and optionally in a shared Supabase table
+so that warm instances and parallel workers reuse each other's work.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, replace
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence
+
+from src.shared.utils.logging import get_logger
+
+from ..llm import ClaimVerificationResult
+
+LOGGER = get_logger(__name__)
+
+_DEFAULT_TTL_SECONDS = 6 * 60 * 60
+_DEFAULT_MAX_ENTRIES = 4096
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = ".,;:!?\"'“”‘’ "
+
+
+def normalise_claim_text(text: str) -> str:
+    """Return a comparison form of *text* that ignores case and spacing."""
+
+    collapsed = _WHITESPACE.sub(" ", text or "").strip().lower()
+    return collapsed.strip(_TRAILING_PUNCTUATION)
+
+
+def context_fingerprint(
+    *,
+    model: Optional[str],
+    source_summaries: Optional[Sequence[str]] = None,
+    additional_context: Optional[str] = None,
+) -> str:
+    """Hash the inputs that influence a verdict besides the claim itself."""
+
+    digest = hashlib.sha256()
+    digest.update((model or "").encode("utf-8"))
+    digest.update(b"\x1d")
+    digest.update(_WHITESPACE.sub(" ", additional_context or "").strip().encode("utf-8"))
+    for summary in sorted(
+        _WHITESPACE.sub(" ", summary).strip()
+        for summary in (source_summaries or [])
+        if isinstance(summary, str) and summary.strip()
+    ):
+        digest.update(b"\x1f")
+        digest.update(summary.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def claim_cache_key(claim_text: str, fingerprint: str) -> str:
+    material = f"{normalise_claim_text(claim_text)}\x1e{fingerprint}"
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def is_cacheable(result: ClaimVerificationResult | Exception) -> bool:
+    """Only keep verdicts the model actually produced."""
+
+    if isinstance(result, Exception):
+        return False
+    if result.verdict in {"verified", "contradicted"}:
+        return True
+    return result.confidence > 0.0 and "omitted claim results" not in result.reasoning
+
+
+class SupabaseClaimVerdictStore:
+    """Shared verdict store backed by a Supabase table.
+
+    Expected columns: ``cache_key`` (primary key), ``result`` (jsonb) and
+    ``expires_at`` (timestamptz).
+    """
+
+    def __init__(self, client: Any, table: str = "claim_verification_cache") -> None:
+        self._client = client
+        self._table = table
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, ClaimVerificationResult]:
+        if not keys:
+            return {}
+        now = datetime.now(timezone.utc).isoformat()
+        response = (
+            self._client.table(self._table)
+            .select("cache_key,result")
+            .in_("cache_key", list(keys))
+            .gt("expires_at", now)
+            .execute()
+        )
+        found: Dict[str, ClaimVerificationResult] = {}
+        for row in getattr(response, "data", None) or []:
+            payload = row.get("result")
+            if isinstance(payload, Mapping):
+                found[row["cache_key"]] = ClaimVerificationResult(
+                    claim=str(payload.get("claim") or ""),
+                    verdict=str(payload.get("verdict") or "uncertain"),
+                    confidence=float(payload.get("confidence") or 0.0),
+                    reasoning=str(payload.get("reasoning") or ""),
+                    sources=list(payload.get("sources") or []),
+                )
+        return found
+
+    def set_many(self, entries: Mapping[str, ClaimVerificationResult], ttl_seconds: int) -> None:
+        if not entries:
+            return
+        expires_at = (datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)).isoformat()
+        rows = []
+        for key, result in entries.items():
+            payload = asdict(result)
+            payload.pop("raw_response", None)
+            rows.append({"cache_key": key, "result": payload, "expires_at": expires_at})
+        self._client.table(self._table).upsert(rows, on_conflict="cache_key").execute()
+
+
+class VerdictLRU:
+    """Thread-safe LRU of verdicts with per-entry expiry."""
+
+    def __init__(self, max_entries: int = _DEFAULT_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[float, ClaimVerificationResult]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, ClaimVerificationResult]:
+        now = time.monotonic()
+        found: Dict[str, ClaimVerificationResult] = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                expires_at, result = entry
+                if expires_at <= now:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = result
+        return found
+
+    def set_many(self, entries: Mapping[str, ClaimVerificationResult], ttl_seconds: int) -> None:
+        expires_at = time.monotonic() + ttl_seconds
+        with self._lock:
+            for key, result in entries.items():
+                self._entries[key] = (expires_at, replace(result, raw_response=None))
+                self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_process_lru = VerdictLRU()
+
+
+class ClaimVerdictCache:
+    """Two-tier verdict cache: the process-wide LRU, then an optional shared store."""
+
+    def __init__(
+        self,
+        *,
+        store: Optional[SupabaseClaimVerdictStore] = None,
+        ttl_seconds: int = _DEFAULT_TTL_SECONDS,
+        lru: Optional[VerdictLRU] = None,
+    ) -> None:
+        self._store = store
+        self._ttl_seconds = ttl_seconds
+        self._lru = lru if lru is not None else _process_lru
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, ClaimVerificationResult]:
+        keys = list(dict.fromkeys(keys))
+        found = self._lru.get_many(keys)
+
+        remaining = [key for key in keys if key not in found]
+        if remaining and self._store is not None:
+            try:
+                shared = self._store.get_many(remaining)
+            except Exception as exc:  # noqa: BLE001 - cache must never fail validation
+                LOGGER.warning("Shared claim cache lookup failed: %s", exc)
+                shared = {}
+            if shared:
+                self._lru.set_many(shared, self._ttl_seconds)
+                found.update(shared)
+
+        with self._stats_lock:
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def set_many(self, entries: Mapping[str, ClaimVerificationResult]) -> None:
+        if not entries:
+            return
+        self._lru.set_many(entries, self._ttl_seconds)
+        if self._store is not None:
+            try:
+                self._store.set_many(entries, self._ttl_seconds)
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.warning("Shared claim cache write failed: %s", exc)
+
+
+__all__ = [
+    "ClaimVerdictCache",
+    "SupabaseClaimVerdictStore",
+    "VerdictLRU",
+    "claim_cache_key",
+    "context_fingerprint",
+    "is_cacheable",
+    "normalise_claim_text",
+]
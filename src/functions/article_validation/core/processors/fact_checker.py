@@ -3,14 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from statistics import mean
-from typing import Iterable, List, Mapping, Optional, Sequence, Tuple
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 from src.shared.utils.logging import get_logger
 
 from ..contracts import ValidationDimension, ValidationIssue
 from ..llm import ClaimVerificationResult, GeminiClient, GeminiClientError
+from .claim_cache import ClaimVerdictCache, claim_cache_key, context_fingerprint, is_cacheable
 from .claim_extractor import ClaimCandidate, extract_claims
 
 LOGGER = get_logger(__name__)
@@ -99,6 +100,7 @@ class FactCheckerConfig:
     max_claims: int = _DEFAULT_MAX_CLAIMS
     max_concurrent_requests: int = 3
     min_priority_score: float = _DEFAULT_PRIORITY_THRESHOLD
+    enable_verdict_cache: bool = True
 
 
 class FactChecker:
@@ -109,9 +111,13 @@ class FactChecker:
     llm_client: GeminiClient,
         *,
         config: Optional[FactCheckerConfig] = None,
+        verdict_cache: Optional[ClaimVerdictCache] = None,
     ) -> None:
         self._llm_client = llm_client
         self._config = config or FactCheckerConfig()
+        self._verdict_cache: Optional[ClaimVerdictCache] = None
+        if self._config.enable_verdict_cache:
+            self._verdict_cache = verdict_cache or ClaimVerdictCache()
         if self._config.max_claims <= 0:
             LOGGER.warning(
                 "max_claims must be positive; falling back to %d", _DEFAULT_MAX_CLAIMS
@@ -201,22 +207,57 @@ class FactChecker:
 
             shared_context = "\n".join(shared_context_parts) if shared_context_parts else None
 
-            async with self._semaphore:
-                results = await self._llm_client.verify_claims_batch(
-                    claim_payloads,
-                    shared_context=shared_context,
+            cache_keys: List[Optional[str]] = [None] * len(selected)
+            cached: Mapping[str, ClaimVerificationResult] = {}
+            if self._verdict_cache is not None:
+                fingerprint = context_fingerprint(
+                    model=getattr(getattr(self._llm_client, "config", None), "model", None),
                     source_summaries=source_summaries,
+                    additional_context=additional_context,
+                )
+                cache_keys = [claim_cache_key(entry.claim.text, fingerprint) for entry in selected]
+                cached = await asyncio.to_thread(self._verdict_cache.get_many, cache_keys)
+
+            miss_positions = [pos for pos, key in enumerate(cache_keys) if key is None or key not in cached]
+            miss_claims = [selected[pos] for pos in miss_positions]
+            miss_payloads = [
+                {**claim_payloads[pos], "index": idx} for idx, pos in enumerate(miss_positions)
+            ]
+            if cached:
+                self._logger.info(
+                    "Claim verdict cache: %d of %d claims served from cache",
+                    len(selected) - len(miss_positions),
+                    len(selected),
                 )
 
-                # Fallback: if batch returned all uncertain/empty, try individual verifications
-                if results and all(
-                    r.verdict == "uncertain" and r.confidence == 0.0 and "omitted claim results" in r.reasoning
-                    for r in results
-                ):
-                    self._logger.warning("Batch verification returned empty results; falling back to individual verifications")
-                    results = await self._verify_claims_individually(
-                        selected, claim_payloads, shared_context, source_summaries
+            miss_results: Sequence[ClaimVerificationResult | Exception] = []
+            if miss_payloads:
+                try:
+                    miss_results = await self._verify_uncached(
+                        miss_claims, miss_payloads, shared_context, source_summaries
                     )
+                except GeminiClientError as exc:
+                    self._logger.warning("Batch fact-checking failed: %s", exc)
+                    miss_results = [exc for _ in miss_claims]
+
+            # Merge cached and fresh verdicts back into claim order.
+            merged: Dict[int, ClaimVerificationResult | Exception] = {
+                pos: replace(cached[key], claim=selected[pos].claim.text)
+                for pos, key in enumerate(cache_keys)
+                if key is not None and key in cached
+            }
+            fresh: Dict[str, ClaimVerificationResult] = {}
+            for pos, result in zip(miss_positions, miss_results):
+                merged[pos] = result
+                key = cache_keys[pos]
+                if key is not None and is_cacheable(result):
+                    fresh[key] = result
+            results = [
+                merged.get(pos) or GeminiClientError("No verification result returned for claim")
+                for pos in range(len(selected))
+            ]
+            if fresh and self._verdict_cache is not None:
+                await asyncio.to_thread(self._verdict_cache.set_many, fresh)
 
         except GeminiClientError as exc:
             self._logger.warning("Batch fact-checking failed: %s", exc)
@@ -231,6 +272,31 @@ class FactChecker:
         )
         return dimension
 
+    async def _verify_uncached(
+        self,
+        claims: Sequence[PrioritisedClaim],
+        claim_payloads: List[dict],
+        shared_context: Optional[str],
+        source_summaries: Optional[Sequence[str]],
+    ) -> List[ClaimVerificationResult | Exception]:
+        async with self._semaphore:
+            results = await self._llm_client.verify_claims_batch(
+                claim_payloads,
+                shared_context=shared_context,
+                source_summaries=source_summaries,
+            )
+
+            # Fallback: if batch returned all uncertain/empty, try individual verifications
+            if results and all(
+                r.verdict == "uncertain" and r.confidence == 0.0 and "omitted claim results" in r.reasoning
+                for r in results
+            ):
+                self._logger.warning("Batch verification returned empty results; falling back to individual verifications")
+                results = await self._verify_claims_individually(
+                    claims, claim_payloads, shared_context, source_summaries
+                )
+        return results
+
     async def _verify_claims_individually(
         self,
         claims: Sequence[PrioritisedClaim],
@@ -330,6 +396,11 @@ class FactChecker:
             "deferred_capacity": self._serialise_priorities(deferred_capacity),
             "deferred_low_priority": self._serialise_priorities(deferred_low_priority),
             "priority_policy": "heuristic-weighted",
+            "cache": {
+                "enabled": self._verdict_cache is not None,
+                "hits": self._verdict_cache.hits if self._verdict_cache else 0,
+                "misses": self._verdict_cache.misses if self._verdict_cache else 0,
+            },
         }
 
         return ValidationDimension(
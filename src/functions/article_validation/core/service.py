@@ -18,9 +18,11 @@ from .contracts.validation_report import ValidationDimension, ValidationIssue
 from .contracts.validation_standards import ValidationStandards
 from .llm import GeminiClient, GeminiClientError
 from .processors import (
+    ClaimVerdictCache,
     ContextValidator,
     DecisionEngine,
     FactChecker,
+    SupabaseClaimVerdictStore,
     QualityValidator,
     resolve_quality_standards,
 )
@@ -36,12 +38,15 @@ class ArticleValidationService:
         self._logger = get_logger(__name__)
         self._validation_config = self._ensure_validation_config()
         self._llm_client = GeminiClient(self._ensure_llm_config())
-        self._fact_checker = FactChecker(self._llm_client)
+        self._supabase_config = self.request.supabase_config
+        self._supabase_client = self._initialise_supabase_client(self._supabase_config)
+        self._fact_checker = FactChecker(
+            self._llm_client,
+            verdict_cache=self._build_verdict_cache(),
+        )
         self._context_validator = ContextValidator(self._llm_client)
         self._quality_validator = QualityValidator(self._llm_client)
         self._decision_engine = DecisionEngine(self._validation_config)
-        self._supabase_config = self.request.supabase_config
-        self._supabase_client = self._initialise_supabase_client(self._supabase_config)
 
     async def validate(self) -> ValidationReport:
         start_time = time.perf_counter()
@@ -170,6 +175,21 @@ class ArticleValidationService:
             self._logger.warning("Failed to initialise Supabase client: %s", exc)
             return None
 
+    def _build_verdict_cache(self) -> ClaimVerdictCache:
+        """Back the in-process verdict LRU with Supabase when a cache table is configured."""
+
+        store = None
+        table = get_env("ARTICLE_VALIDATION_CLAIM_CACHE_TABLE")
+        if table and self._supabase_client is not None:
+            store = SupabaseClaimVerdictStore(self._supabase_client, table.strip())
+        ttl = get_env("ARTICLE_VALIDATION_CLAIM_CACHE_TTL_SECONDS")
+        if ttl:
+            try:
+                return ClaimVerdictCache(store=store, ttl_seconds=int(ttl))
+            except ValueError:
+                self._logger.warning("Invalid ARTICLE_VALIDATION_CLAIM_CACHE_TTL_SECONDS=%s", ttl)
+        return ClaimVerdictCache(store=store)
+
     async def _run_validation_dimensions(
         self,
         standards: ValidationStandards,
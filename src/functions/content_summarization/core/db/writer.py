@@ -247,3 +247,37 @@ class SummaryWriter:
         except Exception as e:
             logger.error(f"Failed to check if summary exists: {e}", exc_info=True)
             return False
+
+    def fetch_existing_ids(self, news_url_ids: list[str]) -> set[str]:
+        """
+        Return which of the given URLs already have a summary.
+
+        One query per ``batch_size`` IDs instead of a round trip per URL.
+
+        Args:
+            news_url_ids: UUIDs of news_url records
+
+        Returns:
+            Set of news_url IDs that already have a summary
+        """
+        if self.dry_run:
+            logger.info(f"[DRY-RUN] Would check existing summaries for {len(news_url_ids)} URL IDs")
+            return set()
+
+        existing: set[str] = set()
+        unique_ids = list(dict.fromkeys(news_url_ids))
+        for i in range(0, len(unique_ids), self.batch_size):
+            chunk = unique_ids[i : i + self.batch_size]
+            try:
+                response = (
+                    self.client.table(self.table_name)
+                    .select("news_url_id")
+                    .in_("news_url_id", chunk)
+                    .execute()
+                )
+                existing.update(row["news_url_id"] for row in response.data or [])
+            except Exception as e:
+                logger.error(f"Failed to check existing summaries: {e}", exc_info=True)
+
+        logger.debug(f"{len(existing)}/{len(unique_ids)} URLs already summarized")
+        return existing
@@ -0,0 +1,334 @@
+"""Process-wide embedding micro-batcher.
+
+Worker threads in the backlog processor and the pipeline CLI each embed a
+handful of texts at a time. :class:`EmbeddingMicroBatcher` queues texts from
+all threads and sends them to the embeddings API as one multi-input request
+once ``max_batch_size`` texts are waiting or the oldest has waited
+``max_wait_ms``. Identical texts that are pending at the same time share a
+single input slot. Callers get their vectors back through futures; a failed
+request resolves its futures to ``[]`` to match the existing "empty vector
+means failure" convention of the embedding helpers.
+
+When ``EMBEDDING_CACHE_PATH`` / ``EMBEDDING_CACHE_TABLE`` are set, batches go
+through the story_embeddings content-hash cache first and only misses are sent.
+
+Requests are paced by the host-wide limiter for the embedding model (see
+:mod:`src.shared.utils.rate_limiter`), which also learns from 429s and the
+provider's rate-limit headers.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence, Tuple
+
+import requests
+
+from src.shared.utils.rate_limiter import (
+    DEFAULT_EMBEDDING_REQUESTS_PER_MINUTE,
+    DEFAULT_EMBEDDING_TOKENS_PER_MINUTE,
+    estimate_tokens,
+    get_rate_limiter,
+    provider_for_model,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 512
+DEFAULT_MAX_WAIT_MS = 50
+DEFAULT_MAX_IN_FLIGHT = 2
+MAX_RETRIES = 3
+
+
+class SupportsRateLimit(Protocol):
+    def acquire(self, tokens: int = 0) -> None: ...
+
+    def record_success(
+        self,
+        headers: Optional[Any] = None,
+        *,
+        tokens_used: Optional[int] = None,
+        estimated_tokens: int = 0,
+    ) -> None: ...
+
+    def record_rate_limited(
+        self,
+        retry_after: Optional[float] = None,
+        headers: Optional[Any] = None,
+        *,
+        attempt: int = 0,
+    ) -> float: ...
+
+
+SendBatch = Callable[[List[str]], List[List[float]]]
+
+
+def post_embeddings(
+    texts: List[str],
+    *,
+    api_url: str,
+    api_key: str,
+    model: str,
+    timeout: float,
+    rate_limiter: Optional[SupportsRateLimit] = None,
+) -> List[List[float]]:
+    """Embed *texts* with one API request, retrying transient failures.
+
+    Returns one vector per input in order, or ``[]`` for every input when the
+    request ultimately fails.
+    """
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+    payload = {"model": model, "input": texts}
+    estimated_tokens = sum(estimate_tokens(text) for text in texts)
+
+    for attempt in range(MAX_RETRIES):
+        try:
+            if rate_limiter:
+                rate_limiter.acquire(estimated_tokens)
+            response = requests.post(api_url, headers=headers, json=payload, timeout=timeout)
+            if response.status_code == 429:
+                if rate_limiter:
+                    delay = rate_limiter.record_rate_limited(headers=response.headers, attempt=attempt)
+                else:
+                    delay = min(30.0, 2 ** attempt)
+                logger.info(f"⏳ Embedding rate limit backoff: sleeping for {delay}s...")
+                time.sleep(delay)
+                continue
+            response.raise_for_status()
+            data = response.json()
+            if rate_limiter:
+                rate_limiter.record_success(
+                    response.headers,
+                    tokens_used=(data.get("usage") or {}).get("total_tokens"),
+                    estimated_tokens=estimated_tokens,
+                )
+
+            rows = sorted(data["data"], key=lambda item: item.get("index", 0))
+            vectors = [list(row["embedding"]) for row in rows if isinstance(row.get("embedding"), list)]
+            if len(vectors) != len(texts):
+                logger.error(f"Embedding count mismatch: expected {len(texts)}, got {len(vectors)}")
+                return [[] for _ in texts]
+            return vectors
+        except Exception as e:
+            logger.warning(f"Embedding batch failed (attempt {attempt + 1}/{MAX_RETRIES}): {e}")
+            if attempt < MAX_RETRIES - 1:
+                time.sleep(2 ** attempt)
+
+    return [[] for _ in texts]
+
+
+class EmbeddingMicroBatcher:
+    """Coalesces embedding requests from many threads into large API calls."""
+
+    def __init__(
+        self,
+        send_batch: SendBatch,
+        *,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: int = DEFAULT_MAX_WAIT_MS,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ):
+        self._send_batch = send_batch
+        self.limiter_slot: Dict[str, Optional[SupportsRateLimit]] = {}
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0, max_wait_ms) / 1000.0
+        self._cond = threading.Condition()
+        self._pending: Dict[str, Future] = {}
+        self._oldest: Optional[float] = None
+        self._closed = False
+        self._senders = ThreadPoolExecutor(
+            max_workers=max(1, max_in_flight),
+            thread_name_prefix="embedding-batch",
+        )
+        self._stats = {"texts_submitted": 0, "texts_deduplicated": 0, "requests": 0, "texts_sent": 0}
+        self._flusher = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+        self._flusher.start()
+
+    def submit(self, texts: Sequence[str]) -> List[Future]:
+        """Queue *texts* and return one future per text resolving to its vector."""
+        futures: List[Future] = []
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("EmbeddingMicroBatcher is closed")
+            for text in texts:
+                self._stats["texts_submitted"] += 1
+                future = self._pending.get(text)
+                if future is not None:
+                    self._stats["texts_deduplicated"] += 1
+                else:
+                    future = Future()
+                    self._pending[text] = future
+                    if self._oldest is None:
+                        self._oldest = time.monotonic()
+                futures.append(future)
+            self._cond.notify()
+        return futures
+
+    def embed(self, texts: Sequence[str], timeout: Optional[float] = None) -> List[List[float]]:
+        """Blocking convenience wrapper around :meth:`submit`."""
+        return [future.result(timeout=timeout) for future in self.submit(texts)]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            stats = dict(self._stats)
+            stats["pending"] = len(self._pending)
+        stats["avg_batch_size"] = stats["texts_sent"] / stats["requests"] if stats["requests"] else 0.0
+        return stats
+
+    def close(self) -> None:
+        """Flush anything still pending and stop the background threads."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._flusher.join(timeout=5)
+        self._senders.shutdown(wait=True)
+
+    def _take_batch(self) -> List[Tuple[str, Future]]:
+        """Wait until a flush threshold is met and pop one batch. Caller holds the lock."""
+        while True:
+            if self._pending:
+                if self._closed or len(self._pending) >= self.max_batch_size:
+                    break
+                waited = time.monotonic() - (self._oldest or time.monotonic())
+                if waited >= self.max_wait:
+                    break
+                self._cond.wait(timeout=self.max_wait - waited)
+            elif self._closed:
+                return []
+            else:
+                self._cond.wait()
+
+        batch: List[Tuple[str, Future]] = []
+        for text in list(self._pending)[: self.max_batch_size]:
+            batch.append((text, self._pending.pop(text)))
+        self._oldest = time.monotonic() if self._pending else None
+        self._stats["requests"] += 1
+        self._stats["texts_sent"] += len(batch)
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                batch = self._take_batch()
+            if not batch:
+                return
+            self._senders.submit(self._send, batch)
+
+    def _send(self, batch: List[Tuple[str, Future]]) -> None:
+        texts = [text for text, _ in batch]
+        try:
+            vectors = self._send_batch(texts)
+        except Exception as e:
+            logger.error(f"Embedding micro-batch of {len(texts)} texts failed: {e}")
+            vectors = []
+        if len(vectors) != len(texts):
+            vectors = [[] for _ in texts]
+        for (_, future), vector in zip(batch, vectors):
+            future.set_result(vector)
+
+
+def _load_embedding_cache() -> Any:
+    """Return the content-hash embedding cache configured via env, if any."""
+    try:
+        from src.functions.story_embeddings.core.llm.embedding_cache import build_embedding_cache_from_env
+    except ImportError as e:
+        logger.debug(f"Embedding cache unavailable: {e}")
+        return None
+    return build_embedding_cache_from_env()
+
+
+def _send_through_cache(
+    texts: List[str],
+    cache: Any,
+    model: str,
+    request: SendBatch,
+) -> List[List[float]]:
+    """Serve cached vectors and only send the misses to the API."""
+    from src.functions.story_embeddings.core.llm.embedding_cache import embedding_cache_key
+
+    keys = [embedding_cache_key(model, text) for text in texts]
+    found = cache.get_many(keys)
+    misses = [(idx, text) for idx, (text, key) in enumerate(zip(texts, keys)) if key not in found]
+
+    vectors: List[List[float]] = [found.get(key, []) for key in keys]
+    if misses:
+        fresh = request([text for _, text in misses])
+        to_store: Dict[str, List[float]] = {}
+        for (idx, _), vector in zip(misses, fresh):
+            vectors[idx] = vector
+            if vector:
+                to_store[keys[idx]] = vector
+        cache.set_many(to_store)
+    return vectors
+
+
+_batchers: Dict[Tuple[str, str, str], EmbeddingMicroBatcher] = {}
+_batchers_lock = threading.Lock()
+
+
+def get_embedding_batcher(
+    config: Any,
+    rate_limiter: Optional[SupportsRateLimit] = None,
+    *,
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    max_wait_ms: int = DEFAULT_MAX_WAIT_MS,
+) -> EmbeddingMicroBatcher:
+    """Return the process-wide batcher for the embedding endpoint in *config*.
+
+    *config* is any object with ``embedding_api_url``, ``embedding_api_key``,
+    ``embedding_model_name`` and ``embedding_timeout_seconds`` (both pipeline
+    configs in this module qualify). The rate limiter passed on first use is
+    the one the batcher keeps; without one it uses the host-wide limiter for
+    the embedding model.
+    """
+    key_hash = hashlib.sha256(str(config.embedding_api_key).encode("utf-8")).hexdigest()[:16]
+    key = (config.embedding_api_url, config.embedding_model_name, key_hash)
+    with _batchers_lock:
+        batcher = _batchers.get(key)
+        if batcher is None:
+            api_url = config.embedding_api_url
+            api_key = config.embedding_api_key
+            model = config.embedding_model_name
+            timeout = config.embedding_timeout_seconds
+            limiter_slot: Dict[str, Optional[SupportsRateLimit]] = {
+                "limiter": rate_limiter
+                or get_rate_limiter(
+                    provider_for_model(model),
+                    model,
+                    requests_per_minute=DEFAULT_EMBEDDING_REQUESTS_PER_MINUTE,
+                    tokens_per_minute=DEFAULT_EMBEDDING_TOKENS_PER_MINUTE,
+                )
+            }
+
+            cache = _load_embedding_cache()
+
+            def _request(texts: List[str]) -> List[List[float]]:
+                return post_embeddings(
+                    texts,
+                    api_url=api_url,
+                    api_key=api_key,
+                    model=model,
+                    timeout=timeout,
+                    rate_limiter=limiter_slot["limiter"],
+                )
+
+            def _send(texts: List[str]) -> List[List[float]]:
+                if cache is None:
+                    return _request(texts)
+                return _send_through_cache(texts, cache, model, _request)
+
+            batcher = EmbeddingMicroBatcher(_send, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+            batcher.limiter_slot = limiter_slot
+            _batchers[key] = batcher
+            logger.info(
+                "Embedding micro-batcher started",
+                {"model": model, "max_batch_size": max_batch_size, "max_wait_ms": max_wait_ms},
+            )
+        return batcher
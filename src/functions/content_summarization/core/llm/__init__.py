@@ -5,14 +5,15 @@ Production-ready client with rate limiting, retry logic, and comprehensive error
 """
 
 import logging
+import threading
 import time
 from typing import Any, Optional
-from collections import deque
-from datetime import datetime, timedelta
 
 from google import genai
 from google.genai.types import GenerateContentConfig
 
+from src.shared.utils.rate_limiter import get_rate_limiter
+
 from .content_fetcher import ContentFetcher
 from ..prompts import build_article_content_prompt, build_url_prompt
 
@@ -21,53 +22,40 @@ logger = logging.getLogger(__name__)
 
 class RateLimiter:
     """
-    Token bucket rate limiter for API calls.
+    Request rate limiter for Gemini API calls.
     
-    Ensures we don't exceed API rate limits and provides graceful throttling.
+    Backed by the host-wide adaptive limiter for the model, so every process
+    summarizing with it shares one budget and backs off together on 429s.
     """
     
-    def __init__(self, max_requests: int = 60, time_window: int = 60):
+    def __init__(self, max_requests: int = 60, time_window: int = 60, model: str = "gemini"):
         """
         Initialize rate limiter.
         
         Args:
             max_requests: Maximum requests allowed in time window
             time_window: Time window in seconds
+            model: Model whose shared budget this limiter draws from
         """
         self.max_requests = max_requests
         self.time_window = time_window
-        self.requests = deque()
+        self._limiter = get_rate_limiter(
+            "gemini", model, requests_per_minute=max_requests * 60 / time_window
+        )
         
-        logger.info(f"Initialized RateLimiter: {max_requests} requests per {time_window}s")
+        logger.info(f"Initialized RateLimiter: {max_requests} requests per {time_window}s ({model})")
     
     def wait_if_needed(self):
         """Wait if rate limit would be exceeded."""
-        now = datetime.now()
-        
-        # Remove requests outside the time window
-        cutoff = now - timedelta(seconds=self.time_window)
-        while self.requests and self.requests[0] < cutoff:
-            self.requests.popleft()
-        
-        # Check if we're at the limit
-        if len(self.requests) >= self.max_requests:
-            # Calculate wait time
-            oldest_request = self.requests[0]
-            wait_until = oldest_request + timedelta(seconds=self.time_window)
-            wait_seconds = (wait_until - now).total_seconds()
-            
-            if wait_seconds > 0:
-                logger.warning(
-                    f"Rate limit reached ({self.max_requests} requests/{self.time_window}s). "
-                    f"Waiting {wait_seconds:.1f}s..."
-                )
-                time.sleep(wait_seconds)
-                
-                # Recheck after waiting
-                self.wait_if_needed()
-        
-        # Record this request
-        self.requests.append(now)
+        self._limiter.acquire()
+
+    def record_success(self):
+        """Let the shared limiter ramp back up after a successful call."""
+        self._limiter.record_success()
+
+    def record_rate_limited(self, attempt: int) -> float:
+        """Record a quota error and return the delay before retrying."""
+        return self._limiter.record_rate_limited(attempt=attempt)
 
 
 class GeminiClient:
@@ -109,9 +97,12 @@ class GeminiClient:
         
         self.client = genai.Client(api_key=api_key)
         self.content_fetcher = ContentFetcher()
-        self.rate_limiter = RateLimiter(max_requests=max_requests_per_minute, time_window=60)
+        self.rate_limiter = RateLimiter(
+            max_requests=max_requests_per_minute, time_window=60, model=model
+        )
         
-        # Metrics tracking
+        # Metrics tracking (summarize_url may run on several worker threads)
+        self._metrics_lock = threading.Lock()
         self.metrics = {
             "total_requests": 0,
             "successful_requests": 0,
@@ -150,22 +141,21 @@ class GeminiClient:
         Raises:
             Exception: If summarization fails after all retries
         """
-        self.metrics["total_requests"] += 1
-        
-        # Apply rate limiting
-        self.rate_limiter.wait_if_needed()
+        self._bump_metrics(total_requests=1)
         
-        # Retry logic with exponential backoff
+        # Retry logic with exponential backoff; every attempt takes a rate-limit slot
         last_exception = None
         for attempt in range(1, self.max_retries + 1):
             try:
+                self.rate_limiter.wait_if_needed()
                 result = self._summarize_url_internal(url, title)
-                self.metrics["successful_requests"] += 1
-                self.metrics["total_tokens"] += result["metadata"].get("tokens_used", 0)
-                self.metrics["total_processing_time"] += result["metadata"].get("processing_time_seconds", 0)
-                
-                if result["metadata"].get("fallback_method"):
-                    self.metrics["fallback_requests"] += 1
+                self.rate_limiter.record_success()
+                self._bump_metrics(
+                    successful_requests=1,
+                    total_tokens=result["metadata"].get("tokens_used", 0),
+                    total_processing_time=result["metadata"].get("processing_time_seconds", 0),
+                    fallback_requests=1 if result["metadata"].get("fallback_method") else 0,
+                )
                 
                 return result
                 
@@ -173,17 +163,26 @@ class GeminiClient:
                 last_exception = e
                 logger.warning(f"Attempt {attempt}/{self.max_retries} failed for {url}: {e}")
                 
-                if attempt < self.max_retries:
+                if _is_quota_error(e):
+                    # Throttles every process using this model, not just this call
+                    wait_time = self.rate_limiter.record_rate_limited(attempt)
+                else:
                     # Exponential backoff: 2^attempt seconds
                     wait_time = 2 ** attempt
+                if attempt < self.max_retries:
                     logger.info(f"Retrying in {wait_time}s...")
                     time.sleep(wait_time)
         
         # All retries failed
-        self.metrics["failed_requests"] += 1
+        self._bump_metrics(failed_requests=1)
         logger.error(f"All {self.max_retries} attempts failed for {url}")
         raise Exception(f"Failed after {self.max_retries} attempts: {last_exception}") from last_exception
     
+    def _bump_metrics(self, **increments) -> None:
+        with self._metrics_lock:
+            for key, value in increments.items():
+                self.metrics[key] += value
+
     def _summarize_url_internal(self, url: str, title: Optional[str] = None) -> dict[str, Any]:
         """
         Internal method to generate summary (single attempt).
@@ -592,3 +591,8 @@ class GeminiClient:
         """Context manager exit."""
         self.close()
         return False
+
+
+def _is_quota_error(exc: Exception) -> bool:
+    text = str(exc)
+    return "429" in text or "RESOURCE_EXHAUSTED" in text
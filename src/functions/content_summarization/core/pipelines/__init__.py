@@ -5,6 +5,7 @@ Orchestrates the full workflow: fetch URLs -> summarize -> write results.
 """
 
 import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from typing import Optional
 
@@ -25,7 +26,9 @@ class SummarizationPipeline:
     3. Write results to context_summaries table
 
     Features:
-    - Batch processing
+    - Batch processing with a bounded worker pool (paced by the Gemini limiter)
+    - One bulk existence check per batch
+    - Write-behind: summaries are written in small batches as they complete
     - Error handling with continue-on-error
     - Progress tracking
     - Dry-run support
@@ -37,6 +40,9 @@ class SummarizationPipeline:
         url_reader: NewsUrlReader,
         summary_writer: SummaryWriter,
         continue_on_error: bool = True,
+        max_workers: int = 1,
+        write_batch_size: int = 10,
+        keep_summaries: bool = False,
     ):
         """
         Initialize the pipeline.
@@ -46,13 +52,23 @@ class SummarizationPipeline:
             url_reader: URL reader instance
             summary_writer: Summary writer instance
             continue_on_error: If True, continue processing after errors
+            max_workers: URLs summarized concurrently (1 = sequential)
+            write_batch_size: Completed summaries buffered before each write
+            keep_summaries: Also return every summary in ``stats["summaries"]``
+                (for dry-run display; holds the whole batch in memory)
         """
         self.gemini_client = gemini_client
         self.url_reader = url_reader
         self.summary_writer = summary_writer
         self.continue_on_error = continue_on_error
+        self.max_workers = max(1, max_workers)
+        self.write_batch_size = max(1, write_batch_size)
+        self.keep_summaries = keep_summaries
 
-        logger.info("Initialized SummarizationPipeline")
+        logger.info(
+            f"Initialized SummarizationPipeline (workers: {self.max_workers}, "
+            f"write_batch_size: {self.write_batch_size})"
+        )
 
     def process_unsummarized_urls(self, limit: Optional[int] = None) -> dict:
         """
@@ -97,6 +113,11 @@ class SummarizationPipeline:
         """
         Process a batch of URLs.
 
+        Existing summaries are looked up in one bulk query, then up to
+        ``max_workers`` URLs are summarized at a time. Finished summaries are
+        written every ``write_batch_size`` completions, so a crash mid-batch
+        only loses the summaries still in the buffer.
+
         Args:
             urls: List of NewsUrlRecord instances
 
@@ -109,86 +130,132 @@ class SummarizationPipeline:
             "failed": 0,
             "skipped": 0,
             "errors": [],
-            "summaries": [],  # Store generated summaries
         }
+        if self.keep_summaries:
+            stats["summaries"] = []
 
-        summaries = []
+        write_buffer: list[ContentSummary] = []
 
+        existing = self.summary_writer.fetch_existing_ids([url_record.id for url_record in urls])
+        queue = []
         for i, url_record in enumerate(urls, 1):
-            logger.info(f"Processing URL {i}/{len(urls)}: {url_record.url}")
-
+            if url_record.id in existing:
+                logger.info(f"Skipping URL (already summarized): {url_record.url}")
+                stats["skipped"] += 1
+            else:
+                queue.append((i, url_record))
+        queue.reverse()  # pop() from the end in original order
+
+        in_flight: dict[Future, tuple[int, NewsUrlRecord]] = {}
+        stop = False
+
+        def collect(future: Future) -> None:
+            nonlocal stop
+            i, url_record = in_flight.pop(future)
             try:
-                # Check if already summarized (skip if exists)
-                if self.summary_writer.check_exists(url_record.id):
-                    logger.info(f"Skipping URL (already summarized): {url_record.url}")
-                    stats["skipped"] += 1
-                    continue
-
-                # Generate summary
-                result = self.gemini_client.summarize_url(
-                    url=url_record.url,
-                    title=url_record.title,
-                )
-
-                # Create ContentSummary object
-                summary = ContentSummary(
-                    news_url_id=url_record.id,
-                    summary=result["summary"],
-                    key_points=result["key_points"],
-                    players_mentioned=result["players_mentioned"],
-                    teams_mentioned=result["teams_mentioned"],
-                    game_references=result["game_references"],
-                    article_type=result["article_type"],
-                    sentiment=result["sentiment"],
-                    content_quality=result["content_quality"],
-                    injury_updates=result["injury_updates"],
-                    model_used=result["metadata"]["model_used"],
-                    tokens_used=result["metadata"]["tokens_used"],
-                    processing_time_seconds=result["metadata"]["processing_time_seconds"],
-                    url_retrieval_status=result["metadata"]["url_retrieval_status"],
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                )
-
-                summaries.append(summary)
-                stats["successful"] += 1
-
-                logger.info(
-                    f"Successfully summarized URL {i}/{len(urls)} "
-                    f"(tokens: {summary.tokens_used}, time: {summary.processing_time_seconds:.2f}s)"
-                )
-
+                summary = future.result()
             except Exception as e:
                 error_msg = f"Failed to summarize {url_record.url}: {e}"
                 logger.error(error_msg, exc_info=True)
                 stats["failed"] += 1
                 stats["errors"].append(error_msg)
 
-                if not self.continue_on_error:
+                if not self.continue_on_error and not stop:
                     logger.error("Stopping pipeline due to error (continue_on_error=False)")
-                    break
+                    stop = True
+                return
+
+            write_buffer.append(summary)
+            if self.keep_summaries:
+                stats["summaries"].append(summary)
+            stats["successful"] += 1
 
-        # Write all summaries in batch
-        if summaries:
-            logger.info(f"Writing {len(summaries)} summaries to database...")
-            write_stats = self.summary_writer.write_summaries(summaries)
+            logger.info(
+                f"Successfully summarized URL {i}/{len(urls)} "
+                f"(tokens: {summary.tokens_used}, time: {summary.processing_time_seconds:.2f}s)"
+            )
 
-            # Update stats with write results
-            if write_stats["failed"] > 0:
-                stats["failed"] += write_stats["failed"]
-                stats["successful"] -= write_stats["failed"]
-                stats["errors"].extend(write_stats["errors"])
+            if len(write_buffer) >= self.write_batch_size:
+                self._flush_summaries(write_buffer, stats)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="summarize") as executor:
+                try:
+                    while True:
+                        while queue and not stop and len(in_flight) < self.max_workers:
+                            i, url_record = queue.pop()
+                            logger.info(f"Processing URL {i}/{len(urls)}: {url_record.url}")
+                            in_flight[executor.submit(self._summarize_record, url_record)] = (i, url_record)
+                        if not in_flight:
+                            break
+
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            collect(future)
+                except KeyboardInterrupt:
+                    # The in-flight calls are already paid for: let them finish
+                    # and keep their summaries; anything not started is dropped.
+                    logger.warning(f"Interrupted; finishing {len(in_flight)} in-flight URLs")
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    for future in list(in_flight):
+                        if future.cancelled():
+                            in_flight.pop(future)
+                        else:
+                            collect(future)
+                    raise
+        finally:
+            # Write whatever finished, even if the loop was interrupted
+            self._flush_summaries(write_buffer, stats)
 
         logger.info(
             f"Pipeline complete: {stats['successful']} successful, "
             f"{stats['failed']} failed, {stats['skipped']} skipped"
         )
 
-        # Include summaries in return stats
-        stats["summaries"] = summaries
-
         return stats
 
+    def _summarize_record(self, url_record: NewsUrlRecord) -> ContentSummary:
+        """Summarize one URL (runs on a worker thread)."""
+        result = self.gemini_client.summarize_url(
+            url=url_record.url,
+            title=url_record.title,
+        )
+
+        return ContentSummary(
+            news_url_id=url_record.id,
+            summary=result["summary"],
+            key_points=result["key_points"],
+            players_mentioned=result["players_mentioned"],
+            teams_mentioned=result["teams_mentioned"],
+            game_references=result["game_references"],
+            article_type=result["article_type"],
+            sentiment=result["sentiment"],
+            content_quality=result["content_quality"],
+            injury_updates=result["injury_updates"],
+            model_used=result["metadata"]["model_used"],
+            tokens_used=result["metadata"]["tokens_used"],
+            processing_time_seconds=result["metadata"]["processing_time_seconds"],
+            url_retrieval_status=result["metadata"]["url_retrieval_status"],
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+        )
+
+    def _flush_summaries(self, buffer: list[ContentSummary], stats: dict) -> None:
+        """Write and clear buffered summaries, folding write failures into *stats*."""
+        if not buffer:
+            return
+
+        batch = list(buffer)
+        buffer.clear()
+        logger.info(f"Writing {len(batch)} summaries to database...")
+        write_stats = self.summary_writer.write_summaries(batch)
+
+        # Update stats with write results
+        if write_stats["failed"] > 0:
+            stats["failed"] += write_stats["failed"]
+            stats["successful"] -= write_stats["failed"]
+            stats["errors"].extend(write_stats["errors"])
+
     def process_by_publisher(self, publisher: str, limit: Optional[int] = None) -> dict:
         """
         Process URLs from a specific publisher.
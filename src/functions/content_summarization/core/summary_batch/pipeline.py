@@ -199,6 +199,7 @@ class SummaryBatchPipeline:
             "articles_in_output": result.articles_in_output,
             "articles_processed": result.articles_processed,
             "articles_skipped_existing": result.articles_skipped_existing,
+            "articles_resumed": result.articles_resumed,
             "articles_skipped_no_data": result.articles_skipped_no_data,
             "summaries_written": result.summaries_written,
             "topic_summaries_written": result.topic_summaries_written,
@@ -12,6 +12,7 @@ from typing import Any, Dict, List, Optional
 
 import requests
 
+from src.shared.batch.stream_ingest import DEFAULT_WINDOW_SIZE, IngestWindow, StreamingIngestor
 from src.shared.db.connection import get_supabase_client
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,7 @@ class SummaryBatchResult:
     embeddings_created: int = 0
     articles_in_output: int = 0
     articles_skipped_existing: int = 0
+    articles_resumed: int = 0
     articles_skipped_no_data: int = 0
     errors: List[str] = field(default_factory=list)
 
@@ -44,12 +46,14 @@ class SummaryBatchResultProcessor:
         embedding_model: str = "text-embedding-3-small",
         continue_on_error: bool = True,
         chunk_size: int = 100,
+        window_size: int = DEFAULT_WINDOW_SIZE,
     ) -> None:
         self.client = get_supabase_client()
         self.embedding_api_key = embedding_api_key
         self.embedding_model = embedding_model
         self.continue_on_error = continue_on_error
         self.chunk_size = chunk_size
+        self.window_size = window_size
         logger.info("Initialized SummaryBatchResultProcessor with bulk operations")
 
     def process(
@@ -60,140 +64,227 @@ class SummaryBatchResultProcessor:
         dry_run: bool = False,
         skip_existing: bool = False,
         create_embeddings: bool = True,
+        resume: bool = True,
     ) -> SummaryBatchResult:
-        """Process a downloaded batch output file using bulk database operations."""
+        """Process a downloaded batch output file using bulk database operations.
+
+        The file is streamed in windows of ``window_size`` articles. Summaries
+        for a window are written while embeddings for the previous window are
+        still being created, and progress is recorded per window so a failed
+        run can be resumed (see :mod:`src.shared.batch.stream_ingest`).
+        """
 
         if not output_file.exists():
             raise FileNotFoundError(f"Output file not found: {output_file}")
 
         result = SummaryBatchResult()
-        
-        # Group results by article for proper handling
-        easy_summaries: Dict[str, str] = {}  # news_url_id -> summary
-        hard_summaries: Dict[str, List[Dict[str, Any]]] = {}  # news_url_id -> list of topic summaries
         seen_articles: set[str] = set()
+        processed_articles: set[str] = set()
+        skipped_articles: set[str] = set()
+        embed = create_embeddings and bool(self.embedding_api_key)
+
+        def on_invalid_line(line_number: int, exc: Exception) -> None:
+            msg = f"Invalid JSON on line {line_number}: {exc}"
+            logger.error(msg)
+            result.errors.append(msg)
+            if not self.continue_on_error:
+                raise exc
+
+        def write_window(window: IngestWindow) -> Optional[tuple]:
+            # Group results by article for proper handling
+            easy_summaries: Dict[str, str] = {}  # news_url_id -> summary
+            hard_summaries: Dict[str, List[Dict[str, Any]]] = {}  # news_url_id -> list of topic summaries
+            for _, record in window.records:
+                self._collect_record(record, easy_summaries, hard_summaries, seen_articles, result)
+
+            if dry_run:
+                result.summaries_written += len(easy_summaries)
+                result.topic_summaries_written += sum(len(ts) for ts in hard_summaries.values())
+                return None
+
+            # Filter out existing articles if skip_existing is set. Articles
+            # continued from an earlier window were already decided there.
+            if skip_existing:
+                easy_summaries, hard_summaries = self._filter_window_existing(
+                    window, easy_summaries, hard_summaries, skipped_articles, result
+                )
 
-        # Phase 1: Parse all results from the output file
-        logger.info("Phase 1: Parsing batch output file...")
-        with output_file.open("r") as handle:
-            for line_number, line in enumerate(handle, 1):
-                try:
-                    record = json.loads(line)
-                except json.JSONDecodeError as exc:
-                    msg = f"Invalid JSON on line {line_number}: {exc}"
-                    logger.error(msg)
-                    result.errors.append(msg)
-                    if not self.continue_on_error:
-                        raise
-                    continue
-
-                custom_id = record.get("custom_id", "")
-                error = record.get("error")
-                response = record.get("response") or {}
-
-                if error:
-                    msg = f"Batch request {custom_id} failed: {error}"
-                    logger.error(msg)
-                    result.errors.append(msg)
-                    if not self.continue_on_error:
-                        raise RuntimeError(msg)
-                    continue
-
-                if response.get("status_code") != 200:
-                    msg = f"Non-200 response for {custom_id}: {response}"
-                    logger.error(msg)
-                    result.errors.append(msg)
-                    if not self.continue_on_error:
-                        raise RuntimeError(msg)
-                    continue
-
-                body = response.get("body") or {}
-                output_text = self._extract_output_text(body)
-                
-                if not output_text:
-                    logger.warning("No output text for %s", custom_id)
-                    continue
-
-                summary = self._parse_summary(output_text)
-                if not summary:
-                    logger.warning("Failed to parse summary for %s", custom_id)
-                    result.articles_skipped_no_data += 1
-                    continue
-
-                # Parse custom_id to determine type and article
-                parsed = self._parse_custom_id(custom_id)
-                if not parsed:
-                    logger.warning("Failed to parse custom_id: %s", custom_id)
-                    continue
-
-                news_url_id = parsed["news_url_id"]
-                seen_articles.add(news_url_id)
-
-                if parsed["type"] == "easy":
-                    easy_summaries[news_url_id] = summary
-                else:
-                    if news_url_id not in hard_summaries:
-                        hard_summaries[news_url_id] = []
-                    hard_summaries[news_url_id].append({
-                        "topic": parsed.get("topic", "general"),
-                        "scope_type": parsed.get("scope_type"),
-                        "scope_id": parsed.get("scope_id"),
-                        "scope_label": parsed.get("scope_label"),
-                        "summary": summary,
-                    })
+            # Bulk clear existing data for articles we're about to update;
+            # continued articles were cleared with their first window.
+            all_article_ids = list(dict.fromkeys([*easy_summaries, *hard_summaries]))
+            to_clear = [aid for aid in all_article_ids if not window.is_continuation(aid)]
+            if to_clear:
+                logger.debug("Clearing existing data for %d articles", len(to_clear))
+                self._bulk_clear_existing(to_clear)
+
+            # Bulk insert easy summaries
+            if easy_summaries:
+                result.summaries_written += self._bulk_insert_easy_summaries(easy_summaries, model)
+
+            # Bulk insert topic summaries for hard articles
+            if hard_summaries:
+                result.topic_summaries_written += self._bulk_insert_topic_summaries(hard_summaries, model)
+
+            processed_articles.update(all_article_ids)
+            logger.info(
+                "Window %d: wrote summaries for %d articles", window.index + 1, len(all_article_ids)
+            )
+            return easy_summaries, hard_summaries, all_article_ids
+
+        def finish_window(window: IngestWindow, written: Optional[tuple]) -> None:
+            if not written:
+                return
+            easy_summaries, hard_summaries, all_article_ids = written
+
+            # Create embeddings (batch API call for multiple texts)
+            if embed:
+                result.embeddings_created += self._bulk_create_embeddings(easy_summaries, hard_summaries)
+
+            # Bulk mark articles as completed
+            if all_article_ids:
+                self._bulk_mark_completed(all_article_ids)
+
+        ingestor = StreamingIngestor(
+            output_file,
+            key_fn=self._record_article_id,
+            window_size=self.window_size,
+            resume=resume,
+            record_progress=not dry_run,
+            on_invalid_line=on_invalid_line,
+        )
+        stats = ingestor.run(write_window, None if dry_run else finish_window)
 
         result.articles_in_output = len(seen_articles)
-        logger.info(f"Parsed {len(easy_summaries)} easy and {len(hard_summaries)} hard articles")
-
         if dry_run:
-            result.summaries_written = len(easy_summaries)
-            result.topic_summaries_written = sum(len(ts) for ts in hard_summaries.values())
             result.articles_processed = len(seen_articles)
             logger.info("[DRY RUN] Would process %d articles", len(seen_articles))
             return result
 
-        # Phase 2: Filter out existing articles if skip_existing is set
-        if skip_existing:
-            easy_summaries, hard_summaries, skipped = self._filter_existing(
-                easy_summaries, hard_summaries
-            )
-            result.articles_skipped_existing = skipped
-            logger.info(f"Skipped {skipped} existing articles")
-
-        # Phase 3: Bulk clear existing data for articles we're about to update
-        all_article_ids = list(easy_summaries.keys()) + list(hard_summaries.keys())
-        if all_article_ids:
-            logger.info(f"Phase 2: Clearing existing data for {len(all_article_ids)} articles...")
-            self._bulk_clear_existing(all_article_ids)
-
-        # Phase 4: Bulk insert easy summaries
-        if easy_summaries:
-            logger.info(f"Phase 3: Inserting {len(easy_summaries)} easy summaries...")
-            written = self._bulk_insert_easy_summaries(easy_summaries, model)
-            result.summaries_written = written
-
-        # Phase 5: Bulk insert topic summaries for hard articles
-        if hard_summaries:
-            logger.info(f"Phase 4: Inserting topic summaries for {len(hard_summaries)} hard articles...")
-            written = self._bulk_insert_topic_summaries(hard_summaries, model)
-            result.topic_summaries_written = written
-
-        # Phase 6: Create embeddings (batch API call for multiple texts)
-        if create_embeddings and self.embedding_api_key:
-            logger.info("Phase 5: Creating embeddings...")
-            embeddings_created = self._bulk_create_embeddings(easy_summaries, hard_summaries)
-            result.embeddings_created = embeddings_created
-
-        # Phase 7: Bulk mark articles as completed
-        if all_article_ids:
-            logger.info(f"Phase 6: Marking {len(all_article_ids)} articles as completed...")
-            self._bulk_mark_completed(all_article_ids)
-
-        result.articles_processed = len(all_article_ids)
-        logger.info(f"Batch processing complete: {result.articles_processed} articles processed")
+        result.articles_processed = len(processed_articles)
+        logger.info(
+            "Batch processing complete: %d articles processed in %d windows",
+            result.articles_processed,
+            stats.windows_committed,
+        )
 
         return result
 
+    def _collect_record(
+        self,
+        record: Dict[str, Any],
+        easy_summaries: Dict[str, str],
+        hard_summaries: Dict[str, List[Dict[str, Any]]],
+        seen_articles: set[str],
+        result: SummaryBatchResult,
+    ) -> None:
+        """Parse one output line into the window's easy/hard summary maps."""
+
+        custom_id = record.get("custom_id", "")
+        error = record.get("error")
+        response = record.get("response") or {}
+
+        if error:
+            msg = f"Batch request {custom_id} failed: {error}"
+            logger.error(msg)
+            result.errors.append(msg)
+            if not self.continue_on_error:
+                raise RuntimeError(msg)
+            return
+
+        if response.get("status_code") != 200:
+            msg = f"Non-200 response for {custom_id}: {response}"
+            logger.error(msg)
+            result.errors.append(msg)
+            if not self.continue_on_error:
+                raise RuntimeError(msg)
+            return
+
+        body = response.get("body") or {}
+        output_text = self._extract_output_text(body)
+
+        if not output_text:
+            logger.warning("No output text for %s", custom_id)
+            return
+
+        summary = self._parse_summary(output_text)
+        if not summary:
+            logger.warning("Failed to parse summary for %s", custom_id)
+            result.articles_skipped_no_data += 1
+            return
+
+        # Parse custom_id to determine type and article
+        parsed = self._parse_custom_id(custom_id)
+        if not parsed:
+            logger.warning("Failed to parse custom_id: %s", custom_id)
+            return
+
+        news_url_id = parsed["news_url_id"]
+        seen_articles.add(news_url_id)
+
+        if parsed["type"] == "easy":
+            easy_summaries[news_url_id] = summary
+        else:
+            if news_url_id not in hard_summaries:
+                hard_summaries[news_url_id] = []
+            hard_summaries[news_url_id].append({
+                "topic": parsed.get("topic", "general"),
+                "scope_type": parsed.get("scope_type"),
+                "scope_id": parsed.get("scope_id"),
+                "scope_label": parsed.get("scope_label"),
+                "summary": summary,
+            })
+
+    def _record_article_id(self, record: Dict[str, Any]) -> Optional[str]:
+        """Window key for an output line: the article it belongs to."""
+
+        parsed = self._parse_custom_id(record.get("custom_id") or "")
+        return parsed["news_url_id"] if parsed else None
+
+    def _filter_window_existing(
+        self,
+        window: IngestWindow,
+        easy_summaries: Dict[str, str],
+        hard_summaries: Dict[str, List[Dict]],
+        skipped_articles: set[str],
+        result: SummaryBatchResult,
+    ) -> tuple[Dict[str, str], Dict[str, List[Dict]]]:
+        """Apply ``skip_existing`` to the articles first seen in *window*.
+
+        In a ``replayed`` window (see :mod:`src.shared.batch.stream_ingest`) an
+        article with summaries but no ``summary_created_at`` was inserted by
+        the failed run before its embeddings and completion mark; it is
+        written again from the window instead of being skipped.
+        """
+
+        easy_new = {k: v for k, v in easy_summaries.items() if not window.is_continuation(k)}
+        hard_new = {k: v for k, v in hard_summaries.items() if not window.is_continuation(k)}
+        kept_easy, kept_hard, skipped = self._filter_existing(easy_new, hard_new)
+        if window.replayed and skipped:
+            dropped = (easy_new.keys() | hard_new.keys()) - kept_easy.keys() - kept_hard.keys()
+            unfinished = self._fetch_unfinished(sorted(dropped))
+            if unfinished:
+                logger.info(
+                    "Finishing %d articles written before the previous run stopped",
+                    len(unfinished),
+                )
+            kept_easy.update((k, v) for k, v in easy_new.items() if k in unfinished)
+            kept_hard.update((k, v) for k, v in hard_new.items() if k in unfinished)
+            skipped -= len(unfinished)
+            result.articles_resumed += len(unfinished)
+        result.articles_skipped_existing += skipped
+        skipped_articles.update(easy_new.keys() - kept_easy.keys())
+        skipped_articles.update(hard_new.keys() - kept_hard.keys())
+
+        def keep(news_url_id: str, kept: Dict[str, Any]) -> bool:
+            if window.is_continuation(news_url_id):
+                return news_url_id not in skipped_articles
+            return news_url_id in kept
+
+        return (
+            {k: v for k, v in easy_summaries.items() if keep(k, kept_easy)},
+            {k: v for k, v in hard_summaries.items() if keep(k, kept_hard)},
+        )
+
     def _filter_existing(
         self,
         easy_summaries: Dict[str, str],
@@ -241,6 +332,22 @@ class SummaryBatchResultProcessor:
         
         return filtered_easy, filtered_hard, skipped
 
+    def _fetch_unfinished(self, article_ids: List[str]) -> set[str]:
+        """Return the articles not yet marked with ``summary_created_at``."""
+
+        unfinished: set[str] = set()
+        for i in range(0, len(article_ids), self.chunk_size):
+            chunk = article_ids[i:i + self.chunk_size]
+            response = (
+                self.client.table("news_urls")
+                .select("id")
+                .in_("id", chunk)
+                .is_("summary_created_at", "null")
+                .execute()
+            )
+            unfinished.update(row["id"] for row in getattr(response, "data", []) or [])
+        return unfinished
+
     def _bulk_clear_existing(self, article_ids: List[str]) -> None:
         """Bulk delete existing summaries and embeddings for articles."""
         
@@ -23,6 +23,10 @@ setup_logging(level=os.getenv("LOG_LEVEL", "INFO"))
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on "max_workers" so one request can't fan out an unbounded
+# number of concurrent Gemini calls.
+MAX_WORKERS = 8
+
 
 @functions_framework.http
 def summarize_content(request: Request) -> tuple[Any, int]:
@@ -35,6 +39,7 @@ def summarize_content(request: Request) -> tuple[Any, int]:
     - url_ids (list[str], optional): Specific URL IDs to process
     - model (str, optional): Gemini model to use
     - enable_grounding (bool, optional): Enable Google Search grounding
+    - max_workers (int, optional): URLs summarized concurrently (default: 1, max: MAX_WORKERS)
 
     Returns:
         JSON response with processing statistics
@@ -65,10 +70,18 @@ def summarize_content(request: Request) -> tuple[Any, int]:
         )
         enable_grounding = request_json.get("enable_grounding", False)
 
+        try:
+            max_workers = int(request_json.get("max_workers") or 1)
+        except (TypeError, ValueError):
+            return jsonify({"error": "max_workers must be an integer"}), 400
+        if max_workers < 1:
+            return jsonify({"error": "max_workers must be at least 1"}), 400
+        max_workers = min(max_workers, MAX_WORKERS)
+
         logger.info(
             f"Received summarization request: limit={limit}, "
             f"publisher={publisher}, url_ids={url_ids}, "
-            f"model={model}, grounding={enable_grounding}"
+            f"model={model}, grounding={enable_grounding}, workers={max_workers}"
         )
 
         # Validate environment
@@ -92,6 +105,7 @@ def summarize_content(request: Request) -> tuple[Any, int]:
             url_reader=url_reader,
             summary_writer=summary_writer,
             continue_on_error=True,
+            max_workers=max_workers,
         )
 
         # Process based on request parameters
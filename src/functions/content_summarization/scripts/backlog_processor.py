@@ -8,9 +8,11 @@ Features:
 - Concurrent processing with ThreadPoolExecutor (15 workers default)
 - Adaptive memory monitoring with automatic worker scaling
 - Per-stage checkpoint system with resume support
-- Rate limiting with exponential backoff (30 req/min for Gemini)
+- Optional streaming stage graph (--streaming) that hands each article to the next stage
+  as soon as the previous one commits, with a bounded queue and worker pool per stage
+- Host-wide adaptive rate limiting shared with other pipeline processes (30 req/min for Gemini)
 - Lazy-initialized browser pool (max 5 Playwright instances)
-- Batch embedding generation (100 texts per API call)
+- Batch embedding generation (texts from all workers coalesced into up to 512-input API calls)
 - Bulk database operations
 - Comprehensive progress tracking and failure recovery
 """
@@ -41,9 +43,12 @@ import requests
 # Ensure repository root is importable when executing from the scripts directory
 sys.path.insert(0, str(Path(__file__).resolve().parents[4]))
 
+from src.functions.content_summarization.core.embedding_batcher import get_embedding_batcher
+from src.shared.batch.checkpoint import CheckpointManager as SharedCheckpointManager
 from src.shared.db import get_supabase_client
 from src.shared.utils.env import load_env
 from src.shared.utils.logging import setup_logging
+from src.shared.utils.rate_limiter import AdaptiveRateLimiter, get_rate_limiter, provider_for_model
 from src.shared.extractors.extractor_factory import (
     get_extractor,
 )
@@ -138,61 +143,6 @@ def build_config(env: Dict[str, str], *, fact_llm_override: Optional[str] = None
     )
 
 
-class RateLimiter:
-    """Simple sliding-window rate limiter with backoff tracking."""
-
-    def __init__(self, rate_per_minute: int):
-        self.rate_per_minute = rate_per_minute
-        self._lock = threading.Lock()
-        self._request_times: deque[float] = deque()
-        self._rate_limit_hits = 0
-        self._total_requests = 0
-
-    def acquire(self) -> None:
-        """Block until a slot within the per-minute window is available."""
-        wait_time = 0.0
-        with self._lock:
-            now = time.time()
-            window = 60.0
-            while self._request_times and now - self._request_times[0] >= window:
-                self._request_times.popleft()
-
-            if len(self._request_times) >= self.rate_per_minute:
-                wait_time = window - (now - self._request_times[0])
-
-        if wait_time > 0:
-            time.sleep(wait_time)
-
-        with self._lock:
-            self._request_times.append(time.time())
-            self._total_requests += 1
-
-    def handle_429(self, attempt: int) -> float:
-        """Record a rate-limit response and return exponential backoff delay."""
-        with self._lock:
-            self._rate_limit_hits += 1
-        return min(30.0, 2 ** attempt)
-
-    def get_stats(self) -> Dict[str, Any]:
-        with self._lock:
-            window = 60.0
-            now = time.time()
-            while self._request_times and now - self._request_times[0] >= window:
-                self._request_times.popleft()
-
-            return {
-                "rate_per_minute": self.rate_per_minute,
-                "requests_in_window": len(self._request_times),
-                "total_requests": self._total_requests,
-                "rate_limit_hits": self._rate_limit_hits,
-                "hit_rate": (
-                    (self._rate_limit_hits / self._total_requests * 100)
-                    if self._total_requests
-                    else 0.0
-                ),
-            }
-
-
 class MemoryMonitor(threading.Thread):
     """Watches system memory usage and trims browser pool under pressure."""
 
@@ -364,10 +314,9 @@ class BrowserPool:
 # CHECKPOINT MANAGER WITH PER-STAGE TRACKING
 # ============================================================================
 
-class CheckpointManager:
-    """Manages per-article, per-stage checkpoint with atomic writes and validation."""
+class CheckpointManager(SharedCheckpointManager):
+    """Journaled per-article, per-stage checkpoint with database-backed validation."""
     
-    CHECKPOINT_VERSION = "1.0"
     STAGES = ["content", "facts", "knowledge", "summary"]
     
     def __init__(self, filepath: str):
@@ -376,91 +325,7 @@ class CheckpointManager:
         Args:
             filepath: Path to checkpoint JSON file
         """
-        self.filepath = Path(filepath)
-        self.data: Dict[str, Any] = {
-            "version": self.CHECKPOINT_VERSION,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "last_updated": datetime.now(timezone.utc).isoformat(),
-            "articles": {}
-        }
-        self.lock = threading.Lock()
-        self._load()
-    
-    def _load(self) -> None:
-        """Load checkpoint from file if exists."""
-        if self.filepath.exists():
-            try:
-                with open(self.filepath, 'r') as f:
-                    loaded = json.load(f)
-                    if loaded.get("version") == self.CHECKPOINT_VERSION:
-                        self.data = loaded
-                        logger.info(f"Loaded checkpoint from {self.filepath}", {
-                            "articles": len(self.data.get("articles", {})),
-                            "created_at": self.data.get("created_at"),
-                        })
-                    else:
-                        logger.warning(f"Checkpoint version mismatch, starting fresh")
-            except Exception as e:
-                logger.error(f"Failed to load checkpoint: {e}")
-    
-    def is_stage_complete(self, article_id: str, stage: str) -> bool:
-        """Check if a stage is complete for an article.
-        
-        Args:
-            article_id: Article ID
-            stage: Stage name
-            
-        Returns:
-            True if stage is complete
-        """
-        with self.lock:
-            article = self.data["articles"].get(article_id, {})
-            return article.get(stage) is not None
-    
-    def mark_stage_complete(self, article_id: str, stage: str) -> None:
-        """Mark a stage as complete for an article.
-        
-        Args:
-            article_id: Article ID
-            stage: Stage name
-        """
-        with self.lock:
-            if article_id not in self.data["articles"]:
-                self.data["articles"][article_id] = {s: None for s in self.STAGES}
-            
-            self.data["articles"][article_id][stage] = datetime.now(timezone.utc).isoformat()
-            self.data["last_updated"] = datetime.now(timezone.utc).isoformat()
-    
-    def get_incomplete_articles(self, stage: str, candidate_ids: List[str]) -> List[str]:
-        """Get list of article IDs that haven't completed a stage.
-        
-        Args:
-            stage: Stage name
-            candidate_ids: List of candidate article IDs to check
-            
-        Returns:
-            List of article IDs that haven't completed the stage
-        """
-        with self.lock:
-            return [
-                article_id for article_id in candidate_ids
-                if not self.is_stage_complete(article_id, stage)
-            ]
-    
-    def flush(self) -> None:
-        """Atomically write checkpoint to disk."""
-        with self.lock:
-            try:
-                # Write to temp file first
-                temp_path = self.filepath.with_suffix('.tmp')
-                with open(temp_path, 'w') as f:
-                    json.dump(self.data, f, indent=2)
-                
-                # Atomic rename
-                temp_path.replace(self.filepath)
-                logger.debug(f"Checkpoint flushed to {self.filepath}")
-            except Exception as e:
-                logger.error(f"Failed to flush checkpoint: {e}")
+        super().__init__(filepath, stages=self.STAGES)
     
     def validate_integrity(self, client, sample_rate: float = 0.1) -> dict:
         """Validate checkpoint integrity by sampling database.
@@ -521,31 +386,6 @@ class CheckpointManager:
             "invalid": invalid,
             "valid_rate": valid_rate,
         }
-    
-    def archive(self, timestamp: str) -> Path:
-        """Create timestamped backup of checkpoint.
-        
-        Args:
-            timestamp: Timestamp string for archive filename
-            
-        Returns:
-            Path to archive file
-        """
-        if not self.filepath.exists():
-            return None
-        
-        archive_path = self.filepath.with_name(
-            f"{self.filepath.stem}_{timestamp}{self.filepath.suffix}"
-        )
-        
-        try:
-            import shutil
-            shutil.copy2(self.filepath, archive_path)
-            logger.info(f"Checkpoint archived to {archive_path}")
-            return archive_path
-        except Exception as e:
-            logger.error(f"Failed to archive checkpoint: {e}")
-            return None
 
 
 # ============================================================================
@@ -599,7 +439,7 @@ class ProgressTracker:
     def log_progress(
         self,
         memory_monitor: MemoryMonitor,
-        rate_limiter: RateLimiter,
+        rate_limiter: AdaptiveRateLimiter,
         browser_pool: BrowserPool
     ) -> None:
         """Log current progress with all metrics.
@@ -1092,90 +932,29 @@ def ping_keepalive(
 def generate_embeddings_batch(
     texts: List[str],
     config: PipelineConfig,
-    rate_limiter: Optional[RateLimiter] = None
+    rate_limiter: Optional[AdaptiveRateLimiter] = None
 ) -> List[List[float]]:
-    """Generate embeddings for multiple texts in batches.
+    """Generate embeddings for multiple texts through the shared micro-batcher.
+    
+    Texts from all worker threads are coalesced into large multi-input requests
+    (see ``core/embedding_batcher.py``), so concurrent articles share API calls
+    and rate-limit slots instead of each sending a small request.
     
     Args:
         texts: List of text strings to embed
         config: Pipeline configuration
-        rate_limiter: Optional rate limiter
+        rate_limiter: Optional limiter replacing the shared one for the embedding model
         
     Returns:
-        List of embedding vectors in same order as input texts
+        List of embedding vectors in same order as input texts ([] on failure)
     """
     if not texts:
         return []
     
-    BATCH_SIZE = 100  # OpenAI supports up to 2048, but 100 is safer
-    MAX_RETRIES = 3
-    
-    all_embeddings = []
-    
-    # Process in batches
-    for i in range(0, len(texts), BATCH_SIZE):
-        batch = texts[i:i + BATCH_SIZE]
-        
-        # Retry logic for this batch
-        for attempt in range(MAX_RETRIES):
-            try:
-                if rate_limiter:
-                    rate_limiter.acquire()
-                
-                headers = {
-                    "Authorization": f"Bearer {config.embedding_api_key}",
-                    "Content-Type": "application/json",
-                }
-                payload = {
-                    "model": config.embedding_model_name,
-                    "input": batch,
-                }
-                
-                response = requests.post(
-                    config.embedding_api_url,
-                    headers=headers,
-                    json=payload,
-                    timeout=config.embedding_timeout_seconds,
-                )
-                
-                if response.status_code == 429 and rate_limiter:
-                    delay = rate_limiter.handle_429(attempt)
-                    logger.info(f"⏳ Rate limit backoff: Sleeping for {delay}s...")
-                    time.sleep(delay)
-                    continue
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                # Extract embeddings in order
-                batch_embeddings = []
-                for item in data["data"]:
-                    embedding = item["embedding"]
-                    if isinstance(embedding, list):
-                        batch_embeddings.append(embedding)
-                
-                if len(batch_embeddings) != len(batch):
-                    logger.error(
-                        f"Embedding count mismatch: expected {len(batch)}, got {len(batch_embeddings)}"
-                    )
-                    # Return empty vectors for failed batch
-                    batch_embeddings = [[] for _ in batch]
-                
-                all_embeddings.extend(batch_embeddings)
-                logger.debug(f"Generated {len(batch_embeddings)} embeddings (batch {i // BATCH_SIZE + 1})")
-                break
-                
-            except Exception as e:
-                logger.warning(f"Embedding batch failed (attempt {attempt + 1}/{MAX_RETRIES}): {e}")
-                if attempt == MAX_RETRIES - 1:
-                    # Return empty vectors for failed batch
-                    all_embeddings.extend([[] for _ in batch])
-                else:
-                    sleep_time = 2 ** attempt
-                    logger.info(f"⏳ Retrying embedding batch in {sleep_time}s...")
-                    time.sleep(sleep_time)
-    
-    return all_embeddings
+    batcher = get_embedding_batcher(config, rate_limiter)
+    embeddings = batcher.embed(texts)
+    logger.debug(f"Generated {sum(1 for e in embeddings if e)}/{len(texts)} embeddings via micro-batcher")
+    return embeddings
 
 
 # ============================================================================
@@ -1402,7 +1181,7 @@ def process_article_facts_stage(
     config: PipelineConfig,
     checkpoint: CheckpointManager,
     browser_pool: BrowserPool,
-    rate_limiter: RateLimiter,
+    rate_limiter: AdaptiveRateLimiter,
     failure_tracker: FailureTracker,
     ping_handle: Optional[TaskPingHandle] = None,
 ) -> bool:
@@ -1472,10 +1251,8 @@ def process_article_facts_stage(
         checkpoint.mark_stage_complete(url_id, "content")
         send_ping(ping_handle, "facts: content extracted")
         
-        # Extract facts
+        # Extract facts (call_llm_json waits on the shared limiter for the fact model)
         logger.debug(f"[{url_id}] Extracting facts with LLM (acquiring rate limit)...")
-        send_ping(ping_handle, "facts: waiting for LLM slot")
-        rate_limiter.acquire()
         with ping_keepalive(ping_handle, "facts: extracting facts"):
             facts = extract_facts(article_text, config)
         if not facts:
@@ -1552,7 +1329,7 @@ def process_article_facts_stage(
                 # Batch generate embeddings
                 texts = [row.get("fact_text", "") for row in fact_rows]
                 with ping_keepalive(ping_handle, "facts: generating embeddings"):
-                    embeddings = generate_embeddings_batch(texts, config, rate_limiter)
+                    embeddings = generate_embeddings_batch(texts, config)
                 
                 logger.debug(f"[{url_id}] Generated {len(embeddings)} embeddings, storing...")
                 # Prepare embedding records
@@ -1714,7 +1491,7 @@ def process_article_knowledge_stage(
     client,
     config: PipelineConfig,
     checkpoint: CheckpointManager,
-    rate_limiter: RateLimiter,
+    rate_limiter: AdaptiveRateLimiter,
     failure_tracker: FailureTracker,
     ping_handle: Optional[TaskPingHandle] = None,
 ) -> bool:
@@ -1844,7 +1621,7 @@ def process_article_summary_stage(
     client,
     config: PipelineConfig,
     checkpoint: CheckpointManager,
-    rate_limiter: RateLimiter,
+    rate_limiter: AdaptiveRateLimiter,
     failure_tracker: FailureTracker,
     ping_handle: Optional[TaskPingHandle] = None,
 ) -> bool:
@@ -1982,7 +1759,7 @@ def process_batch_concurrent(
     config: PipelineConfig,
     checkpoint: CheckpointManager,
     browser_pool: BrowserPool,
-    rate_limiter: RateLimiter,
+    rate_limiter: AdaptiveRateLimiter,
     memory_monitor: MemoryMonitor,
     progress_tracker: ProgressTracker,
     failure_tracker: FailureTracker,
@@ -2175,6 +1952,302 @@ def process_batch_concurrent(
         logger.info("Thread pool shutdown initiated")
 
 
+# ============================================================================
+# STREAMING STAGE GRAPH
+# ============================================================================
+
+STREAMING_STAGES = ("facts", "knowledge", "summary")
+
+
+class _StreamStage:
+    """Bounded queue and worker pool for one stage of the streaming graph."""
+
+    def __init__(self, name: str, handler: Callable[[dict, TaskPingHandle], bool], workers: int, queue_size: int):
+        self.name = name
+        self.handler = handler
+        self.queue: "Queue[Optional[dict]]" = Queue(maxsize=max(1, queue_size))
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"stream-{name}")
+        self.slots = threading.Semaphore(workers)
+        self.progress = ProgressTracker(0, name)
+        self.enqueued: Set[str] = set()
+        self.lock = threading.Lock()
+
+
+class StreamingStageGraph:
+    """Runs facts -> knowledge -> summary as a pipeline instead of stage-by-stage passes.
+
+    Each stage owns a bounded queue and a worker pool. An article is handed to the
+    next stage as soon as its current stage returns successfully, so knowledge and
+    summary work starts while facts extraction is still draining the backlog. A
+    full downstream queue blocks the upstream worker that is forwarding into it,
+    which keeps memory bounded when a later stage is slower.
+
+    Stage handlers, the checkpoint and the failure tracker are the same ones used
+    by :func:`process_batch_concurrent`; stalled tasks are detected through the
+    shared :class:`TaskPingManager` and registered as failures in the same way.
+    """
+
+    HEARTBEAT_INTERVAL = 30
+    FLUSH_EVERY = 10
+
+    def __init__(
+        self,
+        client,
+        config: PipelineConfig,
+        checkpoint: CheckpointManager,
+        browser_pool: BrowserPool,
+        rate_limiter: AdaptiveRateLimiter,
+        memory_monitor: MemoryMonitor,
+        failure_tracker: FailureTracker,
+        ping_manager: TaskPingManager,
+        *,
+        workers: int,
+        queue_size: int,
+    ):
+        self.client = client
+        self.config = config
+        self.checkpoint = checkpoint
+        self.browser_pool = browser_pool
+        self.rate_limiter = rate_limiter
+        self.memory_monitor = memory_monitor
+        self.failure_tracker = failure_tracker
+        self.ping_manager = ping_manager
+
+        handlers: Dict[str, Callable[[dict, TaskPingHandle], bool]] = {
+            "facts": lambda item, ping: process_article_facts_stage(
+                item, client, config, checkpoint, browser_pool, rate_limiter, failure_tracker, ping
+            ),
+            "knowledge": lambda item, ping: process_article_knowledge_stage(
+                item, client, config, checkpoint, rate_limiter, failure_tracker, ping
+            ),
+            "summary": lambda item, ping: process_article_summary_stage(
+                item, client, config, checkpoint, rate_limiter, failure_tracker, ping
+            ),
+        }
+        self.stages = [_StreamStage(name, handlers[name], workers, queue_size) for name in STREAMING_STAGES]
+        self._next = {stage.name: nxt for stage, nxt in zip(self.stages, list(self.stages[1:]) + [None])}
+
+        self._outstanding = 0
+        self._outstanding_cond = threading.Condition()
+        self._futures: Dict[Any, Tuple[_StreamStage, dict]] = {}
+        self._settled: Set[Any] = set()
+        self._futures_lock = threading.Lock()
+        self._completed = 0
+        self._latencies: List[float] = []
+        self._stop = threading.Event()
+
+    # -- admission -----------------------------------------------------------
+
+    def offer(self, stage: _StreamStage, item: dict) -> bool:
+        """Queue *item* for *stage*, blocking while the stage queue is full."""
+        raw_id = item.get("id")
+        if not raw_id:
+            return False
+        article_id = str(raw_id)
+        if self.failure_tracker.is_skipped(stage.name, article_id):
+            return False
+        with stage.lock:
+            if article_id in stage.enqueued:
+                return False
+            stage.enqueued.add(article_id)
+        with stage.progress.lock:
+            stage.progress.total_articles += 1
+        with self._outstanding_cond:
+            self._outstanding += 1
+        stage.queue.put({
+            "id": article_id,
+            "url": item.get("url"),
+            "admitted_at": item.get("admitted_at") or time.time(),
+        })
+        return True
+
+    def feed(self, stage: _StreamStage, pending_cache: PendingUrlCache, batch_size: int, limit: Optional[int]) -> int:
+        """Admit pending URLs for *stage* until the cache is depleted or *limit* is reached."""
+        admitted = 0
+
+        def _should_skip(item: dict) -> bool:
+            article_id = str(item.get("id") or "")
+            if not article_id or self.failure_tracker.is_skipped(stage.name, article_id):
+                return True
+            return self.checkpoint.is_stage_complete(article_id, stage.name)
+
+        while not self._stop.is_set():
+            remaining = limit - admitted if limit else None
+            batch = pending_cache.next_batch(batch_size, limit_remaining=remaining, skip_predicate=_should_skip)
+            if not batch:
+                break
+            for item in batch:
+                if self.offer(stage, item):
+                    admitted += 1
+        logger.info(f"Streaming feeder admitted {admitted} articles from the {stage.name} backlog")
+        return admitted
+
+    # -- execution -----------------------------------------------------------
+
+    def _dispatch(self, stage: _StreamStage) -> None:
+        while True:
+            item = stage.queue.get()
+            if item is None:
+                return
+            stage.slots.acquire()
+            article_id = item["id"]
+            ping_handle = self.ping_manager.create_handle(stage.name, article_id, item.get("url") or "")
+            try:
+                future = stage.executor.submit(stage.handler, item, ping_handle)
+            except RuntimeError:
+                # Executor shut down during interruption.
+                stage.slots.release()
+                self._finish()
+                return
+            with self._futures_lock:
+                self._futures[future] = (stage, item)
+            self.ping_manager.track(future, ping_handle)
+            future.add_done_callback(self._on_done)
+
+    def _claim(self, future) -> Optional[Tuple[_StreamStage, dict]]:
+        with self._futures_lock:
+            if future in self._settled:
+                return None
+            self._settled.add(future)
+            return self._futures.pop(future, None)
+
+    def _on_done(self, future) -> None:
+        claimed = self._claim(future)
+        if claimed is None:
+            return
+        stage, item = claimed
+        self.ping_manager.release(future)
+        try:
+            success = bool(future.result())
+        except Exception as e:
+            logger.error(f"Future failed for {item.get('id')} ({stage.name}): {e}")
+            success = False
+        try:
+            stage.progress.increment(success=success)
+            nxt = self._next[stage.name]
+            if success and nxt is not None and not self._stop.is_set():
+                # Blocks while the downstream queue is full (backpressure).
+                self.offer(nxt, item)
+            elif success and nxt is None:
+                with self._futures_lock:
+                    self._latencies.append(time.time() - item["admitted_at"])
+            self._after_completion(stage)
+        finally:
+            stage.slots.release()
+            self._finish()
+
+    def _expire(self, future, handle: TaskPingHandle) -> None:
+        claimed = self._claim(future)
+        if claimed is None:
+            return
+        stage, item = claimed
+        article_id = handle.article_id
+        logger.error(
+            f"[{article_id}] {stage.name} stalled — no ping for {self.ping_manager.timeout_seconds}s. Skipping this article."
+        )
+        register_stage_failure(
+            stage.name,
+            article_id,
+            handle.article_url or item.get("url", ""),
+            f"Ping timeout ({self.ping_manager.timeout_seconds}s without heartbeat)",
+            self.failure_tracker,
+        )
+        self.failure_tracker.mark_skipped(stage.name, article_id)
+        self.ping_manager.release(future)
+        future.cancel()
+        stage.progress.increment(success=False)
+        stage.slots.release()
+        self._finish()
+
+    def _after_completion(self, stage: _StreamStage) -> None:
+        with self._futures_lock:
+            self._completed += 1
+            flush = self._completed % self.FLUSH_EVERY == 0
+        if flush:
+            self.checkpoint.flush()
+        if stage.progress.should_log(interval=10):
+            stage.progress.log_progress(self.memory_monitor, self.rate_limiter, self.browser_pool)
+
+    def _finish(self) -> None:
+        with self._outstanding_cond:
+            self._outstanding -= 1
+            self._outstanding_cond.notify_all()
+
+    # -- driver --------------------------------------------------------------
+
+    def run(self, *, batch_size: int, prefetch_size: int, limit: Optional[int]) -> None:
+        dispatchers = [
+            threading.Thread(target=self._dispatch, args=(stage,), name=f"stream-dispatch-{stage.name}", daemon=True)
+            for stage in self.stages
+        ]
+        for thread in dispatchers:
+            thread.start()
+
+        feeder_done = threading.Event()
+
+        def _feed_all() -> None:
+            try:
+                # Facts first so fresh articles start flowing immediately; then
+                # backfill articles that stopped mid-pipeline in earlier runs.
+                for stage in self.stages:
+                    fetch_window = prefetch_size if prefetch_size > 0 else (limit or batch_size * 5)
+                    fetch_window = min(max(batch_size, fetch_window), MAX_EDGE_FETCH_LIMIT)
+                    self.feed(stage, PendingUrlCache(stage.name, self.config, fetch_window), batch_size, limit)
+            except Exception as e:
+                logger.error(f"Streaming feeder failed: {e}", exc_info=True)
+            finally:
+                feeder_done.set()
+                with self._outstanding_cond:
+                    self._outstanding_cond.notify_all()
+
+        feeder = threading.Thread(target=_feed_all, name="stream-feeder", daemon=True)
+        feeder.start()
+
+        last_heartbeat = time.time()
+        try:
+            while True:
+                for future, handle in self.ping_manager.collect_timeouts():
+                    self._expire(future, handle)
+
+                with self._outstanding_cond:
+                    if feeder_done.is_set() and self._outstanding == 0:
+                        break
+                    self._outstanding_cond.wait(timeout=1.0)
+
+                if time.time() - last_heartbeat >= self.HEARTBEAT_INTERVAL:
+                    last_heartbeat = time.time()
+                    logger.info(
+                        "⏳ Streaming heartbeat: "
+                        + ", ".join(
+                            f"{stage.name} {stage.progress.processed_count}/{stage.progress.total_articles} "
+                            f"(queued {stage.queue.qsize()})"
+                            for stage in self.stages
+                        )
+                    )
+        except KeyboardInterrupt:
+            logger.info("KeyboardInterrupt in streaming pipeline, cancelling queued work...")
+            self._stop.set()
+            raise
+        finally:
+            self._stop.set()
+            for stage in self.stages:
+                stage.executor.shutdown(wait=False, cancel_futures=True)
+                try:
+                    stage.queue.put_nowait(None)
+                except Exception:
+                    pass
+            self.checkpoint.flush()
+            for stage in self.stages:
+                stage.progress.log_summary(self.memory_monitor)
+            if self._latencies:
+                ordered = sorted(self._latencies)
+                logger.info(
+                    f"Streaming end-to-end latency: {len(ordered)} articles, "
+                    f"median {ordered[len(ordered) // 2]:.1f}s, "
+                    f"p95 {ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]:.1f}s"
+                )
+
+
 def run_backlog_processor(args) -> None:
     """Main backlog processor entry point.
     
@@ -2194,6 +2267,7 @@ def run_backlog_processor(args) -> None:
         "max_browsers": args.max_browsers,
         "resume": args.resume,
         "retry_failures": args.retry_failures,
+        "streaming": args.streaming,
     })
     
     # Build config
@@ -2211,7 +2285,13 @@ def run_backlog_processor(args) -> None:
     # Initialize components
     client = get_supabase_client()
     checkpoint = CheckpointManager(args.checkpoint_file)
-    rate_limiter = RateLimiter(rate_per_minute=30)  # Gemini limit
+    # Shared with every process on this host calling the same model; the
+    # embedding batcher keeps its own limiter keyed by the embedding model.
+    rate_limiter = get_rate_limiter(
+        provider_for_model(config.fact_llm_model),
+        config.fact_llm_model,
+        requests_per_minute=30,  # Gemini limit
+    )
     browser_pool = BrowserPool(max_browsers=args.max_browsers)
     memory_monitor = MemoryMonitor(
         max_percent=args.max_memory_percent,
@@ -2226,7 +2306,7 @@ def run_backlog_processor(args) -> None:
     
     try:
         # Validate checkpoint if resuming
-        if args.resume and Path(args.checkpoint_file).exists():
+        if args.resume and checkpoint.exists():
             logger.info("Resuming from checkpoint...")
             validation = checkpoint.validate_integrity(client, sample_rate=0.1)
             logger.info(
@@ -2276,6 +2356,23 @@ def run_backlog_processor(args) -> None:
         
         # Normal processing mode
         stages = ["content", "facts", "knowledge", "summary"] if args.stage == "full" else [args.stage]
+
+        if args.streaming:
+            if args.stage != "full":
+                logger.warning("--streaming only applies to --stage full; running stage-by-stage")
+            else:
+                logger.info(
+                    "Streaming stage graph enabled",
+                    {"workers_per_stage": args.workers, "queue_size": args.stage_queue_size or args.workers * 2},
+                )
+                graph = StreamingStageGraph(
+                    client, config, checkpoint, browser_pool, rate_limiter, memory_monitor,
+                    failure_tracker, ping_manager,
+                    workers=args.workers,
+                    queue_size=args.stage_queue_size or args.workers * 2,
+                )
+                graph.run(batch_size=args.batch_size, prefetch_size=args.prefetch_size, limit=args.limit)
+                stages = []
         
         for stage in stages:
             logger.info(f"Processing stage: {stage}")
@@ -2365,6 +2462,7 @@ def run_backlog_processor(args) -> None:
         try:
             rate_stats = rate_limiter.get_stats()
             logger.info(f"Rate limiter stats: {rate_stats}")
+            logger.info(f"Embedding batcher stats: {get_embedding_batcher(config).get_stats()}")
         except Exception as e:
             logger.warning(f"Could not get rate limiter stats: {e}")
         
@@ -2375,6 +2473,8 @@ def run_backlog_processor(args) -> None:
         # Log final summary
         failure_summary = failure_tracker.get_summary()
         logger.info(f"Processing complete. Failures by stage: {failure_summary}")
+        # os._exit below skips the finally block, so fold the journal in here.
+        checkpoint.close()
         logger.info(f"Checkpoint saved to: {args.checkpoint_file}")
         logger.info(f"Failures saved to: {failures_path}")
         
@@ -2423,6 +2523,12 @@ def run_backlog_processor(args) -> None:
         try:
             logger.info("Starting cleanup...")
             
+            # Fold the journal into the snapshot
+            try:
+                checkpoint.close()
+            except Exception as e:
+                logger.warning(f"Error closing checkpoint: {e}")
+            
             # Stop memory monitor
             try:
                 memory_monitor.stop()
@@ -2532,6 +2638,22 @@ def main() -> None:
         help="Seconds without a task ping before declaring it stalled (default: 90)"
     )
     
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help=(
+            "With --stage full, stream each article through facts -> knowledge -> summary "
+            "as soon as its previous stage commits instead of running whole-stage passes"
+        ),
+    )
+
+    parser.add_argument(
+        "--stage-queue-size",
+        type=int,
+        default=0,
+        help="Bounded queue size per stage in --streaming mode (default: 2 x --workers)",
+    )
+    
     parser.add_argument(
         "--resume",
         action="store_true",
@@ -48,9 +48,11 @@ import requests
 # Add project root to Python path
 sys.path.insert(0, str(Path(__file__).resolve().parents[4]))
 
+from src.functions.content_summarization.core.embedding_batcher import get_embedding_batcher
 from src.shared.db import get_supabase_client
 from src.shared.utils.env import load_env
 from src.shared.utils.logging import setup_logging
+from src.shared.utils.rate_limiter import estimate_tokens, get_rate_limiter, provider_for_model
 from src.functions.knowledge_extraction.core.pipelines.extraction_pipeline import (
     ExtractionPipeline,
 )
@@ -800,6 +802,10 @@ def call_llm_json(
             }
         }
 
+    # Host-wide limiter for this model; the backlog processor configures its limits.
+    limiter = get_rate_limiter(provider_for_model(model), model)
+    estimated_tokens = estimate_tokens(prompt) + estimate_tokens(user_content)
+    limiter.acquire(estimated_tokens)
     try:
         response = requests.post(
             url,
@@ -807,6 +813,8 @@ def call_llm_json(
             json=payload,
             timeout=config.llm_timeout_seconds,
         )
+        if response.status_code == 429:
+            limiter.record_rate_limited(headers=response.headers)
         response.raise_for_status()
     except requests.RequestException as exc:
         status = getattr(exc.response, "status_code", None) if hasattr(exc, "response") else None
@@ -820,6 +828,13 @@ def call_llm_json(
         logger.error("LLM response was not valid JSON", {"model": model})
         return {}
 
+    usage = (data.get("usage") or data.get("usageMetadata") or {}) if isinstance(data, dict) else {}
+    limiter.record_success(
+        response.headers,
+        tokens_used=usage.get("total_tokens") or usage.get("totalTokenCount"),
+        estimated_tokens=estimated_tokens,
+    )
+
     # Parse OpenAI API response format
     if isinstance(data, dict) and "choices" in data:
         try:
@@ -1179,13 +1194,15 @@ def create_fact_embeddings(client, fact_ids: Sequence[str], config: PipelineConf
             .order("id")
             .execute()
         )
-        rows = getattr(facts_response, "data", []) or []
-        for row in rows:
+        rows = [
+            row
+            for row in getattr(facts_response, "data", []) or []
+            if row.get("id") and row.get("fact_text")
+        ]
+        # One multi-input request per chunk instead of one request per fact.
+        vectors = get_embedding_batcher(config).embed([row["fact_text"] for row in rows])
+        for row, embedding in zip(rows, vectors):
             fact_id = row.get("id")
-            fact_text = row.get("fact_text", "")
-            if not fact_id or not fact_text:
-                continue
-            embedding = generate_embedding(fact_text, config)
             if not embedding:
                 logger.warning(
                     "Embedding API returned empty vector", {"news_fact_id": fact_id}
@@ -1222,67 +1239,20 @@ def create_fact_embeddings(client, fact_ids: Sequence[str], config: PipelineConf
 
 
 def generate_embedding(text: str, config: PipelineConfig) -> List[float]:
-    """Call embedding API to generate vector representation."""
-
-    headers = {
-        "Authorization": f"Bearer {config.embedding_api_key}",
-        "Content-Type": "application/json",
-    }
-    payload = {
-        "model": config.embedding_model_name,
-        "input": text,
-    }
+    """Call embedding API to generate vector representation.
 
-    try:
-        response = requests.post(
-            config.embedding_api_url,
-            headers=headers,
-            json=payload,
-            timeout=config.embedding_timeout_seconds,
-        )
-        response.raise_for_status()
-    except requests.RequestException as exc:
-        logger.error("Embedding request failed", {"error": str(exc)})
-        return []
+    Requests go through the process-wide micro-batcher, so concurrent callers
+    (e.g. backlog processor workers) share multi-input API calls.
+    """
 
-    try:
-        data = response.json()
-    except ValueError:
-        logger.error("Embedding response was not valid JSON")
+    if not text or not text.strip():
+        logger.error("Embedding requested for empty text")
         return []
 
-    # Debug log the response structure
-    logger.debug(
-        "Embedding API response",
-        {
-            "response_keys": list(data.keys()) if isinstance(data, dict) else "not_a_dict",
-            "has_data_key": "data" in data if isinstance(data, dict) else False,
-            "has_embedding_key": "embedding" in data if isinstance(data, dict) else False,
-        }
-    )
-
-    if isinstance(data, dict):
-        if "data" in data:
-            try:
-                embedding_list = list(data["data"][0]["embedding"])
-                logger.debug(
-                    "Extracted embedding from OpenAI format",
-                    {
-                        "embedding_length": len(embedding_list),
-                        "first_3_values": embedding_list[:3] if len(embedding_list) >= 3 else embedding_list,
-                    }
-                )
-                return embedding_list
-            except (KeyError, IndexError, TypeError):
-                logger.error("Unexpected embedding payload structure with 'data'")
-                return []
-        if "embedding" in data:
-            embedding = data.get("embedding")
-            if isinstance(embedding, list):
-                return [float(value) for value in embedding]
-
-    logger.error("Embedding response had unexpected format", {"payload": data})
-    return []
+    embedding = get_embedding_batcher(config).embed([text])[0]
+    if not embedding:
+        logger.error("Embedding request failed")
+    return embedding
 
 
 def create_fact_pooled_embedding(client, news_url_id: str, config: PipelineConfig) -> None:
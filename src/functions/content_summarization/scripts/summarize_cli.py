@@ -93,6 +93,20 @@ Examples:
     )
 
     # Execution options
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="URLs to summarize concurrently; requests still share the Gemini rate limit (default: 1)"
+    )
+
+    parser.add_argument(
+        "--write-batch-size",
+        type=int,
+        default=10,
+        help="Write summaries every N completions instead of at the end (default: 10)"
+    )
+
     parser.add_argument(
         "--stop-on-error",
         action="store_true",
@@ -136,6 +150,7 @@ def main():
     logger.info(f"  Dry-run: {args.dry_run}")
     logger.info(f"  Limit: {args.limit}")
     logger.info(f"  Stop on error: {args.stop_on_error}")
+    logger.info(f"  Workers: {args.workers}")
 
     if args.publisher:
         logger.info(f"  Publisher filter: {args.publisher}")
@@ -156,7 +171,10 @@ def main():
             gemini_client=llm_client,
             url_reader=reader,
             summary_writer=writer,
-            continue_on_error=not args.stop_on_error
+            continue_on_error=not args.stop_on_error,
+            max_workers=args.workers,
+            write_batch_size=args.write_batch_size,
+            keep_summaries=args.dry_run,
         )
 
         logger.info("Components initialized successfully")
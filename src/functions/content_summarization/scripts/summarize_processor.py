@@ -194,7 +194,7 @@ def run_summary_processor(args) -> None:
     
     try:
         # Validate checkpoint if resuming
-        if args.resume and Path(args.checkpoint_file).exists():
+        if args.resume and checkpoint.exists():
             logger.info("Resuming from checkpoint...")
         
         total_processed = 0
@@ -306,6 +306,7 @@ def run_summary_processor(args) -> None:
         logger.info(f"Failures saved to: {failures_path}")
         
     finally:
+        checkpoint.close()
         memory_monitor.stop()
         logger.info("Summary processor shutdown complete")
 
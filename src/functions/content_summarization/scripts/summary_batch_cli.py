@@ -212,6 +212,7 @@ def main() -> None:
         print(f"Articles in output:       {summary.get('articles_in_output', 'N/A')}")
         print(f"Articles processed:       {summary['articles_processed']}")
         print(f"Articles skipped (exist): {summary.get('articles_skipped_existing', 0)}")
+        print(f"Articles resumed:         {summary.get('articles_resumed', 0)}")
         print(f"Articles skipped (no data): {summary.get('articles_skipped_no_data', 0)}")
         print(f"Summaries written:        {summary['summaries_written']}")
         print(f"Topic summaries written:  {summary['topic_summaries_written']}")
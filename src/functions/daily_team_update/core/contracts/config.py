@@ -116,6 +116,14 @@ class PipelineConfig(BaseModel):
         description="Optional cap on URLs processed per team to limit costs",
     )
     summarization_batch_size: int = Field(default=5, ge=1, le=20)
+    parallel_post_generation: bool = Field(
+        default=True,
+        description="Run translation and image selection concurrently after article generation",
+    )
+    speculative_translation: bool = Field(
+        default=True,
+        description="Start translation while validation runs; discarded when the draft is rejected",
+    )
 
     @field_validator("image_count")
     @classmethod
@@ -89,6 +89,16 @@ def build_pipeline_config(overrides: Optional[Dict[str, object]] = None) -> Pipe
         summarisation_batch = int_from_env("PIPELINE_SUMMARIZATION_BATCH_SIZE", 5)
     else:
         summarisation_batch = int(summarisation_batch_override)
+    parallel_post_override = overrides.get("parallel_post_generation")
+    if parallel_post_override is None:
+        parallel_post_generation = bool_from_env("PIPELINE_PARALLEL_POST_GENERATION", True)
+    else:
+        parallel_post_generation = bool(parallel_post_override)
+    speculative_override = overrides.get("speculative_translation")
+    if speculative_override is None:
+        speculative_translation = bool_from_env("PIPELINE_SPECULATIVE_TRANSLATION", True)
+    else:
+        speculative_translation = bool(speculative_override)
 
     return PipelineConfig(
         run_parallel=bool(run_parallel),
@@ -100,6 +110,8 @@ def build_pipeline_config(overrides: Optional[Dict[str, object]] = None) -> Pipe
         allow_empty_urls=allow_empty,
         max_urls_per_team=max_urls,
         summarization_batch_size=summarisation_batch,
+        parallel_post_generation=parallel_post_generation,
+        speculative_translation=speculative_translation,
     )
 
 
@@ -0,0 +1,76 @@
+"""Dependency-aware fan-out for the stages that run after article generation."""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+from ..integration.service_coordinator import ServiceInvocationError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class StageRun(Generic[T]):
+    """Outcome of a single service call executed by the fan-out."""
+
+    value: Optional[T] = None
+    error: Optional[ServiceInvocationError] = None
+    duration: float = 0.0
+
+
+class PostGenerationFanOut:
+    """Runs post-generation service calls concurrently on a private worker pool.
+
+    Translation only depends on the generated article, so the processor may
+    start it speculatively while validation is still running. Image selection
+    does not depend on the translation and can run alongside it once the
+    article has been accepted. Work started for a draft that validation later
+    rejects is handed to :meth:`discard`: it is cancelled when it has not
+    started yet and its result is ignored otherwise.
+    """
+
+    def __init__(self, max_workers: int = 2) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="post-generation",
+        )
+
+    def submit(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[StageRun[T]]":
+        """Schedule *func* and return a future resolving to its :class:`StageRun`.
+
+        ``ServiceInvocationError`` is captured on the run so callers can report
+        it like a synchronous failure; any other exception propagates from
+        ``Future.result()``.
+        """
+
+        def _run() -> StageRun[T]:
+            start = time.perf_counter()
+            try:
+                value = func(*args, **kwargs)
+            except ServiceInvocationError as exc:
+                return StageRun(error=exc, duration=time.perf_counter() - start)
+            return StageRun(value=value, duration=time.perf_counter() - start)
+
+        return self._executor.submit(_run)
+
+    @staticmethod
+    def discard(future: Optional[Future]) -> None:
+        """Drop speculative work whose input is no longer valid."""
+
+        if future is None or future.done():
+            return
+        if future.cancel():
+            logger.debug("Cancelled speculative post-generation call before it started")
+        else:
+            logger.debug("Discarding result of in-flight speculative post-generation call")
+
+    def close(self) -> None:
+        """Release the worker pool without waiting on discarded work."""
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future
 from dataclasses import asdict
 import logging
 import time
@@ -23,6 +24,7 @@ from ..integration.service_coordinator import (
 from ..integration.supabase_client import SupabaseClient
 from ..monitoring.error_handler import ErrorHandler
 from ..monitoring.metrics_collector import MetricsCollector
+from .post_generation import PostGenerationFanOut
 
 logger = logging.getLogger(__name__)
 
@@ -204,120 +206,140 @@ class TeamProcessor:
             finally:
                 result.add_stage_duration("article_generation", time.perf_counter() - stage_start)
             
-            # Stage 5: Article Validation
-            review_reasons: List[str] = []
-            if self._service.has_article_validation():
-                validation_attempts = 0
-                previous_article: Optional[GeneratedArticle] = None
-                rejection_feedback: List[str] = []
-                while True:
-                    stage_start = time.perf_counter()
-                    try:
-                        validation_report = self._service.validate_article(
-                            team=team,
-                            article=article,
-                            summaries=summaries,
-                            previous_article=previous_article,
-                            rejection_reasons=rejection_feedback or None,
-                        )
-                    except ServiceInvocationError as exc:
-                        result.add_stage_duration("article_validation", time.perf_counter() - stage_start)
-                        logger.error("Article validation failed for %s: %s", team.abbreviation, exc)
-                        self._errors.record(team.abbreviation, exc.stage, exc, retryable=exc.retryable)
-                        result.add_error(FailureDetail(stage=exc.stage, message=str(exc), retryable=exc.retryable))
-                        result.status = "failed"
-                        return result
-                    else:
-                        result.add_stage_duration("article_validation", time.perf_counter() - stage_start)
-                    validation_attempts += 1
-                    result.validation_attempts = validation_attempts
-                    result.validation_decision = validation_report.decision
-                    result.validation_rejection_reasons = list(validation_report.rejection_reasons)
-                    result.validation_review_reasons = list(validation_report.review_reasons)
-                    review_reasons = list(validation_report.review_reasons)
+            # Stages 5-7 run on a private pool: translation can start speculatively while
+            # validation runs and image selection runs alongside translation.
+            fan_out = PostGenerationFanOut()
+            translation_future: Optional[Future] = None
+            image_future: Optional[Future] = None
+            try:
+                # Stage 5: Article Validation
+                review_reasons: List[str] = []
+                if self._service.has_article_validation():
+                    validation_attempts = 0
+                    previous_article: Optional[GeneratedArticle] = None
+                    rejection_feedback: List[str] = []
+                    while True:
+                        if self._config.parallel_post_generation and self._config.speculative_translation:
+                            translation_future = fan_out.submit(self._service.translate_article, article)
+                        stage_start = time.perf_counter()
+                        try:
+                            validation_report = self._service.validate_article(
+                                team=team,
+                                article=article,
+                                summaries=summaries,
+                                previous_article=previous_article,
+                                rejection_reasons=rejection_feedback or None,
+                            )
+                        except ServiceInvocationError as exc:
+                            result.add_stage_duration("article_validation", time.perf_counter() - stage_start)
+                            logger.error("Article validation failed for %s: %s", team.abbreviation, exc)
+                            self._errors.record(team.abbreviation, exc.stage, exc, retryable=exc.retryable)
+                            result.add_error(FailureDetail(stage=exc.stage, message=str(exc), retryable=exc.retryable))
+                            result.status = "failed"
+                            return result
+                        else:
+                            result.add_stage_duration("article_validation", time.perf_counter() - stage_start)
+                        validation_attempts += 1
+                        result.validation_attempts = validation_attempts
+                        result.validation_decision = validation_report.decision
+                        result.validation_rejection_reasons = list(validation_report.rejection_reasons)
+                        result.validation_review_reasons = list(validation_report.review_reasons)
+                        review_reasons = list(validation_report.review_reasons)
 
-                    if validation_report.decision != "reject":
-                        break
+                        if validation_report.decision != "reject":
+                            break
 
-                    rejection_feedback = list(validation_report.rejection_reasons) or [
-                        "Article validation rejected the content without specific reasons."
-                    ]
-                    logger.warning(
-                        "Validation rejected article for %s: %s", team.abbreviation, rejection_feedback
-                    )
-                    if validation_attempts >= self._config.max_validation_attempts:
-                        result.add_error(
-                            FailureDetail(
-                                stage="article_validation",
-                                message="Article rejected by validation after retry",
-                                retryable=False,
-                            )
+                        # The speculative translation belongs to the rejected draft.
+                        fan_out.discard(translation_future)
+                        translation_future = None
+                        rejection_feedback = list(validation_report.rejection_reasons) or [
+                            "Article validation rejected the content without specific reasons."
+                        ]
+                        logger.warning(
+                            "Validation rejected article for %s: %s", team.abbreviation, rejection_feedback
                         )
-                        result.status = "failed"
-                        return result
+                        if validation_attempts >= self._config.max_validation_attempts:
+                            result.add_error(
+                                FailureDetail(
+                                    stage="article_validation",
+                                    message="Article rejected by validation after retry",
+                                    retryable=False,
+                                )
+                            )
+                            result.status = "failed"
+                            return result
 
-                    previous_article = article
-                    stage_start = time.perf_counter()
-                    try:
-                        article = self._service.generate_article(
-                            team,
-                            summaries,
-                            feedback=rejection_feedback,
-                            previous_article=previous_article,
-                        )
-                    except ServiceInvocationError as exc:
-                        result.add_stage_duration("article_generation", time.perf_counter() - stage_start)
-                        logger.error(
-                            "Article regeneration failed for %s after validation rejection: %s",
-                            team.abbreviation,
-                            exc,
-                        )
-                        self._errors.record(team.abbreviation, exc.stage, exc, retryable=exc.retryable)
-                        result.add_error(
-                            FailureDetail(stage=exc.stage, message=str(exc), retryable=exc.retryable)
-                        )
-                        result.mark_incomplete("Article regeneration failed after validation rejection")
-                        return result
-                    else:
-                        result.add_stage_duration("article_generation", time.perf_counter() - stage_start)
-                    continue
+                        previous_article = article
+                        stage_start = time.perf_counter()
+                        try:
+                            article = self._service.generate_article(
+                                team,
+                                summaries,
+                                feedback=rejection_feedback,
+                                previous_article=previous_article,
+                            )
+                        except ServiceInvocationError as exc:
+                            result.add_stage_duration("article_generation", time.perf_counter() - stage_start)
+                            logger.error(
+                                "Article regeneration failed for %s after validation rejection: %s",
+                                team.abbreviation,
+                                exc,
+                            )
+                            self._errors.record(team.abbreviation, exc.stage, exc, retryable=exc.retryable)
+                            result.add_error(
+                                FailureDetail(stage=exc.stage, message=str(exc), retryable=exc.retryable)
+                            )
+                            result.mark_incomplete("Article regeneration failed after validation rejection")
+                            return result
+                        else:
+                            result.add_stage_duration("article_generation", time.perf_counter() - stage_start)
+                        continue
 
-            # Stage 6: Translation - MUST succeed
-            translated = None
-            stage_start = time.perf_counter()
-            try:
-                translated = self._service.translate_article(article)
-            except ServiceInvocationError as exc:
-                result.add_stage_duration("translation", time.perf_counter() - stage_start)
-                logger.error("Translation failed for %s: %s", team.abbreviation, exc)
-                self._errors.record(team.abbreviation, exc.stage, exc, retryable=exc.retryable)
-                result.add_error(FailureDetail(stage=exc.stage, message=str(exc), retryable=exc.retryable))
-                result.mark_incomplete("No translation generated")
-                return result
-            else:
-                result.add_stage_duration("translation", time.perf_counter() - stage_start)
+                if translation_future is None:
+                    translation_future = fan_out.submit(self._service.translate_article, article)
+                if self._config.image_count > 0 and self._config.parallel_post_generation:
+                    # The image selection service ranks on the English text only.
+                    image_future = fan_out.submit(self._service.select_images, article=article, translated=None)
 
-            # Stage 7: Image Selection - MUST succeed
-            images: List[SelectedImage] = []
-            if self._config.image_count > 0:
-                stage_start = time.perf_counter()
-                try:
-                    images = self._service.select_images(article=article, translated=translated)
-                    if not images:
-                        raise ServiceInvocationError(
+                # Stage 6: Translation - MUST succeed
+                translation_run = translation_future.result()
+                result.add_stage_duration("translation", translation_run.duration)
+                if translation_run.error is not None:
+                    exc = translation_run.error
+                    logger.error("Translation failed for %s: %s", team.abbreviation, exc)
+                    self._errors.record(team.abbreviation, exc.stage, exc, retryable=exc.retryable)
+                    result.add_error(FailureDetail(stage=exc.stage, message=str(exc), retryable=exc.retryable))
+                    result.mark_incomplete("No translation generated")
+                    return result
+                translated = translation_run.value
+
+                # Stage 7: Image Selection - MUST succeed
+                images: List[SelectedImage] = []
+                if self._config.image_count > 0:
+                    if image_future is None:
+                        image_future = fan_out.submit(
+                            self._service.select_images, article=article, translated=translated
+                        )
+                    image_run = image_future.result()
+                    result.add_stage_duration("image_selection", image_run.duration)
+                    images = image_run.value or []
+                    exc = image_run.error
+                    if exc is None and not images:
+                        exc = ServiceInvocationError(
                             "image_selection",
                             f"No images returned (requested {self._config.image_count})",
                             retryable=True
                         )
-                except ServiceInvocationError as exc:
-                    result.add_stage_duration("image_selection", time.perf_counter() - stage_start)
-                    logger.error("Image selection failed for %s: %s", team.abbreviation, exc)
-                    self._errors.record(team.abbreviation, exc.stage, exc, retryable=exc.retryable)
-                    result.add_error(FailureDetail(stage=exc.stage, message=str(exc), retryable=exc.retryable))
-                    result.mark_incomplete("No images selected")
-                    return result
-                else:
-                    result.add_stage_duration("image_selection", time.perf_counter() - stage_start)
+                    if exc is not None:
+                        logger.error("Image selection failed for %s: %s", team.abbreviation, exc)
+                        self._errors.record(team.abbreviation, exc.stage, exc, retryable=exc.retryable)
+                        result.add_error(FailureDetail(stage=exc.stage, message=str(exc), retryable=exc.retryable))
+                        result.mark_incomplete("No images selected")
+                        return result
+            finally:
+                fan_out.discard(translation_future)
+                fan_out.discard(image_future)
+                fan_out.close()
 
             # Stage 8: Persistence
             stage_start = time.perf_counter()
@@ -58,6 +58,8 @@ def pipeline_handler(request: flask.Request) -> flask.Response:
         "max_urls_per_team": payload.get("max_urls_per_team"),
         "summarization_batch_size": payload.get("summarization_batch_size"),
         "allow_empty_urls": payload.get("allow_empty_urls"),
+        "parallel_post_generation": payload.get("parallel_post_generation"),
+        "speculative_translation": payload.get("speculative_translation"),
     }
 
     try:
@@ -49,6 +49,11 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         type=int,
         help="Maximum validation attempts before failing an article (default: env or 2)",
     )
+    parser.add_argument(
+        "--sequential-post-generation",
+        action="store_true",
+        help="Run validation, translation and image selection strictly one after another",
+    )
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable debug logging")
     parser.add_argument(
         "--output",
@@ -73,6 +78,7 @@ def run(argv: Optional[List[str]] = None) -> int:
                 "dry_run": True if args.dry_run else None,
                 "image_count": args.image_count,
                 "max_validation_attempts": args.max_validation_attempts,
+                "parallel_post_generation": False if args.sequential_post_generation else None,
             }
         )
         service_config = build_service_config()
@@ -6,7 +6,10 @@ import asyncio
 import base64
 import io
 import json
+import os
 import tempfile
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
@@ -27,14 +30,92 @@ from .config import (
 )
 
 
+def ensure_mp3(audio_bytes: bytes, mime_type: str) -> bytes:
+    """Return *audio_bytes* as MP3, converting WAV/PCM audio with pydub."""
+
+    if "mpeg" in mime_type.lower() or "mp3" in mime_type.lower():
+        return audio_bytes
+
+    if "l16" in mime_type.lower() or "pcm" in mime_type.lower():
+        sample_rate = 24000
+        if "rate=" in mime_type:
+            try:
+                rate_str = mime_type.split("rate=")[1].split(";")[0].split(",")[0]
+                sample_rate = int(rate_str)
+            except ValueError:
+                sample_rate = 24000
+        audio = AudioSegment(
+            data=audio_bytes,
+            sample_width=2,
+            frame_rate=sample_rate,
+            channels=1,
+        )
+    elif "wav" in mime_type.lower():
+        audio = AudioSegment.from_file(io.BytesIO(audio_bytes), format="wav")
+    else:
+        audio = AudioSegment.from_file(io.BytesIO(audio_bytes))
+
+    buffer = io.BytesIO()
+    audio.export(buffer, format="mp3", bitrate="192k")
+    return buffer.getvalue()
+
+
+def needs_mp3_encoding(mime_type: str) -> bool:
+    lowered = mime_type.lower()
+    return not ("mpeg" in lowered or "mp3" in lowered)
+
+
+def decode_and_encode_audio(data_b64: str, mime_type: str) -> bytes:
+    """Decode a batch response's base64 audio and convert it to MP3.
+
+    Module-level so it can run in a worker process.
+    """
+    return ensure_mp3(base64.b64decode(data_b64), mime_type)
+
+
+class _ByteBudget:
+    """Async limit on the audio bytes held by in-flight items.
+
+    An item larger than the whole budget is still admitted once nothing else
+    is in flight, so oversized clips cannot stall the pipeline.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = max(1, limit)
+        self.in_use = 0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self, size: int) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_use == 0 or self.in_use + size <= self.limit)
+            self.in_use += size
+
+    async def release(self, size: int) -> None:
+        async with self._cond:
+            self.in_use -= size
+            self._cond.notify_all()
+
+
 class TTSBatchService:
     """Orchestrates Gemini batch creation, status checks, and result processing."""
 
     MODEL_ENDPOINT = "https://generativelanguage.googleapis.com/v1beta/models/{model_name}"
+    DEFAULT_UPLOAD_CONCURRENCY = 8
+    DEFAULT_MAX_IN_FLIGHT_BYTES = 64 * 1024 * 1024
 
-    def __init__(self, *, work_dir: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        *,
+        work_dir: Optional[Path] = None,
+        encode_workers: Optional[int] = None,
+        upload_concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+        max_in_flight_bytes: int = DEFAULT_MAX_IN_FLIGHT_BYTES,
+    ) -> None:
         self.work_dir = work_dir or (Path(tempfile.gettempdir()) / "gemini_tts_batch")
         self.work_dir.mkdir(parents=True, exist_ok=True)
+        self.encode_workers = encode_workers or os.cpu_count() or 1
+        self.upload_concurrency = max(1, upload_concurrency)
+        self.max_in_flight_bytes = max_in_flight_bytes
 
     async def create_batch(self, request: CreateBatchRequest) -> dict[str, Any]:
         api_key = self._resolve_gemini_api_key(request)
@@ -90,77 +171,19 @@ class TTSBatchService:
         if not result_file_name:
             raise ValueError(f"Batch {request.batch_id} has no output file")
 
-        output_text = await asyncio.to_thread(self._download_file_text, client, result_file_name)
+        started = time.perf_counter()
+        output_path = await asyncio.to_thread(
+            self._download_result_file, client, result_file_name, request.batch_id
+        )
+        download_seconds = time.perf_counter() - started
         supabase = self._create_supabase_client(request.supabase.url, request.supabase.key)
-        results: list[dict[str, Any]] = []
-        failures: list[dict[str, Any]] = []
-
-        for raw_line in output_text.splitlines():
-            if not raw_line.strip():
-                continue
-
-            entry = json.loads(raw_line)
-            item_id = entry.get("key")
-            if entry.get("error"):
-                response = entry.get("response") or {}
-                failures.append(
-                    {
-                        "id": item_id,
-                        "error": entry["error"],
-                        "token_usage": self._extract_token_usage(response),
-                    }
-                )
-                continue
-
-            response = entry.get("response")
-            if not response:
-                failures.append(
-                    {
-                        "id": item_id,
-                        "error": "Missing response payload",
-                    }
-                )
-                continue
-
-            inline_data = self._extract_inline_data(response)
-            token_usage = self._extract_token_usage(response)
-            if inline_data is None:
-                failures.append(
-                    {
-                        "id": item_id,
-                        "error": "No audio inlineData found in batch response",
-                        "token_usage": token_usage,
-                    }
-                )
-                continue
-
-            source_mime_type = inline_data.get("mimeType", "audio/wav")
-            audio_bytes = base64.b64decode(inline_data["data"])
-            mp3_bytes = self._ensure_mp3(audio_bytes, source_mime_type)
-            storage_path = self._build_storage_path(
-                path_prefix=request.supabase.path_prefix,
-                batch_id=request.batch_id,
-                item_id=item_id or "unknown",
-            )
-            public_url = await asyncio.to_thread(
-                self._upload_bytes_to_supabase,
-                supabase,
-                request.supabase.bucket,
-                storage_path,
-                mp3_bytes,
-                "audio/mpeg",
-                request.supabase.url,
-            )
-            results.append(
-                {
-                    "id": item_id,
-                    "storage_path": storage_path,
-                    "mime_type": "audio/mpeg",
-                    "source_mime_type": source_mime_type,
-                    "public_url": public_url,
-                    "token_usage": token_usage,
-                }
+        try:
+            results, failures, timings = await self._process_result_lines(
+                output_path, request, supabase
             )
+        finally:
+            output_path.unlink(missing_ok=True)
+        timings = {"download_seconds": round(download_seconds, 3), **timings}
 
         aggregated_token_usage = self._aggregate_token_usage(results, failures)
         processed_at = datetime.now(timezone.utc).isoformat()
@@ -170,6 +193,7 @@ class TTSBatchService:
             processed_count=len(results),
             failed_count=len(failures),
             processed_at=processed_at,
+            timings=timings,
         )
         manifest = {
             "batch_id": request.batch_id,
@@ -201,6 +225,7 @@ class TTSBatchService:
             "failed_count": len(failures),
             "token_usage": aggregated_token_usage,
             "processed_at": processed_at,
+            "timings": timings,
             "manifest_path": manifest_path,
         }
         usage_summary_path = (
@@ -222,6 +247,7 @@ class TTSBatchService:
             "processed_count": len(results),
             "failed_count": len(failures),
             "token_usage": aggregated_token_usage,
+            "timings": timings,
             "local_usage_summary_file": str(local_usage_summary_path),
             "usage_summary_path": usage_summary_path,
             "usage_summary_public_url": usage_summary_public_url,
@@ -231,6 +257,166 @@ class TTSBatchService:
             "failures": failures,
         }
 
+    async def _process_result_lines(
+        self,
+        output_path: Path,
+        request: ProcessBatchRequest,
+        supabase: Any,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]], dict[str, float]]:
+        """Stream result lines through decode/encode and upload stages.
+
+        MP3 encoding runs on a process pool sized to the cores and uploads run
+        on threads, bounded by ``upload_concurrency`` and by
+        ``max_in_flight_bytes`` of audio held at once. Results and failures
+        keep the order of the output file.
+        """
+        loop = asyncio.get_running_loop()
+        budget = _ByteBudget(self.max_in_flight_bytes)
+        upload_slots = asyncio.Semaphore(self.upload_concurrency)
+        outcomes: dict[int, tuple[str, dict[str, Any]]] = {}
+        timings = {"parse_seconds": 0.0, "encode_seconds": 0.0, "upload_seconds": 0.0}
+        tasks: list[asyncio.Task] = []
+        pool: Optional[Executor] = None
+        started = time.perf_counter()
+
+        async def process_item(
+            index: int,
+            item_id: Optional[str],
+            inline_data: dict[str, Any],
+            token_usage: dict[str, Optional[int]],
+            size: int,
+        ) -> None:
+            nonlocal pool
+            try:
+                source_mime_type = inline_data.get("mimeType", "audio/wav")
+                encode_started = time.perf_counter()
+                if needs_mp3_encoding(source_mime_type):
+                    if pool is None:
+                        pool = self._create_encode_pool()
+                    mp3_bytes = await loop.run_in_executor(
+                        pool, decode_and_encode_audio, inline_data["data"], source_mime_type
+                    )
+                else:
+                    mp3_bytes = base64.b64decode(inline_data["data"])
+                timings["encode_seconds"] += time.perf_counter() - encode_started
+
+                storage_path = self._build_storage_path(
+                    path_prefix=request.supabase.path_prefix,
+                    batch_id=request.batch_id,
+                    item_id=item_id or "unknown",
+                )
+                async with upload_slots:
+                    upload_started = time.perf_counter()
+                    public_url = await asyncio.to_thread(
+                        self._upload_bytes_to_supabase,
+                        supabase,
+                        request.supabase.bucket,
+                        storage_path,
+                        mp3_bytes,
+                        "audio/mpeg",
+                        request.supabase.url,
+                    )
+                    timings["upload_seconds"] += time.perf_counter() - upload_started
+                outcomes[index] = (
+                    "result",
+                    {
+                        "id": item_id,
+                        "storage_path": storage_path,
+                        "mime_type": "audio/mpeg",
+                        "source_mime_type": source_mime_type,
+                        "public_url": public_url,
+                        "token_usage": token_usage,
+                    },
+                )
+            finally:
+                await budget.release(size)
+
+        try:
+            with output_path.open("r", encoding="utf-8") as handle:
+                for index, raw_line in enumerate(handle):
+                    if not raw_line.strip():
+                        continue
+
+                    parse_started = time.perf_counter()
+                    entry = json.loads(raw_line)
+                    timings["parse_seconds"] += time.perf_counter() - parse_started
+                    item_id = entry.get("key")
+                    if entry.get("error"):
+                        response = entry.get("response") or {}
+                        outcomes[index] = (
+                            "failure",
+                            {
+                                "id": item_id,
+                                "error": entry["error"],
+                                "token_usage": self._extract_token_usage(response),
+                            },
+                        )
+                        continue
+
+                    response = entry.get("response")
+                    if not response:
+                        outcomes[index] = (
+                            "failure",
+                            {
+                                "id": item_id,
+                                "error": "Missing response payload",
+                            },
+                        )
+                        continue
+
+                    inline_data = self._extract_inline_data(response)
+                    token_usage = self._extract_token_usage(response)
+                    if inline_data is None:
+                        outcomes[index] = (
+                            "failure",
+                            {
+                                "id": item_id,
+                                "error": "No audio inlineData found in batch response",
+                                "token_usage": token_usage,
+                            },
+                        )
+                        continue
+
+                    # Budget by decoded size; the MP3 is smaller than the source audio.
+                    size = len(inline_data.get("data") or "") * 3 // 4
+                    await budget.acquire(size)
+                    tasks.append(
+                        asyncio.create_task(process_item(index, item_id, inline_data, token_usage, size))
+                    )
+                    del entry, response, inline_data
+                    self._raise_first_error(tasks)
+
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+        results = [payload for _, (kind, payload) in sorted(outcomes.items()) if kind == "result"]
+        failures = [payload for _, (kind, payload) in sorted(outcomes.items()) if kind == "failure"]
+        timings = {key: round(value, 3) for key, value in timings.items()}
+        timings["pipeline_seconds"] = round(time.perf_counter() - started, 3)
+        return results, failures, timings
+
+    @staticmethod
+    def _raise_first_error(tasks: list[asyncio.Task]) -> None:
+        for task in tasks:
+            if task.done() and not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+
+    def _create_encode_pool(self) -> Executor:
+        try:
+            return ProcessPoolExecutor(max_workers=self.encode_workers)
+        except (OSError, NotImplementedError, PermissionError):
+            # Sandboxes without working multiprocessing still get concurrency.
+            return ThreadPoolExecutor(
+                max_workers=self.encode_workers, thread_name_prefix="tts-encode"
+            )
+
     async def _fetch_model_metadata(self, *, api_key: str, model_name: str) -> dict[str, Any]:
         url = self.MODEL_ENDPOINT.format(model_name=model_name)
         async with httpx.AsyncClient() as client:
@@ -402,6 +588,18 @@ class TTSBatchService:
             return content.decode("utf-8")
         raise RuntimeError(f"Unexpected file download type: {type(content)!r}")
 
+    def _download_result_file(self, client: Any, file_name: str, batch_id: str) -> Path:
+        """Download the batch output to the work dir so it can be read line by line."""
+        content = client.files.download(file=file_name)
+        file_path = self.work_dir / f"{self._safe_batch_id(batch_id)}_output.jsonl"
+        if isinstance(content, str):
+            file_path.write_text(content, encoding="utf-8")
+        elif isinstance(content, (bytes, bytearray, memoryview)):
+            file_path.write_bytes(bytes(content))
+        else:
+            raise RuntimeError(f"Unexpected file download type: {type(content)!r}")
+        return file_path
+
     def _serialize_batch(self, batch_job: Any) -> dict[str, Any]:
         state = getattr(batch_job, "state", None)
         status = getattr(state, "name", state)
@@ -494,6 +692,7 @@ class TTSBatchService:
         processed_count: int,
         failed_count: int,
         processed_at: str,
+        timings: Optional[dict[str, float]] = None,
     ) -> Path:
         summary = {
             "batch_id": batch_id,
@@ -502,6 +701,8 @@ class TTSBatchService:
             "token_usage": token_usage,
             "processed_at": processed_at,
         }
+        if timings is not None:
+            summary["timings"] = timings
         file_path = self.work_dir / f"{self._safe_batch_id(batch_id)}_usage_summary.json"
         with file_path.open("w", encoding="utf-8") as handle:
             json.dump(summary, handle, indent=2)
@@ -511,31 +712,7 @@ class TTSBatchService:
         return batch_id.replace("/", "_")
 
     def _ensure_mp3(self, audio_bytes: bytes, mime_type: str) -> bytes:
-        if "mpeg" in mime_type.lower() or "mp3" in mime_type.lower():
-            return audio_bytes
-
-        if "l16" in mime_type.lower() or "pcm" in mime_type.lower():
-            sample_rate = 24000
-            if "rate=" in mime_type:
-                try:
-                    rate_str = mime_type.split("rate=")[1].split(";")[0].split(",")[0]
-                    sample_rate = int(rate_str)
-                except ValueError:
-                    sample_rate = 24000
-            audio = AudioSegment(
-                data=audio_bytes,
-                sample_width=2,
-                frame_rate=sample_rate,
-                channels=1,
-            )
-        elif "wav" in mime_type.lower():
-            audio = AudioSegment.from_file(io.BytesIO(audio_bytes), format="wav")
-        else:
-            audio = AudioSegment.from_file(io.BytesIO(audio_bytes))
-
-        buffer = io.BytesIO()
-        audio.export(buffer, format="mp3", bitrate="192k")
-        return buffer.getvalue()
+        return ensure_mp3(audio_bytes, mime_type)
 
     def _build_storage_path(self, *, path_prefix: str, batch_id: str, item_id: str) -> str:
         prefix = path_prefix.rstrip("/")
@@ -58,6 +58,9 @@ class VisionConfig:
     similarity_threshold: float = 0.25  # Min CLIP similarity score (0.0-1.0)
     enable_ocr: bool = True
     enable_clip: bool = True
+    clip_batch_size: int = 8  # Max images scored per forward pass
+    clip_batch_window_ms: int = 25  # How long to wait for more images before scoring
+    clip_quantize: bool = False  # Dynamic int8 quantization for CPU inference
 
 
 @dataclass
@@ -76,6 +79,9 @@ class ImageSelectionRequest:
     min_width: int = 1024
     min_height: int = 576
     min_bytes: int = 50_000
+    max_concurrent_candidates: int = 4
+    enable_phash_dedup: bool = True
+    phash_max_distance: int = 6
     llm_config: Optional[LLMConfig] = None
     search_config: Optional[SearchConfig] = None
     supabase_config: Optional[SupabaseConfig] = None
@@ -119,3 +125,7 @@ class ImageSelectionRequest:
             raise ValueError("min_width and min_height must be >= 0")
         if self.min_bytes < 0:
             raise ValueError("min_bytes must be >= 0")
+        if self.max_concurrent_candidates < 1:
+            raise ValueError("max_concurrent_candidates must be at least 1")
+        if not 0 <= self.phash_max_distance <= 64:
+            raise ValueError("phash_max_distance must be between 0 and 64")
@@ -5,7 +5,10 @@ from __future__ import annotations
 import os
 from typing import Any, Dict, Optional
 
+from src.shared.utils.config_validator import validate_bool_env
+
 from .config import ImageSelectionRequest, LLMConfig, SearchConfig, SupabaseConfig, VisionConfig
+from .vision_validator import DEFAULT_CLIP_MODEL
 
 
 def request_from_payload(payload: Dict[str, Any]) -> ImageSelectionRequest:
@@ -95,14 +98,23 @@ def request_from_payload(payload: Dict[str, Any]) -> ImageSelectionRequest:
         os.getenv("K_SERVICE") or       # GCF Gen2 / Cloud Run
         os.getenv("AWS_LAMBDA_FUNCTION_NAME")  # AWS Lambda
     )
-    default_enable_clip = not is_cloud_function  # Disable CLIP in cloud, enable locally
+    # Disable CLIP in cloud unless the instance preloads the model at start-up
+    clip_preloaded = validate_bool_env("IMAGE_SELECTION_PRELOAD_CLIP", False)
+    default_enable_clip = not is_cloud_function or clip_preloaded
+    # Same model the instance preloads, so requests don't load a second one
+    default_clip_model = os.getenv("IMAGE_SELECTION_CLIP_MODEL", DEFAULT_CLIP_MODEL)
+    default_clip_quantize = validate_bool_env("IMAGE_SELECTION_CLIP_QUANTIZE", False)
     default_strict_mode = is_cloud_function
     default_min_relevance = 7.0 if default_strict_mode else 0.0
     default_min_source_score = 0.5 if default_strict_mode else 0.0
     
     if vision_payload is None:
         # Default: vision validation enabled, CLIP based on environment
-        vision_config = VisionConfig(enable_clip=default_enable_clip)
+        vision_config = VisionConfig(
+            enable_clip=default_enable_clip,
+            clip_model=default_clip_model,
+            clip_quantize=default_clip_quantize,
+        )
     elif not isinstance(vision_payload, dict):
         raise ValueError("vision configuration must be an object when provided")
     elif vision_payload.get("enabled") is False:
@@ -112,7 +124,7 @@ def request_from_payload(payload: Dict[str, Any]) -> ImageSelectionRequest:
         vision_config = VisionConfig(
             enabled=vision_payload.get("enabled", True),
             google_cloud_credentials=vision_payload.get("google_cloud_credentials"),
-            clip_model=vision_payload.get("clip_model", "openai/clip-vit-base-patch32"),
+            clip_model=vision_payload.get("clip_model", default_clip_model),
             text_rejection_threshold=int(
                 vision_payload.get("text_rejection_threshold", 15)
             ),
@@ -121,6 +133,9 @@ def request_from_payload(payload: Dict[str, Any]) -> ImageSelectionRequest:
             ),
             enable_ocr=vision_payload.get("enable_ocr", True),
             enable_clip=vision_payload.get("enable_clip", default_enable_clip),
+            clip_batch_size=int(vision_payload.get("clip_batch_size", 8)),
+            clip_batch_window_ms=int(vision_payload.get("clip_batch_window_ms", 25)),
+            clip_quantize=bool(vision_payload.get("clip_quantize", default_clip_quantize)),
         )
 
     request_model = ImageSelectionRequest(
@@ -136,6 +151,9 @@ def request_from_payload(payload: Dict[str, Any]) -> ImageSelectionRequest:
         min_width=int(payload.get("min_width", 1024)),
         min_height=int(payload.get("min_height", 576)),
         min_bytes=int(payload.get("min_bytes", 50_000)),
+        max_concurrent_candidates=int(payload.get("max_concurrent_candidates", 4)),
+        enable_phash_dedup=bool(payload.get("enable_phash_dedup", True)),
+        phash_max_distance=int(payload.get("phash_max_distance", 6)),
         llm_config=llm_config,
         search_config=search_config,
         supabase_config=supabase_config,
@@ -0,0 +1,168 @@
+"""Perceptual hashing and near-duplicate lookup for stored images.
+
+A 64-bit difference hash (dHash) is computed locally with Pillow/NumPy. Hashes
+of stored images are kept in a BK-tree so that near-duplicate lookups by
+Hamming distance stay sublinear in the number of stored images.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HASH_SIZE = 8
+DEFAULT_MAX_DISTANCE = 6
+INDEX_TTL_SECONDS = 600
+
+_index_cache: Dict[Tuple[str, str, str], Tuple[float, "PerceptualHashIndex"]] = {}
+_index_cache_lock = threading.Lock()
+
+
+def compute_dhash(image_bytes: bytes, hash_size: int = DEFAULT_HASH_SIZE) -> Optional[int]:
+    """Return the difference hash of an image, or None when it cannot be decoded."""
+    try:
+        import numpy as np
+        from PIL import Image
+    except ImportError:
+        logger.warning("Pillow/numpy not installed, perceptual dedup will be disabled")
+        return None
+
+    try:
+        image = Image.open(io.BytesIO(image_bytes)).convert("L")
+        image = image.resize((hash_size + 1, hash_size), Image.Resampling.LANCZOS)
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Could not decode image for hashing: %s", exc)
+        return None
+
+    pixels = np.asarray(image, dtype=np.int16)
+    bits = (pixels[:, 1:] > pixels[:, :-1]).flatten()
+    value = 0
+    for bit in bits:
+        value = (value << 1) | int(bit)
+    return value
+
+
+def hamming_distance(left: int, right: int) -> int:
+    return (left ^ right).bit_count()
+
+
+def format_hash(value: int) -> str:
+    return f"{value:016x}"
+
+
+def parse_hash(raw: Any) -> Optional[int]:
+    if not isinstance(raw, str) or not raw.strip():
+        return None
+    try:
+        return int(raw.strip(), 16)
+    except ValueError:
+        return None
+
+
+class BKTree:
+    """Burkhard-Keller tree over integer hashes using Hamming distance."""
+
+    def __init__(self) -> None:
+        self._root: Optional[Tuple[int, List[Any], Dict[int, Any]]] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, key: int, value: Any) -> None:
+        self._size += 1
+        if self._root is None:
+            self._root = (key, [value], {})
+            return
+        node = self._root
+        while True:
+            node_key, values, children = node
+            distance = hamming_distance(key, node_key)
+            if distance == 0:
+                values.append(value)
+                return
+            child = children.get(distance)
+            if child is None:
+                children[distance] = (key, [value], {})
+                return
+            node = child
+
+    def search(self, key: int, max_distance: int) -> List[Tuple[int, Any]]:
+        """Return ``(distance, value)`` pairs within *max_distance*, closest first."""
+        if self._root is None:
+            return []
+        matches: List[Tuple[int, Any]] = []
+        stack = [self._root]
+        while stack:
+            node_key, values, children = stack.pop()
+            distance = hamming_distance(key, node_key)
+            if distance <= max_distance:
+                matches.extend((distance, value) for value in values)
+            low, high = distance - max_distance, distance + max_distance
+            for child_distance, child in children.items():
+                if low <= child_distance <= high:
+                    stack.append(child)
+        matches.sort(key=lambda item: item[0])
+        return matches
+
+
+class PerceptualHashIndex:
+    """Thread-safe near-duplicate index of stored image records."""
+
+    def __init__(self, records: Iterable[Dict[str, Any]] = ()) -> None:
+        self._tree = BKTree()
+        self._lock = threading.Lock()
+        for record in records:
+            phash = parse_hash(record.get("phash"))
+            if phash is not None:
+                self._tree.add(phash, record)
+
+    def __len__(self) -> int:
+        return len(self._tree)
+
+    def add(self, phash: int, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._tree.add(phash, record)
+
+    def find(self, phash: int, max_distance: int = DEFAULT_MAX_DISTANCE) -> List[Tuple[int, Dict[str, Any]]]:
+        with self._lock:
+            return self._tree.search(phash, max_distance)
+
+
+def load_phash_index(supabase: Any, table: str, cache_key: Tuple[str, str, str]) -> PerceptualHashIndex:
+    """Return the process-wide index for *table*, reloading it after the TTL expires."""
+    now = time.monotonic()
+    with _index_cache_lock:
+        cached = _index_cache.get(cache_key)
+        if cached and now - cached[0] < INDEX_TTL_SECONDS:
+            return cached[1]
+
+    records: List[Dict[str, Any]] = []
+    page_size = 1000
+    offset = 0
+    while True:
+        response = (
+            supabase.table(table)
+            .select("id,image_url,original_url,phash")
+            .not_.is_("phash", "null")
+            # Offset paging needs a stable order or pages can overlap or skip rows.
+            .order("id")
+            .range(offset, offset + page_size - 1)
+            .execute()
+        )
+        rows = getattr(response, "data", None) or []
+        records.extend(rows)
+        if len(rows) < page_size:
+            break
+        offset += page_size
+
+    index = PerceptualHashIndex(records)
+    logger.info("Loaded perceptual hash index with %d images", len(index))
+    with _index_cache_lock:
+        _index_cache[cache_key] = (now, index)
+    return index
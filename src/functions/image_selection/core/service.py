@@ -25,6 +25,14 @@ from src.shared.db.connection import SupabaseConfig as SharedSupabaseConfig
 from src.shared.db.connection import get_supabase_client
 
 from .config import ImageSelectionRequest
+from .image_hash import (
+    PerceptualHashIndex,
+    compute_dhash,
+    format_hash,
+    hamming_distance,
+    load_phash_index,
+    parse_hash,
+)
 from .llm import LLMClient, create_llm_client
 from .prompts import build_image_query
 from .vision_validator import VisionValidator
@@ -369,68 +377,174 @@ class ImageSelectionService:
     async def _process_candidates(
         self, session: aiohttp.ClientSession, candidates: List[ImageCandidate]
     ) -> List[ProcessedImage]:
-        results: List[ProcessedImage] = []
-        for candidate in candidates:
-            if len(results) >= self.request.num_images:
-                break
-            try:
-                if not await self._validate_candidate(session, candidate):
-                    continue
-
-                image_bytes = await self._download_image(session, candidate.url)
+        """Select up to ``num_images`` candidates, preferring already stored images.
+
+        A single batched lookup resolves which candidates already exist in the
+        image table before anything is downloaded; those are reused as-is. The
+        remaining slots are filled by validating, downloading and (optionally)
+        vision-checking cold candidates concurrently. Downloaded images whose
+        perceptual hash is close to a stored image reuse that record instead of
+        being vision-checked and uploaded again. Outstanding work is cancelled
+        as soon as enough candidates have been accepted, and results are
+        returned in rank order.
+        """
+        if not candidates:
+            return []
 
-                if self.vision_validator:
-                    validation = await self.vision_validator.validate_image(
-                        image_bytes, self.resolved_query or ""
-                    )
-                    if not validation.passed:
-                        logger.info(
-                            "Rejecting %s via vision validation: %s",
-                            candidate.url,
-                            validation.reason,
-                        )
-                        continue
-                    if validation.clip_similarity:
-                        logger.debug(
-                            "Image %s CLIP score: %.2f",
-                            candidate.url,
-                            validation.clip_similarity,
+        num_images = self.request.num_images
+        existing = await self._find_existing_images(candidates)
+        accepted: Dict[int, ProcessedImage] = {}
+        selected_urls: set[str] = set()
+        warm_hashes: List[int] = []
+        cold: List[tuple[int, ImageCandidate]] = []
+        for index, candidate in enumerate(candidates):
+            record = self._match_existing_image(candidate, existing)
+            if record is None:
+                cold.append((index, candidate))
+                continue
+            public_url = record.get("image_url") or candidate.url
+            if len(accepted) < num_images and public_url not in selected_urls:
+                logger.info("Reusing existing image for original_url %s", candidate.url)
+                accepted[index] = self._build_processed_image(candidate, public_url, record)
+                selected_urls.add(public_url)
+                warm_hash = parse_hash(record.get("phash"))
+                if warm_hash is not None:
+                    warm_hashes.append(warm_hash)
+
+        if len(accepted) >= num_images or not cold:
+            return [accepted[index] for index in sorted(accepted)]
+
+        phash_index = await self._load_phash_index()
+        max_distance = self.request.phash_max_distance
+        # Seeded with the reused images above so a cold CDN variant of one of
+        # them is recognised before it is validated and uploaded again.
+        run_hashes: List[int] = warm_hashes
+
+        # Slots are claimed only after a candidate passes validation, so in-flight
+        # work never uploads more images than requested.
+        claimed = len(accepted)
+        semaphore = asyncio.Semaphore(max(1, self.request.max_concurrent_candidates))
+
+        async def process_one(index: int, candidate: ImageCandidate) -> None:
+            nonlocal claimed
+            async with semaphore:
+                if claimed >= num_images:
+                    return
+                try:
+                    if not await self._validate_candidate(session, candidate):
+                        return
+
+                    image_bytes = await self._download_image(session, candidate.url)
+
+                    image_hash: Optional[int] = None
+                    if phash_index is not None:
+                        image_hash = await asyncio.to_thread(compute_dhash, image_bytes)
+                    if image_hash is not None:
+                        if any(hamming_distance(image_hash, other) <= max_distance for other in run_hashes):
+                            logger.info("Skipping %s: near-duplicate of an image already selected", candidate.url)
+                            return
+                        duplicate, already_selected = self._find_near_duplicate(
+                            phash_index, image_hash, selected_urls
                         )
+                        if already_selected:
+                            logger.info("Skipping %s: near-duplicate of an image already selected", candidate.url)
+                            return
+                        if duplicate is not None:
+                            if claimed >= num_images:
+                                return
+                            claimed += 1
+                            run_hashes.append(image_hash)
+                            public_url = duplicate.get("image_url") or candidate.url
+                            selected_urls.add(public_url)
+                            logger.info(
+                                "Reusing near-duplicate image %s for %s",
+                                duplicate.get("original_url"),
+                                candidate.url,
+                            )
+                            accepted[index] = self._build_processed_image(candidate, public_url, duplicate)
+                            return
 
-                public_url = candidate.url
-                record: Optional[Dict[str, Any]] = None
-                if self.supabase is not None:
-                    # Check for existing image by original_url to avoid duplicates
-                    existing = await self._find_existing_image(candidate)
-                    if existing:
-                        public_url = existing.get("image_url") or candidate.url
-                        record = existing
-                        logger.info(
-                            "Reusing existing image for original_url %s",
-                            candidate.url,
+                    if self.vision_validator:
+                        validation = await self.vision_validator.validate_image(
+                            image_bytes, self.resolved_query or ""
                         )
-                    else:
-                        public_url = await self._upload_image(image_bytes, candidate)
-                        record = await self._record_image(public_url, candidate)
-                results.append(
-                    ProcessedImage(
-                        public_url=public_url,
-                        original_url=candidate.url,
-                        author=candidate.author,
-                        source=candidate.source,
-                        width=candidate.width,
-                        height=candidate.height,
-                        title=candidate.title,
-                        record_id=self._extract_record_id(record),
+                        if not validation.passed:
+                            logger.info(
+                                "Rejecting %s via vision validation: %s",
+                                candidate.url,
+                                validation.reason,
+                            )
+                            return
+                        if validation.clip_similarity:
+                            logger.debug(
+                                "Image %s CLIP score: %.2f",
+                                candidate.url,
+                                validation.clip_similarity,
+                            )
+
+                    if claimed >= num_images:
+                        return
+                    if image_hash is not None:
+                        if any(hamming_distance(image_hash, other) <= max_distance for other in run_hashes):
+                            logger.info("Skipping %s: near-duplicate of an image already selected", candidate.url)
+                            return
+                        run_hashes.append(image_hash)
+                    claimed += 1
+                    try:
+                        public_url = candidate.url
+                        record: Optional[Dict[str, Any]] = None
+                        if self.supabase is not None:
+                            public_url = await self._upload_image(image_bytes, candidate)
+                            record = await self._record_image(public_url, candidate)
+                            if image_hash is not None and phash_index is not None:
+                                await self._store_phash(phash_index, record, image_hash)
+                    except BaseException:
+                        claimed -= 1
+                        if image_hash is not None:
+                            run_hashes.remove(image_hash)
+                        raise
+                    selected_urls.add(public_url)
+                    accepted[index] = self._build_processed_image(candidate, public_url, record)
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning(
+                        "Failed to process candidate %s: %s", candidate.url, exc
                     )
-                )
-            except Exception as exc:  # noqa: BLE001
-                logger.warning(
-                    "Failed to process candidate %s: %s", candidate.url, exc
-                )
-                continue
 
-        return results
+        tasks = [
+            asyncio.create_task(process_one(index, candidate))
+            for index, candidate in cold
+        ]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                await finished
+                if len(accepted) >= num_images:
+                    break
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                logger.debug("Cancelled %d outstanding candidates", len(pending))
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return [accepted[index] for index in sorted(accepted)]
+
+    def _build_processed_image(
+        self,
+        candidate: ImageCandidate,
+        public_url: str,
+        record: Optional[Dict[str, Any]],
+    ) -> ProcessedImage:
+        return ProcessedImage(
+            public_url=public_url,
+            original_url=candidate.url,
+            author=candidate.author,
+            source=candidate.source,
+            width=candidate.width,
+            height=candidate.height,
+            title=candidate.title,
+            record_id=self._extract_record_id(record),
+        )
 
     async def _source_url_fallback(
         self, session: aiohttp.ClientSession
@@ -1121,31 +1235,107 @@ class ImageSelectionService:
             raise RuntimeError("Supabase URL requested but Supabase is disabled")
         return config.url.rstrip("/")
 
-    async def _find_existing_image(
-        self, candidate: ImageCandidate
-    ) -> Optional[Dict[str, Any]]:
-        """Look up an existing image record by original_url to avoid duplicate uploads."""
+    async def _find_existing_images(
+        self, candidates: List[ImageCandidate]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Return existing image records keyed by original_url for all candidates.
+
+        Issues one query for every candidate URL (and its context URL) so that
+        duplicates are known before any image is downloaded.
+        """
         if self.supabase is None or not self.supabase_table:
-            return None
+            return {}
 
-        def _lookup() -> Optional[Dict[str, Any]]:
-            table = self.supabase.table(self.supabase_table)
-            original_urls = [candidate.url]
-            if candidate.context_url and candidate.context_url != candidate.url:
-                original_urls.append(candidate.context_url)
-            for original_url in original_urls:
-                existing = (
-                    table.select("id,image_url,original_url")
-                    .eq("original_url", original_url)
-                    .limit(1)
-                    .execute()
-                )
-                existing_data = getattr(existing, "data", None) or []
-                if existing_data:
-                    return existing_data[0]
+        original_urls: List[str] = []
+        for candidate in candidates:
+            for url in (candidate.url, candidate.context_url):
+                if url and url not in original_urls:
+                    original_urls.append(url)
+        if not original_urls:
+            return {}
+
+        def _lookup() -> Dict[str, Dict[str, Any]]:
+            response = (
+                self.supabase.table(self.supabase_table)
+                .select("id,image_url,original_url,phash")
+                .in_("original_url", original_urls)
+                .execute()
+            )
+            records: Dict[str, Dict[str, Any]] = {}
+            for row in getattr(response, "data", None) or []:
+                original_url = row.get("original_url")
+                if original_url and original_url not in records:
+                    records[original_url] = row
+            return records
+
+        try:
+            return await asyncio.to_thread(_lookup)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Existing image lookup failed; treating all candidates as new: %s", exc)
+            return {}
+
+    @staticmethod
+    def _match_existing_image(
+        candidate: ImageCandidate, existing: Dict[str, Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        record = existing.get(candidate.url)
+        if record is None and candidate.context_url:
+            record = existing.get(candidate.context_url)
+        return record
+
+    async def _load_phash_index(self) -> Optional[PerceptualHashIndex]:
+        """Return the near-duplicate index for the image table, if enabled."""
+        if (
+            self.supabase is None
+            or not self.supabase_table
+            or not self.request.enable_phash_dedup
+        ):
             return None
+        cache_key = (self.supabase_url(), self.supabase_schema or "", self.supabase_table)
+        try:
+            return await asyncio.to_thread(
+                load_phash_index, self.supabase, self.supabase_table, cache_key
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Perceptual hash index unavailable; near-duplicate detection disabled: %s", exc)
+            return None
+
+    def _find_near_duplicate(
+        self,
+        index: PerceptualHashIndex,
+        image_hash: int,
+        selected_urls: set[str],
+    ) -> tuple[Optional[Dict[str, Any]], bool]:
+        """Return a stored near-duplicate to reuse and whether every match is already selected."""
+        matches = index.find(image_hash, self.request.phash_max_distance)
+        for distance, record in matches:
+            if record.get("image_url") in selected_urls:
+                continue
+            logger.debug("Near-duplicate match at Hamming distance %d: %s", distance, record.get("original_url"))
+            return record, False
+        return None, bool(matches)
+
+    async def _store_phash(
+        self,
+        index: PerceptualHashIndex,
+        record: Optional[Dict[str, Any]],
+        image_hash: int,
+    ) -> None:
+        """Persist the hash on the stored image row and add it to the index."""
+        record_id = self._extract_record_id(record)
+        if not record or not record_id:
+            return
+        hex_hash = format_hash(image_hash)
+
+        def _update() -> None:
+            self.supabase.table(self.supabase_table).update({"phash": hex_hash}).eq("id", record_id).execute()
 
-        return await asyncio.to_thread(_lookup)
+        try:
+            await asyncio.to_thread(_update)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to store perceptual hash for %s: %s", record_id, exc)
+            return
+        index.add(image_hash, {**record, "phash": hex_hash})
 
     async def _record_image(self, public_url: str, candidate: ImageCandidate) -> Optional[Dict[str, Any]]:
         if self.supabase is None or not self.supabase_table:
@@ -11,15 +11,24 @@ import asyncio
 import io
 import logging
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CLIP_MODEL = "openai/clip-vit-base-patch32"
+TEXT_EMBEDDING_CACHE_SIZE = 256
+
 # Lazy imports for optional dependencies
 _vision_client = None
-_clip_model = None
-_clip_processor = None
+# Process-wide warm pool of CLIP models keyed by (model name, quantized)
+_clip_models: Dict[Tuple[str, bool], Tuple[Any, Any]] = {}
+_clip_lock = threading.Lock()
+# Normalised text embeddings keyed by (model name, quantized, query)
+_text_embeddings: "OrderedDict[Tuple[str, bool, str], Any]" = OrderedDict()
+_text_embeddings_lock = threading.Lock()
 
 
 @dataclass
@@ -28,11 +37,14 @@ class VisionConfig:
 
     enabled: bool = True
     google_cloud_credentials: Optional[str] = None  # JSON key string or file path
-    clip_model: str = "openai/clip-vit-base-patch32"
+    clip_model: str = DEFAULT_CLIP_MODEL
     text_rejection_threshold: int = 15  # Max characters allowed
     similarity_threshold: float = 0.25  # Min CLIP similarity score
     enable_ocr: bool = True
     enable_clip: bool = True
+    clip_batch_size: int = 8  # Max images scored per forward pass
+    clip_batch_window_ms: int = 25  # How long to wait for more images before scoring
+    clip_quantize: bool = False  # Dynamic int8 quantization for CPU inference
 
 
 @dataclass
@@ -114,16 +126,29 @@ def _get_vision_client():
     return _vision_client
 
 
-def _get_clip_model(model_name: str):
-    """Lazy-load CLIP model and processor."""
-    global _clip_model, _clip_processor
-    if _clip_model is None:
+def _get_clip_model(model_name: str, quantize: bool = False):
+    """Return a CLIP model and processor from the process-wide warm pool.
+
+    The first call loads the model; concurrent callers wait on the same load
+    instead of loading it twice.
+    """
+    key = (model_name, quantize)
+    with _clip_lock:
+        cached = _clip_models.get(key)
+        if cached is not None:
+            return cached
         try:
+            import torch
             from transformers import CLIPModel, CLIPProcessor
 
-            logger.info("Loading CLIP model: %s", model_name)
-            _clip_model = CLIPModel.from_pretrained(model_name)
-            _clip_processor = CLIPProcessor.from_pretrained(model_name)
+            logger.info("Loading CLIP model: %s (quantized=%s)", model_name, quantize)
+            model = CLIPModel.from_pretrained(model_name)
+            processor = CLIPProcessor.from_pretrained(model_name)
+            if quantize:
+                model = torch.quantization.quantize_dynamic(
+                    model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+            model.eval()
             logger.info("CLIP model loaded successfully")
         except ImportError:
             logger.warning(
@@ -133,7 +158,76 @@ def _get_clip_model(model_name: str):
         except Exception as exc:
             logger.warning("Failed to load CLIP model: %s", exc)
             return None, None
-    return _clip_model, _clip_processor
+        _clip_models[key] = (model, processor)
+        return model, processor
+
+
+def preload_clip_model(
+    model_name: str = DEFAULT_CLIP_MODEL,
+    quantize: bool = False,
+    *,
+    background: bool = True,
+) -> Optional[threading.Thread]:
+    """Load the CLIP model at process start so requests never pay the load.
+
+    With ``background=True`` the load runs on a daemon thread and the thread is
+    returned; requests arriving before it finishes wait for the same load.
+    """
+    if not background:
+        _get_clip_model(model_name, quantize)
+        return None
+    thread = threading.Thread(
+        target=_get_clip_model,
+        args=(model_name, quantize),
+        name="clip-preload",
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+class _ClipBatcher:
+    """Coalesces concurrent single-image CLIP requests into batched forward passes."""
+
+    def __init__(self, validator: "VisionValidator", max_batch: int, window_seconds: float) -> None:
+        self._validator = validator
+        self._max_batch = max(1, max_batch)
+        self._window = max(0.0, window_seconds)
+        self._pending: List[Tuple[bytes, str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+
+    async def score(self, image_bytes: bytes, query: str) -> float:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((image_bytes, query, future))
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[bytes, str, asyncio.Future]]) -> None:
+        by_query: Dict[str, List[Tuple[bytes, asyncio.Future]]] = {}
+        for image_bytes, query, future in batch:
+            by_query.setdefault(query, []).append((image_bytes, future))
+        for query, items in by_query.items():
+            scores = await self._validator.compute_clip_similarities(
+                [image_bytes for image_bytes, _ in items], query
+            )
+            for (_, future), score in zip(items, scores):
+                if not future.done():
+                    future.set_result(score)
 
 
 class VisionValidator:
@@ -144,13 +238,14 @@ class VisionValidator:
         self._vision_client = None
         self._clip_model = None
         self._clip_processor = None
+        self._clip_batcher: Optional[_ClipBatcher] = None
 
         if config.enable_ocr:
             self._vision_client = _get_vision_client()
 
         if config.enable_clip:
             self._clip_model, self._clip_processor = _get_clip_model(
-                config.clip_model
+                config.clip_model, config.clip_quantize
             )
 
     async def detect_text(self, image_bytes: bytes) -> TextDetectionResult:
@@ -245,6 +340,9 @@ class VisionValidator:
     ) -> float:
         """Compute CLIP embedding similarity between image and query.
 
+        Concurrent calls on the same event loop are coalesced into one
+        batched forward pass (see ``clip_batch_size``/``clip_batch_window_ms``).
+
         Args:
             image_bytes: Raw image bytes.
             query: Text query to compare against.
@@ -256,50 +354,93 @@ class VisionValidator:
             logger.debug("CLIP not available, returning neutral score")
             return 0.5
 
-        def _compute() -> float:
-            import torch
-            from PIL import Image
-
-            # Load image
-            image = Image.open(io.BytesIO(image_bytes)).convert("RGB")
-
-            # Process inputs
-            inputs = self._clip_processor(
-                text=[query],
-                images=image,
-                return_tensors="pt",
-                padding=True,
+        if self._clip_batcher is None:
+            self._clip_batcher = _ClipBatcher(
+                self,
+                self.config.clip_batch_size,
+                self.config.clip_batch_window_ms / 1000,
             )
+        return await self._clip_batcher.score(image_bytes, query)
 
-            # Compute embeddings
-            with torch.no_grad():
-                outputs = self._clip_model(**inputs)
-                image_embeds = outputs.image_embeds
-                text_embeds = outputs.text_embeds
-
-                # Normalize embeddings
-                image_embeds = image_embeds / image_embeds.norm(
-                    p=2, dim=-1, keepdim=True
-                )
-                text_embeds = text_embeds / text_embeds.norm(
-                    p=2, dim=-1, keepdim=True
-                )
-
-                # Compute cosine similarity
-                similarity = torch.matmul(
-                    image_embeds, text_embeds.transpose(0, 1)
-                )
-                score = similarity.item()
+    async def compute_clip_similarities(
+        self, images: Sequence[bytes], query: str
+    ) -> List[float]:
+        """Score several images against one query in batched forward passes.
 
-                # Normalize to 0-1 range (CLIP scores are typically -1 to 1)
-                normalized_score = (score + 1) / 2
-                return max(0.0, min(1.0, normalized_score))
+        Args:
+            images: Raw image bytes for each candidate.
+            query: Text query to compare against.
 
-        try:
-            return await asyncio.to_thread(_compute)
-        except Exception as exc:
-            logger.warning("CLIP similarity computation failed: %s", exc)
-            return 0.5
+        Returns:
+            Similarity scores between 0.0 and 1.0 in input order. Images that
+            cannot be decoded, or a failed batch, score a neutral 0.5.
+        """
+        if not images:
+            return []
+        if not self._clip_model or not self._clip_processor:
+            logger.debug("CLIP not available, returning neutral scores")
+            return [0.5] * len(images)
+
+        batch_size = max(1, self.config.clip_batch_size)
+        scores: List[float] = []
+        for start in range(0, len(images), batch_size):
+            chunk = list(images[start : start + batch_size])
+            try:
+                scores.extend(await asyncio.to_thread(self._score_batch, chunk, query))
+            except Exception as exc:
+                logger.warning("CLIP similarity computation failed: %s", exc)
+                scores.extend([0.5] * len(chunk))
+        return scores
+
+    def _text_embedding(self, query: str) -> Any:
+        import torch
+
+        key = (self.config.clip_model, self.config.clip_quantize, query)
+        with _text_embeddings_lock:
+            cached = _text_embeddings.get(key)
+            if cached is not None:
+                _text_embeddings.move_to_end(key)
+                return cached
+
+        inputs = self._clip_processor(text=[query], return_tensors="pt", padding=True)
+        with torch.no_grad():
+            text_embeds = self._clip_model.get_text_features(**inputs)
+        text_embeds = text_embeds / text_embeds.norm(p=2, dim=-1, keepdim=True)
+
+        with _text_embeddings_lock:
+            _text_embeddings[key] = text_embeds
+            while len(_text_embeddings) > TEXT_EMBEDDING_CACHE_SIZE:
+                _text_embeddings.popitem(last=False)
+        return text_embeds
+
+    def _score_batch(self, images: List[bytes], query: str) -> List[float]:
+        import torch
+        from PIL import Image
+
+        decoded = []
+        positions = []
+        for position, image_bytes in enumerate(images):
+            try:
+                decoded.append(Image.open(io.BytesIO(image_bytes)).convert("RGB"))
+                positions.append(position)
+            except Exception as exc:
+                logger.debug("Could not decode image for CLIP scoring: %s", exc)
+
+        scores = [0.5] * len(images)
+        if not decoded:
+            return scores
+
+        text_embeds = self._text_embedding(query)
+        inputs = self._clip_processor(images=decoded, return_tensors="pt")
+        with torch.no_grad():
+            image_embeds = self._clip_model.get_image_features(**inputs)
+        image_embeds = image_embeds / image_embeds.norm(p=2, dim=-1, keepdim=True)
+        similarity = torch.matmul(image_embeds, text_embeds.transpose(0, 1)).squeeze(-1)
+
+        for position, score in zip(positions, similarity.tolist()):
+            # Normalize to 0-1 range (CLIP scores are typically -1 to 1)
+            scores[position] = max(0.0, min(1.0, (score + 1) / 2))
+        return scores
 
     async def validate_image(
         self, image_bytes: bytes, query: str
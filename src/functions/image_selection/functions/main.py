@@ -17,16 +17,28 @@ project_root = Path(__file__).parent.parent.parent.parent.parent.absolute()
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
+from src.shared.utils.config_validator import validate_bool_env
 from src.shared.utils.env import load_env
 from src.shared.utils.logging import setup_logging
 
 from src.functions.image_selection.core.factory import request_from_payload
 from src.functions.image_selection.core.service import ImageSelectionService
+from src.functions.image_selection.core.vision_validator import (
+    DEFAULT_CLIP_MODEL,
+    preload_clip_model,
+)
 
 load_env()
 setup_logging(level=os.getenv("LOG_LEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
+# Warm the CLIP model while the instance starts instead of inside the first request
+if validate_bool_env("IMAGE_SELECTION_PRELOAD_CLIP", False):
+    preload_clip_model(
+        os.getenv("IMAGE_SELECTION_CLIP_MODEL", DEFAULT_CLIP_MODEL),
+        quantize=validate_bool_env("IMAGE_SELECTION_CLIP_QUANTIZE", False),
+    )
+
 
 def image_selection_handler(request: flask.Request) -> flask.Response:
     """HTTP handler that orchestrates image selection."""
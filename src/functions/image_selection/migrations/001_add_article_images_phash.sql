@@ -0,0 +1,16 @@
+-- Migration: Perceptual hash column for near-duplicate image detection
+-- Purpose: Store a 64-bit dHash (16 hex chars) per stored image so that the
+-- image selection service can reuse an existing record when the same photo is
+-- served from a different CDN or in a resized variant.
+
+ALTER TABLE content.article_images
+    ADD COLUMN IF NOT EXISTS phash text;
+
+-- The service loads all hashed rows into an in-process BK-tree; this partial
+-- index keeps that scan cheap as the table grows.
+CREATE INDEX IF NOT EXISTS idx_article_images_phash
+    ON content.article_images (id)
+    WHERE phash IS NOT NULL;
+
+COMMENT ON COLUMN content.article_images.phash IS
+    'Hex-encoded 64-bit difference hash used for near-duplicate detection';
@@ -7,9 +7,11 @@ Handles parsing of batch output files and writing extracted knowledge.
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+from src.shared.batch.stream_ingest import DEFAULT_WINDOW_SIZE, IngestWindow, StreamingIngestor
+
 from ..db.completion_tracker import KnowledgeCompletionTracker
 from ..db.knowledge_writer import KnowledgeWriter
 from ..db.fact_reader import NewsFactReader
@@ -39,6 +41,37 @@ class BatchResult:
             self.errors = []
 
 
+def _group_key(batch_response: Dict) -> Optional[str]:
+    parts = (batch_response.get("custom_id") or "").split("_", 1)
+    return parts[1] if len(parts) == 2 else None
+
+
+def _index_group_lines(output_file: Path) -> Dict[str, List[Tuple[int, int]]]:
+    """Map each group to the ``(line_number, byte_offset)`` of its output lines.
+
+    Batch output order is not guaranteed, so a group's topic and entity lines
+    may land in different windows.
+    """
+    index: Dict[str, List[Tuple[int, int]]] = {}
+    offset = 0
+    with open(output_file, "rb") as handle:
+        for line_number, raw in enumerate(handle, start=1):
+            try:
+                record = json.loads(raw)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                record = None
+            group_id = _group_key(record) if isinstance(record, dict) else None
+            if group_id is not None:
+                index.setdefault(group_id, []).append((line_number, offset))
+            offset += len(raw)
+    return index
+
+
+def _read_record(handle: BinaryIO, offset: int) -> Dict:
+    handle.seek(offset)
+    return json.loads(handle.readline())
+
+
 class BatchResultProcessor:
     """
     Processes batch API output files and writes to database.
@@ -56,6 +89,7 @@ class BatchResultProcessor:
         entity_resolver: Optional[EntityResolver] = None,
         reader: Optional[NewsFactReader] = None,
         continue_on_error: bool = True,
+        window_size: int = DEFAULT_WINDOW_SIZE,
     ):
         """
         Initialize the batch result processor.
@@ -65,12 +99,14 @@ class BatchResultProcessor:
             entity_resolver: Entity resolver (default: new instance)
             reader: News fact reader (default: new instance)
             continue_on_error: Whether to continue on errors
+            window_size: Groups per streamed ingestion window
         """
         self.writer = writer or KnowledgeWriter()
         self.entity_resolver = entity_resolver or EntityResolver()
         self.reader = reader or NewsFactReader()
         self.completion_tracker = KnowledgeCompletionTracker(client=self.writer.client)
         self.continue_on_error = continue_on_error
+        self.window_size = window_size
         
         logger.info("Initialized BatchResultProcessor")
     
@@ -78,6 +114,7 @@ class BatchResultProcessor:
         self,
         output_file: Path,
         dry_run: bool = False,
+        resume: bool = True,
     ) -> BatchResult:
         """
         Process a batch output file and write results to database.
@@ -85,6 +122,7 @@ class BatchResultProcessor:
         Args:
             output_file: Path to batch output .jsonl file
             dry_run: If True, don't write to database
+            resume: Continue after the last committed window of a failed run
             
         Returns:
             BatchResult with processing statistics
@@ -99,193 +137,61 @@ class BatchResultProcessor:
         result = BatchResult()
         
         # Group results by story group ID
-        # We have 2 requests per group: topic_{group_id} and entity_{group_id}
-        group_results = {}
-        
-        # Read all results from file
-        logger.info("Reading batch output file...")
-        with open(output_file, 'r') as f:
-            for line_num, line in enumerate(f, 1):
+        # We have 2 requests per group: topic_{group_id} and entity_{group_id}.
+        # The file is streamed in windows of ``window_size`` groups so memory
+        # stays bounded and a failed run resumes after the last committed window.
+        # A group is written once, when its last line is streamed; lines that
+        # arrived in earlier windows (possibly before a resume) are read back
+        # by offset from a first indexing pass.
+        group_lines = _index_group_lines(output_file)
+        processed = 0
+
+        def on_invalid_line(line_num: int, e: Exception) -> None:
+            error_msg = f"Invalid JSON at line {line_num}: {e}"
+            logger.error(error_msg)
+            result.errors.append(error_msg)
+
+        def write_window(window: IngestWindow) -> None:
+            nonlocal processed
+            window_lines = {line_num for line_num, _ in window.records}
+            records = list(window.records)
+            deferred = set()
+            for group_id in window.keys:
+                lines = group_lines.get(group_id, [])
+                if lines and lines[-1][0] not in window_lines:
+                    deferred.add(group_id)
+                    continue
+                for line_num, offset in lines:
+                    if line_num not in window_lines:
+                        records.append((line_num, _read_record(lookup, offset)))
+
+            group_results: Dict[str, Dict] = {}
+            for line_num, batch_response in sorted(records, key=lambda item: item[0]):
+                if _group_key(batch_response) in deferred:
+                    continue
                 try:
-                    batch_response = json.loads(line)
-                    
-                    custom_id = batch_response.get("custom_id")
-                    response = batch_response.get("response")
-                    error = batch_response.get("error")
-                    
-                    if error:
-                        error_msg = f"Batch request {custom_id} failed: {error}"
-                        logger.error(error_msg)
-                        result.errors.append(error_msg)
-                        result.groups_with_errors += 1
-                        continue
-                    
-                    if not response or response.get("status_code") != 200:
-                        error_msg = f"Invalid response for {custom_id}: {response}"
-                        logger.error(error_msg)
-                        result.errors.append(error_msg)
-                        continue
-                    
-                    # Parse custom_id to get type and group_id
-                    # Format: "topic_{group_id}" or "entity_{group_id}"
-                    parts = custom_id.split("_", 1)
-                    if len(parts) != 2:
-                        logger.warning(f"Invalid custom_id format: {custom_id}")
-                        continue
-                    
-                    request_type, group_id = parts
-                    
-                    # Initialize group results if needed
-                    if group_id not in group_results:
-                        group_results[group_id] = {
-                            "topics": None,
-                            "entities": None,
-                            "errors": [],
-                            "model": None
-                        }
-                    
-                    # Extract response body
-                    body = response.get("body", {})
-                    
-                    # Capture model if available
-                    if not group_results[group_id]["model"]:
-                        group_results[group_id]["model"] = body.get("model")
-                    
-                    # For Responses API, the text is in output[1].content[0].text
-                    # Structure: body.output -> array of [reasoning, message]
-                    # message.content -> array of content items with text
-                    output_text = None
-                    
-                    if "output" in body and isinstance(body["output"], list):
-                        # Find the message output (not reasoning)
-                        for output_item in body["output"]:
-                            if output_item.get("type") == "message":
-                                content = output_item.get("content", [])
-                                if content and isinstance(content, list):
-                                    for content_item in content:
-                                        if content_item.get("type") == "output_text":
-                                            output_text = content_item.get("text", "")
-                                            break
-                                if output_text:
-                                    break
-                    
-                    # Fallback to direct output_text field (for other API formats)
-                    if not output_text:
-                        output_text = body.get("output_text", "")
-                    
-                    if not output_text:
-                        logger.warning(f"No output text for {custom_id}")
-                        continue
-                    
-                    # Parse the response based on type
-                    if request_type == "topic":
-                        topics = self._parse_topic_response(output_text, custom_id)
-                        group_results[group_id]["topics"] = topics
-                    elif request_type == "entity":
-                        entities = self._parse_entity_response(output_text, custom_id)
-                        group_results[group_id]["entities"] = entities
-                    else:
-                        logger.warning(f"Unknown request type: {request_type}")
-                    
-                except json.JSONDecodeError as e:
-                    error_msg = f"Invalid JSON at line {line_num}: {e}"
-                    logger.error(error_msg)
-                    result.errors.append(error_msg)
+                    self._collect_response(batch_response, group_results, result)
                 except Exception as e:
                     error_msg = f"Error processing line {line_num}: {e}"
                     logger.error(error_msg, exc_info=True)
                     result.errors.append(error_msg)
-        
-        # Process each group's results
-        logger.info(f"\nProcessing {len(group_results)} groups...")
-        
-        for i, (group_id, group_data) in enumerate(group_results.items(), 1):
-            logger.info(f"\n[{i}/{len(group_results)}] Processing group {group_id}")
-            
-            try:
-                topics = group_data.get("topics") or []
-                extracted_entities = group_data.get("entities") or []
-                
-                # Resolve entities to database IDs
-                logger.debug(f"Resolving {len(extracted_entities)} entities...")
-                resolved_entities = self._resolve_entities(extracted_entities)
-                logger.info(f"Resolved {len(resolved_entities)} entities")
-                
-                # Write to database
-                if topics or resolved_entities:
-                    # Fetch facts for this group (news_url)
-                    facts = self.reader.get_facts_for_url(group_id)
-                    if not facts:
-                        logger.warning(f"No facts found for group {group_id}")
-                        result.groups_with_errors += 1
-                        continue
 
-                    llm_model = group_data.get("model") or "gpt-5-nano"
-                    topics_count = 0
-                    entities_count = 0
-
-                    fact_ids = [fact.get("id") for fact in facts if fact.get("id")]
-                    existing_topic_fact_ids = set(self.reader.get_existing_topic_fact_ids(fact_ids))
-                    existing_entity_fact_ids = set(self.reader.get_existing_entity_fact_ids(fact_ids))
-
-                    for fact in facts:
-                        fact_id = fact.get("id")
-                        if not fact_id:
-                            continue
-
-                        need_topics = bool(topics) and fact_id not in existing_topic_fact_ids
-                        need_entities = bool(resolved_entities) and fact_id not in existing_entity_fact_ids
-
-                        if not need_topics and not need_entities:
-                            logger.debug("Skipping fact %s (already populated)", fact_id)
-                            continue
-
-                        if need_topics:
-                            topics_count += self.writer.write_fact_topics(
-                                news_fact_id=fact_id,
-                                topics=topics,
-                                llm_model=llm_model,
-                                dry_run=dry_run
-                            )
-                            existing_topic_fact_ids.add(fact_id)
-
-                        if need_entities:
-                            entities_count += self.writer.write_fact_entities(
-                                news_fact_id=fact_id,
-                                entities=resolved_entities,
-                                llm_model=llm_model,
-                                dry_run=dry_run
-                            )
-                            existing_entity_fact_ids.add(fact_id)
-
-                    # Update article metrics
-                    self.writer.update_article_metrics(
-                        news_url_id=group_id,
-                        dry_run=dry_run
-                    )
-                    if not dry_run:
-                        self.completion_tracker.mark_complete_for_url_ids([group_id])
-                    
-                    result.groups_processed += 1
-                    result.topics_extracted += topics_count
-                    result.entities_extracted += entities_count
-                    
-                    logger.info(
-                        f"Wrote {topics_count} topics and "
-                        f"{entities_count} entities across {len(facts)} facts"
-                    )
-                else:
-                    logger.warning(f"No knowledge extracted for group {group_id}")
-                    result.groups_with_errors += 1
-                
-            except Exception as e:
-                error_msg = f"Error processing group {group_id}: {e}"
-                logger.error(error_msg, exc_info=True)
-                result.groups_with_errors += 1
-                result.errors.append(error_msg)
-                
-                if not self.continue_on_error:
-                    raise
+            for group_id, group_data in group_results.items():
+                processed += 1
+                logger.info(f"\n[{processed}] Processing group {group_id}")
+                self._process_group(group_id, group_data, result, dry_run)
+
+        logger.info("Streaming batch output file...")
+        ingestor = StreamingIngestor(
+            output_file,
+            key_fn=_group_key,
+            window_size=self.window_size,
+            resume=resume,
+            record_progress=not dry_run,
+            on_invalid_line=on_invalid_line,
+        )
+        with open(output_file, "rb") as lookup:
+            ingestor.run(write_window)
         
         # Log summary
         logger.info("\n" + "=" * 80)
@@ -298,6 +204,184 @@ class BatchResultProcessor:
         
         return result
     
+    def _collect_response(
+        self,
+        batch_response: Dict,
+        group_results: Dict[str, Dict],
+        result: BatchResult,
+    ) -> None:
+        """Parse one output line into ``group_results``."""
+        custom_id = batch_response.get("custom_id")
+        response = batch_response.get("response")
+        error = batch_response.get("error")
+
+        if error:
+            error_msg = f"Batch request {custom_id} failed: {error}"
+            logger.error(error_msg)
+            result.errors.append(error_msg)
+            result.groups_with_errors += 1
+            return
+
+        if not response or response.get("status_code") != 200:
+            error_msg = f"Invalid response for {custom_id}: {response}"
+            logger.error(error_msg)
+            result.errors.append(error_msg)
+            return
+
+        # Parse custom_id to get type and group_id
+        # Format: "topic_{group_id}" or "entity_{group_id}"
+        parts = custom_id.split("_", 1)
+        if len(parts) != 2:
+            logger.warning(f"Invalid custom_id format: {custom_id}")
+            return
+
+        request_type, group_id = parts
+
+        # Initialize group results if needed
+        if group_id not in group_results:
+            group_results[group_id] = {
+                "topics": None,
+                "entities": None,
+                "errors": [],
+                "model": None
+            }
+
+        # Extract response body
+        body = response.get("body", {})
+
+        # Capture model if available
+        if not group_results[group_id]["model"]:
+            group_results[group_id]["model"] = body.get("model")
+
+        # For Responses API, the text is in output[1].content[0].text
+        # Structure: body.output -> array of [reasoning, message]
+        # message.content -> array of content items with text
+        output_text = None
+
+        if "output" in body and isinstance(body["output"], list):
+            # Find the message output (not reasoning)
+            for output_item in body["output"]:
+                if output_item.get("type") == "message":
+                    content = output_item.get("content", [])
+                    if content and isinstance(content, list):
+                        for content_item in content:
+                            if content_item.get("type") == "output_text":
+                                output_text = content_item.get("text", "")
+                                break
+                    if output_text:
+                        break
+
+        # Fallback to direct output_text field (for other API formats)
+        if not output_text:
+            output_text = body.get("output_text", "")
+
+        if not output_text:
+            logger.warning(f"No output text for {custom_id}")
+            return
+
+        # Parse the response based on type
+        if request_type == "topic":
+            topics = self._parse_topic_response(output_text, custom_id)
+            group_results[group_id]["topics"] = topics
+        elif request_type == "entity":
+            entities = self._parse_entity_response(output_text, custom_id)
+            group_results[group_id]["entities"] = entities
+        else:
+            logger.warning(f"Unknown request type: {request_type}")
+
+    def _process_group(
+        self,
+        group_id: str,
+        group_data: Dict,
+        result: BatchResult,
+        dry_run: bool,
+    ) -> None:
+        """Resolve and write the topics and entities parsed for one group."""
+        try:
+            topics = group_data.get("topics") or []
+            extracted_entities = group_data.get("entities") or []
+
+            # Resolve entities to database IDs
+            logger.debug(f"Resolving {len(extracted_entities)} entities...")
+            resolved_entities = self._resolve_entities(extracted_entities)
+            logger.info(f"Resolved {len(resolved_entities)} entities")
+
+            # Write to database
+            if topics or resolved_entities:
+                # Fetch facts for this group (news_url)
+                facts = self.reader.get_facts_for_url(group_id)
+                if not facts:
+                    logger.warning(f"No facts found for group {group_id}")
+                    result.groups_with_errors += 1
+                    return
+
+                llm_model = group_data.get("model") or "gpt-5-nano"
+                topics_count = 0
+                entities_count = 0
+
+                fact_ids = [fact.get("id") for fact in facts if fact.get("id")]
+                existing_topic_fact_ids = set(self.reader.get_existing_topic_fact_ids(fact_ids))
+                existing_entity_fact_ids = set(self.reader.get_existing_entity_fact_ids(fact_ids))
+
+                for fact in facts:
+                    fact_id = fact.get("id")
+                    if not fact_id:
+                        continue
+
+                    need_topics = bool(topics) and fact_id not in existing_topic_fact_ids
+                    need_entities = bool(resolved_entities) and fact_id not in existing_entity_fact_ids
+
+                    if not need_topics and not need_entities:
+                        logger.debug("Skipping fact %s (already populated)", fact_id)
+                        continue
+
+                    if need_topics:
+                        topics_count += self.writer.write_fact_topics(
+                            news_fact_id=fact_id,
+                            topics=topics,
+                            llm_model=llm_model,
+                            dry_run=dry_run
+                        )
+                        existing_topic_fact_ids.add(fact_id)
+
+                    if need_entities:
+                        entities_count += self.writer.write_fact_entities(
+                            news_fact_id=fact_id,
+                            entities=resolved_entities,
+                            llm_model=llm_model,
+                            dry_run=dry_run
+                        )
+                        existing_entity_fact_ids.add(fact_id)
+
+                # Update article metrics
+                self.writer.update_article_metrics(
+                    news_url_id=group_id,
+                    dry_run=dry_run
+                )
+                if not dry_run:
+                    self.completion_tracker.mark_complete_for_url_ids([group_id])
+
+                result.groups_processed += 1
+                result.topics_extracted += topics_count
+                result.entities_extracted += entities_count
+
+                logger.info(
+                    f"Wrote {topics_count} topics and "
+                    f"{entities_count} entities across {len(facts)} facts"
+                )
+            else:
+                logger.warning(f"No knowledge extracted for group {group_id}")
+                result.groups_with_errors += 1
+
+        except Exception as e:
+            error_msg = f"Error processing group {group_id}: {e}"
+            logger.error(error_msg, exc_info=True)
+            result.groups_with_errors += 1
+            result.errors.append(error_msg)
+
+            if not self.continue_on_error:
+                raise
+
     def _parse_topic_response(self, output_text: str, custom_id: str) -> List[ExtractedTopic]:
         """Parse topic extraction response from LLM."""
         try:
@@ -6,17 +6,78 @@ Extracts mentions of players, teams, and games from NFL story content.
 
 import logging
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 
 import openai
 from openai import OpenAIError, RateLimitError, APITimeoutError
 
+from src.shared.utils.rate_limiter import estimate_tokens, get_rate_limiter, provider_for_model
+
 from ..prompts import build_entity_extraction_prompt, build_batched_entity_extraction_prompt
 
 logger = logging.getLogger(__name__)
 
+# Budgets for one batched multi-fact request. Facts are packed in order until
+# the next one would overflow either budget or the fact cap.
+DEFAULT_MULTI_INPUT_TOKENS = 1200
+DEFAULT_MULTI_OUTPUT_TOKENS = 4000
+MAX_FACTS_PER_REQUEST = 40
+# How many times a chunk may be halved or re-requested before its remaining
+# facts are retried whole; 40 facts bottom out at chunks of five.
+MAX_SPLIT_DEPTH = 3
+DEFAULT_MAX_WORKERS = 4
+# Tier-1 OpenAI request limit for gpt-5-nano; shared host-wide per model.
+DEFAULT_REQUESTS_PER_MINUTE = 500
+# Rough output cost of one fact: the {"fact_index", "entities"} wrapper plus
+# entity objects, which grow with the length of the fact.
+_OUTPUT_TOKENS_PER_FACT = 15
+_OUTPUT_TOKENS_PER_INPUT_TOKEN = 3
+# "N. " numbering and newline added per fact by the batched prompt.
+_PROMPT_TOKENS_PER_FACT = 3
+
+
+def estimate_fact_tokens(fact_text: str) -> tuple[int, int]:
+    """Estimated (input, output) tokens one fact adds to a batched request."""
+    input_tokens = estimate_tokens(fact_text) + _PROMPT_TOKENS_PER_FACT
+    return input_tokens, _OUTPUT_TOKENS_PER_FACT + input_tokens * _OUTPUT_TOKENS_PER_INPUT_TOKEN
+
+
+def pack_facts(
+    facts: List[Dict],
+    max_input_tokens: int = DEFAULT_MULTI_INPUT_TOKENS,
+    max_output_tokens: int = DEFAULT_MULTI_OUTPUT_TOKENS,
+    max_facts: int = MAX_FACTS_PER_REQUEST,
+) -> List[List[Dict]]:
+    """
+    Greedily pack facts, in order, into chunks that fit the token budgets.
+
+    A single fact larger than a budget still gets a chunk of its own.
+    """
+    chunks: List[List[Dict]] = []
+    current: List[Dict] = []
+    input_total = output_total = 0
+
+    for fact in facts:
+        input_tokens, output_tokens = estimate_fact_tokens(fact.get("fact_text", ""))
+        if current and (
+            len(current) >= max_facts
+            or input_total + input_tokens > max_input_tokens
+            or output_total + output_tokens > max_output_tokens
+        ):
+            chunks.append(current)
+            current, input_total, output_total = [], 0, 0
+        current.append(fact)
+        input_total += input_tokens
+        output_total += output_tokens
+
+    if current:
+        chunks.append(current)
+    return chunks
+
 
 @dataclass
 class ExtractedEntity:
@@ -47,6 +108,9 @@ class EntityExtractor:
     - Reduces false positives from players with common names
     
     Production features:
+    - Token-budget packing of facts into batched requests, sent concurrently
+    - Adaptive splitting of batched responses that fail to parse
+    - Host-wide rate limiting shared with other processes using the model
     - Exponential backoff retry on rate limits
     - Timeout handling
     - Circuit breaker for consecutive failures
@@ -81,8 +145,12 @@ class EntityExtractor:
             raise ValueError("OpenAI API key required (set OPENAI_API_KEY env var)")
         
         openai.api_key = self.api_key
+        self._rate_limiter = get_rate_limiter(
+            provider_for_model(model), model, requests_per_minute=DEFAULT_REQUESTS_PER_MINUTE
+        )
         
-        # Circuit breaker state
+        # Circuit breaker state (shared by concurrent chunk workers)
+        self._breaker_lock = threading.Lock()
         self._consecutive_failures = 0
         self._circuit_open = False
         self._last_failure_time = None
@@ -94,38 +162,72 @@ class EntityExtractor:
     
     def _check_circuit_breaker(self):
         """Check if circuit breaker should prevent API calls."""
-        if not self._circuit_open:
-            return
-        
-        # Auto-reset circuit after 5 minutes
-        if self._last_failure_time and (time.time() - self._last_failure_time) > 300:
-            logger.info("Circuit breaker reset after cooldown period")
-            self._circuit_open = False
-            self._consecutive_failures = 0
-            return
-        
-        raise Exception(
-            f"Circuit breaker is open after {self._consecutive_failures} consecutive failures. "
-            "Wait 5 minutes before retrying."
-        )
+        with self._breaker_lock:
+            if not self._circuit_open:
+                return
+            
+            # Auto-reset circuit after 5 minutes
+            if self._last_failure_time and (time.time() - self._last_failure_time) > 300:
+                logger.info("Circuit breaker reset after cooldown period")
+                self._circuit_open = False
+                self._consecutive_failures = 0
+                return
+            
+            raise Exception(
+                f"Circuit breaker is open after {self._consecutive_failures} consecutive failures. "
+                "Wait 5 minutes before retrying."
+            )
     
     def _record_success(self):
         """Record successful API call."""
-        if self._consecutive_failures > 0:
-            logger.info("API call succeeded, resetting failure counter")
-        self._consecutive_failures = 0
-        self._circuit_open = False
+        with self._breaker_lock:
+            if self._consecutive_failures > 0:
+                logger.info("API call succeeded, resetting failure counter")
+            self._consecutive_failures = 0
+            self._circuit_open = False
     
     def _record_failure(self):
         """Record failed API call and potentially open circuit."""
-        self._consecutive_failures += 1
-        self._last_failure_time = time.time()
-        
-        if self._consecutive_failures >= self.circuit_breaker_threshold:
-            self._circuit_open = True
-            logger.error(
-                f"Circuit breaker opened after {self._consecutive_failures} consecutive failures"
+        with self._breaker_lock:
+            self._consecutive_failures += 1
+            self._last_failure_time = time.time()
+            
+            if self._consecutive_failures >= self.circuit_breaker_threshold:
+                self._circuit_open = True
+                logger.error(
+                    f"Circuit breaker opened after {self._consecutive_failures} consecutive failures"
+                )
+
+    def _create_response(self, prompt: str, expected_output_tokens: int = 0, attempt: int = 0):
+        """Call the Responses API through the shared rate limiter.
+
+        A 429 sets the limiter's shared cooldown (growing with *attempt*), which
+        the next ``acquire`` waits out, so callers retry without sleeping.
+        """
+        estimated_tokens = estimate_tokens(prompt) + expected_output_tokens
+        self._rate_limiter.acquire(estimated_tokens)
+        try:
+            # Use Responses API for GPT-5 models with timeout
+            response = openai.responses.create(
+                model=self.model,
+                input=prompt,
+                reasoning={"effort": "low"},
+                text={"verbosity": "low"},
+                timeout=self.timeout,
+            )
+        except RateLimitError as e:
+            delay = self._rate_limiter.record_rate_limited(
+                headers=getattr(getattr(e, "response", None), "headers", None),
+                attempt=attempt,
             )
+            logger.warning(f"Rate limited by {self.model}; shared cooldown {delay:.1f}s")
+            raise
+        usage = getattr(response, "usage", None)
+        self._rate_limiter.record_success(
+            tokens_used=getattr(usage, "total_tokens", None),
+            estimated_tokens=estimated_tokens,
+        )
+        return response
     
     def extract(
         self,
@@ -155,15 +257,7 @@ class EntityExtractor:
         for attempt in range(self.max_retries):
             try:
                 prompt = self._build_extraction_prompt(summary_text, max_entities)
-                
-                # Use Responses API for GPT-5 models with timeout
-                response = openai.responses.create(
-                    model=self.model,
-                    input=prompt,
-                    reasoning={"effort": "low"},
-                    text={"verbosity": "low"},
-                    timeout=self.timeout,
-                )
+                response = self._create_response(prompt, attempt=attempt)
                 
                 entities = self._parse_response(response.output_text)
                 self._record_success()
@@ -171,14 +265,9 @@ class EntityExtractor:
                 return entities
                 
             except RateLimitError as e:
-                wait_time = min(2 ** attempt, 60)  # Exponential backoff, max 60s
-                logger.warning(
-                    f"Rate limit hit (attempt {attempt + 1}/{self.max_retries}). "
-                    f"Waiting {wait_time}s before retry..."
-                )
-                if attempt < self.max_retries - 1:
-                    time.sleep(wait_time)
-                else:
+                # The next acquire waits out the cooldown the limiter just set.
+                logger.warning(f"Rate limit hit (attempt {attempt + 1}/{self.max_retries})")
+                if attempt >= self.max_retries - 1:
                     self._record_failure()
                     logger.error(f"Rate limit exceeded after {self.max_retries} attempts")
                     return []
@@ -314,48 +403,55 @@ class EntityExtractor:
         self,
         facts: List[Dict],
         max_entities_per_fact: int = 10,
-        chunk_size: int = 15,
+        chunk_size: Optional[int] = None,
+        max_input_tokens: int = DEFAULT_MULTI_INPUT_TOKENS,
+        max_output_tokens: int = DEFAULT_MULTI_OUTPUT_TOKENS,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> Dict[str, List[ExtractedEntity]]:
         """
-        Extract entities from multiple facts in a single API call per chunk.
+        Extract entities from multiple facts with one API call per packed chunk.
 
-        Sends chunk_size facts at once, dramatically reducing prompt overhead
-        compared to one API call per fact.
+        Facts are packed into chunks by estimated token cost, so short facts
+        share a request and long ones don't overflow the response. Chunks are
+        sent concurrently on a bounded pool, each still going through the
+        circuit breaker and the shared rate limiter.
 
         Args:
             facts: List of dicts with 'id' and 'fact_text' keys
             max_entities_per_fact: Max entities to extract per fact
-            chunk_size: Number of facts per API call
+            chunk_size: Maximum facts per API call (default: MAX_FACTS_PER_REQUEST)
+            max_input_tokens: Target fact-text tokens per API call
+            max_output_tokens: Target response tokens per API call
+            max_workers: Chunks in flight at once
 
         Returns:
             Dict mapping fact ID to list of extracted entities
         """
         results: Dict[str, List[ExtractedEntity]] = {}
 
-        # Process in chunks
-        for chunk_start in range(0, len(facts), chunk_size):
-            chunk = facts[chunk_start:chunk_start + chunk_size]
+        chunks = pack_facts(
+            [f for f in facts if f.get("fact_text")],
+            max_input_tokens=max_input_tokens,
+            max_output_tokens=max_output_tokens,
+            max_facts=chunk_size or MAX_FACTS_PER_REQUEST,
+        )
+        if not chunks:
+            return results
+
+        def _run(chunk: List[Dict]) -> Dict[str, List[ExtractedEntity]]:
             fact_texts = [f.get("fact_text", "") for f in chunk]
             fact_ids = [f.get("id", "") for f in chunk]
+            return self._extract_multi_chunk(fact_texts, fact_ids, max_entities_per_fact)
 
-            if not any(fact_texts):
-                continue
-
-            # Check circuit breaker
-            try:
-                self._check_circuit_breaker()
-            except Exception as e:
-                logger.error(str(e))
-                for fid in fact_ids:
-                    results[fid] = []
-                continue
-
-            chunk_results = self._extract_multi_chunk(
-                fact_texts, fact_ids, max_entities_per_fact
-            )
-            results.update(chunk_results)
+        workers = max(1, min(max_workers, len(chunks)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="entities") as executor:
+            for chunk_results in executor.map(_run, chunks):
+                results.update(chunk_results)
 
-        logger.info(f"Extracted entities for {len(results)} facts via batched extraction")
+        logger.info(
+            f"Extracted entities for {len(results)} facts via batched extraction "
+            f"({len(chunks)} requests, {workers} workers)"
+        )
         return results
 
     def _extract_multi_chunk(
@@ -363,49 +459,85 @@ class EntityExtractor:
         fact_texts: List[str],
         fact_ids: List[str],
         max_entities_per_fact: int,
+        depth: int = 0,
     ) -> Dict[str, List[ExtractedEntity]]:
-        """Extract entities from a single chunk of facts via one API call."""
-        import json as json_mod
+        """
+        Extract entities from a single chunk of facts via one API call.
+
+        A response that doesn't parse is split in half and each half is
+        requested on its own; facts missing from an otherwise valid response
+        are requested again without the ones already answered. Past
+        MAX_SPLIT_DEPTH, or for a single fact, the chunk is retried whole.
+        Every request checks the circuit breaker first, so an open breaker
+        stops the recursion instead of fanning out across the halves.
+        """
+        expected_output_tokens = sum(estimate_fact_tokens(text)[1] for text in fact_texts)
 
         for attempt in range(self.max_retries):
+            try:
+                self._check_circuit_breaker()
+            except Exception as e:
+                logger.error(str(e))
+                return {fid: [] for fid in fact_ids}
+
             try:
                 prompt = build_batched_entity_extraction_prompt(
                     fact_texts, max_entities_per_fact
                 )
-
-                response = openai.responses.create(
-                    model=self.model,
-                    input=prompt,
-                    reasoning={"effort": "low"},
-                    text={"verbosity": "low"},
-                    timeout=self.timeout,
-                )
-
+                response = self._create_response(prompt, expected_output_tokens, attempt)
                 parsed = self._parse_multi_response(response.output_text, fact_ids)
 
-                # Treat parse failures (e.g., wrong shape / missing fact IDs) as failures
-                # so that the retry loop and circuit breaker behave correctly.
-                if not isinstance(parsed, dict) or any(fid not in parsed for fid in fact_ids):
-                    logger.error(
-                        "Failed to parse multi-extract response into expected shape; "
-                        "treating as failure and retrying."
-                    )
+                if parsed is not None and len(fact_ids) == 1:
+                    # A valid but empty answer for one fact means "no entities".
+                    self._record_success()
+                    return {fact_ids[0]: parsed.get(fact_ids[0], [])}
+
+                if not parsed:
+                    # Treat parse failures (e.g., truncated JSON / wrong shape) as failures
+                    # so the circuit breaker still sees them, then shrink the request.
                     self._record_failure()
-                    # Let the retry loop handle backoff / eventual exhaustion.
-                    continue
+                    if len(fact_ids) == 1 or depth >= MAX_SPLIT_DEPTH:
+                        continue
+                    mid = len(fact_ids) // 2
+                    logger.warning(
+                        f"Multi-extract response for {len(fact_ids)} facts did not parse; "
+                        "splitting chunk in half"
+                    )
+                    results = self._extract_multi_chunk(
+                        fact_texts[:mid], fact_ids[:mid], max_entities_per_fact, depth + 1
+                    )
+                    results.update(
+                        self._extract_multi_chunk(
+                            fact_texts[mid:], fact_ids[mid:], max_entities_per_fact, depth + 1
+                        )
+                    )
+                    return results
 
                 self._record_success()
+                missing = [i for i, fid in enumerate(fact_ids) if fid not in parsed]
+                if missing and depth < MAX_SPLIT_DEPTH:
+                    logger.warning(
+                        f"Multi-extract response skipped {len(missing)}/{len(fact_ids)} facts; "
+                        "requesting them again"
+                    )
+                    parsed.update(
+                        self._extract_multi_chunk(
+                            [fact_texts[i] for i in missing],
+                            [fact_ids[i] for i in missing],
+                            max_entities_per_fact,
+                            depth + 1,
+                        )
+                    )
+                for fid in fact_ids:
+                    parsed.setdefault(fid, [])
                 return parsed
 
             except RateLimitError:
-                wait_time = min(2 ** attempt, 60)
+                # The next acquire waits out the cooldown the limiter just set.
                 logger.warning(
-                    f"Rate limit hit on multi-extract (attempt {attempt + 1}/{self.max_retries}). "
-                    f"Waiting {wait_time}s..."
+                    f"Rate limit hit on multi-extract (attempt {attempt + 1}/{self.max_retries})"
                 )
-                if attempt < self.max_retries - 1:
-                    time.sleep(wait_time)
-                else:
+                if attempt >= self.max_retries - 1:
                     self._record_failure()
 
             except APITimeoutError as e:
@@ -432,25 +564,30 @@ class EntityExtractor:
 
     def _parse_multi_response(
         self, response_text: str, fact_ids: List[str]
-    ) -> Dict[str, List[ExtractedEntity]]:
-        """Parse the batched multi-fact response into per-fact entity lists."""
+    ) -> Optional[Dict[str, List[ExtractedEntity]]]:
+        """
+        Parse the batched multi-fact response into per-fact entity lists.
+
+        Returns only the facts the response answered, or None when the
+        response is not a JSON list.
+        """
         import json
 
-        results: Dict[str, List[ExtractedEntity]] = {fid: [] for fid in fact_ids}
+        results: Dict[str, List[ExtractedEntity]] = {}
 
         try:
             data = json.loads(response_text)
 
             if not isinstance(data, list):
                 logger.error(f"Expected list response for multi-extract, got {type(data)}")
-                return results
+                return None
 
             for item in data:
                 if not isinstance(item, dict):
                     continue
 
                 fact_index = item.get("fact_index")
-                if fact_index is None:
+                if not isinstance(fact_index, int):
                     continue
 
                 # fact_index is 1-based
@@ -478,8 +615,10 @@ class EntityExtractor:
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse multi-extract response: {e}")
+            return None
         except Exception as e:
             logger.error(f"Error parsing multi-extract response: {e}", exc_info=True)
+            return None
 
         return results
 
@@ -487,19 +626,20 @@ class EntityExtractor:
         self,
         summaries: List[Dict[str, str]],
         max_entities_per_summary: int = 20,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> Dict[str, List[ExtractedEntity]]:
         """
-        Extract entities from multiple summaries.
+        Extract entities from multiple summaries concurrently.
         
         Args:
             summaries: List of dicts with 'id' and 'summary_text' keys
             max_entities_per_summary: Max entities per summary
+            max_workers: Summaries extracted at once
             
         Returns:
             Dict mapping summary ID to list of extracted entities
         """
-        results = {}
-        
+        valid = []
         for summary in summaries:
             summary_id = summary.get("id")
             summary_text = summary.get("summary_text", "")
@@ -508,8 +648,17 @@ class EntityExtractor:
                 logger.warning(f"Skipping invalid summary: {summary}")
                 continue
             
-            entities = self.extract(summary_text, max_entities_per_summary)
-            results[summary_id] = entities
+            valid.append((summary_id, summary_text))
+
+        results = {}
+        if valid:
+            workers = max(1, min(max_workers, len(valid)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="entities") as executor:
+                extracted = executor.map(
+                    lambda item: self.extract(item[1], max_entities_per_summary), valid
+                )
+                for (summary_id, _), entities in zip(valid, extracted):
+                    results[summary_id] = entities
         
         logger.info(f"Extracted entities for {len(results)} summaries")
         return results
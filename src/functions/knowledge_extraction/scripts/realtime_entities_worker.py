@@ -253,12 +253,12 @@ def main() -> None:
     ]
     stats["skipped_existing"] = len(pending_facts) - len(facts_to_process)
 
-    # Use batched multi-fact extraction (Phase 3 optimization)
+    # Use batched multi-fact extraction (Phase 3 optimization); facts are
+    # packed by token budget and chunks are sent concurrently
     if facts_to_process:
         multi_results = extractor.extract_multi(
             facts_to_process,
             max_entities_per_fact=args.max_entities,
-            chunk_size=15,
         )
 
         for row in facts_to_process:
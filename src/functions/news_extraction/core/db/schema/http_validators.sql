@@ -0,0 +1,10 @@
+-- Shared HTTP validator cache for news_extraction feed/sitemap fetches (optional).
+-- Enable with NEWS_VALIDATOR_CACHE_TABLE=news_http_validators.
+
+CREATE TABLE IF NOT EXISTS news_http_validators (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    body_hash TEXT,                        -- sha256 of the last written response body
+    checked_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
@@ -17,6 +17,7 @@ import logging
 from ..contracts import NewsItem
 from ..config import SourceConfig
 from ..utils.dates import parse_feed_date
+from ..utils.validators import validator_key
 from .base import BaseExtractor
 
 logger = logging.getLogger(__name__)
@@ -51,9 +52,17 @@ class RssExtractor(BaseExtractor):
         if not self._is_valid_url(url):
             raise ValueError(f"Invalid RSS URL: {url}")
 
+        max_articles = kwargs.get("max_articles") or source.max_articles
+        days_back = kwargs.get("days_back") or source.days_back
+        # A body read with other limits yields other items, so it is not "unchanged"
+        cache_key = validator_key(url, max_articles=max_articles, days_back=days_back)
+
         try:
-            # Fetch the feed with timeout
-            response = self.http_client.get(url, timeout=RSS_TIMEOUT_SECONDS)
+            # Fetch the feed with timeout (None when unchanged since the last run)
+            response = self.http_client.get_if_changed(url, key=cache_key, timeout=RSS_TIMEOUT_SECONDS)
+            if response is None:
+                logger.info(f"Skipping unchanged RSS feed: {source.name}")
+                return []
             
             if not response.content:
                 logger.warning(f"Empty response from RSS feed: {source.name}")
@@ -71,8 +80,6 @@ class RssExtractor(BaseExtractor):
                 logger.warning(f"RSS feed parsing warnings for {source.name}: {getattr(feed, 'bozo_exception', 'Unknown')}")
 
             items = []
-            max_articles = kwargs.get("max_articles") or source.max_articles
-            days_back = kwargs.get("days_back") or source.days_back
 
             # Process each entry (capped to prevent memory issues on huge feeds)
             for entry in feed.entries[:MAX_ENTRIES_TO_PROCESS]:
@@ -94,6 +101,8 @@ class RssExtractor(BaseExtractor):
 
         except Exception as e:
             logger.error(f"Error extracting from RSS feed {source.name}: {e}")
+            # Keep refetching this feed until its items are actually extracted
+            self.http_client.discard_validators(cache_key)
             raise
 
     def _parse_entry(
@@ -17,6 +17,7 @@ import logging
 from ..contracts import NewsItem
 from ..config import SourceConfig
 from ..utils.dates import parse_feed_date
+from ..utils.validators import validator_key
 from .base import BaseExtractor
 
 logger = logging.getLogger(__name__)
@@ -53,9 +54,17 @@ class SitemapExtractor(BaseExtractor):
         if not self._is_valid_url(url):
             raise ValueError(f"Invalid sitemap URL: {url}")
 
+        max_articles = kwargs.get("max_articles") or source.max_articles
+        days_back = kwargs.get("days_back") or source.days_back
+        # A body read with other limits yields other items, so it is not "unchanged"
+        cache_key = validator_key(url, max_articles=max_articles, days_back=days_back)
+
         try:
-            # Fetch the sitemap with timeout
-            response = self.http_client.get(url, timeout=SITEMAP_TIMEOUT_SECONDS)
+            # Fetch the sitemap with timeout (None when unchanged since the last run)
+            response = self.http_client.get_if_changed(url, key=cache_key, timeout=SITEMAP_TIMEOUT_SECONDS)
+            if response is None:
+                logger.info(f"Skipping unchanged sitemap: {source.name}")
+                return []
             
             if not response.content:
                 logger.warning(f"Empty response from sitemap: {source.name}")
@@ -75,8 +84,6 @@ class SitemapExtractor(BaseExtractor):
             }
 
             items = []
-            max_articles = kwargs.get("max_articles") or source.max_articles
-            days_back = kwargs.get("days_back") or source.days_back
 
             # Find all <url> elements with limit to prevent memory issues
             url_elements = root.findall("ns:url", namespaces)[:MAX_URLS_TO_PROCESS]
@@ -100,10 +107,13 @@ class SitemapExtractor(BaseExtractor):
 
         except ET.ParseError as e:
             logger.error(f"XML parse error for sitemap {source.name}: {e}")
+            self.http_client.discard_validators(cache_key)
             raise RuntimeError(f"Sitemap XML parsing failed for {source.name}: {e}") from e
 
         except Exception as e:
             logger.error(f"Error extracting from sitemap {source.name}: {e}")
+            # Keep refetching this sitemap until its items are actually extracted
+            self.http_client.discard_validators(cache_key)
             raise RuntimeError(f"Sitemap extraction failed for {source.name}: {e}") from e
 
     def _parse_url_element(
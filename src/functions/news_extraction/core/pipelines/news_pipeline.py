@@ -20,7 +20,7 @@ from ..processors import UrlProcessor
 from ..data.transformers import NewsTransformer
 from ..db import NewsUrlWriter
 from ..db.watermarks import NewsSourceWatermarkStore
-from ..utils import HttpClient
+from ..utils import HttpClient, build_validator_store_from_env
 from ..utils.dates import ensure_utc
 from ..monitoring import PerformanceMonitor
 
@@ -80,6 +80,7 @@ class NewsExtractionPipeline:
                 max_requests_per_minute=getattr(
                     self.config, "max_requests_per_minute_per_source", 60
                 ),
+                validator_store=build_validator_store_from_env(),
             )
 
     def close(self) -> None:
@@ -228,6 +229,14 @@ class NewsExtractionPipeline:
         if write_result.get("success") and not dry_run and new_watermarks:
             self.watermarks.update_watermarks(new_watermarks)
 
+        # Only remember feed validators once this run's items are stored;
+        # otherwise the next run would skip the unchanged feed and lose them.
+        if write_result.get("success") and not dry_run:
+            if hasattr(self.http_client, "commit_validators"):
+                self.http_client.commit_validators()
+        elif hasattr(self.http_client, "discard_validators"):
+            self.http_client.discard_validators()
+
         final_metrics = monitor.finish_extraction()
 
         result = {
@@ -241,6 +250,11 @@ class NewsExtractionPipeline:
             "inserted_ids": write_result.get("inserted_ids", []),
             "total_records": len(records),
             "dry_run": dry_run,
+            "conditional_fetch": (
+                self.http_client.get_conditional_stats()
+                if hasattr(self.http_client, "get_conditional_stats")
+                else {}
+            ),
             "metrics": final_metrics.to_dict(),
             "performance": {
                 "duration_seconds": final_metrics.duration_seconds,
@@ -2,5 +2,14 @@
 
 from .client import HttpClient, RateLimiter
 from .dates import ensure_utc, parse_feed_date
+from .validators import HttpValidators, build_validator_store_from_env, validator_key
 
-__all__ = ["HttpClient", "RateLimiter", "ensure_utc", "parse_feed_date"]
+__all__ = [
+    "HttpClient",
+    "HttpValidators",
+    "RateLimiter",
+    "build_validator_store_from_env",
+    "ensure_utc",
+    "parse_feed_date",
+    "validator_key",
+]
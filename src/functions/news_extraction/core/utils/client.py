@@ -20,6 +20,8 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import logging
 
+from .validators import HttpValidators
+
 logger = logging.getLogger(__name__)
 
 # Caching constants
@@ -275,6 +277,7 @@ class HttpClient:
         circuit_breaker_threshold: int = 5,
         enable_cache: bool = True,
         cache_ttl: int = DEFAULT_CACHE_TTL_SECONDS,
+        validator_store: Optional[Any] = None,
     ):
         """
         Initialize HTTP client.
@@ -287,6 +290,9 @@ class HttpClient:
             circuit_breaker_threshold: Failures before opening circuit
             enable_cache: Whether to enable response caching
             cache_ttl: Cache time-to-live in seconds
+            validator_store: Optional persistent store of ETag / Last-Modified /
+                body hash per URL (see ``validators.py``); enables
+                :meth:`get_if_changed` to skip unchanged sources
         """
         self.user_agent = user_agent
         self.timeout = timeout
@@ -296,6 +302,14 @@ class HttpClient:
         # Initialize cache if enabled
         self.cache = SimpleCache(default_ttl=cache_ttl) if enable_cache else None
 
+        # Validators observed this run are held until the caller confirms the
+        # results were written (commit_validators), so a failed write doesn't
+        # make the next run skip a source whose items were never stored.
+        self.validator_store = validator_store
+        self._pending_validators: Dict[str, HttpValidators] = {}
+        self._validator_lock = threading.Lock()
+        self._conditional_stats = {"conditional_requests": 0, "not_modified": 0, "unchanged_body": 0}
+
         # Configure session with retries
         self.session = requests.Session()
 
@@ -399,6 +413,105 @@ class HttpClient:
             logger.error(f"Request error fetching {url}: {e}")
             raise
 
+    def get_if_changed(self, url: str, key: Optional[str] = None, **kwargs) -> Optional[requests.Response]:
+        """
+        GET *url* unless it is unchanged since the last committed fetch.
+
+        Sends ``If-None-Match`` / ``If-Modified-Since`` from the validator
+        store and compares the body hash for servers that ignore them.
+        Behaves like :meth:`get` when no validator store is configured.
+
+        Args:
+            url: URL to fetch
+            key: Validator store key (default: *url*), see ``validator_key``
+
+        Returns:
+            The response, or None on ``304 Not Modified`` / an identical body
+        """
+        if self.validator_store is None:
+            return self.get(url, **kwargs)
+        return self.circuit_breaker.call(self._do_conditional_get, url, key or url, **kwargs)
+
+    def _do_conditional_get(self, url: str, key: str, **kwargs) -> Optional[requests.Response]:
+        """Conditional GET; bypasses the in-memory cache since a 304 is cheap."""
+        try:
+            known = self.validator_store.get(key)
+        except Exception as e:
+            logger.warning(f"Validator lookup failed for {key}: {e}")
+            known = None
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if known:
+            headers.update(known.request_headers())
+        kwargs.setdefault("timeout", self.timeout)
+
+        self.rate_limiter.acquire()
+        with self._validator_lock:
+            self._conditional_stats["conditional_requests"] += 1
+
+        try:
+            response = self.session.get(url, headers=headers, **kwargs)
+            if response.status_code == 304:
+                logger.info(f"Not modified since last run: {url}")
+                with self._validator_lock:
+                    self._conditional_stats["not_modified"] += 1
+                return None
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request error fetching {url}: {e}")
+            raise
+
+        body_hash = hashlib.sha256(response.content or b"").hexdigest()
+        if known and known.body_hash == body_hash:
+            logger.info(f"Body unchanged since last run: {url}")
+            with self._validator_lock:
+                self._conditional_stats["unchanged_body"] += 1
+            return None
+
+        with self._validator_lock:
+            self._pending_validators[key] = HttpValidators(
+                url=key,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                body_hash=body_hash,
+            )
+        return response
+
+    def commit_validators(self) -> int:
+        """Persist validators for URLs fetched since the last commit.
+
+        Returns the number of URLs recorded. Store failures are logged; they
+        only cost a full fetch on the next run.
+        """
+        with self._validator_lock:
+            pending = list(self._pending_validators.values())
+            self._pending_validators.clear()
+        if not pending or self.validator_store is None:
+            return 0
+        try:
+            self.validator_store.put_many(pending)
+        except Exception as e:
+            logger.warning(f"Failed to persist HTTP validators: {e}")
+            return 0
+        return len(pending)
+
+    def discard_validators(self, key: Optional[str] = None) -> None:
+        """Drop validators fetched since the last commit (e.g. after a failed write).
+
+        Args:
+            key: Only drop this entry, e.g. for a source whose extraction failed
+        """
+        with self._validator_lock:
+            if key is None:
+                self._pending_validators.clear()
+            else:
+                self._pending_validators.pop(key, None)
+
+    def get_conditional_stats(self) -> Dict[str, int]:
+        """Counters for :meth:`get_if_changed`."""
+        with self._validator_lock:
+            return dict(self._conditional_stats)
+
     def clear_cache(self) -> None:
         """Clear all cached responses."""
         if self.cache:
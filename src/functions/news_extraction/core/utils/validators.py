@@ -0,0 +1,196 @@
+"""Persistent HTTP validator cache for feed and sitemap URLs.
+
+For every source URL we remember the ``ETag`` / ``Last-Modified`` headers and
+a sha256 of the body from the last run whose results were written. The HTTP
+client sends them back as ``If-None-Match`` / ``If-Modified-Since`` so servers
+that support conditional requests answer ``304 Not Modified``; for servers that
+don't, an identical body hash lets the extractor skip parsing all the same.
+
+Entries are keyed by URL plus the extraction parameters (``max_articles``,
+``days_back``) the feed was read with, since a run with a tighter window keeps
+fewer items from the same body; see :func:`validator_key`.
+
+Two stores are provided:
+
+- LocalValidatorStore: SQLite file on local disk (per machine / per worker)
+- SupabaseValidatorStore: shared table, see core/db/schema/http_validators.sql
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HttpValidators:
+    """Validators remembered for one URL."""
+
+    url: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    body_hash: Optional[str] = None
+
+    def request_headers(self) -> Dict[str, str]:
+        """Conditional request headers for the next fetch of :attr:`url`."""
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def validator_key(url: str, **params: Any) -> str:
+    """Store key for *url* read with *params*; the bare URL when none are set."""
+    variant = "&".join(f"{name}={value}" for name, value in sorted(params.items()) if value is not None)
+    return f"{url}#{variant}" if variant else url
+
+
+class LocalValidatorStore:
+    """SQLite-backed validator store, safe to share between threads."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS http_validators ("
+            "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body_hash TEXT, checked_at TEXT)"
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[HttpValidators]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, body_hash FROM http_validators WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        return HttpValidators(url=url, etag=row[0], last_modified=row[1], body_hash=row[2])
+
+    def put_many(self, entries: Iterable[HttpValidators]) -> None:
+        rows = [
+            (v.url, v.etag, v.last_modified, v.body_hash, datetime.now(timezone.utc).isoformat())
+            for v in entries
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO http_validators "
+                "(url, etag, last_modified, body_hash, checked_at) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class SupabaseValidatorStore:
+    """Shared validator store backed by a Supabase table.
+
+    Rows are loaded once per store instance (a handful of feed URLs) and
+    served from memory afterwards.
+    """
+
+    def __init__(self, client: Any, table: str = "news_http_validators"):
+        self.client = client
+        self.table = table
+        self._rows: Optional[Dict[str, HttpValidators]] = None
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[HttpValidators]:
+        with self._lock:
+            if self._rows is None:
+                self._rows = self._load()
+            return self._rows.get(url)
+
+    def put_many(self, entries: Iterable[HttpValidators]) -> None:
+        entries = list(entries)
+        if not entries:
+            return
+        now = datetime.now(timezone.utc).isoformat()
+        payload = [
+            {
+                "url": v.url,
+                "etag": v.etag,
+                "last_modified": v.last_modified,
+                "body_hash": v.body_hash,
+                "checked_at": now,
+            }
+            for v in entries
+        ]
+        self.client.table(self.table).upsert(payload, on_conflict="url").execute()
+        with self._lock:
+            if self._rows is not None:
+                self._rows.update({v.url: v for v in entries})
+
+    def _load(self) -> Dict[str, HttpValidators]:
+        response = (
+            self.client.table(self.table)
+            .select("url,etag,last_modified,body_hash")
+            .execute()
+        )
+        rows: Dict[str, HttpValidators] = {}
+        for row in getattr(response, "data", None) or []:
+            url = row.get("url")
+            if url:
+                rows[url] = HttpValidators(
+                    url=url,
+                    etag=row.get("etag"),
+                    last_modified=row.get("last_modified"),
+                    body_hash=row.get("body_hash"),
+                )
+        return rows
+
+
+def build_validator_store_from_env(supabase_client: Any = None) -> Optional[Any]:
+    """Build a store from ``NEWS_VALIDATOR_CACHE_TABLE`` / ``NEWS_VALIDATOR_CACHE_PATH``.
+
+    The shared table wins when both are set, since Cloud Function instances
+    don't keep local disk between cold starts. Returns None when neither is
+    configured (conditional requests are then disabled).
+    """
+    table = (os.getenv("NEWS_VALIDATOR_CACHE_TABLE") or "").strip() or None
+    local_path = (os.getenv("NEWS_VALIDATOR_CACHE_PATH") or "").strip() or None
+
+    if table:
+        if supabase_client is None:
+            try:
+                from src.shared.db.connection import get_supabase_client
+
+                supabase_client = get_supabase_client()
+            except Exception as exc:
+                logger.warning("Validator cache table configured but Supabase is unavailable: %s", exc)
+        if supabase_client is not None:
+            return SupabaseValidatorStore(supabase_client, table)
+
+    if local_path:
+        try:
+            return LocalValidatorStore(local_path)
+        except Exception as exc:
+            logger.warning("Could not open local validator cache at %s: %s", local_path, exc)
+    return None
+
+
+__all__ = [
+    "HttpValidators",
+    "LocalValidatorStore",
+    "SupabaseValidatorStore",
+    "build_validator_store_from_env",
+    "validator_key",
+]
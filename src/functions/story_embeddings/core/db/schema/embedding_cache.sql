@@ -0,0 +1,12 @@
+-- Shared content-hash embedding cache (optional).
+-- Enable with EMBEDDING_CACHE_TABLE=embedding_cache.
+
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    cache_key TEXT PRIMARY KEY,            -- "<model>:<sha256 of normalized text>"
+    model_name TEXT NOT NULL,
+    embedding_vector VECTOR(1536) NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_embedding_cache_model
+    ON embedding_cache (model_name);
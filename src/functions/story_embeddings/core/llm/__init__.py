@@ -1,5 +1,21 @@
 """LLM clients for story embeddings."""
 
+from .embedding_cache import (
+    EmbeddingCache,
+    LocalEmbeddingStore,
+    SupabaseEmbeddingStore,
+    build_embedding_cache,
+    build_embedding_cache_from_env,
+    embedding_cache_key,
+)
 from .openai_client import OpenAIEmbeddingClient
 
-__all__ = ["OpenAIEmbeddingClient"]
+__all__ = [
+    "EmbeddingCache",
+    "LocalEmbeddingStore",
+    "OpenAIEmbeddingClient",
+    "SupabaseEmbeddingStore",
+    "build_embedding_cache",
+    "build_embedding_cache_from_env",
+    "embedding_cache_key",
+]
@@ -0,0 +1,225 @@
+"""
+Content-addressed embedding cache.
+
+Vectors are keyed by (model, sha256 of the whitespace-normalised text), so the
+same fact or summary text is only embedded once per model no matter which
+article, run or pipeline produced it. Two stores are provided:
+
+- LocalEmbeddingStore: SQLite file on local disk (per machine / per worker)
+- SupabaseEmbeddingStore: shared table, see db/schema/embedding_cache.sql
+
+EmbeddingCache chains stores in order and back-fills faster stores with hits
+from slower ones. Store failures are logged and treated as misses.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so formatting-only differences share a cache entry."""
+    return _WHITESPACE.sub(" ", text or "").strip()
+
+
+def embedding_cache_key(model: str, text: str) -> str:
+    """Return the cache key for *text* embedded with *model*."""
+    digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"{model}:{digest}"
+
+
+class LocalEmbeddingStore:
+    """SQLite-backed on-disk embedding store, safe to share between threads."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (cache_key TEXT PRIMARY KEY, vector TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        keys = list(keys)
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" for _ in chunk)
+                rows = self._conn.execute(
+                    f"SELECT cache_key, vector FROM embeddings WHERE cache_key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, vector in rows:
+                    found[key] = json.loads(vector)
+        return found
+
+    def set_many(self, entries: Dict[str, List[float]]) -> None:
+        if not entries:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (cache_key, vector) VALUES (?, ?)",
+                [(key, json.dumps(vector)) for key, vector in entries.items()],
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class SupabaseEmbeddingStore:
+    """Shared embedding store backed by a Supabase table."""
+
+    CHUNK_SIZE = 200
+
+    def __init__(self, client: Any, table: str = "embedding_cache"):
+        self.client = client
+        self.table = table
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        keys = list(keys)
+        for start in range(0, len(keys), self.CHUNK_SIZE):
+            chunk = keys[start:start + self.CHUNK_SIZE]
+            response = (
+                self.client.table(self.table)
+                .select("cache_key,embedding_vector")
+                .in_("cache_key", chunk)
+                .execute()
+            )
+            for row in getattr(response, "data", None) or []:
+                vector = row.get("embedding_vector")
+                if isinstance(vector, str):
+                    # pgvector columns come back as "[0.1,0.2,...]"
+                    vector = json.loads(vector)
+                if isinstance(vector, list):
+                    found[row["cache_key"]] = vector
+        return found
+
+    def set_many(self, entries: Dict[str, List[float]]) -> None:
+        rows = [
+            {"cache_key": key, "model_name": key.split(":", 1)[0], "embedding_vector": vector}
+            for key, vector in entries.items()
+        ]
+        for start in range(0, len(rows), self.CHUNK_SIZE):
+            self.client.table(self.table).upsert(
+                rows[start:start + self.CHUNK_SIZE], on_conflict="cache_key"
+            ).execute()
+
+
+class EmbeddingCache:
+    """Read-through cache over one or more embedding stores."""
+
+    def __init__(self, stores: Iterable[Any]):
+        self.stores = [store for store in stores if store is not None]
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        """Return cached vectors for *keys*; missing keys are simply absent."""
+        unique = list(dict.fromkeys(keys))
+        found: Dict[str, List[float]] = {}
+        missed_by: List[Tuple[Any, List[str]]] = []
+
+        remaining = unique
+        for store in self.stores:
+            if not remaining:
+                break
+            try:
+                hits = store.get_many(remaining)
+            except Exception as e:
+                logger.warning(f"Embedding cache lookup failed in {type(store).__name__}: {e}")
+                hits = {}
+            missed_by.append((store, [key for key in remaining if key not in hits]))
+            if hits:
+                found.update(hits)
+                # Back-fill the faster stores that missed these keys.
+                for earlier, earlier_missed in missed_by[:-1]:
+                    backfill = {key: hits[key] for key in earlier_missed if key in hits}
+                    self._safe_set(earlier, backfill)
+            remaining = [key for key in remaining if key not in found]
+
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(unique) - len(found)
+        return found
+
+    def set_many(self, entries: Dict[str, List[float]]) -> None:
+        if not entries:
+            return
+        for store in self.stores:
+            self._safe_set(store, entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "cache_hits": self.hits,
+                "cache_misses": self.misses,
+                "cache_hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    @staticmethod
+    def _safe_set(store: Any, entries: Dict[str, List[float]]) -> None:
+        if not entries:
+            return
+        try:
+            store.set_many(entries)
+        except Exception as e:
+            logger.warning(f"Embedding cache write failed in {type(store).__name__}: {e}")
+
+
+def build_embedding_cache(
+    *,
+    local_path: Optional[str] = None,
+    supabase_client: Any = None,
+    supabase_table: Optional[str] = None,
+) -> Optional[EmbeddingCache]:
+    """Build a cache from whichever stores are configured, or None when none are."""
+    stores: List[Any] = []
+    if local_path:
+        try:
+            stores.append(LocalEmbeddingStore(local_path))
+        except Exception as e:
+            logger.warning(f"Could not open local embedding cache at {local_path}: {e}")
+    if supabase_client is not None and supabase_table:
+        stores.append(SupabaseEmbeddingStore(supabase_client, supabase_table))
+    return EmbeddingCache(stores) if stores else None
+
+
+def build_embedding_cache_from_env(supabase_client: Any = None) -> Optional[EmbeddingCache]:
+    """Build a cache from ``EMBEDDING_CACHE_PATH`` / ``EMBEDDING_CACHE_TABLE``.
+
+    The Supabase store is only used when a table is configured; the shared
+    client is created lazily when none is passed in.
+    """
+    local_path = (os.getenv("EMBEDDING_CACHE_PATH") or "").strip() or None
+    table = (os.getenv("EMBEDDING_CACHE_TABLE") or "").strip() or None
+    if table and supabase_client is None:
+        try:
+            from src.shared.db.connection import get_supabase_client
+
+            supabase_client = get_supabase_client()
+        except Exception as e:
+            logger.warning(f"Embedding cache table configured but Supabase is unavailable: {e}")
+    return build_embedding_cache(
+        local_path=local_path,
+        supabase_client=supabase_client,
+        supabase_table=table,
+    )
@@ -13,6 +13,14 @@ from typing import Optional
 from openai import OpenAI, RateLimitError, APIError, APITimeoutError, APIConnectionError
 
 from src.shared.utils.env import load_env
+from src.shared.utils.rate_limiter import (
+    DEFAULT_EMBEDDING_REQUESTS_PER_MINUTE,
+    DEFAULT_EMBEDDING_TOKENS_PER_MINUTE,
+    estimate_tokens,
+    get_rate_limiter,
+)
+
+from .embedding_cache import EmbeddingCache, embedding_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -26,10 +34,11 @@ class OpenAIEmbeddingClient:
 
     Features:
     - text-embedding-3-small model (1536 dimensions)
-    - Rate limiting with token-based throttling
+    - Request and token rate limiting shared with other processes on the host
     - Automatic retry logic with exponential backoff
     - Timeout handling and connection error recovery
-    - Batch processing support
+    - Batch processing support (multi-input requests)
+    - Optional content-hash cache so identical texts are embedded once per model
     - Cost tracking and monitoring
     """
 
@@ -40,6 +49,8 @@ class OpenAIEmbeddingClient:
         api_key: Optional[str] = None,
         timeout: float = 30.0,
         max_tokens_per_minute: Optional[int] = None,
+        cache: Optional[EmbeddingCache] = None,
+        batch_size: int = 256,
     ):
         """
         Initialize the OpenAI embedding client.
@@ -49,9 +60,14 @@ class OpenAIEmbeddingClient:
             max_retries: Maximum retry attempts for failed requests
             api_key: OpenAI API key (if not provided, loads from env)
             timeout: Request timeout in seconds (default: 30.0)
-            max_tokens_per_minute: Optional rate limit for tokens per minute
+            max_tokens_per_minute: Optional tokens-per-minute budget for this model
+                (defaults to the tier-1 OpenAI limit)
+            cache: Optional embedding cache consulted before calling the API
+            batch_size: Maximum inputs per embeddings request in generate_embeddings_batch
         """
         self.model = model
+        self.cache = cache
+        self.batch_size = max(1, batch_size)
         self.max_retries = max_retries
         self.timeout = timeout
         self.max_tokens_per_minute = max_tokens_per_minute
@@ -74,45 +90,33 @@ class OpenAIEmbeddingClient:
         self.total_tokens = 0
         self.total_requests = 0
         self.failed_requests = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
         
-        # Rate limiting
-        self.tokens_this_minute = 0
-        self.minute_start_time = time.time()
+        # Rate limiting: one adaptive budget per model across all processes
+        self.rate_limiter = get_rate_limiter(
+            "openai",
+            model,
+            requests_per_minute=DEFAULT_EMBEDDING_REQUESTS_PER_MINUTE,
+            tokens_per_minute=max_tokens_per_minute or DEFAULT_EMBEDDING_TOKENS_PER_MINUTE,
+        )
         
         logger.info(
             f"Initialized OpenAIEmbeddingClient: model={model}, "
             f"timeout={timeout}s, max_retries={max_retries}"
         )
 
-    def _enforce_rate_limit(self):
+    def _enforce_rate_limit(self, inputs) -> int:
         """
-        Enforce rate limiting if max_tokens_per_minute is set.
-        
-        Implements a sliding window rate limiter to prevent hitting API rate limits.
+        Wait for room in the shared request and token budget.
+
+        Returns:
+            The estimated tokens charged up front, settled once usage is known
         """
-        if not self.max_tokens_per_minute:
-            return
-        
-        current_time = time.time()
-        time_since_start = current_time - self.minute_start_time
-        
-        # Reset counter every minute
-        if time_since_start >= 60:
-            self.tokens_this_minute = 0
-            self.minute_start_time = current_time
-            return
-        
-        # Check if we're over the limit
-        if self.tokens_this_minute >= self.max_tokens_per_minute:
-            sleep_time = 60 - time_since_start
-            if sleep_time > 0:
-                logger.info(
-                    f"Rate limit reached ({self.tokens_this_minute} tokens), "
-                    f"sleeping for {sleep_time:.1f}s"
-                )
-                time.sleep(sleep_time)
-                self.tokens_this_minute = 0
-                self.minute_start_time = time.time()
+        texts = [inputs] if isinstance(inputs, str) else inputs
+        estimated_tokens = sum(estimate_tokens(text) for text in texts)
+        self.rate_limiter.acquire(estimated_tokens)
+        return estimated_tokens
 
     def generate_embedding(self, text: str) -> dict:
         """
@@ -125,8 +129,9 @@ class OpenAIEmbeddingClient:
             Dictionary containing:
                 - embedding: List of floats (1536 dimensions)
                 - model: Model used
-                - tokens_used: Number of tokens consumed
+                - tokens_used: Number of tokens consumed (0 for cache hits)
                 - processing_time: Time taken in seconds
+                - cached: Whether the vector came from the cache
 
         Raises:
             Exception: If embedding generation fails after retries
@@ -134,55 +139,83 @@ class OpenAIEmbeddingClient:
         if not text or not text.strip():
             raise ValueError("Text cannot be empty")
 
-        # Rate limiting check
-        self._enforce_rate_limit()
-
         start_time = time.time()
-        last_error = None
-        
+        key = embedding_cache_key(self.model, text)
+        cached = self._cache_lookup([key])
+        if key in cached:
+            return {
+                "embedding": cached[key],
+                "model": self.model,
+                "tokens_used": 0,
+                "processing_time": time.time() - start_time,
+                "cached": True,
+            }
+
+        response = self._create_embeddings(text)
+        embedding = response.data[0].embedding
+        tokens_used = response.usage.total_tokens
+        processing_time = time.time() - start_time
+        self._cache_store({key: embedding})
+
+        logger.debug(
+            f"Generated embedding: {len(embedding)} dimensions, "
+            f"{tokens_used} tokens, {processing_time:.2f}s"
+        )
+
+        return {
+            "embedding": embedding,
+            "model": self.model,
+            "tokens_used": tokens_used,
+            "processing_time": processing_time,
+            "cached": False,
+        }
+
+    def _create_embeddings(self, inputs):
+        """
+        Call the embeddings endpoint for one or more inputs with retries.
+
+        Args:
+            inputs: A single text or a list of texts
+
+        Returns:
+            The raw OpenAI embeddings response
+
+        Raises:
+            Exception: If the request fails after retries
+        """
         # Retry logic with exponential backoff
         for attempt in range(self.max_retries):
             try:
+                # Rate limiting check (each attempt is a request)
+                estimated_tokens = self._enforce_rate_limit(inputs)
                 response = self.client.embeddings.create(
-                    input=text,
+                    input=inputs,
                     model=self.model
                 )
-                
-                # Extract embedding
-                embedding = response.data[0].embedding
                 tokens_used = response.usage.total_tokens
                 
                 # Update statistics
                 self.total_tokens += tokens_used
                 self.total_requests += 1
                 
-                # Update rate limiting counter
-                if self.max_tokens_per_minute:
-                    self.tokens_this_minute += tokens_used
-                
-                processing_time = time.time() - start_time
-                
-                logger.debug(
-                    f"Generated embedding: {len(embedding)} dimensions, "
-                    f"{tokens_used} tokens, {processing_time:.2f}s"
+                # Settle the token estimate and ramp the shared rate back up
+                self.rate_limiter.record_success(
+                    tokens_used=tokens_used, estimated_tokens=estimated_tokens
                 )
                 
-                return {
-                    "embedding": embedding,
-                    "model": self.model,
-                    "tokens_used": tokens_used,
-                    "processing_time": processing_time,
-                }
+                return response
                 
             except RateLimitError as e:
                 error_msg = f"Rate limit hit (attempt {attempt + 1}/{self.max_retries}): {e}"
                 logger.warning(error_msg)
-                last_error = e
                 self.failed_requests += 1
                 
+                # Backs off every process sharing this model, honouring retry-after
+                sleep_time = self.rate_limiter.record_rate_limited(
+                    headers=getattr(getattr(e, "response", None), "headers", None),
+                    attempt=attempt + 1,
+                )
                 if attempt < self.max_retries - 1:
-                    # Exponential backoff: 2s, 4s, 8s...
-                    sleep_time = 2 ** (attempt + 1)
                     logger.info(f"Retrying in {sleep_time} seconds...")
                     time.sleep(sleep_time)
                 else:
@@ -191,7 +224,6 @@ class OpenAIEmbeddingClient:
             except APITimeoutError as e:
                 error_msg = f"Request timeout (attempt {attempt + 1}/{self.max_retries}): {e}"
                 logger.warning(error_msg)
-                last_error = e
                 self.failed_requests += 1
                 
                 if attempt < self.max_retries - 1:
@@ -204,7 +236,6 @@ class OpenAIEmbeddingClient:
             except APIConnectionError as e:
                 error_msg = f"Connection error (attempt {attempt + 1}/{self.max_retries}): {e}"
                 logger.warning(error_msg)
-                last_error = e
                 self.failed_requests += 1
                 
                 if attempt < self.max_retries - 1:
@@ -217,7 +248,6 @@ class OpenAIEmbeddingClient:
             except APIError as e:
                 error_msg = f"OpenAI API error (attempt {attempt + 1}/{self.max_retries}): {e}"
                 logger.warning(error_msg)
-                last_error = e
                 self.failed_requests += 1
                 
                 if attempt < self.max_retries - 1:
@@ -236,41 +266,110 @@ class OpenAIEmbeddingClient:
         """
         Generate embeddings for multiple texts.
 
+        Cached texts are served without an API call. Remaining texts are
+        de-duplicated and sent in multi-input requests of up to ``batch_size``.
+
         Args:
             texts: List of texts to embed
 
         Returns:
-            List of dictionaries, each containing:
-                - embedding: List of floats
+            List of dictionaries (same order as ``texts``), each containing:
+                - embedding: List of floats (None on failure)
                 - model: Model used
-                - tokens_used: Tokens for this text
+                - tokens_used: Tokens attributed to this text
                 - processing_time: Time taken
+                - cached: Whether the vector came from the cache
+                - error: Error message (only on failure)
         """
         if not texts:
             return []
         
         logger.info(f"Generating embeddings for {len(texts)} texts...")
-        
-        results = []
-        for i, text in enumerate(texts, 1):
-            try:
-                result = self.generate_embedding(text)
-                results.append(result)
-                logger.debug(f"Generated embedding {i}/{len(texts)}")
-            except Exception as e:
-                logger.error(f"Failed to generate embedding {i}/{len(texts)}: {e}")
-                # Continue with next text instead of failing entire batch
-                results.append({
-                    "embedding": None,
+        start_time = time.time()
+
+        results: list[Optional[dict]] = [None] * len(texts)
+        keys: dict[int, str] = {}
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                results[i] = self._failed_result("Text cannot be empty")
+            else:
+                keys[i] = embedding_cache_key(self.model, text)
+
+        cached = self._cache_lookup(list(keys.values()))
+        for i, key in keys.items():
+            if key in cached:
+                results[i] = {
+                    "embedding": cached[key],
                     "model": self.model,
                     "tokens_used": 0,
                     "processing_time": 0,
-                    "error": str(e),
-                })
-        
-        logger.info(f"Completed batch: {len([r for r in results if r.get('embedding')])} successful")
+                    "cached": True,
+                }
+
+        # One input per distinct uncached text.
+        pending: dict[str, list[int]] = {}
+        for i, key in keys.items():
+            if results[i] is None:
+                pending.setdefault(key, []).append(i)
+        pending_keys = list(pending)
+
+        for start in range(0, len(pending_keys), self.batch_size):
+            chunk = pending_keys[start:start + self.batch_size]
+            inputs = [texts[pending[key][0]] for key in chunk]
+            batch_start = time.time()
+            try:
+                response = self._create_embeddings(inputs)
+                vectors = [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+                if len(vectors) != len(inputs):
+                    raise Exception(f"Embedding count mismatch: expected {len(inputs)}, got {len(vectors)}")
+            except Exception as e:
+                logger.error(f"Failed to generate embeddings for {len(inputs)} texts: {e}")
+                for key in chunk:
+                    for i in pending[key]:
+                        results[i] = self._failed_result(str(e))
+                continue
+
+            tokens_each = response.usage.total_tokens / len(inputs)
+            elapsed = time.time() - batch_start
+            self._cache_store(dict(zip(chunk, vectors)))
+            for key, vector in zip(chunk, vectors):
+                for i in pending[key]:
+                    results[i] = {
+                        "embedding": vector,
+                        "model": self.model,
+                        "tokens_used": round(tokens_each),
+                        "processing_time": elapsed,
+                        "cached": False,
+                    }
+
+        logger.info(
+            f"Completed batch: {len([r for r in results if r and r.get('embedding')])} successful "
+            f"({len(cached)} cached, {len(pending_keys)} requested) in {time.time() - start_time:.2f}s"
+        )
         return results
 
+    def _failed_result(self, error: str) -> dict:
+        return {
+            "embedding": None,
+            "model": self.model,
+            "tokens_used": 0,
+            "processing_time": 0,
+            "error": error,
+        }
+
+    def _cache_lookup(self, keys: list[str]) -> dict:
+        if not self.cache or not keys:
+            return {}
+        found = self.cache.get_many(keys)
+        unique = len(set(keys))
+        self.cache_hits += len(found)
+        self.cache_misses += unique - len(found)
+        return found
+
+    def _cache_store(self, entries: dict) -> None:
+        if self.cache and entries:
+            self.cache.set_many(entries)
+
     def get_usage_stats(self) -> dict:
         """
         Get usage statistics for this client instance.
@@ -281,16 +380,21 @@ class OpenAIEmbeddingClient:
                 - failed_requests: Number of failed requests
                 - total_tokens: Total tokens consumed
                 - estimated_cost: Estimated cost in USD (based on current pricing)
+                - cache_hits / cache_misses / cache_hit_rate: Embedding cache effectiveness
         """
         # text-embedding-3-small pricing: $0.00002 per 1K tokens (as of Oct 2024)
         cost_per_1k_tokens = 0.00002
         estimated_cost = (self.total_tokens / 1000) * cost_per_1k_tokens
+        lookups = self.cache_hits + self.cache_misses
         
         return {
             "total_requests": self.total_requests,
             "failed_requests": self.failed_requests,
             "total_tokens": self.total_tokens,
             "estimated_cost_usd": round(estimated_cost, 4),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_rate": round(self.cache_hits / lookups, 4) if lookups else 0.0,
         }
 
     def reset_stats(self):
@@ -298,6 +402,6 @@ class OpenAIEmbeddingClient:
         self.total_tokens = 0
         self.total_requests = 0
         self.failed_requests = 0
-        self.tokens_this_minute = 0
-        self.minute_start_time = time.time()
+        self.cache_hits = 0
+        self.cache_misses = 0
         logger.info("Usage statistics reset")
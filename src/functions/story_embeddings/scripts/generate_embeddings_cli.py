@@ -21,7 +21,7 @@ from _bootstrap import *  # noqa
 from src.shared.utils.logging import setup_logging
 from src.shared.utils.env import load_env
 from src.functions.story_embeddings.core.db import SummaryReader, EmbeddingWriter
-from src.functions.story_embeddings.core.llm import OpenAIEmbeddingClient
+from src.functions.story_embeddings.core.llm import OpenAIEmbeddingClient, build_embedding_cache_from_env
 from src.functions.story_embeddings.core.pipelines import EmbeddingPipeline
 
 logger = logging.getLogger(__name__)
@@ -80,8 +80,11 @@ def main():
 
     try:
         # Initialize components
-        openai_client = OpenAIEmbeddingClient(model=args.model)
         summary_reader = SummaryReader()
+        openai_client = OpenAIEmbeddingClient(
+            model=args.model,
+            cache=build_embedding_cache_from_env(summary_reader.client),
+        )
         embedding_writer = EmbeddingWriter(dry_run=args.dry_run)
         
         pipeline = EmbeddingPipeline(
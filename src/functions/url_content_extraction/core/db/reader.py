@@ -174,6 +174,37 @@ class FactsReader:
                 offset += page_size
         return out
 
+    def fetch_facts_for_articles(
+        self,
+        article_ids: Sequence[str],
+        *,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+        page_size: int = _DEFAULT_PAGE_SIZE,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Return ``{news_url_id: [{id, fact_text, llm_model}, ...]}`` (this prompt version)."""
+        facts: Dict[str, List[Dict[str, Any]]] = {}
+        ids = list(article_ids)
+        for i in range(0, len(ids), chunk_size):
+            chunk = ids[i : i + chunk_size]
+            offset = 0
+            while True:
+                response = (
+                    self.client.table("news_facts")
+                    .select("id,news_url_id,fact_text,llm_model")
+                    .in_("news_url_id", chunk)
+                    .eq("prompt_version", self.prompt_version)
+                    .range(offset, offset + page_size - 1)
+                    .execute()
+                )
+                rows = getattr(response, "data", []) or []
+                for row in rows:
+                    if row.get("id") and row.get("news_url_id") and row.get("fact_text") is not None:
+                        facts.setdefault(row["news_url_id"], []).append(row)
+                if len(rows) < page_size:
+                    break
+                offset += page_size
+        return facts
+
     # ------------------------------------------------------------------
     # facts_embeddings / story_embeddings
     # ------------------------------------------------------------------
@@ -231,6 +262,34 @@ class FactsReader:
                     vectors.append(vector)
         return vectors
 
+    def fetch_fact_embedding_rows(
+        self,
+        fact_ids: Sequence[str],
+        *,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Return ``{news_fact_id: {embedding_vector, model_name}}`` (parse-safe)."""
+        rows_by_fact: Dict[str, Dict[str, Any]] = {}
+        ids = list(fact_ids)
+        for i in range(0, len(ids), chunk_size):
+            chunk = ids[i : i + chunk_size]
+            response = (
+                self.client.table("facts_embeddings")
+                .select("news_fact_id,embedding_vector,model_name")
+                .in_("news_fact_id", chunk)
+                .execute()
+            )
+            for row in getattr(response, "data", []) or []:
+                vector = row.get("embedding_vector")
+                if isinstance(vector, str):
+                    vector = _parse_vector_string(vector)
+                if row.get("news_fact_id") and isinstance(vector, list) and vector:
+                    rows_by_fact[row["news_fact_id"]] = {
+                        "embedding_vector": vector,
+                        "model_name": row.get("model_name"),
+                    }
+        return rows_by_fact
+
     def pooled_embedding_exists(self, news_url_id: str) -> bool:
         """Return True when a ``fact_pooled`` story embedding already exists."""
         response = (
@@ -242,3 +301,35 @@ class FactsReader:
             .execute()
         )
         return bool(getattr(response, "data", []) or [])
+
+    # ------------------------------------------------------------------
+    # news_url_fingerprints
+    # ------------------------------------------------------------------
+
+    def fetch_recent_fingerprints(
+        self,
+        since_iso: str,
+        *,
+        page_size: int = _DEFAULT_PAGE_SIZE,
+    ) -> Dict[str, List[int]]:
+        """Return ``{news_url_id: minhash}`` for canonical articles fingerprinted since ``since_iso``."""
+        fingerprints: Dict[str, List[int]] = {}
+        offset = 0
+        while True:
+            response = (
+                self.client.table("news_url_fingerprints")
+                .select("news_url_id,minhash")
+                .is_("canonical_news_url_id", "null")
+                .gte("created_at", since_iso)
+                .range(offset, offset + page_size - 1)
+                .execute()
+            )
+            rows = getattr(response, "data", []) or []
+            for row in rows:
+                minhash = row.get("minhash")
+                if row.get("news_url_id") and isinstance(minhash, list):
+                    fingerprints[row["news_url_id"]] = [int(v) for v in minhash]
+            if len(rows) < page_size:
+                break
+            offset += page_size
+        return fingerprints
@@ -0,0 +1,13 @@
+-- MinHash fingerprints of fetched article text, used by the facts batch to
+-- skip LLM extraction for near-duplicate articles (wire stories, press releases).
+
+CREATE TABLE IF NOT EXISTS news_url_fingerprints (
+    news_url_id UUID PRIMARY KEY REFERENCES news_urls(id) ON DELETE CASCADE,
+    minhash JSONB NOT NULL,                -- 64 MinHash values over word 5-shingles
+    canonical_news_url_id UUID REFERENCES news_urls(id) ON DELETE SET NULL,  -- NULL for canonical articles
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_news_url_fingerprints_created_at
+    ON news_url_fingerprints (created_at)
+    WHERE canonical_news_url_id IS NULL;
@@ -209,6 +209,32 @@ class FactsWriter:
             logger.error("Failed to insert pooled embedding for %s: %s", news_url_id, exc)
             return False
 
+    # ------------------------------------------------------------------
+    # news_url_fingerprints (near-duplicate detection)
+    # ------------------------------------------------------------------
+
+    def upsert_content_fingerprints(
+        self,
+        rows: Sequence[Dict[str, Any]],
+        *,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """Upsert ``{news_url_id, minhash, canonical_news_url_id}`` rows. Returns rows written."""
+        records = list(rows)
+        total = 0
+        for i in range(0, len(records), chunk_size):
+            chunk = records[i : i + chunk_size]
+            try:
+                response = (
+                    self.client.table("news_url_fingerprints")
+                    .upsert(chunk, on_conflict="news_url_id")
+                    .execute()
+                )
+                total += len(getattr(response, "data", []) or [])
+            except Exception as exc:
+                logger.error("Failed to upsert content fingerprints chunk: %s", exc)
+        return total
+
     # ------------------------------------------------------------------
     # news_urls (stage tracking)
     # ------------------------------------------------------------------
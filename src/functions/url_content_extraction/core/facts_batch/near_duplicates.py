@@ -0,0 +1,165 @@
+"""Skip LLM fact extraction for near-duplicate articles.
+
+The same wire story shows up under many publishers in ``news_urls``. Before a
+facts batch is written, each fetched article is MinHash-fingerprinted (see
+:mod:`src.shared.processors.near_duplicates`) and checked against an LSH
+index holding recently fingerprinted articles that already have facts plus
+the articles earlier in the same batch. A match is linked to its canonical
+article instead of getting its own request: the canonical's facts (and their
+embeddings) are copied to the duplicate once they exist, so downstream stages
+see a normal article.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from src.shared.processors.near_duplicates import NearDuplicateIndex, minhash_signature
+
+from ..db import FactsReader, FactsWriter
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio used for the savings estimate.
+_CHARS_PER_TOKEN = 4
+
+
+@dataclass
+class NearDuplicateReport:
+    """Near-duplicates found while generating one facts batch."""
+
+    fingerprinted: int = 0
+    prior_canonicals: int = 0
+    links: Dict[str, str] = field(default_factory=dict)
+    # Links whose canonical is in the same batch, so its facts don't exist yet.
+    pending_links: Dict[str, str] = field(default_factory=dict)
+    similarities: Dict[str, float] = field(default_factory=dict)
+    linked_to_existing: int = 0
+    estimated_tokens_avoided: int = 0
+
+    @property
+    def requests_avoided(self) -> int:
+        return len(self.links)
+
+    @property
+    def existing_links(self) -> Dict[str, str]:
+        """Links whose canonical already has facts."""
+        return {dup: canonical for dup, canonical in self.links.items() if dup not in self.pending_links}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "fingerprinted": self.fingerprinted,
+            "prior_canonicals": self.prior_canonicals,
+            "requests_avoided": self.requests_avoided,
+            "estimated_tokens_avoided": self.estimated_tokens_avoided,
+            "linked_to_existing": self.linked_to_existing,
+            "links": dict(self.links),
+        }
+
+
+def find_near_duplicates(
+    articles: Sequence[Dict[str, Any]],
+    contents: Mapping[str, str],
+    *,
+    prior: Mapping[str, Sequence[int]],
+    threshold: float,
+    prompt: str = "",
+) -> Tuple[NearDuplicateReport, List[Dict[str, Any]]]:
+    """Link each article to an earlier near-identical one, in article order.
+
+    Returns the report and the fingerprint rows to persist for this batch.
+    """
+    index = NearDuplicateIndex(threshold=threshold)
+    for news_url_id, signature in prior.items():
+        index.add(news_url_id, signature)
+
+    report = NearDuplicateReport(prior_canonicals=len(index))
+    rows: List[Dict[str, Any]] = []
+    for article in articles:
+        news_url_id = article["id"]
+        content = contents.get(news_url_id)
+        if not content or news_url_id in index:
+            continue
+        signature = minhash_signature(content)
+        if signature is None:
+            continue
+        report.fingerprinted += 1
+        match = index.query(signature)
+        canonical = match[0] if match else None
+        if canonical is None:
+            index.add(news_url_id, signature)
+        else:
+            report.links[news_url_id] = canonical
+            if canonical not in prior:
+                report.pending_links[news_url_id] = canonical
+            report.similarities[news_url_id] = round(match[1], 3)
+            report.estimated_tokens_avoided += (len(prompt) + len(content)) // _CHARS_PER_TOKEN
+        rows.append(
+            {
+                "news_url_id": news_url_id,
+                "minhash": signature,
+                "canonical_news_url_id": canonical,
+            }
+        )
+    return report, rows
+
+
+def link_near_duplicates(
+    reader: FactsReader,
+    writer: FactsWriter,
+    links: Mapping[str, str],
+    *,
+    chunk_size: int = 100,
+) -> int:
+    """Copy canonical facts (and embeddings) to their duplicates.
+
+    Duplicates whose canonical has no facts are left alone, so the next batch
+    picks them up and extracts them normally. Returns the number of
+    duplicates linked.
+    """
+    if not links:
+        return 0
+    canonical_facts = reader.fetch_facts_for_articles(sorted(set(links.values())), chunk_size=chunk_size)
+    source_ids = [row["id"] for rows in canonical_facts.values() for row in rows]
+    embeddings = reader.fetch_fact_embedding_rows(source_ids, chunk_size=chunk_size) if source_ids else {}
+
+    facts_by_model: Dict[str, Dict[str, List[str]]] = {}
+    sources: Dict[str, List[str]] = {}
+    for duplicate, canonical in links.items():
+        rows = canonical_facts.get(canonical)
+        if not rows:
+            continue
+        model = rows[0].get("llm_model") or "unknown"
+        facts_by_model.setdefault(model, {})[duplicate] = [row["fact_text"] for row in rows]
+        sources[duplicate] = [row["id"] for row in rows]
+
+    linked: Dict[str, List[str]] = {}
+    embedding_records: List[Dict[str, Any]] = []
+    for model, facts_by_article in facts_by_model.items():
+        ids_by_article, _ = writer.insert_facts(facts_by_article, model, chunk_size=chunk_size)
+        for duplicate, new_ids in ids_by_article.items():
+            if not new_ids:
+                continue
+            linked[duplicate] = facts_by_article[duplicate]
+            # Only pair embeddings when every fact was inserted, otherwise
+            # positions no longer line up; missing ones are backfilled later.
+            if len(new_ids) != len(sources[duplicate]):
+                continue
+            for source_id, new_id in zip(sources[duplicate], new_ids):
+                embedding: Optional[Dict[str, Any]] = embeddings.get(source_id)
+                if embedding:
+                    embedding_records.append({"news_fact_id": new_id, **embedding})
+
+    writer.insert_fact_embeddings(embedding_records, chunk_size=chunk_size)
+    writer.mark_facts_extracted(linked, chunk_size=chunk_size)
+    logger.info(
+        "Linked %d near-duplicate articles to canonical facts (%d embeddings copied)",
+        len(linked),
+        len(embedding_records),
+    )
+    return len(linked)
+
+
+__all__ = ["NearDuplicateReport", "find_near_duplicates", "link_near_duplicates"]
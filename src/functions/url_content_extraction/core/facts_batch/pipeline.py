@@ -35,6 +35,9 @@ class BatchCreationResult:
     total_requests: int
     total_articles: int
     articles_skipped_no_content: int
+    near_duplicates_skipped: int = 0
+    near_duplicates_linked: int = 0
+    estimated_tokens_avoided: int = 0
 
 
 class FactsBatchPipeline:
@@ -180,6 +183,8 @@ class FactsBatchPipeline:
             except Exception as e:
                 raise RuntimeError(f"Failed to create batch job: {e}")
 
+        near_duplicates = batch_payload.metadata.get("near_duplicates") or {}
+
         # Save batch info locally
         batch_info = {
             "batch_id": batch.id,
@@ -192,6 +197,11 @@ class FactsBatchPipeline:
             "total_requests": batch_payload.total_requests,
             "total_articles": batch_payload.total_articles,
             "articles_skipped_no_content": batch_payload.metadata.get("articles_skipped_no_content", 0),
+            "near_duplicates": {
+                key: value for key, value in near_duplicates.items() if key != "links"
+            },
+            # Linked to their canonical's facts when this batch is processed.
+            "near_duplicate_links": batch_payload.metadata.get("near_duplicate_links", {}),
         }
 
         batch_info_path = self.output_dir / f"facts_batch_{batch.id}.json"
@@ -217,6 +227,9 @@ class FactsBatchPipeline:
             total_requests=batch_payload.total_requests,
             total_articles=batch_payload.total_articles,
             articles_skipped_no_content=batch_payload.metadata.get("articles_skipped_no_content", 0),
+            near_duplicates_skipped=near_duplicates.get("requests_avoided", 0),
+            near_duplicates_linked=near_duplicates.get("linked_to_existing", 0),
+            estimated_tokens_avoided=near_duplicates.get("estimated_tokens_avoided", 0),
         )
 
     def check_status(self, batch_id: str) -> dict:
@@ -308,6 +321,12 @@ class FactsBatchPipeline:
             force_delete=force_delete,
         )
 
+        batch_info = self._load_batch_info(batch_id)
+        near_duplicate_links = batch_info.get("near_duplicate_links") or {}
+        near_duplicates_linked = 0
+        if near_duplicate_links and not dry_run:
+            near_duplicates_linked = self.processor.link_near_duplicates(near_duplicate_links)
+
         # Save summary
         summary = {
             "batch_id": batch_id,
@@ -317,12 +336,15 @@ class FactsBatchPipeline:
             "articles_in_output": result.articles_in_output,
             "articles_processed": result.articles_processed,
             "articles_skipped_existing": result.articles_skipped_existing,
+            "articles_resumed": result.articles_resumed,
             "articles_skipped_no_facts": result.articles_skipped_no_facts,
             "articles_with_errors": result.articles_with_errors,
             "facts_extracted": result.facts_extracted,
             "facts_filtered": result.facts_filtered,
             "facts_written": result.facts_written,
             "embeddings_created": result.embeddings_created,
+            "near_duplicates_pending": len(near_duplicate_links),
+            "near_duplicates_linked": near_duplicates_linked,
             "errors": result.errors[:50],  # Limit errors in summary
             "dry_run": dry_run,
         }
@@ -383,13 +405,15 @@ class FactsBatchPipeline:
 
     def _load_model_from_metadata(self, batch_id: str) -> str:
         """Load model from stored batch metadata."""
-        # Try to find batch info file
+        return self._load_batch_info(batch_id).get("model", self.model)
+
+    def _load_batch_info(self, batch_id: str) -> dict:
+        """Load the batch info saved by :meth:`create_batch` (empty if missing)."""
         for path in self.output_dir.glob(f"facts_batch_{batch_id}.json"):
             try:
                 with path.open("r") as handle:
-                    data = json.load(handle)
-                    return data.get("model", self.model)
+                    return json.load(handle)
             except Exception:
                 pass
 
-        return self.model
+        return {}
@@ -12,8 +12,11 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from src.shared.db.connection import get_supabase_client
+from src.shared.processors.near_duplicates import DEFAULT_THRESHOLD
+from ..db import FactsReader, FactsWriter
 from ..facts.prompts import FACT_PROMPT, get_formatted_prompt
 from ..extractors.extractor_factory import get_extractor
+from .near_duplicates import NearDuplicateReport, find_near_duplicates, link_near_duplicates
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +51,8 @@ class FactsBatchRequestGenerator:
         output_dir: Optional[Path] = None,
         page_size: int = 100,
         max_workers: int = 10,
+        near_duplicate_threshold: Optional[float] = DEFAULT_THRESHOLD,
+        fingerprint_lookback_hours: int = 72,
     ) -> None:
         """Initialize request generator.
         
@@ -56,6 +61,11 @@ class FactsBatchRequestGenerator:
             output_dir: Directory for batch files
             page_size: Page size for database queries
             max_workers: Number of parallel workers for content fetching
+            near_duplicate_threshold: Estimated Jaccard similarity at which an
+                article is linked to an earlier copy instead of getting its own
+                request (None disables near-duplicate detection)
+            fingerprint_lookback_hours: How far back stored fingerprints of
+                already-extracted articles are matched against
         """
         self.client = get_supabase_client()
         self.model = model
@@ -63,6 +73,10 @@ class FactsBatchRequestGenerator:
         self.output_dir.mkdir(exist_ok=True)
         self.page_size = page_size
         self.max_workers = max_workers
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self.fingerprint_lookback_hours = fingerprint_lookback_hours
+        self._reader = FactsReader(self.client)
+        self._writer = FactsWriter(self.client)
 
         # Check if this is a reasoning model (gpt-5-nano, o1, o3)
         self.is_reasoning_model = (
@@ -219,6 +233,14 @@ class FactsBatchRequestGenerator:
 
         logger.info(f"Content fetching complete: {len(fetched_contents)} successful, {failed_fetches} failed")
 
+        # Re-extraction deletes and rewrites existing facts, so copies must
+        # not be linked to facts that are about to change.
+        near_duplicates = (
+            self._find_near_duplicates(unique_articles, fetched_contents, prompt)
+            if high_fact_count_threshold is None
+            else NearDuplicateReport()
+        )
+
         # Write batch file
         total_requests = 0
         article_ids: List[str] = []
@@ -228,7 +250,7 @@ class FactsBatchRequestGenerator:
                 news_url_id = article["id"]
                 content = fetched_contents.get(news_url_id, "")
                 
-                if not content:
+                if not content or news_url_id in near_duplicates.links:
                     continue
 
                 request = self._build_request(
@@ -242,6 +264,11 @@ class FactsBatchRequestGenerator:
                 article_ids.append(news_url_id)
 
         if total_requests == 0:
+            if near_duplicates.requests_avoided:
+                raise ValueError(
+                    f"No requests generated - {near_duplicates.requests_avoided} articles were near-duplicates "
+                    f"({near_duplicates.linked_to_existing} linked to existing facts)"
+                )
             raise ValueError("No requests generated - articles may have no content")
 
         metadata = {
@@ -257,6 +284,9 @@ class FactsBatchRequestGenerator:
             "include_unextracted": include_unextracted,
             "max_workers": self.max_workers,
             "max_age_hours": max_age_hours,
+            "near_duplicates": near_duplicates.to_dict(),
+            # Duplicates of articles in this batch, linked once its facts exist.
+            "near_duplicate_links": near_duplicates.pending_links,
         }
 
         metadata_path = self.output_dir / f"facts_batch_{timestamp}_metadata.json"
@@ -269,6 +299,8 @@ class FactsBatchRequestGenerator:
                 "requests": total_requests,
                 "articles": total_requests,
                 "skipped_no_content": failed_fetches,
+                "near_duplicates_skipped": near_duplicates.requests_avoided,
+                "estimated_tokens_avoided": near_duplicates.estimated_tokens_avoided,
             },
         )
 
@@ -280,6 +312,59 @@ class FactsBatchRequestGenerator:
             metadata=metadata,
         )
 
+    def _find_near_duplicates(
+        self,
+        articles: List[Dict[str, Any]],
+        contents: Dict[str, str],
+        prompt: str,
+    ) -> NearDuplicateReport:
+        """Fingerprint fetched articles and link near-duplicates.
+
+        Duplicates of already-extracted articles get the canonical facts
+        copied right away; duplicates of articles in this batch are returned
+        as pending links for the result processor. Fingerprint storage is
+        best-effort: without it only in-batch duplicates are found.
+        """
+        if self.near_duplicate_threshold is None or not contents:
+            return NearDuplicateReport()
+
+        since = (datetime.now(timezone.utc) - timedelta(hours=self.fingerprint_lookback_hours)).isoformat()
+        try:
+            prior = self._reader.fetch_recent_fingerprints(since, page_size=1000)
+            # Only canonicals whose facts exist can be linked to.
+            with_facts = self._reader.check_existing_facts(list(prior)) if prior else set()
+            prior = {news_url_id: sig for news_url_id, sig in prior.items() if news_url_id in with_facts}
+        except Exception as exc:
+            logger.warning("Could not load stored content fingerprints: %s", exc)
+            prior = {}
+
+        report, rows = find_near_duplicates(
+            articles,
+            contents,
+            prior=prior,
+            threshold=self.near_duplicate_threshold,
+            prompt=prompt,
+        )
+        self._writer.upsert_content_fingerprints(rows)
+
+        if report.existing_links:
+            try:
+                report.linked_to_existing = link_near_duplicates(
+                    self._reader, self._writer, report.existing_links
+                )
+            except Exception as exc:
+                # Unlinked duplicates stay pending and are matched again next run.
+                logger.warning("Failed to link near-duplicates to existing facts: %s", exc)
+
+        logger.info(
+            "Near-duplicate check: %d fingerprinted, %d duplicates (%d linked to existing facts), ~%d tokens avoided",
+            report.fingerprinted,
+            report.requests_avoided,
+            report.linked_to_existing,
+            report.estimated_tokens_avoided,
+        )
+        return report
+
     def _fetch_pending_articles(
         self,
         *,
@@ -491,11 +576,11 @@ class FactsBatchRequestGenerator:
         Returns:
             Extracted article content, or empty string on failure
         """
-        from src.shared.utils.amp_detector import probe_for_amp
+        from src.shared.extractors.extractor_factory import probe_amp
         
         try:
             # Step 1: Probe for AMP version first (faster, cleaner markup)
-            amp_url, is_amp = probe_for_amp(url, timeout=8.0, logger=logger)
+            amp_url, is_amp = probe_amp(url, timeout=8.0, logger=logger)
             if is_amp and amp_url != url:
                 logger.debug(f"Using AMP version: {amp_url}")
             
@@ -11,11 +11,13 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 
 from openai import OpenAI
 
+from src.shared.batch.stream_ingest import DEFAULT_WINDOW_SIZE, IngestWindow, StreamingIngestor
 from src.shared.db.connection import get_supabase_client
 from ..db import FactsReader, FactsWriter
 from ..facts.parser import parse_fact_response, extract_json_from_text
 from ..facts.filter import filter_story_facts
 from ..facts.prompts import FACT_PROMPT_VERSION
+from .near_duplicates import link_near_duplicates
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +31,7 @@ class ProcessingResult:
     articles_in_output: int = 0
     articles_processed: int = 0
     articles_skipped_existing: int = 0
+    articles_resumed: int = 0
     articles_skipped_no_facts: int = 0
     articles_with_errors: int = 0
     facts_extracted: int = 0
@@ -38,10 +41,24 @@ class ProcessingResult:
     errors: List[str] = field(default_factory=list)
 
 
+@dataclass
+class _WrittenWindow:
+    """Facts inserted for one window, handed to the embedding step."""
+
+    facts_by_article: Dict[str, List[str]]
+    fact_ids_by_article: Dict[str, List[str]]
+    texts_by_id: Dict[str, str]
+
+
+def _article_key(data: Dict[str, Any]) -> Optional[str]:
+    custom_id = data.get("custom_id") or ""
+    return custom_id[6:] if custom_id.startswith("facts_") else None
+
+
 class FactsBatchResultProcessor:
     """Process completed OpenAI batch outputs for fact extraction.
 
-    Parses batch output JSONL, extracts and filters facts, stores to database,
+    Streams batch output JSONL, extracts and filters facts, stores to database,
     and optionally creates embeddings.
     
     Example:
@@ -59,6 +76,7 @@ class FactsBatchResultProcessor:
         embedding_api_key: Optional[str] = None,
         embedding_model: str = "text-embedding-3-small",
         chunk_size: int = 100,
+        window_size: int = DEFAULT_WINDOW_SIZE,
     ) -> None:
         """Initialize result processor.
         
@@ -66,11 +84,13 @@ class FactsBatchResultProcessor:
             embedding_api_key: API key for creating embeddings
             embedding_model: Model for embeddings
             chunk_size: Chunk size for bulk operations
+            window_size: Articles per streamed ingestion window
         """
         self.client = get_supabase_client()
         self.embedding_api_key = embedding_api_key
         self.embedding_model = embedding_model
         self.chunk_size = chunk_size
+        self.window_size = window_size
         # Instantiate a request-scoped OpenAI client instead of mutating the
         # `openai.api_key` module global (unsafe in warm Cloud Function
         # containers serving multiple tenants).
@@ -90,9 +110,15 @@ class FactsBatchResultProcessor:
         skip_existing: bool = True,
         create_embeddings: bool = True,
         force_delete: bool = False,
+        resume: bool = True,
     ) -> ProcessingResult:
         """Process a completed batch output file.
-        
+
+        The file is streamed in windows of ``window_size`` articles: facts for a
+        window are written while embeddings for the previous window are still
+        being created, and progress is recorded per window so a failed run can
+        be resumed (see :mod:`src.shared.batch.stream_ingest`).
+
         Args:
             output_file: Path to the JSONL output file
             model: Model used for extraction (for metadata)
@@ -100,24 +126,102 @@ class FactsBatchResultProcessor:
             skip_existing: Skip articles that already have facts
             create_embeddings: Create embeddings for new facts
             force_delete: Delete existing facts before inserting (for re-extraction)
-            
+            resume: Continue after the last committed window of a previous run
+
         Returns:
             ProcessingResult with statistics
         """
         result = ProcessingResult()
+        embed = create_embeddings and bool(self.embedding_api_key)
+
+        def on_invalid_line(line_num: int, error: Exception) -> None:
+            result.errors.append(f"Line {line_num}: JSON decode error: {error}")
+            result.articles_with_errors += 1
+
+        def write_window(window: IngestWindow) -> Optional[_WrittenWindow]:
+            parsed_responses: Dict[str, Dict[str, Any]] = {}
+            for line_num, data in window.records:
+                parsed = self._parse_record(line_num, data, result)
+                if parsed:
+                    parsed_responses[parsed[0]] = parsed[1]
+            result.articles_in_output += len(parsed_responses)
+            return self._write_window(
+                parsed_responses,
+                result,
+                model=model,
+                dry_run=dry_run,
+                skip_existing=skip_existing,
+                force_delete=force_delete,
+                replayed=window.replayed,
+            )
 
-        # Phase 1: Parse all responses
-        parsed_responses = self._parse_output_file(output_file, result)
-        result.articles_in_output = len(parsed_responses)
+        def finish_window(window: IngestWindow, written: Optional[_WrittenWindow]) -> None:
+            if written is None:
+                return
+            # Embeddings before the completion mark, as in the unwindowed flow.
+            if embed:
+                all_fact_ids = [
+                    fid for ids in written.fact_ids_by_article.values() for fid in ids
+                ]
+                if all_fact_ids:
+                    result.embeddings_created += self._bulk_create_embeddings(
+                        all_fact_ids, texts_by_id=written.texts_by_id
+                    )
+            if written.fact_ids_by_article:
+                self._bulk_mark_completed(written.facts_by_article)
+
+        ingestor = StreamingIngestor(
+            output_file,
+            key_fn=_article_key,
+            window_size=self.window_size,
+            resume=resume,
+            record_progress=not dry_run,
+            on_invalid_line=on_invalid_line,
+        )
+        stats = ingestor.run(write_window, None if dry_run else finish_window)
 
-        if not parsed_responses:
+        if not result.articles_in_output:
             logger.warning("No valid responses found in batch output")
-            return result
 
-        # Phase 2: Handle existing facts
+        logger.info(
+            "Batch processing complete",
+            extra={
+                "articles_processed": result.articles_processed,
+                "facts_written": result.facts_written,
+                "embeddings_created": result.embeddings_created,
+                "windows": stats.windows_committed,
+                "resumed_from_line": stats.resumed_from_line,
+            },
+        )
+
+        return result
+
+    def _write_window(
+        self,
+        parsed_responses: Dict[str, Dict[str, Any]],
+        result: ProcessingResult,
+        *,
+        model: str,
+        dry_run: bool,
+        skip_existing: bool,
+        force_delete: bool,
+        replayed: bool = False,
+    ) -> Optional[_WrittenWindow]:
+        """Filter, extract and insert facts for one window of articles.
+
+        In a ``replayed`` window (see :mod:`src.shared.batch.stream_ingest`)
+        articles that already have facts may have been inserted by the failed
+        run before their embeddings and completion mark; they are finished
+        from the stored facts instead of being skipped.
+        """
+        if not parsed_responses:
+            return None
+
+        # Handle existing facts
         article_ids = list(parsed_responses.keys())
+        resumed: Optional[_WrittenWindow] = None
         if force_delete:
-            # Delete existing facts for all articles in the batch
+            # Delete existing facts for all articles in the window
             if not dry_run:
                 self._bulk_delete_existing_data(article_ids)
                 logger.info(f"Deleted existing data for {len(article_ids)} articles (force_delete mode)")
@@ -125,13 +229,14 @@ class FactsBatchResultProcessor:
             existing = self._check_existing_facts(article_ids)
             for article_id in existing:
                 del parsed_responses[article_id]
-                result.articles_skipped_existing += 1
-
-        if not parsed_responses:
-            logger.info("All articles already have facts, nothing to process")
-            return result
+            if replayed and existing and not dry_run:
+                resumed = self._resume_written_articles(sorted(existing))
+                result.articles_resumed += len(resumed.facts_by_article)
+                result.articles_skipped_existing += len(existing) - len(resumed.facts_by_article)
+            else:
+                result.articles_skipped_existing += len(existing)
 
-        # Phase 3: Extract and filter facts
+        # Extract and filter facts
         facts_by_article: Dict[str, List[str]] = {}
         for article_id, response_data in parsed_responses.items():
             raw_facts = self._extract_facts_from_response(response_data)
@@ -159,105 +264,90 @@ class FactsBatchResultProcessor:
                 result.articles_skipped_no_facts += 1
 
         if not facts_by_article:
-            logger.warning("No valid facts extracted from any article")
-            return result
+            return resumed
 
         if dry_run:
             logger.info(
                 "DRY RUN: Would write facts for %d articles",
                 len(facts_by_article),
             )
-            result.articles_processed = len(facts_by_article)
-            result.facts_written = sum(len(f) for f in facts_by_article.values())
-            return result
+            result.articles_processed += len(facts_by_article)
+            result.facts_written += sum(len(f) for f in facts_by_article.values())
+            return None
 
-        # Phase 4: Bulk insert facts (returns text map so embeddings can skip
-        # a redundant SELECT against the rows we just wrote).
+        # Bulk insert facts (returns text map so embeddings can skip a
+        # redundant SELECT against the rows we just wrote).
         fact_ids_by_article, texts_by_id = self._bulk_insert_facts(
             facts_by_article, model
         )
-        result.articles_processed = len(fact_ids_by_article)
-        result.facts_written = sum(len(ids) for ids in fact_ids_by_article.values())
-
-        # Phase 5: Create embeddings
-        if create_embeddings and self.embedding_api_key:
-            all_fact_ids = [
-                fid for ids in fact_ids_by_article.values() for fid in ids
-            ]
-            if all_fact_ids:
-                result.embeddings_created = self._bulk_create_embeddings(
-                    all_fact_ids, texts_by_id=texts_by_id
-                )
-
-        # Phase 6: Mark facts_extracted_at and update stats
-        if fact_ids_by_article:
-            self._bulk_mark_completed(facts_by_article)
-
-        logger.info(
-            "Batch processing complete",
-            extra={
-                "articles_processed": result.articles_processed,
-                "facts_written": result.facts_written,
-                "embeddings_created": result.embeddings_created,
-            },
+        result.articles_processed += len(fact_ids_by_article)
+        result.facts_written += sum(len(ids) for ids in fact_ids_by_article.values())
+        written = _WrittenWindow(facts_by_article, fact_ids_by_article, texts_by_id)
+        if resumed is not None:
+            written.facts_by_article.update(resumed.facts_by_article)
+            written.fact_ids_by_article.update(resumed.fact_ids_by_article)
+            written.texts_by_id.update(resumed.texts_by_id)
+        return written
+
+    def _resume_written_articles(self, article_ids: List[str]) -> _WrittenWindow:
+        """Rebuild the hand-off for articles whose facts are already stored.
+
+        Only facts still lacking an embedding are queued for embedding; every
+        article is marked complete again with its stored fact count.
+        """
+        stored = self._reader.fetch_facts_for_articles(
+            article_ids, chunk_size=self.chunk_size
         )
+        all_ids = [row["id"] for rows in stored.values() for row in rows]
+        embedded = self._reader.check_existing_embeddings(all_ids)
+
+        resumed = _WrittenWindow({}, {}, {})
+        for article_id, rows in stored.items():
+            resumed.facts_by_article[article_id] = [row["fact_text"] for row in rows]
+            pending = [row for row in rows if row["id"] not in embedded]
+            resumed.fact_ids_by_article[article_id] = [row["id"] for row in pending]
+            resumed.texts_by_id.update((row["id"], row["fact_text"]) for row in pending)
+        if resumed.facts_by_article:
+            logger.info(
+                "Finishing %d articles written before the previous run stopped",
+                len(resumed.facts_by_article),
+            )
+        return resumed
 
-        return result
-
-    def _parse_output_file(
+    def _parse_record(
         self,
-        output_file: Path,
+        line_num: int,
+        data: Dict[str, Any],
         result: ProcessingResult,
-    ) -> Dict[str, Dict[str, Any]]:
-        """Parse the JSONL output file.
-        
-        Returns:
-            Dict mapping article_id to response data
-        """
-        parsed: Dict[str, Dict[str, Any]] = {}
-
-        with output_file.open("r") as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
-
-                try:
-                    data = json.loads(line)
-                except json.JSONDecodeError as e:
-                    result.errors.append(f"Line {line_num}: JSON decode error: {e}")
-                    result.articles_with_errors += 1
-                    continue
-
-                custom_id = data.get("custom_id", "")
-                
-                # Extract article ID from custom_id (format: facts_{news_url_id})
-                if not custom_id.startswith("facts_"):
-                    result.errors.append(f"Line {line_num}: Invalid custom_id: {custom_id}")
-                    result.articles_with_errors += 1
-                    continue
-
-                article_id = custom_id[6:]  # Remove "facts_" prefix
-
-                # Check for API errors
-                error = data.get("error")
-                if error:
-                    result.errors.append(f"Article {article_id}: API error: {error}")
-                    result.articles_with_errors += 1
-                    continue
-
-                # Extract response body
-                response = data.get("response", {})
-                body = response.get("body", {})
-                
-                if not body:
-                    result.errors.append(f"Article {article_id}: Empty response body")
-                    result.articles_with_errors += 1
-                    continue
-
-                parsed[article_id] = body
-
-        return parsed
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Parse one output line into ``(article_id, response_body)``."""
+        custom_id = data.get("custom_id", "")
+
+        # Extract article ID from custom_id (format: facts_{news_url_id})
+        if not custom_id.startswith("facts_"):
+            result.errors.append(f"Line {line_num}: Invalid custom_id: {custom_id}")
+            result.articles_with_errors += 1
+            return None
+
+        article_id = custom_id[6:]  # Remove "facts_" prefix
+
+        # Check for API errors
+        error = data.get("error")
+        if error:
+            result.errors.append(f"Article {article_id}: API error: {error}")
+            result.articles_with_errors += 1
+            return None
+
+        # Extract response body
+        response = data.get("response", {})
+        body = response.get("body", {})
+
+        if not body:
+            result.errors.append(f"Article {article_id}: Empty response body")
+            result.articles_with_errors += 1
+            return None
+
+        return article_id, body
 
     def _extract_facts_from_response(self, response_body: Dict[str, Any]) -> List[str]:
         """Extract facts from a chat completion response.
@@ -373,6 +463,19 @@ class FactsBatchResultProcessor:
             records, chunk_size=self.chunk_size
         )
 
+    def link_near_duplicates(self, links: Dict[str, str]) -> int:
+        """Copy facts from canonical articles to their near-duplicates.
+
+        ``links`` maps duplicate article IDs to canonical ones (as recorded by
+        the request generator). Duplicates that already have facts are left
+        untouched. Returns the number of duplicates linked.
+        """
+        if not links:
+            return 0
+        already_done = self._check_existing_facts(list(links))
+        pending = {dup: canonical for dup, canonical in links.items() if dup not in already_done}
+        return link_near_duplicates(self._reader, self._writer, pending, chunk_size=self.chunk_size)
+
     def _bulk_mark_completed(self, facts_by_article: Dict[str, List[str]]) -> None:
         self._writer.mark_facts_extracted(
             facts_by_article, chunk_size=self.chunk_size
@@ -14,8 +14,8 @@ from src.shared.contracts.extracted_content import (
 )
 from src.shared.extractors.extractor_factory import (
     get_extractor,
+    probe_amp,
 )
-from src.shared.utils import amp_detector
 
 load_env()
 setup_logging(level=os.getenv("LOG_LEVEL", "INFO"))
@@ -297,7 +297,7 @@ def _prefer_amp_variant(
     logger: logging.Logger,
 ) -> tuple[str, bool]:
     try:
-        return amp_detector.probe_for_amp(url, logger=logger)
+        return probe_amp(url, logger=logger)
     except Exception as exc:  # pragma: no cover - defensive safety
         logger.debug("AMP probe raised for %s: %s", url, exc)
         return url, False
@@ -147,11 +147,13 @@ def _batch_extract_heavy(
     items: List[Dict[str, Any]],
     *,
     timeout: int = 45,
+    max_pages: int = 4,
 ) -> Dict[str, str]:
     """Extract heavy (Playwright) URLs using one shared browser.
 
     Launching Chromium costs ~2-3s per URL; reusing the browser across the
-    whole batch amortizes that to a single launch. Returns a ``{url_id:
+    whole batch amortizes that to a single launch, and keeping ``max_pages``
+    pages in flight overlaps their load waits. Returns a ``{url_id:
     content}`` map. Items with extraction errors are omitted so the
     downstream per-URL path handles them through the standard failure flow.
     """
@@ -163,7 +165,7 @@ def _batch_extract_heavy(
     )
 
     urls = [str(item.get("url", "")) for item in items]
-    extractor = PlaywrightExtractor(logger=logger)
+    extractor = PlaywrightExtractor(logger=logger, max_pages=max_pages)
     try:
         results = extractor.extract_many(urls, timeout=timeout)
     except Exception as exc:
@@ -172,7 +174,53 @@ def _batch_extract_heavy(
             exc,
         )
         return {}
+    if extractor.last_batch_stats is not None:
+        logger.info("Playwright batch stats: %s", extractor.last_batch_stats.to_dict())
+    logger.info("Playwright resource blocking: %s", extractor.block_stats.to_dict())
+    for host, timing in extractor.readiness.summary().items():
+        logger.info(
+            "Time-to-content %s: p50=%dms p95=%dms (%d pages, %d hit the wait cap)",
+            host,
+            timing["p50_ms"],
+            timing["p95_ms"],
+            timing["count"],
+            timing["capped"],
+        )
+
+    return _content_by_id(items, results)
+
+
+def _batch_extract_light(
+    items: List[Dict[str, Any]],
+    *,
+    timeout: int = 45,
+) -> Dict[str, str]:
+    """Extract light (HTTP-only) URLs through one async batch.
+
+    Fetches share an HTTP/2 client with per-host limits and parsing runs in
+    a process pool, instead of one blocking thread per URL. Returns the same
+    ``{url_id: content}`` map as :func:`_batch_extract_heavy`.
+    """
+    if not items:
+        return {}
+
+    from src.shared.extractors.light_extractor import LightExtractor
 
+    urls = [str(item.get("url", "")) for item in items]
+    extractor = LightExtractor(logger=logger)
+    try:
+        results = extractor.extract_many(urls, timeout=timeout)
+    except Exception as exc:
+        logger.warning(
+            "Light batch failed (%s); falling back to per-URL extraction",
+            exc,
+        )
+        return {}
+    return _content_by_id(items, results)
+
+
+def _content_by_id(items: List[Dict[str, Any]], results: List[Any]) -> Dict[str, str]:
+    """Map batch results to ``{url_id: content}``, omitting errors and empty pages."""
     content_by_id: Dict[str, str] = {}
     for item, result in zip(items, results):
         url_id = str(item.get("id", ""))
@@ -395,6 +443,7 @@ def run_batch_processor(
     max_age_hours: Optional[int] = 24,
     max_error_threshold: int = 3,
     max_attempts: int = 3,
+    heavy_pages: int = 4,
 ) -> Dict[str, Any]:
     """Run the content batch processor.
     
@@ -408,6 +457,7 @@ def run_batch_processor(
         max_age_hours: Only process URLs created within this many hours (None for no limit)
         max_error_threshold: Skip URLs with this many or more consecutive failures
         max_attempts: Attempts before quarantining a URL for the run
+        heavy_pages: Concurrent Playwright pages for heavy URLs
         
     Returns:
         Summary dict with statistics
@@ -453,7 +503,7 @@ def run_batch_processor(
         light_urls = [item for item in pending if not is_heavy_url(item.get("url", ""))]
         heavy_urls = [item for item in pending if is_heavy_url(item.get("url", ""))]
         
-        logger.info("URL breakdown: %d light (parallel), %d heavy (sequential)", len(light_urls), len(heavy_urls))
+        logger.info("URL breakdown: %d light (parallel), %d heavy (shared browser)", len(light_urls), len(heavy_urls))
 
         progress = ProgressTracker(total_articles=len(pending), stage="content")
         successful = 0
@@ -488,9 +538,19 @@ def run_batch_processor(
                 progress.increment(success=False)
                 return False
 
-        # Process light URLs in parallel (safe with ThreadPoolExecutor)
+        # Light URLs: fetch + parse in one async batch, then store in parallel
+        # (the workers now only do database writes and the failure flow).
         if light_urls:
             logger.info("Processing %d light URLs with %d workers...", len(light_urls), workers)
+            light_content_by_id = _batch_extract_light(
+                [
+                    item
+                    for item in light_urls
+                    if not checkpoint.is_stage_complete(str(item.get("id", "")), "content")
+                    and not failure_tracker.is_skipped("content", str(item.get("id", "")))
+                ],
+                timeout=timeout,
+            )
             with ThreadPoolExecutor(max_workers=workers) as executor:
                 futures = {
                     executor.submit(
@@ -501,6 +561,7 @@ def run_batch_processor(
                         failure_tracker,
                         timeout,
                         max_attempts,
+                        prefetched_content=light_content_by_id.get(str(item.get("id", ""))),
                     ): item
                     for item in light_urls
                 }
@@ -544,7 +605,9 @@ def run_batch_processor(
                 if not checkpoint.is_stage_complete(str(item.get("id", "")), "content")
                 and not failure_tracker.is_skipped("content", str(item.get("id", "")))
             ]
-            content_by_id = _batch_extract_heavy(pending_items, timeout=timeout)
+            content_by_id = _batch_extract_heavy(
+                pending_items, timeout=timeout, max_pages=heavy_pages
+            )
 
             for item in heavy_urls:
                 url_id = str(item.get("id", ""))
@@ -575,6 +638,7 @@ def run_batch_processor(
         }
 
     finally:
+        checkpoint.close()
         memory_monitor.stop()
 
 
@@ -637,7 +701,14 @@ Examples:
         "--workers",
         type=int,
         default=10,
-        help="Number of concurrent workers for light URLs (default: 10, heavy URLs always sequential)",
+        help="Number of concurrent workers for light URLs (default: 10)",
+    )
+
+    parser.add_argument(
+        "--heavy-pages",
+        type=int,
+        default=4,
+        help="Concurrent Playwright pages for heavy URLs in the shared browser (default: 4)",
     )
 
     parser.add_argument(
@@ -731,6 +802,7 @@ def main():
         max_age_hours=max_age,
         max_error_threshold=args.max_error_threshold,
         max_attempts=args.max_attempts,
+        heavy_pages=args.heavy_pages,
     )
 
     # Print summary
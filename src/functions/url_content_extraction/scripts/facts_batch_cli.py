@@ -263,6 +263,12 @@ def handle_create(pipeline: FactsBatchPipeline, args: argparse.Namespace) -> boo
         print(f"Articles:       {result.total_articles}")
         print(f"Requests:       {result.total_requests}")
         print(f"Skipped URLs:   {result.articles_skipped_no_content} (content unavailable at facts time)")
+        if result.near_duplicates_skipped:
+            print(
+                f"Near-duplicates: {result.near_duplicates_skipped} requests avoided "
+                f"(~{result.estimated_tokens_avoided:,} tokens; "
+                f"{result.near_duplicates_linked} linked to existing facts)"
+            )
         print(f"Input file:     {result.input_file_path}")
         if register:
             print(f"Tracking:       ✅ Registered")
@@ -405,12 +411,18 @@ def handle_process(pipeline: FactsBatchPipeline, args: argparse.Namespace) -> bo
         print(f"Articles in output:     {result['articles_in_output']}")
         print(f"Articles processed:     {result['articles_processed']}")
         print(f"Articles skipped (existing): {result['articles_skipped_existing']}")
+        print(f"Articles resumed:       {result.get('articles_resumed', 0)}")
         print(f"Articles skipped (no facts): {result['articles_skipped_no_facts']}")
         print(f"Articles with errors:   {result['articles_with_errors']}")
         print(f"\nFacts extracted:        {result['facts_extracted']}")
         print(f"Facts filtered:         {result['facts_filtered']}")
         print(f"Facts written:          {result['facts_written']}")
         print(f"Embeddings created:     {result['embeddings_created']}")
+        if result.get("near_duplicates_pending"):
+            print(
+                f"Near-duplicates linked: {result['near_duplicates_linked']}"
+                f"/{result['near_duplicates_pending']} (facts copied from canonical articles)"
+            )
         print("=" * 60)
 
         if result.get("errors"):
@@ -13,10 +13,9 @@ from datetime import datetime, timezone
 from typing import Any, Callable, Dict, List, Optional
 
 from src.shared.contracts.extracted_content import ExtractedContent
-from src.shared.extractors.extractor_factory import get_extractor
+from src.shared.extractors.extractor_factory import get_extractor, probe_amp
 from src.shared.jobs.contracts import JobStatus, SupabaseConfig
 from src.shared.jobs.store import JobStore
-from src.shared.utils.amp_detector import probe_for_amp
 
 from .. import config as svc_config
 from ..config import ExtractionOptions
@@ -124,7 +123,7 @@ def _default_extractor(url: str, options: ExtractionOptions) -> ExtractedContent
     used_amp = False
     if not options.force_playwright:
         try:
-            amp_url, is_amp = probe_for_amp(url, logger=logger)
+            amp_url, is_amp = probe_amp(url, logger=logger)
             if is_amp and amp_url and amp_url != url:
                 target = amp_url
                 used_amp = True
@@ -18,6 +18,9 @@ class YouTubeSearchRequest(BaseModel):
     allowedChannelTitles: Optional[List[str]] = Field(None, description="List of allowed channel titles (case-insensitive) for filtering results")
     fetchTranscripts: bool = Field(True, description="Whether to fetch transcripts for videos (default: True)")
     proxyUrl: Optional[str] = Field(None, description="Proxy URL for transcript fetching (required for GCP)")
+    transcriptConcurrency: int = Field(8, ge=1, le=25, description="Maximum transcripts fetched in parallel")
+    transcriptTimeoutSeconds: float = Field(15.0, gt=0, le=120, description="Timeout for a single video's transcript")
+    transcriptDeadlineSeconds: float = Field(45.0, gt=0, le=300, description="Overall time budget for transcript fetching")
     credentials: Credentials = Field(..., description="API credentials")
 
 
@@ -1,9 +1,67 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import httpx
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api.proxies import GenericProxyConfig
 from .config import YouTubeSearchRequest, YouTubeSearchResponse, PageInfo
 
+TRANSCRIPT_CACHE_TTL_SECONDS = 6 * 60 * 60
+TRANSCRIPT_CACHE_MAX_ENTRIES = 1024
+
+
+class TranscriptCache:
+    """Thread-safe LRU of fetched transcripts keyed by video id, with a TTL.
+
+    Popular videos recur across searches, so warm instances reuse transcripts
+    instead of fetching them again. Only successful fetches are cached.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = TRANSCRIPT_CACHE_TTL_SECONDS,
+        max_entries: int = TRANSCRIPT_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, str, List[Dict[str, Any]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, video_id: str) -> Optional[Tuple[str, List[Dict[str, Any]]]]:
+        with self._lock:
+            entry = self._entries.get(video_id)
+            if entry is None:
+                return None
+            expires_at, text, snippets = entry
+            if expires_at <= self._clock():
+                del self._entries[video_id]
+                return None
+            self._entries.move_to_end(video_id)
+            return text, snippets
+
+    def set(self, video_id: str, text: str, snippets: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._entries[video_id] = (self._clock() + self.ttl_seconds, text, snippets)
+            self._entries.move_to_end(video_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_transcript_cache = TranscriptCache()
+
 
 class YouTubeSearchService:
     """Service for searching YouTube videos via the YouTube Data API v3 and fetching transcripts."""
@@ -11,11 +69,16 @@ class YouTubeSearchService:
     BASE_URL = "https://www.googleapis.com/youtube/v3/search"
     
     @staticmethod
-    async def search(request: YouTubeSearchRequest) -> YouTubeSearchResponse:
+    async def search(
+        request: YouTubeSearchRequest,
+        transcript_cache: Optional[TranscriptCache] = None,
+    ) -> YouTubeSearchResponse:
         """Searches YouTube for videos and optionally fetches transcripts.
         
         Args:
             request: Validated YouTubeSearchRequest with search parameters.
+            transcript_cache: Cache for fetched transcripts (default: the
+                process-wide cache shared by warm instances).
             
         Returns:
             YouTubeSearchResponse with video results.
@@ -73,7 +136,14 @@ class YouTubeSearchService:
             
             # Fetch transcripts if requested
             if request.fetchTranscripts:
-                YouTubeSearchService._fetch_transcripts_for_items(items, request.proxyUrl)
+                await YouTubeSearchService._fetch_transcripts_for_items(
+                    items,
+                    request.proxyUrl,
+                    concurrency=request.transcriptConcurrency,
+                    per_video_timeout=request.transcriptTimeoutSeconds,
+                    deadline=request.transcriptDeadlineSeconds,
+                    cache=transcript_cache,
+                )
             
             # Parse and validate response
             try:
@@ -93,45 +163,115 @@ class YouTubeSearchService:
                 raise RuntimeError(f"Failed to parse YouTube API response: {str(e)}")
 
     @staticmethod
-    def _fetch_transcripts_for_items(items: List[Dict[str, Any]], proxy_url: str = None) -> None:
-        """Helper to fetch transcripts for a list of video items in place."""
-        # Instantiate API once (not thread safe, but we are in a sync loop here effectively)
-        # Configure proxy if provided
-        proxy_config = None
-        if proxy_url:
-            proxy_config = GenericProxyConfig(http_url=proxy_url, https_url=proxy_url)
-            
-        transcript_api = YouTubeTranscriptApi(proxy_config=proxy_config)
-        
+    async def _fetch_transcripts_for_items(
+        items: List[Dict[str, Any]],
+        proxy_url: str = None,
+        *,
+        concurrency: int = 8,
+        per_video_timeout: float = 15.0,
+        deadline: float = 45.0,
+        cache: Optional[TranscriptCache] = None,
+    ) -> None:
+        """Helper to fetch transcripts for a list of video items in place.
+
+        Cached transcripts are used first. The rest are fetched on a bounded
+        thread pool (the transcript client is synchronous) so the event loop is
+        not blocked. A video that takes longer than ``per_video_timeout``, or
+        is still pending when ``deadline`` expires, gets ``transcript: None``
+        and the remaining results are returned as they are.
+        """
+        cache = cache if cache is not None else _transcript_cache
+
+        # Group items by video id; the same video can appear more than once.
+        pending: Dict[str, List[Dict[str, Any]]] = {}
         for item in items:
             video_id = item.get("id", {}).get("videoId")
             if not video_id:
                 continue
-                
+            cached = cache.get(video_id)
+            if cached is not None:
+                item["transcript"], item["transcript_snippets"] = cached[0], cached[1]
+            else:
+                pending.setdefault(video_id, []).append(item)
+
+        if not pending:
+            return
+
+        # Configure proxy if provided
+        proxy_config = None
+        if proxy_url:
+            proxy_config = GenericProxyConfig(http_url=proxy_url, https_url=proxy_url)
+
+        # YouTubeTranscriptApi holds a requests session, so each worker thread
+        # gets its own instance.
+        local = threading.local()
+
+        def fetch(video_id: str) -> Tuple[str, List[Dict[str, Any]]]:
+            api = getattr(local, "api", None)
+            if api is None:
+                api = local.api = YouTubeTranscriptApi(proxy_config=proxy_config)
+            # v1.2.3: use instance method .fetch() which defaults to english
+            # We could expose languages in config if needed.
+            transcript_objects = api.fetch(video_id)
+
+            # Convert objects to list of dicts for JSON serialization
+            transcript_list = [
+                {
+                    "text": t.text,
+                    "start": t.start,
+                    "duration": t.duration
+                }
+                for t in transcript_objects
+            ]
+
+            # Combine snippets into one text string
+            combined_text = " ".join([t["text"] for t in transcript_list]).strip()
+            cache.set(video_id, combined_text, transcript_list)
+            return combined_text, transcript_list
+
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(max(1, concurrency))
+        # Spare workers so a thread still stuck on a timed-out fetch does not
+        # hold up the next video (its timeout only covers its own fetch).
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(2 * concurrency, len(pending))),
+            thread_name_prefix="yt-transcript",
+        )
+
+        async def fetch_one(video_id: str) -> None:
             try:
-                # v1.2.3: use instance method .fetch() which defaults to english
-                # We could expose languages in config if needed.
-                transcript_objects = transcript_api.fetch(video_id)
-                
-                # Convert objects to list of dicts for JSON serialization
-                transcript_list = [
-                    {
-                        "text": t.text,
-                        "start": t.start,
-                        "duration": t.duration
-                    }
-                    for t in transcript_objects
-                ]
-                
-                # Combine snippets into one text string
-                combined_text = " ".join([t["text"] for t in transcript_list]).strip()
-                
-                item["transcript"] = combined_text
-                item["transcript_snippets"] = transcript_list
+                async with slots:
+                    text, snippets = await asyncio.wait_for(
+                        loop.run_in_executor(executor, fetch, video_id),
+                        timeout=per_video_timeout,
+                    )
+            except asyncio.TimeoutError:
+                print(f"Timed out fetching transcript for {video_id} after {per_video_timeout}s")
+                text, snippets = None, None
             except Exception as e:
                 # Log the error for debugging purposes
                 print(f"Failed to fetch transcript for {video_id}: {str(e)}")
-                # If transcript fails (disabled, not found, etc.), 
-                # we simply do not add the 'transcript' field or set as None/empty
-                item["transcript"] = None
-                item["transcript_snippets"] = None
+                # If transcript fails (disabled, not found, etc.),
+                # we simply set the 'transcript' field to None
+                text, snippets = None, None
+            for item in pending[video_id]:
+                item["transcript"] = text
+                item["transcript_snippets"] = snippets
+
+        tasks = [asyncio.ensure_future(fetch_one(video_id)) for video_id in pending]
+        try:
+            _, unfinished = await asyncio.wait(tasks, timeout=deadline)
+            for task in unfinished:
+                task.cancel()
+            if unfinished:
+                print(f"Transcript deadline of {deadline}s reached with {len(unfinished)} videos pending")
+                await asyncio.gather(*unfinished, return_exceptions=True)
+        finally:
+            # Threads still blocked on slow fetches finish in the background;
+            # their results land in the cache for the next search.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        for video_id, video_items in pending.items():
+            for item in video_items:
+                item.setdefault("transcript", None)
+                item.setdefault("transcript_snippets", None)
@@ -1,15 +1,18 @@
 import unittest
 import json
 import asyncio
+import time
 from unittest.mock import patch, MagicMock
 from src.functions.youtube_search.core.factory import YouTubeSearchFactory
-from src.functions.youtube_search.core.service import YouTubeSearchService
+from src.functions.youtube_search.core.service import TranscriptCache, YouTubeSearchService, _transcript_cache
 from src.functions.youtube_search.core.config import YouTubeSearchRequest
 from src.functions.youtube_search.functions.main import youtube_search_http
 
 class TestYouTubeSearchEdgeCases(unittest.TestCase):
 
     def setUp(self):
+        # Transcripts cached by one test must not satisfy another's fetch
+        _transcript_cache.clear()
         self.valid_payload = {
             "maxResults": 5,
             "q": "test",
@@ -274,6 +277,55 @@ class TestYouTubeSearchEdgeCases(unittest.TestCase):
         self.assertEqual(len(response.items), 1)
         self.assertIsNone(response.items[0].get("transcript"))
 
+    def test_transcript_cache_hit_and_ttl(self):
+        """Test cached transcripts are returned until their TTL expires."""
+        now = [100.0]
+        cache = TranscriptCache(ttl_seconds=60, max_entries=2, clock=lambda: now[0])
+        cache.set("a", "Hello", [{"text": "Hello", "start": 0.0, "duration": 1.0}])
+
+        self.assertEqual(cache.get("a")[0], "Hello")
+        self.assertIsNone(cache.get("missing"))
+
+        now[0] += 61
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+        # Least recently used entry is evicted beyond max_entries
+        for video_id in ("a", "b", "c"):
+            cache.set(video_id, video_id, [])
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("c")[0], "c")
+
+    @patch('src.functions.youtube_search.core.service.YouTubeTranscriptApi')
+    def test_fetch_transcripts_concurrently_with_timeout_and_cache(self, mock_api_cls):
+        """Test slow videos time out, repeats share one fetch, and hits skip the fetch."""
+        def fetch(video_id):
+            if video_id == "slow":
+                time.sleep(0.5)
+            snippet = MagicMock()
+            snippet.text, snippet.start, snippet.duration = f"Text {video_id}", 0.0, 1.0
+            return [snippet]
+
+        mock_api_cls.return_value.fetch.side_effect = fetch
+        cache = TranscriptCache()
+        items = [{"id": {"videoId": video_id}} for video_id in ("fast", "slow", "fast")] + [{"id": {}}]
+
+        asyncio.run(YouTubeSearchService._fetch_transcripts_for_items(
+            items, per_video_timeout=0.1, deadline=2.0, cache=cache,
+        ))
+
+        self.assertEqual([item.get("transcript") for item in items[:3]], ["Text fast", None, "Text fast"])
+        self.assertEqual(items[0]["transcript_snippets"], [{"text": "Text fast", "start": 0.0, "duration": 1.0}])
+        self.assertNotIn("transcript", items[3])
+        fetched = [call.args[0] for call in mock_api_cls.return_value.fetch.call_args_list]
+        self.assertEqual(fetched.count("fast"), 1)
+
+        mock_api_cls.return_value.fetch.reset_mock()
+        repeat = [{"id": {"videoId": "fast"}}]
+        asyncio.run(YouTubeSearchService._fetch_transcripts_for_items(repeat, cache=cache))
+        self.assertEqual(repeat[0]["transcript"], "Text fast")
+        mock_api_cls.return_value.fetch.assert_not_called()
+
     @patch('src.functions.youtube_search.functions.main.YouTubeSearchFactory')
     def test_main_invalid_json_body(self, mock_factory):
         """Test Cloud Function entry point with invalid factory output (validation error)."""
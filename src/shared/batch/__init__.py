@@ -9,6 +9,7 @@ Provides generic utilities for batch processing pipelines:
 - TaskPingHandle: Per-task heartbeat tracking
 - retry_on_network_error: Decorator for network retry with exponential backoff
 - BatchTracker: Track OpenAI Batch API jobs for pipeline orchestration
+- StreamingIngestor: Windowed, resumable ingestion of Batch API output files
 
 Usage:
     from src.shared.batch import CheckpointManager, FailureTracker, ProgressTracker
@@ -16,6 +17,7 @@ Usage:
     from src.shared.batch import TaskPingHandle, send_ping, ping_keepalive
     from src.shared.batch import retry_on_network_error
     from src.shared.batch import BatchTracker, BatchStage, BatchStatus, get_next_stage
+    from src.shared.batch import StreamingIngestor, IngestWindow
 """
 
 from .checkpoint import CheckpointManager
@@ -26,6 +28,7 @@ from .memory_monitor import MemoryMonitor
 from .task_ping import TaskPingHandle, TaskPingManager, send_ping, ping_keepalive
 from .retry import retry_on_network_error
 from .tracking import BatchTracker, BatchStage, BatchStatus, BatchJob, get_next_stage
+from .stream_ingest import IngestStats, IngestWindow, StreamingIngestor
 
 __all__ = [
     "CheckpointManager",
@@ -44,4 +47,7 @@ __all__ = [
     "BatchStatus",
     "BatchJob",
     "get_next_stage",
+    "StreamingIngestor",
+    "IngestWindow",
+    "IngestStats",
 ]
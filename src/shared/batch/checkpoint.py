@@ -1,31 +1,41 @@
-"""Checkpoint manager for per-article, per-stage tracking with atomic writes."""
+"""Checkpoint manager for per-article, per-stage tracking with a write-ahead journal.
+
+State is persisted as a JSON snapshot plus an append-only JSONL journal next to
+it (``<checkpoint>.journal``). Marking a stage complete appends one line to the
+journal, so its cost does not grow with the size of the checkpoint. ``flush``
+fsyncs the journal and folds it into the snapshot on the first flush and then
+whenever the journal grows past ``compact_every`` entries. On load the snapshot is read and the journal is
+replayed on top of it; replay is idempotent, so a crash between writing the
+snapshot and truncating the journal loses nothing.
+"""
 
 from __future__ import annotations
 
 import json
 import logging
+import os
 import random
 import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import IO, Any, Callable, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
 
 class CheckpointManager:
-    """Manages per-article, per-stage checkpoint with atomic writes and validation.
-    
+    """Manages per-article, per-stage checkpoint with journaled writes and validation.
+
     Provides persistence for batch processing pipelines to resume from failures.
     Each article can have multiple stages tracked independently.
-    
+
     Example:
         checkpoint = CheckpointManager("./checkpoints/run_001.json")
-        
+
         for article in articles:
             if checkpoint.is_stage_complete(article.id, "facts"):
                 continue
-            
+
             # Process article...
             checkpoint.mark_stage_complete(article.id, "facts")
             checkpoint.flush()  # Persist to disk
@@ -33,54 +43,126 @@ class CheckpointManager:
 
     CHECKPOINT_VERSION = "1.0"
     DEFAULT_STAGES = ["content", "facts", "knowledge", "summary"]
+    DEFAULT_COMPACT_EVERY = 50_000
 
     def __init__(
         self,
         filepath: str,
         *,
         stages: Optional[List[str]] = None,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
     ):
         """Initialize checkpoint manager.
 
         Args:
-            filepath: Path to checkpoint JSON file
+            filepath: Path to checkpoint JSON snapshot
             stages: List of valid stage names (defaults to content/facts/knowledge/summary)
+            compact_every: Journal entries after which ``flush`` rewrites the snapshot
         """
         self.filepath = Path(filepath)
+        self.journal_path = self.filepath.with_name(f"{self.filepath.name}.journal")
         self.stages = stages or self.DEFAULT_STAGES
-        self.data: Dict[str, Any] = {
+        self.compact_every = max(1, compact_every)
+        self.data: Dict[str, Any] = self._empty_data()
+        self.lock = threading.Lock()
+        self._journal: Optional[IO[str]] = None
+        self._journal_entries = 0
+        self._load()
+
+    def _empty_data(self) -> Dict[str, Any]:
+        now = datetime.now(timezone.utc).isoformat()
+        return {
             "version": self.CHECKPOINT_VERSION,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "last_updated": datetime.now(timezone.utc).isoformat(),
+            "created_at": now,
+            "last_updated": now,
             "articles": {},
         }
-        self.lock = threading.Lock()
-        self._load()
 
     def _load(self) -> None:
-        """Load checkpoint from file if exists."""
+        """Load the snapshot if it exists and replay the journal on top of it."""
         if self.filepath.exists():
             try:
                 with open(self.filepath, "r") as f:
                     loaded = json.load(f)
                     if loaded.get("version") == self.CHECKPOINT_VERSION:
                         self.data = loaded
-                        logger.info(
-                            "Loaded checkpoint from %s",
-                            self.filepath,
-                            extra={
-                                "articles": len(self.data.get("articles", {})),
-                                "created_at": self.data.get("created_at"),
-                            },
-                        )
                     else:
                         logger.warning("Checkpoint version mismatch, starting fresh")
             except Exception as e:
                 logger.error("Failed to load checkpoint: %s", e)
 
+        if self.journal_path.exists():
+            try:
+                self._replay_journal()
+            except Exception as e:
+                logger.error("Failed to replay checkpoint journal: %s", e)
+
+        if self.filepath.exists() or self._journal_entries:
+            logger.info(
+                "Loaded checkpoint from %s",
+                self.filepath,
+                extra={
+                    "articles": len(self.data.get("articles", {})),
+                    "journal_entries": self._journal_entries,
+                    "created_at": self.data.get("created_at"),
+                },
+            )
+
+    def _replay_journal(self) -> None:
+        with open(self.journal_path, "r") as f:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from a crash mid-append; everything before it is intact.
+                    logger.warning(
+                        "Skipping unreadable checkpoint journal line %d in %s",
+                        line_number,
+                        self.journal_path,
+                    )
+                    continue
+                self._apply(entry)
+                self._journal_entries += 1
+
+    def _apply(self, entry: Dict[str, Any]) -> None:
+        if entry.get("op") == "clear":
+            self.data = self._empty_data()
+            return
+        article_id = entry.get("a")
+        stage = entry.get("s")
+        if article_id is None or stage is None:
+            return
+        articles = self.data["articles"]
+        article = articles.get(article_id)
+        if article is None:
+            article = {s: None for s in self.stages}
+            articles[article_id] = article
+        article[stage] = entry.get("t")
+        self.data["last_updated"] = entry.get("t") or self.data.get("last_updated")
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        """Append one journal record. Caller must hold ``self.lock``."""
+        if self._journal is None:
+            self.filepath.parent.mkdir(parents=True, exist_ok=True)
+            self._journal = open(self.journal_path, "a", encoding="utf-8")
+        self._journal.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        # Hand the line to the OS so it survives a process crash; fsync happens in flush().
+        self._journal.flush()
+        self._journal_entries += 1
+
+    def exists(self) -> bool:
+        """Return True if a snapshot or journal from an earlier run is on disk."""
+        return self.filepath.exists() or self.journal_path.exists()
+
     def is_stage_complete(self, article_id: str, stage: str) -> bool:
         """Check if a stage is complete for an article.
 
+        Reads are lock-free: writers only ever add keys or swap ``self.data``
+        wholesale, both of which are atomic for readers.
+
         Args:
             article_id: Article ID
             stage: Stage name
@@ -88,9 +170,8 @@ class CheckpointManager:
         Returns:
             True if stage is complete
         """
-        with self.lock:
-            article = self.data["articles"].get(article_id, {})
-            return article.get(stage) is not None
+        article = self.data["articles"].get(article_id)
+        return article is not None and article.get(stage) is not None
 
     def mark_stage_complete(self, article_id: str, stage: str) -> None:
         """Mark a stage as complete for an article.
@@ -99,12 +180,13 @@ class CheckpointManager:
             article_id: Article ID
             stage: Stage name
         """
+        entry = {"a": article_id, "s": stage, "t": datetime.now(timezone.utc).isoformat()}
         with self.lock:
-            if article_id not in self.data["articles"]:
-                self.data["articles"][article_id] = {s: None for s in self.stages}
-
-            self.data["articles"][article_id][stage] = datetime.now(timezone.utc).isoformat()
-            self.data["last_updated"] = datetime.now(timezone.utc).isoformat()
+            self._apply(entry)
+            try:
+                self._append(entry)
+            except Exception as e:
+                logger.error("Failed to journal checkpoint entry: %s", e)
 
     def get_incomplete_articles(self, stage: str, candidate_ids: List[str]) -> List[str]:
         """Get list of article IDs that haven't completed a stage.
@@ -116,28 +198,68 @@ class CheckpointManager:
         Returns:
             List of article IDs that haven't completed the stage
         """
-        with self.lock:
-            return [
-                article_id
-                for article_id in candidate_ids
-                if not self.is_stage_complete(article_id, stage)
-            ]
+        articles = self.data["articles"]
+        incomplete = []
+        for article_id in candidate_ids:
+            article = articles.get(article_id)
+            if article is None or article.get(stage) is None:
+                incomplete.append(article_id)
+        return incomplete
 
     def flush(self) -> None:
-        """Atomically write checkpoint to disk."""
+        """Make journaled progress durable, compacting the journal when it is large."""
         with self.lock:
             try:
-                # Write to temp file first
-                temp_path = self.filepath.with_suffix(".tmp")
-                with open(temp_path, "w") as f:
-                    json.dump(self.data, f, indent=2)
-
-                # Atomic rename
-                temp_path.replace(self.filepath)
-                logger.debug("Checkpoint flushed to %s", self.filepath)
+                if self._journal is not None:
+                    os.fsync(self._journal.fileno())
+                # The first flush writes the snapshot so the checkpoint file
+                # exists even if the process never reaches close().
+                if self._journal_entries >= self.compact_every or (
+                    self._journal_entries and not self.filepath.exists()
+                ):
+                    self._compact_locked()
+                logger.debug("Checkpoint flushed to %s", self.journal_path)
             except Exception as e:
                 logger.error("Failed to flush checkpoint: %s", e)
 
+    def compact(self) -> None:
+        """Atomically rewrite the snapshot and truncate the journal."""
+        with self.lock:
+            try:
+                self._compact_locked()
+            except Exception as e:
+                logger.error("Failed to compact checkpoint: %s", e)
+
+    def _compact_locked(self) -> None:
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.filepath.with_suffix(".tmp")
+        with open(temp_path, "w") as f:
+            json.dump(self.data, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        temp_path.replace(self.filepath)
+
+        # The snapshot now covers every journaled entry; replaying them again
+        # would be harmless, so a crash before this point is safe.
+        if self._journal is not None:
+            self._journal.close()
+        self._journal = open(self.journal_path, "w", encoding="utf-8")
+        self._journal_entries = 0
+        logger.debug("Checkpoint compacted to %s", self.filepath)
+
+    def close(self) -> None:
+        """Compact outstanding journal entries and release the journal handle."""
+        with self.lock:
+            try:
+                if self._journal_entries:
+                    self._compact_locked()
+            except Exception as e:
+                logger.error("Failed to compact checkpoint on close: %s", e)
+            finally:
+                if self._journal is not None:
+                    self._journal.close()
+                    self._journal = None
+
     def validate_integrity(
         self,
         validator: Callable[[str, str], bool],
@@ -153,7 +275,7 @@ class CheckpointManager:
             Validation results dict
         """
         with self.lock:
-            articles = list(self.data["articles"].items())
+            articles = [(article_id, dict(stages)) for article_id, stages in self.data["articles"].items()]
 
         if not articles:
             return {"validated": 0, "invalid": [], "valid_rate": 100.0}
@@ -179,12 +301,17 @@ class CheckpointManager:
     def archive(self, timestamp: str) -> Optional[Path]:
         """Create timestamped backup of checkpoint.
 
+        The journal is folded into the snapshot first so the archive is complete.
+
         Args:
             timestamp: Timestamp string for archive filename
 
         Returns:
             Path to archive file or None if failed
         """
+        if self._journal_entries:
+            self.compact()
+
         if not self.filepath.exists():
             return None
 
@@ -220,6 +347,7 @@ class CheckpointManager:
             return {
                 "total_articles": len(articles),
                 "stage_counts": stage_counts,
+                "journal_entries": self._journal_entries,
                 "created_at": self.data.get("created_at"),
                 "last_updated": self.data.get("last_updated"),
             }
@@ -227,10 +355,9 @@ class CheckpointManager:
     def clear(self) -> None:
         """Clear all checkpoint data."""
         with self.lock:
-            self.data = {
-                "version": self.CHECKPOINT_VERSION,
-                "created_at": datetime.now(timezone.utc).isoformat(),
-                "last_updated": datetime.now(timezone.utc).isoformat(),
-                "articles": {},
-            }
+            self.data = self._empty_data()
+            try:
+                self._append({"op": "clear"})
+            except Exception as e:
+                logger.error("Failed to journal checkpoint clear: %s", e)
             logger.info("Checkpoint cleared")
@@ -0,0 +1,356 @@
+"""Streaming, resumable ingestion of OpenAI Batch API output files.
+
+Batch output files can hold tens of thousands of responses. Instead of parsing
+the whole JSONL into memory and writing everything afterwards,
+:class:`StreamingIngestor` reads the file incrementally and hands it to the
+caller in fixed-size windows of records grouped by a key (usually the article
+id). Each window goes through two steps:
+
+- ``write_window(window)`` runs on the calling thread (database inserts);
+- ``finish_window(window, handoff)`` runs on a single background thread
+  (embeddings, completion marks), so it overlaps the next window's writes.
+
+Once both steps of a window have succeeded, its end byte offset is appended to
+``<output>.progress``. Re-running against the same file after a failure skips
+everything up to the last committed offset; the progress file is removed once
+the whole file has been ingested, so a later re-run starts from the top again.
+Windows of a run that found such a log are flagged ``replayed``: the failed run
+may already have written them without finishing, so callers should complete
+rather than skip work they find already started.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_SIZE = 500
+DEFAULT_MAX_PENDING_WINDOWS = 2
+PROGRESS_SUFFIX = ".progress"
+
+
+@dataclass
+class IngestWindow:
+    """A contiguous slice of the output file covering ``len(keys)`` keys."""
+
+    index: int
+    records: List[Tuple[int, Dict[str, Any]]]
+    keys: List[str]
+    new_keys: Set[str]
+    end_offset: int
+    end_line: int
+    replayed: bool = False
+
+    def is_continuation(self, key: str) -> bool:
+        """True when *key* already appeared in an earlier (possibly resumed) window."""
+        return key not in self.new_keys
+
+
+@dataclass
+class IngestStats:
+    """Counters for one :meth:`StreamingIngestor.run`."""
+
+    lines_read: int = 0
+    lines_invalid: int = 0
+    windows_committed: int = 0
+    resumed_from_line: int = 0
+    keys_seen: int = 0
+
+
+class IngestProgress:
+    """Append-only log of committed windows kept next to the output file.
+
+    The first line records the size of the output file; a log written for a
+    different file size is discarded. Each further line is
+    ``{"o": end_offset, "l": end_line, "k": [keys]}``.
+    """
+
+    def __init__(self, output_file: Path, path: Optional[Path] = None):
+        self.output_file = output_file
+        self.path = path or output_file.with_name(f"{output_file.name}{PROGRESS_SUFFIX}")
+        self.offset = 0
+        self.line = 0
+        self.keys: Set[str] = set()
+        self._handle: Optional[IO[str]] = None
+
+    def load(self, file_size: int) -> bool:
+        """Load committed progress for a file of *file_size* bytes.
+
+        Returns True when there was progress to resume from.
+        """
+        if not self.path.exists():
+            return False
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+
+        header: Dict[str, Any] = {}
+        if lines:
+            try:
+                header = json.loads(lines[0])
+            except json.JSONDecodeError:
+                header = {}
+        if header.get("size") != file_size:
+            logger.warning("Ignoring stale ingest progress %s (output file changed)", self.path)
+            self.reset()
+            return False
+
+        for raw in lines[1:]:
+            try:
+                entry = json.loads(raw)
+            except json.JSONDecodeError:
+                # A torn final line from a crash mid-append; earlier windows are intact.
+                continue
+            if entry.get("o", 0) >= self.offset:
+                self.offset = entry["o"]
+                self.line = entry.get("l", self.line)
+            self.keys.update(entry.get("k") or [])
+        return self.offset > 0
+
+    def start(self, file_size: int) -> None:
+        """Open the log for appending, writing the header for a fresh log."""
+        fresh = not self.path.exists()
+        self._handle = open(self.path, "a", encoding="utf-8")
+        if fresh:
+            self._write({"file": self.output_file.name, "size": file_size})
+
+    def commit(self, window: IngestWindow) -> None:
+        self._write({"o": window.end_offset, "l": window.end_line, "k": window.keys})
+        self.offset = window.end_offset
+        self.line = window.end_line
+
+    def reset(self) -> None:
+        self.close()
+        self.offset = 0
+        self.line = 0
+        self.keys = set()
+        self.path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _write(self, entry: Dict[str, Any]) -> None:
+        assert self._handle is not None
+        self._handle.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+
+
+class StreamingIngestor:
+    """Feeds a batch output JSONL to callbacks window by window.
+
+    Example:
+        ingestor = StreamingIngestor(output_file, key_fn=lambda r: r["custom_id"])
+        stats = ingestor.run(write_window, finish_window)
+    """
+
+    def __init__(
+        self,
+        output_file: Path,
+        *,
+        key_fn: Callable[[Dict[str, Any]], Optional[str]],
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        max_pending_windows: int = DEFAULT_MAX_PENDING_WINDOWS,
+        resume: bool = True,
+        record_progress: bool = True,
+        on_invalid_line: Optional[Callable[[int, Exception], None]] = None,
+    ):
+        """Initialize the ingestor.
+
+        Args:
+            output_file: Batch output JSONL file
+            key_fn: Returns the grouping key of a record, or None for records
+                that belong to no key (they ride along with the current window)
+            window_size: Distinct keys per window
+            max_pending_windows: Windows allowed to wait on ``finish_window``
+                before writes pause, bounding memory held by in-flight windows
+            resume: Continue from ``<output>.progress`` when it exists
+            record_progress: Write the progress log (disable for dry runs)
+            on_invalid_line: Called with (line_number, error) for lines that are
+                not valid JSON
+        """
+        self.output_file = Path(output_file)
+        self.key_fn = key_fn
+        self.window_size = max(1, window_size)
+        self.max_pending_windows = max(1, max_pending_windows)
+        self.resume = resume
+        self.record_progress = record_progress
+        self.on_invalid_line = on_invalid_line
+        self.progress = IngestProgress(self.output_file)
+        self._replaying = False
+
+    def run(
+        self,
+        write_window: Callable[[IngestWindow], Any],
+        finish_window: Optional[Callable[[IngestWindow, Any], None]] = None,
+    ) -> IngestStats:
+        """Ingest the file, returning counters for this run.
+
+        An exception from either callback stops ingestion after the windows
+        already handed to ``finish_window`` have settled; only windows whose
+        both steps succeeded are recorded as committed.
+        """
+        if not self.output_file.exists():
+            raise FileNotFoundError(f"Output file not found: {self.output_file}")
+
+        stats = IngestStats()
+        file_size = self.output_file.stat().st_size
+        self._replaying = False
+
+        if self.record_progress:
+            if not self.resume:
+                self.progress.reset()
+            elif self.progress.load(file_size):
+                stats.resumed_from_line = self.progress.line
+                logger.info(
+                    "Resuming %s from line %d (%d keys already ingested)",
+                    self.output_file,
+                    self.progress.line,
+                    len(self.progress.keys),
+                )
+            # Any log still present belongs to a run that stopped part-way,
+            # possibly after writing windows it never committed.
+            self._replaying = self.progress.path.exists()
+            self.progress.start(file_size)
+
+        executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="ingest-finish")
+            if finish_window
+            else None
+        )
+        in_flight: Deque[Tuple[IngestWindow, Future]] = deque()
+
+        try:
+            for window in self._windows(stats):
+                handoff = write_window(window)
+                if executor is None:
+                    self._commit(window, stats)
+                    continue
+                in_flight.append((window, executor.submit(finish_window, window, handoff)))
+                while len(in_flight) > self.max_pending_windows:
+                    self._settle(in_flight, stats)
+            while in_flight:
+                self._settle(in_flight, stats)
+        except BaseException:
+            # Record whatever finished cleanly before the failure so a re-run
+            # does not redo it; stop at the first window that did not (a
+            # failed window stays at the head of ``in_flight``).
+            while in_flight:
+                window, future = in_flight[0]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error("Window %d did not finish: %s", window.index, e)
+                    break
+                in_flight.popleft()
+                self._commit(window, stats)
+            raise
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+            self.progress.close()
+
+        if self.record_progress:
+            self.progress.reset()
+        logger.info(
+            "Ingested %s: %d lines in %d windows (%d invalid)",
+            self.output_file,
+            stats.lines_read,
+            stats.windows_committed,
+            stats.lines_invalid,
+        )
+        return stats
+
+    def _settle(self, in_flight: Deque[Tuple[IngestWindow, Future]], stats: IngestStats) -> None:
+        window, future = in_flight[0]
+        future.result()
+        in_flight.popleft()
+        self._commit(window, stats)
+
+    def _commit(self, window: IngestWindow, stats: IngestStats) -> None:
+        if self.record_progress:
+            self.progress.commit(window)
+        stats.windows_committed += 1
+
+    def _windows(self, stats: IngestStats) -> Iterator[IngestWindow]:
+        seen: Set[str] = set(self.progress.keys)
+        offset = self.progress.offset
+        line_number = self.progress.line
+        index = 0
+
+        records: List[Tuple[int, Dict[str, Any]]] = []
+        keys: Dict[str, None] = {}
+        dirty = False
+
+        def cut() -> IngestWindow:
+            nonlocal index
+            window = IngestWindow(
+                index=index,
+                records=list(records),
+                keys=list(keys),
+                new_keys={key for key in keys if key not in seen},
+                end_offset=offset,
+                end_line=line_number,
+                replayed=self._replaying,
+            )
+            seen.update(keys)
+            index += 1
+            return window
+
+        with open(self.output_file, "rb") as handle:
+            handle.seek(offset)
+            for raw in handle:
+                line_end = offset + len(raw)
+                text = raw.strip()
+                if not text:
+                    offset, line_number = line_end, line_number + 1
+                    dirty = True
+                    continue
+
+                try:
+                    record = json.loads(text)
+                except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                    stats.lines_invalid += 1
+                    if self.on_invalid_line:
+                        self.on_invalid_line(line_number + 1, e)
+                    else:
+                        logger.error("Invalid JSON on line %d: %s", line_number + 1, e)
+                    offset, line_number = line_end, line_number + 1
+                    dirty = True
+                    continue
+
+                key = self.key_fn(record) if isinstance(record, dict) else None
+                # Close the window at a key boundary so one key's records stay together.
+                if key is not None and key not in keys and len(keys) >= self.window_size:
+                    yield cut()
+                    records, keys, dirty = [], {}, False
+
+                offset, line_number = line_end, line_number + 1
+                stats.lines_read += 1
+                records.append((line_number, record))
+                if key is not None:
+                    keys[key] = None
+                dirty = True
+
+        if dirty:
+            yield cut()
+        stats.keys_seen = len(seen)
+
+
+__all__ = [
+    "DEFAULT_WINDOW_SIZE",
+    "IngestProgress",
+    "IngestStats",
+    "IngestWindow",
+    "StreamingIngestor",
+]
@@ -1,4 +1,9 @@
-"""Factory for selecting extraction strategies."""
+"""Factory for selecting extraction strategies.
+
+Routing combines the static host sets below with profiles learned from past
+extractions (see ``host_profiles.py``): once a host has enough recent evidence,
+the learned choice wins over the static sets.
+"""
 
 from __future__ import annotations
 
@@ -7,7 +12,10 @@ from typing import Protocol
 from urllib.parse import urlparse
 
 from src.shared.contracts.extracted_content import ExtractedContent
+from src.shared.utils import amp_detector
 from src.shared.utils.amp_detector import is_amp_url
+from .host_profiles import get_host_routing
+from .html_archive import get_html_archive
 from .light_extractor import LightExtractor
 from .playwright_extractor import PlaywrightExtractor
 
@@ -45,12 +53,46 @@ _LIGHT_HOSTS = LIGHT_HOSTS
 def is_heavy_url(url: str) -> bool:
     """Return True if ``url`` targets a host that requires Playwright."""
     try:
+        learned = get_host_routing().prefers_playwright(url)
+        if learned is not None:
+            return learned
         hostname = urlparse(url).hostname or ""
         return hostname in HEAVY_HOSTS
     except Exception:
         return False
 
 
+def probe_amp(
+    url: str,
+    *,
+    timeout: float = 8.0,
+    logger: logging.Logger | None = None,
+) -> tuple[str, bool]:
+    """``amp_detector.probe_for_amp`` that skips hosts known to have no AMP.
+
+    Probe outcomes feed the host profile, so a host that starts publishing
+    AMP is probed again once the old "no AMP" evidence has decayed. With an
+    HTML archive in replay mode no request is made; the URL the recorded run
+    chose is returned instead.
+    """
+    if is_amp_url(url):
+        return url, True
+    archive = get_html_archive()
+    if archive is not None and archive.replay:
+        target = archive.resolve(url)
+        return target, target != url
+    routing = get_host_routing()
+    if not routing.should_probe_amp(url):
+        if logger:
+            logger.debug("Skipping AMP probe for %s (host has no AMP recently)", url)
+        return url, False
+    amp_url, is_amp = amp_detector.probe_for_amp(url, timeout=timeout, logger=logger)
+    routing.record_amp_probe(url, found=is_amp and amp_url != url)
+    if archive is not None and is_amp:
+        archive.record_alias(url, amp_url)
+    return amp_url, is_amp
+
+
 def get_extractor(
     url: str,
     *,
@@ -65,6 +107,9 @@ def get_extractor(
         return PlaywrightExtractor(logger=logger)
     if prefer_lightweight:
         return LightExtractor(logger=logger)
+    learned = get_host_routing().prefers_playwright(url)
+    if learned is not None:
+        return PlaywrightExtractor(logger=logger) if learned else LightExtractor(logger=logger)
     if hostname in _HEAVY_HOSTS:
         return PlaywrightExtractor(logger=logger)
     if hostname in _LIGHT_HOSTS:
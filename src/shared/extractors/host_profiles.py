@@ -0,0 +1,254 @@
+"""Learned per-host routing for the extractor factory.
+
+Every extraction outcome updates a small profile for the URL's host: how often
+the light (HTTP-only) extractor succeeded and how many paragraphs it yielded,
+average light and Playwright latency, and how often an AMP probe found an AMP
+variant. ``get_extractor`` uses the profile to send each URL to the cheapest
+extractor likely to succeed, and AMP probes are skipped for hosts that keep
+answering "no AMP".
+
+Counts decay exponentially with ``half_life_hours``, so old evidence fades:
+a host routed to Playwright eventually drops below the evidence threshold and
+gets a fresh light attempt, which is how the profile notices a site change.
+
+Profiles persist to a SQLite file when ``EXTRACTOR_HOST_PROFILE_PATH`` is set
+and otherwise live for the process.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HALF_LIFE_HOURS = 72.0
+# Decayed observations needed before a learned decision overrides the defaults.
+MIN_EVIDENCE = 3.0
+# Below this light success rate, light is not worth trying first.
+MIN_LIGHT_SUCCESS_RATE = 0.25
+# AMP probes stop once this few of the recent probes found a variant.
+MIN_AMP_HIT_RATE = 0.1
+# Playwright latency assumed for hosts that have never been rendered.
+DEFAULT_PLAYWRIGHT_SECONDS = 8.0
+_EWMA_ALPHA = 0.2
+
+
+def _host(url: str) -> str:
+    return (urlparse(url).hostname or "").lower()
+
+
+def _ewma(previous: Optional[float], value: float) -> float:
+    return value if previous is None else previous + _EWMA_ALPHA * (value - previous)
+
+
+@dataclass
+class HostProfile:
+    """Decayed extraction statistics for one host."""
+
+    light_attempts: float = 0.0
+    light_successes: float = 0.0
+    light_paragraphs: Optional[float] = None
+    light_seconds: Optional[float] = None
+    playwright_attempts: float = 0.0
+    playwright_successes: float = 0.0
+    playwright_seconds: Optional[float] = None
+    amp_probes: float = 0.0
+    amp_found: float = 0.0
+    updated_at: float = 0.0
+
+    def decayed(self, now: float, half_life_seconds: float) -> "HostProfile":
+        """Return a copy with counts decayed to *now* (averages are kept)."""
+        factor = 0.5 ** (max(0.0, now - self.updated_at) / half_life_seconds) if self.updated_at else 1.0
+        copy = HostProfile(**asdict(self))
+        for name in (
+            "light_attempts",
+            "light_successes",
+            "playwright_attempts",
+            "playwright_successes",
+            "amp_probes",
+            "amp_found",
+        ):
+            setattr(copy, name, getattr(self, name) * factor)
+        copy.updated_at = now
+        return copy
+
+    @property
+    def light_success_rate(self) -> Optional[float]:
+        if self.light_attempts < MIN_EVIDENCE:
+            return None
+        return self.light_successes / self.light_attempts
+
+
+class HostRoutingTable:
+    """Thread-safe table of :class:`HostProfile` with optional SQLite persistence."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        *,
+        half_life_hours: float = DEFAULT_HALF_LIFE_HOURS,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.half_life_seconds = max(1.0, half_life_hours * 3600)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._profiles: Dict[str, HostProfile] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        if path:
+            self._open(path)
+
+    # ------------------------------------------------------------------
+    # Decisions
+    # ------------------------------------------------------------------
+
+    def prefers_playwright(self, url: str) -> Optional[bool]:
+        """Learned routing for *url*'s host, or None without enough evidence.
+
+        Light is chosen while its expected cost (its own latency plus the
+        Playwright retry it causes on failure) stays below going straight to
+        Playwright.
+        """
+        profile = self.get(url)
+        if profile is None:
+            return None
+        rate = profile.light_success_rate
+        if rate is None:
+            return None
+        if rate < MIN_LIGHT_SUCCESS_RATE:
+            return True
+        playwright_seconds = profile.playwright_seconds or DEFAULT_PLAYWRIGHT_SECONDS
+        expected_light = (profile.light_seconds or 0.0) + (1.0 - rate) * playwright_seconds
+        return expected_light > playwright_seconds
+
+    def should_probe_amp(self, url: str) -> bool:
+        """False once recent probes of this host have almost never found AMP."""
+        profile = self.get(url)
+        if profile is None or profile.amp_probes < MIN_EVIDENCE:
+            return True
+        return profile.amp_found / profile.amp_probes >= MIN_AMP_HIT_RATE
+
+    # ------------------------------------------------------------------
+    # Observations
+    # ------------------------------------------------------------------
+
+    def record_light(self, url: str, *, success: bool, paragraphs: int, seconds: float) -> None:
+        def apply(profile: HostProfile) -> None:
+            profile.light_attempts += 1
+            profile.light_successes += 1 if success else 0
+            profile.light_paragraphs = _ewma(profile.light_paragraphs, float(paragraphs))
+            profile.light_seconds = _ewma(profile.light_seconds, seconds)
+
+        self._update(url, apply)
+
+    def record_playwright(self, url: str, *, success: bool, seconds: float) -> None:
+        def apply(profile: HostProfile) -> None:
+            profile.playwright_attempts += 1
+            profile.playwright_successes += 1 if success else 0
+            profile.playwright_seconds = _ewma(profile.playwright_seconds, seconds)
+
+        self._update(url, apply)
+
+    def record_amp_probe(self, url: str, *, found: bool) -> None:
+        def apply(profile: HostProfile) -> None:
+            profile.amp_probes += 1
+            profile.amp_found += 1 if found else 0
+
+        self._update(url, apply)
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+
+    def get(self, url: str) -> Optional[HostProfile]:
+        """Decayed profile for *url*'s host (or a bare host name)."""
+        host = _host(url) if "://" in url else url.lower()
+        with self._lock:
+            profile = self._profiles.get(host)
+            if profile is None:
+                return None
+            return profile.decayed(self._clock(), self.half_life_seconds)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            now = self._clock()
+            return {
+                host: asdict(profile.decayed(now, self.half_life_seconds))
+                for host, profile in sorted(self._profiles.items())
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._profiles.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM host_profiles")
+                self._conn.commit()
+
+    def _update(self, url: str, apply: Callable[[HostProfile], None]) -> None:
+        host = _host(url)
+        if not host:
+            return
+        with self._lock:
+            current = self._profiles.get(host) or HostProfile()
+            profile = current.decayed(self._clock(), self.half_life_seconds)
+            apply(profile)
+            self._profiles[host] = profile
+            if self._conn is not None:
+                try:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO host_profiles (host, profile) VALUES (?, ?)",
+                        (host, json.dumps(asdict(profile))),
+                    )
+                    self._conn.commit()
+                except sqlite3.Error as exc:
+                    logger.warning("Failed to persist host profile for %s: %s", host, exc)
+
+    def _open(self, path: str) -> None:
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS host_profiles (host TEXT PRIMARY KEY, profile TEXT NOT NULL)")
+            conn.commit()
+            for host, raw in conn.execute("SELECT host, profile FROM host_profiles"):
+                try:
+                    self._profiles[host] = HostProfile(**json.loads(raw))
+                except (TypeError, ValueError):
+                    continue
+        except sqlite3.Error as exc:
+            logger.warning("Could not open host profile store at %s: %s", path, exc)
+            return
+        self._conn = conn
+
+
+_table: Optional[HostRoutingTable] = None
+_table_lock = threading.Lock()
+
+
+def get_host_routing() -> HostRoutingTable:
+    """Return the process-wide routing table, configured from env on first use.
+
+    ``EXTRACTOR_HOST_PROFILE_PATH`` persists profiles to SQLite and
+    ``EXTRACTOR_HOST_PROFILE_HALF_LIFE_HOURS`` sets the decay.
+    """
+    global _table
+    with _table_lock:
+        if _table is None:
+            _table = HostRoutingTable(
+                (os.getenv("EXTRACTOR_HOST_PROFILE_PATH") or "").strip() or None,
+                half_life_hours=float(
+                    os.getenv("EXTRACTOR_HOST_PROFILE_HALF_LIFE_HOURS", DEFAULT_HALF_LIFE_HOURS)
+                ),
+            )
+        return _table
+
+
+__all__ = ["HostProfile", "HostRoutingTable", "get_host_routing"]
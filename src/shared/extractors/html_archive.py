@@ -0,0 +1,257 @@
+"""Compressed local archive of fetched article HTML, with offline replay.
+
+``LightExtractor`` and ``PlaywrightExtractor`` write the HTML they parsed into
+the archive when ``HTML_ARCHIVE_DIR`` is set. Bodies are content-addressed
+(sha256 of the HTML) and zstd-compressed, so refetching an unchanged page
+costs no extra space. A SQLite index records every fetch as (url, fetched_at,
+final_url, extractor, content_hash).
+
+With ``HTML_ARCHIVE_MODE=replay`` the extractors read the latest archived HTML
+for a URL instead of going to the network. It is then re-run through parsing,
+``clean_content`` and ``deduplicate_paragraphs``, so changes to cleaning rules
+or prompts can be re-applied to thousands of articles offline. URLs missing
+from the archive come back as errors rather than being fetched.
+
+``zstandard`` is optional; without it bodies are gzip-compressed instead and
+both formats stay readable.
+
+Environment:
+    HTML_ARCHIVE_DIR    archive root; archiving is off when unset
+    HTML_ARCHIVE_MODE   "record" (default) or "replay"
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+try:  # pragma: no cover - optional dependency
+    import zstandard
+except ImportError:  # pragma: no cover - fall back to stdlib gzip
+    zstandard = None
+
+from src.shared.contracts.extracted_content import ExtractedContent, ExtractionMetadata
+from src.shared.processors.content_cleaner import clean_content
+from src.shared.processors.metadata_extractor import enrich_metadata
+from src.shared.processors.text_deduplicator import deduplicate_paragraphs
+
+logger = logging.getLogger(__name__)
+
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+_ZSTD_LEVEL = 10
+
+
+@dataclass
+class ArchivedPage:
+    """One archived fetch of a URL."""
+
+    url: str
+    final_url: str
+    fetched_at: datetime
+    extractor: str
+    content_hash: str
+    html: str
+
+
+class HtmlArchive:
+    """Content-addressed HTML store with a per-fetch SQLite index."""
+
+    def __init__(self, root: str, *, mode: str = MODE_RECORD):
+        self.root = Path(root)
+        self.mode = mode
+        self.blob_dir = self.root / "blobs"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.root / "index.db"), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS fetches ("
+            "url TEXT NOT NULL, fetched_at TEXT NOT NULL, final_url TEXT NOT NULL, "
+            "extractor TEXT NOT NULL, content_hash TEXT NOT NULL, PRIMARY KEY (url, fetched_at))"
+        )
+        # URL redirections decided before the fetch (e.g. AMP probes), so
+        # replay asks for the same URL the recorded run fetched.
+        self._conn.execute("CREATE TABLE IF NOT EXISTS aliases (url TEXT PRIMARY KEY, target TEXT NOT NULL)")
+        self._conn.commit()
+
+    @property
+    def replay(self) -> bool:
+        return self.mode == MODE_REPLAY
+
+    def put(self, url: str, html: str, *, final_url: Optional[str] = None, extractor: str) -> str:
+        """Archive *html* fetched from *url*; returns its content hash."""
+        data = html.encode("utf-8")
+        content_hash = hashlib.sha256(data).hexdigest()
+        if self._blob_path(content_hash) is None:
+            self._write_blob(content_hash, data)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO fetches (url, fetched_at, final_url, extractor, content_hash) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (url, datetime.now(timezone.utc).isoformat(), final_url or url, extractor, content_hash),
+            )
+            self._conn.commit()
+        return content_hash
+
+    def record(self, url: str, html: str, *, final_url: Optional[str] = None, extractor: str) -> None:
+        """Like :meth:`put`, but a no-op in replay mode and never raises."""
+        if self.replay or not html:
+            return
+        try:
+            self.put(url, html, final_url=final_url, extractor=extractor)
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("Failed to archive HTML for %s: %s", url, exc)
+
+    def record_alias(self, url: str, target: str) -> None:
+        """Remember that *url* was fetched as *target*; no-op in replay mode."""
+        if self.replay or target == url:
+            return
+        try:
+            with self._lock:
+                self._conn.execute("INSERT OR REPLACE INTO aliases (url, target) VALUES (?, ?)", (url, target))
+                self._conn.commit()
+        except sqlite3.Error as exc:
+            logger.warning("Failed to archive alias for %s: %s", url, exc)
+
+    def resolve(self, url: str) -> str:
+        """The URL recorded runs fetched in place of *url* (usually *url* itself)."""
+        with self._lock:
+            row = self._conn.execute("SELECT target FROM aliases WHERE url = ?", (url,)).fetchone()
+        return row[0] if row else url
+
+    def latest(self, url: str) -> Optional[ArchivedPage]:
+        """Most recent archived fetch of *url*, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at, final_url, extractor, content_hash FROM fetches "
+                "WHERE url = ? ORDER BY fetched_at DESC LIMIT 1",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        html = self.read_html(row[3])
+        if html is None:
+            return None
+        return ArchivedPage(
+            url=url,
+            final_url=row[1],
+            fetched_at=datetime.fromisoformat(row[0]),
+            extractor=row[2],
+            content_hash=row[3],
+            html=html,
+        )
+
+    def read_html(self, content_hash: str) -> Optional[str]:
+        path = self._blob_path(content_hash)
+        if path is None:
+            return None
+        raw = path.read_bytes()
+        if path.suffix == ".zst":
+            if zstandard is None:
+                logger.warning("Archived page %s is zstd-compressed but zstandard is not installed", content_hash)
+                return None
+            data = zstandard.ZstdDecompressor().decompress(raw)
+        else:
+            data = gzip.decompress(raw)
+        return data.decode("utf-8")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _blob_base(self, content_hash: str) -> Path:
+        return self.blob_dir / content_hash[:2] / content_hash
+
+    def _blob_path(self, content_hash: str) -> Optional[Path]:
+        base = self._blob_base(content_hash)
+        for suffix in (".html.zst", ".html.gz"):
+            candidate = base.with_name(base.name + suffix)
+            if candidate.exists():
+                return candidate
+        return None
+
+    def _write_blob(self, content_hash: str, data: bytes) -> None:
+        base = self._blob_base(content_hash)
+        base.parent.mkdir(parents=True, exist_ok=True)
+        if zstandard is not None:
+            payload = zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(data)
+            target = base.with_name(base.name + ".html.zst")
+        else:
+            payload = gzip.compress(data)
+            target = base.with_name(base.name + ".html.gz")
+        # Write then rename so a concurrent reader never sees a partial blob.
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(payload)
+        os.replace(tmp, target)
+
+
+def replay_extract(archive: HtmlArchive, url: str, *, max_paragraphs: int = 120) -> ExtractedContent:
+    """Re-extract *url* from its latest archived HTML without network access."""
+    page = archive.latest(url)
+    if page is None:
+        return ExtractedContent(url=url, error="Not in HTML archive")
+
+    if page.extractor == "light":
+        from .light_extractor import _process_html  # Local import to avoid circular dependency
+
+        content, _ = _process_html(page.html, page.final_url, url, max_paragraphs, True)
+    else:
+        from .playwright_extractor import PlaywrightExtractor  # Local import to avoid circular dependency
+
+        content = PlaywrightExtractor()._parse_html(page.html, page.final_url)  # noqa: SLF001 - intentional reuse
+        content.metadata = ExtractionMetadata(
+            fetched_at=page.fetched_at,
+            extractor=page.extractor,
+            duration_seconds=0.0,
+            raw_url=url,
+        )
+        content = enrich_metadata(content, html=page.html, extractor_name=page.extractor)
+        content = deduplicate_paragraphs(content)
+        content = clean_content(content)
+        content.trim(max_paragraphs=max_paragraphs)
+
+    if content.metadata is not None:
+        content.metadata.fetched_at = page.fetched_at
+        content.metadata.extractor = f"replay:{page.extractor}"
+    if not content.is_valid(min_paragraphs=1):
+        content.error = content.error or "Insufficient content in archived HTML"
+    return content
+
+
+_archive: Optional[HtmlArchive] = None
+_archive_loaded = False
+_archive_lock = threading.Lock()
+
+
+def get_html_archive() -> Optional[HtmlArchive]:
+    """Return the process-wide archive configured from env, or None when off."""
+    global _archive, _archive_loaded
+    with _archive_lock:
+        if not _archive_loaded:
+            _archive_loaded = True
+            root = (os.getenv("HTML_ARCHIVE_DIR") or "").strip()
+            if root:
+                mode = (os.getenv("HTML_ARCHIVE_MODE") or MODE_RECORD).strip().lower()
+                try:
+                    _archive = HtmlArchive(root, mode=MODE_REPLAY if mode == MODE_REPLAY else MODE_RECORD)
+                    logger.info("HTML archive enabled at %s (%s mode)", root, _archive.mode)
+                except (OSError, sqlite3.Error) as exc:
+                    logger.warning("Could not open HTML archive at %s: %s", root, exc)
+        return _archive
+
+
+__all__ = [
+    "ArchivedPage",
+    "HtmlArchive",
+    "get_html_archive",
+    "replay_extract",
+]
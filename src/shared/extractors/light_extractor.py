@@ -4,15 +4,26 @@ Uses a module-level ``httpx.Client`` so connection pooling, DNS caching,
 and TLS session resumption amortize across all ``LightExtractor`` calls in
 the same process. ``httpx.Client`` is thread-safe, so a single shared
 instance works fine for the ThreadPoolExecutor callers.
+
+:meth:`LightExtractor.extract_many` is the batch path: it fetches on an
+``httpx.AsyncClient`` (HTTP/2, bounded connections and per-host politeness)
+from one event loop and parses the HTML in a process pool, so hundreds of URLs
+need neither a thread per URL nor a GIL-bound parse queue.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
 import threading
 import time
+from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
 
 import httpx
 from bs4 import BeautifulSoup
@@ -23,6 +34,9 @@ from src.shared.processors.metadata_extractor import enrich_metadata
 from src.shared.processors.text_deduplicator import deduplicate_paragraphs
 from src.shared.utils import amp_detector
 
+from .host_profiles import get_host_routing
+from .html_archive import get_html_archive, replay_extract
+
 
 _DEFAULT_HEADERS = {
     "User-Agent": (
@@ -38,6 +52,12 @@ _DEFAULT_HEADERS = {
 _shared_client: Optional[httpx.Client] = None
 _shared_client_lock = threading.Lock()
 
+DEFAULT_MAX_CONCURRENCY = 32
+DEFAULT_MAX_PER_HOST = 4
+DEFAULT_HOST_DELAY_SECONDS = 0.2
+# Below this many URLs a process pool costs more to start than it saves.
+_MIN_URLS_FOR_PROCESS_POOL = 8
+
 
 def _get_shared_client() -> httpx.Client:
     global _shared_client
@@ -73,13 +93,149 @@ def close_shared_client() -> None:
             _shared_client = None
 
 
+def _process_html(
+    html: str,
+    target_url: str,
+    raw_url: str,
+    max_paragraphs: int,
+    reparse: bool,
+) -> Tuple[ExtractedContent, bool]:
+    """Parse and clean fetched HTML, returning ``(content, is_valid)``.
+
+    Module-level so batch extraction can run it in a worker process. When the
+    first pass finds nothing and *reparse* is set, the richer selector set
+    from ``PlaywrightExtractor._parse_html`` is tried on the same HTML.
+    """
+    soup = BeautifulSoup(html, "lxml")
+    article = soup.find("article") or soup.find("main") or soup.body
+    paragraphs = [
+        element.get_text(" ", strip=True)
+        for element in article.find_all("p")  # type: ignore[union-attr]
+    ] if article else []
+    quotes = [element.get_text(" ", strip=True) for element in soup.find_all("blockquote")]
+    title = soup.title.string.strip() if soup.title and soup.title.string else None
+
+    content = ExtractedContent(
+        url=target_url,
+        title=title,
+        paragraphs=paragraphs,
+        quotes=quotes,
+        metadata=ExtractionMetadata(
+            fetched_at=datetime.now(timezone.utc),
+            extractor="light",
+            duration_seconds=0.0,
+            raw_url=raw_url,
+        ),
+    )
+
+    content = enrich_metadata(content, html=html, extractor_name="light")
+    content = deduplicate_paragraphs(content)
+    content = clean_content(content)
+    content.trim(max_paragraphs=max_paragraphs)
+
+    if content.is_valid(min_paragraphs=1) or not reparse:
+        return content, content.is_valid(min_paragraphs=1)
+
+    # Before paying the Playwright cost, try the richer selector set from
+    # PlaywrightExtractor._parse_html against the HTML we already have.
+    # Many sites have article content in markup we simply didn't target in
+    # the first pass; re-parsing is nearly free.
+    from .playwright_extractor import PlaywrightExtractor  # Local import to avoid circular dependency
+
+    reparsed = PlaywrightExtractor()._parse_html(html, target_url)  # noqa: SLF001 - intentional reuse
+    if reparsed.paragraphs:
+        reparsed.metadata = content.metadata
+        reparsed = enrich_metadata(reparsed, html=html, extractor_name="light")
+        reparsed = deduplicate_paragraphs(reparsed)
+        reparsed = clean_content(reparsed)
+        reparsed.trim(max_paragraphs=max_paragraphs)
+        if reparsed.is_valid(min_paragraphs=1):
+            return reparsed, True
+
+    return content, False
+
+
+@dataclass
+class LightBatchStats:
+    """Counters for one :meth:`LightExtractor.extract_many` call."""
+
+    urls: int = 0
+    fetched: int = 0
+    fetch_errors: int = 0
+    playwright_fallbacks: int = 0
+    wall_seconds: float = 0.0
+    fetch_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    parse_pool: str = "inline"
+    requests_by_host: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "urls": self.urls,
+            "fetched": self.fetched,
+            "fetch_errors": self.fetch_errors,
+            "playwright_fallbacks": self.playwright_fallbacks,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "fetch_seconds": round(self.fetch_seconds, 3),
+            "parse_seconds": round(self.parse_seconds, 3),
+            "parse_pool": self.parse_pool,
+            "requests_by_host": dict(self.requests_by_host),
+        }
+
+
+class _HostGate:
+    """Caps concurrent requests to one host and spaces their starts."""
+
+    def __init__(self, max_concurrent: int, delay_seconds: float):
+        self.slots = asyncio.Semaphore(max_concurrent)
+        self.delay_seconds = delay_seconds
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def __aenter__(self) -> "_HostGate":
+        await self.slots.acquire()
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            wait = self._next_start - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_start = loop.time() + self.delay_seconds
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.slots.release()
+
+
 class LightExtractor:
     """Performs fast HTTP extraction for simple pages."""
 
     _DEFAULT_HEADERS = _DEFAULT_HEADERS  # Kept for back-compat imports.
 
-    def __init__(self, *, logger: Optional[logging.Logger] = None) -> None:
+    def __init__(
+        self,
+        *,
+        logger: Optional[logging.Logger] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+        host_delay_seconds: float = DEFAULT_HOST_DELAY_SECONDS,
+        parse_workers: Optional[int] = None,
+    ) -> None:
+        """Create an extractor.
+
+        Args:
+            logger: Logger to use instead of the module logger
+            max_concurrency: Requests in flight across all hosts in :meth:`extract_many`
+            max_per_host: Requests in flight against one host (HTTP/2 multiplexes
+                them over a single connection where the server supports it)
+            host_delay_seconds: Minimum spacing between request starts to one host
+            parse_workers: Processes for HTML parsing in batches (default: CPU count)
+        """
         self._logger = logger or logging.getLogger(__name__)
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_per_host = max(1, max_per_host)
+        self.host_delay_seconds = max(0.0, host_delay_seconds)
+        self.parse_workers = max(1, parse_workers or os.cpu_count() or 1)
+        self.last_batch_stats: Optional[LightBatchStats] = None
 
     def extract(
         self,
@@ -110,42 +266,37 @@ class LightExtractor:
         return str(options.url), html
 
     def _extract(self, options: ExtractionOptions) -> ExtractedContent:
+        archive = get_html_archive()
+        if archive is not None and archive.replay:
+            return replay_extract(archive, str(options.url), max_paragraphs=options.max_paragraphs)
+
         start = time.perf_counter()
         self._logger.debug("Starting lightweight extraction for %s", options.url)
         try:
             target_url, html = self._fetch(options)
         except httpx.HTTPError as exc:
             self._logger.warning("HTTP extraction failed for %s: %s", options.url, exc)
+            get_host_routing().record_light(
+                str(options.url), success=False, paragraphs=0, seconds=time.perf_counter() - start
+            )
             return ExtractedContent(url=str(options.url), error=str(exc))
+        if archive is not None:
+            archive.record(str(options.url), html, final_url=target_url, extractor="light")
 
-        soup = BeautifulSoup(html, "lxml")
-        article = soup.find("article") or soup.find("main") or soup.body
-        paragraphs = [
-            element.get_text(" ", strip=True)
-            for element in article.find_all("p")  # type: ignore[union-attr]
-        ] if article else []
-        quotes = [element.get_text(" ", strip=True) for element in soup.find_all("blockquote")]
-        title = soup.title.string.strip() if soup.title and soup.title.string else None
-
-        content = ExtractedContent(
-            url=target_url,
-            title=title,
-            paragraphs=paragraphs,
-            quotes=quotes,
-            metadata=ExtractionMetadata(
-                fetched_at=datetime.now(timezone.utc),
-                extractor="light",
-                duration_seconds=time.perf_counter() - start,
-                raw_url=str(options.url),
-            ),
+        content, valid = _process_html(
+            html,
+            target_url,
+            str(options.url),
+            options.max_paragraphs,
+            not options.force_playwright,
         )
-
-        content = enrich_metadata(content, html=html, extractor_name="light")
-        content = deduplicate_paragraphs(content)
-        content = clean_content(content)
-        content.trim(max_paragraphs=options.max_paragraphs)
-
-        if content.is_valid(min_paragraphs=1):
+        elapsed = time.perf_counter() - start
+        if content.metadata is not None:
+            content.metadata.duration_seconds = elapsed
+        get_host_routing().record_light(
+            str(options.url), success=valid, paragraphs=len(content.paragraphs), seconds=elapsed
+        )
+        if valid:
             return content
 
         self._logger.debug("Light extractor found insufficient content for %s", options.url)
@@ -153,24 +304,196 @@ class LightExtractor:
             content.error = content.error or "Insufficient content extracted by light strategy"
             return content
 
-        # Before paying the Playwright cost, try the richer selector set from
-        # PlaywrightExtractor._parse_html against the HTML we already have.
-        # Many sites have article content in markup we simply didn't target in
-        # the first pass; re-parsing is nearly free.
         from .playwright_extractor import PlaywrightExtractor  # Local import to avoid circular dependency
 
-        pw = PlaywrightExtractor(logger=self._logger)
-        reparsed = pw._parse_html(html, target_url)  # noqa: SLF001 - intentional reuse
-        if reparsed.paragraphs:
-            reparsed.metadata = content.metadata
-            reparsed = enrich_metadata(reparsed, html=html, extractor_name="light")
-            reparsed = deduplicate_paragraphs(reparsed)
-            reparsed = clean_content(reparsed)
-            reparsed.trim(max_paragraphs=options.max_paragraphs)
-            if reparsed.is_valid(min_paragraphs=1):
-                return reparsed
-
-        return pw.extract(
+        return PlaywrightExtractor(logger=self._logger).extract(
             url=str(options.url),
             options=options.model_dump(),
         )
+
+    # ------------------------------------------------------------------
+    # Batch API — one event loop, async fetches, pooled parsing
+    # ------------------------------------------------------------------
+
+    def extract_many(
+        self,
+        urls: Sequence[str],
+        *,
+        timeout: Optional[float] = None,
+        options: dict | ExtractionOptions | None = None,
+    ) -> List[ExtractedContent]:
+        """Extract many URLs concurrently; results follow the order of ``urls``.
+
+        Pages the light strategy can't handle are sent to Playwright together
+        through :meth:`PlaywrightExtractor.extract_many` (one shared browser),
+        unless ``force_playwright`` is set in *options*. Failures are returned
+        as ``ExtractedContent(error=...)`` rather than raised. Counters for the
+        batch are left in :attr:`last_batch_stats`.
+        """
+        entries: List[Tuple[str, Optional[ExtractionOptions], Optional[str]]] = []
+        for url in (str(u) for u in urls):
+            merged: dict[str, object] = {"url": url}
+            if timeout:
+                merged["timeout_seconds"] = int(timeout)
+            if options:
+                merged.update(options if isinstance(options, dict) else options.model_dump())
+            try:
+                entries.append((url, parse_options(merged), None))
+            except Exception as exc:
+                entries.append((url, None, f"Invalid extraction options: {exc}"))
+        if not entries:
+            return []
+
+        archive = get_html_archive()
+        if archive is not None and archive.replay:
+            return [
+                replay_extract(archive, url, max_paragraphs=opts.max_paragraphs)
+                if opts is not None
+                else ExtractedContent(url=url, error=err or "Invalid URL")
+                for url, opts, err in entries
+            ]
+
+        stats = LightBatchStats(urls=len(entries))
+        batch_start = time.perf_counter()
+        results, fallbacks = self._run_batch(entries, stats)
+
+        if fallbacks:
+            from .playwright_extractor import PlaywrightExtractor  # Local import to avoid circular dependency
+
+            stats.playwright_fallbacks = len(fallbacks)
+            fallback_results = PlaywrightExtractor(logger=self._logger).extract_many(
+                [str(entries[index][1].url) for index in fallbacks],  # type: ignore[union-attr]
+                timeout=timeout,
+                options=options,
+            )
+            for index, result in zip(fallbacks, fallback_results):
+                results[index] = result
+
+        stats.wall_seconds = time.perf_counter() - batch_start
+        self.last_batch_stats = stats
+        self._logger.info("Light batch: %s", stats.to_dict())
+        return [
+            result if result is not None else ExtractedContent(url=url, error="Extraction did not run")
+            for result, (url, _, _) in zip(results, entries)
+        ]
+
+    def _run_batch(
+        self,
+        entries: List[Tuple[str, Optional[ExtractionOptions], Optional[str]]],
+        stats: LightBatchStats,
+    ) -> Tuple[List[Optional[ExtractedContent]], List[int]]:
+        coro = self._extract_batch(entries, stats)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        # Called from inside a running loop (e.g. a test harness): use a fresh
+        # loop on a worker thread rather than the caller's.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
+    def _create_parse_pool(self, url_count: int) -> Optional[Executor]:
+        if url_count < _MIN_URLS_FOR_PROCESS_POOL or self.parse_workers < 2:
+            return None
+        try:
+            return ProcessPoolExecutor(max_workers=self.parse_workers)
+        except (OSError, NotImplementedError, PermissionError):
+            # Sandboxes without working multiprocessing still get concurrency.
+            return ThreadPoolExecutor(max_workers=self.parse_workers, thread_name_prefix="light-parse")
+
+    async def _extract_batch(
+        self,
+        entries: List[Tuple[str, Optional[ExtractionOptions], Optional[str]]],
+        stats: LightBatchStats,
+    ) -> Tuple[List[Optional[ExtractedContent]], List[int]]:
+        results: List[Optional[ExtractedContent]] = [None] * len(entries)
+        fallbacks: List[int] = []
+        jobs: List[Tuple[int, ExtractionOptions]] = []
+        for index, (url, opts, err) in enumerate(entries):
+            if opts is None or err is not None:
+                results[index] = ExtractedContent(url=url, error=err or "Invalid URL")
+            else:
+                jobs.append((index, opts))
+
+        slots = asyncio.Semaphore(self.max_concurrency)
+        gates: Dict[str, _HostGate] = defaultdict(
+            lambda: _HostGate(self.max_per_host, self.host_delay_seconds)
+        )
+        pool = self._create_parse_pool(len(jobs))
+        if pool is not None:
+            stats.parse_pool = type(pool).__name__
+        loop = asyncio.get_running_loop()
+        routing = get_host_routing()
+        archive = get_html_archive()
+
+        async def fetch(client: httpx.AsyncClient, url: str, timeout: float) -> str:
+            host = (urlparse(url).hostname or "").lower()
+            async with gates[host], slots:
+                stats.requests_by_host[host] = stats.requests_by_host.get(host, 0) + 1
+                response = await client.get(url, timeout=timeout)
+                response.raise_for_status()
+                return response.text
+
+        async def run(client: httpx.AsyncClient, index: int, opts: ExtractionOptions) -> None:
+            start = time.perf_counter()
+            raw_url = str(opts.url)
+            try:
+                html = await fetch(client, raw_url, opts.timeout_seconds)
+                target_url = raw_url
+                amp_alternate = amp_detector.find_amp_alternate(html, raw_url)
+                if amp_alternate:
+                    self._logger.debug("Discovered AMP alternate for %s", raw_url)
+                    html = await fetch(client, amp_alternate, opts.timeout_seconds)
+                    target_url = amp_alternate
+            except httpx.HTTPError as exc:
+                self._logger.warning("HTTP extraction failed for %s: %s", raw_url, exc)
+                stats.fetch_errors += 1
+                routing.record_light(raw_url, success=False, paragraphs=0, seconds=time.perf_counter() - start)
+                results[index] = ExtractedContent(url=raw_url, error=str(exc))
+                return
+            stats.fetched += 1
+            stats.fetch_seconds += time.perf_counter() - start
+            if archive is not None:
+                await asyncio.to_thread(archive.record, raw_url, html, final_url=target_url, extractor="light")
+
+            parse_start = time.perf_counter()
+            args = (html, target_url, raw_url, opts.max_paragraphs, not opts.force_playwright)
+            try:
+                if pool is None:
+                    content, valid = _process_html(*args)
+                else:
+                    content, valid = await loop.run_in_executor(pool, _process_html, *args)
+            except Exception as exc:
+                self._logger.warning("Parsing failed for %s: %s", raw_url, exc)
+                results[index] = ExtractedContent(url=raw_url, error=str(exc))
+                return
+            stats.parse_seconds += time.perf_counter() - parse_start
+
+            elapsed = time.perf_counter() - start
+            if content.metadata is not None:
+                content.metadata.duration_seconds = elapsed
+            routing.record_light(raw_url, success=valid, paragraphs=len(content.paragraphs), seconds=elapsed)
+            if not valid:
+                self._logger.debug("Light extractor found insufficient content for %s", raw_url)
+                if opts.force_playwright:
+                    content.error = content.error or "Insufficient content extracted by light strategy"
+                else:
+                    fallbacks.append(index)
+            results[index] = content
+
+        try:
+            async with httpx.AsyncClient(
+                headers=_DEFAULT_HEADERS,
+                follow_redirects=True,
+                timeout=30.0,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+            ) as client:
+                await asyncio.gather(*(run(client, index, opts) for index, opts in jobs))
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        return results, sorted(fallbacks)
@@ -5,8 +5,11 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, List, Optional, Sequence, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
 
 from bs4 import BeautifulSoup
 
@@ -24,6 +27,46 @@ from src.shared.processors.metadata_extractor import enrich_metadata
 from src.shared.processors.text_deduplicator import deduplicate_paragraphs
 from src.shared.utils import amp_detector, consent_handler
 
+from .host_profiles import get_host_routing
+from .html_archive import get_html_archive, replay_extract
+from .readiness import ReadinessTimings, wait_for_content
+from .resource_blocking import ResourceBlockingProfile, ResourceBlockStats, install_blocking
+
+DEFAULT_MAX_PAGES = 4
+DEFAULT_MAX_CONTEXTS = 1
+DEFAULT_MAX_PAGES_PER_HOST = 2
+
+
+@dataclass
+class BatchStats:
+    """Utilization of one :meth:`PlaywrightExtractor.extract_many` call."""
+
+    urls: int = 0
+    max_pages: int = 1
+    contexts: int = 1
+    wall_seconds: float = 0.0
+    page_seconds: float = 0.0
+    peak_pages: int = 0
+    pages_by_host: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def utilization(self) -> float:
+        """Share of the page slots that were busy over the batch wall time."""
+        capacity = self.wall_seconds * self.max_pages
+        return round(self.page_seconds / capacity, 4) if capacity > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "urls": self.urls,
+            "max_pages": self.max_pages,
+            "contexts": self.contexts,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "page_seconds": round(self.page_seconds, 3),
+            "peak_pages": self.peak_pages,
+            "utilization": self.utilization,
+            "pages_by_host": dict(self.pages_by_host),
+        }
+
 
 class PlaywrightExtractor:
     """Executes JavaScript-capable extraction using Playwright."""
@@ -84,8 +127,34 @@ class PlaywrightExtractor:
         "div.contentItem p",  # ESPN specific
     )
 
-    def __init__(self, *, logger: Optional[logging.Logger] = None) -> None:
+    def __init__(
+        self,
+        *,
+        logger: Optional[logging.Logger] = None,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        max_contexts: int = DEFAULT_MAX_CONTEXTS,
+        max_pages_per_host: int = DEFAULT_MAX_PAGES_PER_HOST,
+        resource_blocking: Optional[ResourceBlockingProfile] = None,
+    ) -> None:
+        """Create an extractor.
+
+        Args:
+            logger: Logger to use instead of the module logger
+            max_pages: Pages kept in flight by :meth:`extract_many`
+            max_contexts: Browser contexts the batch pages are spread over
+            max_pages_per_host: Concurrent pages allowed against one host
+            resource_blocking: Subresources to abort; defaults to
+                :meth:`ResourceBlockingProfile.from_env` (images, media, fonts
+                and known ad/analytics hosts)
+        """
         self._logger = logger or logging.getLogger(__name__)
+        self.max_pages = max(1, max_pages)
+        self.max_contexts = max(1, min(max_contexts, self.max_pages))
+        self.max_pages_per_host = max(1, max_pages_per_host)
+        self.last_batch_stats: Optional[BatchStats] = None
+        self.resource_blocking = resource_blocking or ResourceBlockingProfile.from_env()
+        self.block_stats = ResourceBlockStats()
+        self.readiness = ReadinessTimings()
 
     def extract(
         self,
@@ -102,6 +171,9 @@ class PlaywrightExtractor:
         if options:
             merged_options.update(options if isinstance(options, dict) else options.model_dump())
         validated = parse_options(merged_options)
+        archive = get_html_archive()
+        if archive is not None and archive.replay:
+            return replay_extract(archive, str(validated.url), max_paragraphs=validated.max_paragraphs)
         return self._run_sync(validated)
 
     def _run_sync(self, options: ExtractionOptions) -> ExtractedContent:
@@ -138,12 +210,16 @@ class PlaywrightExtractor:
         timeout: Optional[float] = None,
         options: dict | ExtractionOptions | None = None,
     ) -> List[ExtractedContent]:
-        """Extract multiple URLs with a single browser + context instance.
+        """Extract multiple URLs with a single browser instance.
 
         Launching Chromium costs ~2-3s per URL; reusing the browser across a
-        batch amortizes that cost to once per batch. Yields results in the
-        same order as ``urls``. Failures on individual URLs are returned as
-        ``ExtractedContent(error=...)`` rather than raised.
+        batch amortizes that cost to once per batch. Up to ``max_pages`` pages
+        (``max_pages_per_host`` per host) load concurrently across
+        ``max_contexts`` contexts, so the batch is bounded by page waits
+        overlapping rather than adding up. Returns results in the same order
+        as ``urls``; failures on individual URLs are returned as
+        ``ExtractedContent(error=...)`` rather than raised. Utilization of the
+        batch is left in :attr:`last_batch_stats`.
         """
         url_list = [str(u) for u in urls]
         if not url_list:
@@ -172,6 +248,15 @@ class PlaywrightExtractor:
                 for url, _, err in entries
             ]
 
+        archive = get_html_archive()
+        if archive is not None and archive.replay:
+            return [
+                replay_extract(archive, url, max_paragraphs=opts.max_paragraphs)
+                if opts is not None and err is None
+                else ExtractedContent(url=url, error=err or "Invalid URL")
+                for url, opts, err in entries
+            ]
+
         total_timeout = sum(opt.timeout_seconds for opt in valid_options) + 30
         return self._run_async(self._extract_batch(entries), total_timeout)
 
@@ -188,27 +273,75 @@ class PlaywrightExtractor:
                 for url, _, err in entries
             ]
 
-        results: List[ExtractedContent] = []
+        results: List[Optional[ExtractedContent]] = [None] * len(entries)
+        jobs: List[Tuple[int, ExtractionOptions]] = []
+        for index, (url, opts, err) in enumerate(entries):
+            if opts is None or err is not None:
+                results[index] = ExtractedContent(url=url, error=err or "Invalid URL")
+            else:
+                jobs.append((index, opts))
+
+        stats = BatchStats(urls=len(entries), max_pages=self.max_pages)
+        slots = asyncio.Semaphore(self.max_pages)
+        host_slots: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.max_pages_per_host)
+        )
+        in_flight = 0
+        batch_start = time.perf_counter()
+
         async with async_playwright() as playwright:
             browser = await self._launch_browser(playwright)
             try:
-                context = await self._new_context(browser)
+                contexts = [
+                    await self._new_context(browser)
+                    for _ in range(min(self.max_contexts, max(1, len(jobs))))
+                ]
+                stats.contexts = len(contexts)
+                open_pages = [0] * len(contexts)
+
+                async def run(index: int, opts: ExtractionOptions) -> None:
+                    nonlocal in_flight
+                    host = (urlparse(str(opts.url)).hostname or "").lower()
+                    # Take the host slot first so a throttled host never sits
+                    # on a global slot another host could use.
+                    async with host_slots[host], slots:
+                        slot = min(range(len(contexts)), key=open_pages.__getitem__)
+                        open_pages[slot] += 1
+                        in_flight += 1
+                        stats.peak_pages = max(stats.peak_pages, in_flight)
+                        started = time.perf_counter()
+                        try:
+                            results[index] = await self._extract_one(contexts[slot], opts)
+                        except Exception as exc:  # _extract_one should not raise; keep the batch alive
+                            results[index] = ExtractedContent(url=str(opts.url), error=str(exc))
+                        finally:
+                            stats.page_seconds += time.perf_counter() - started
+                            stats.pages_by_host[host] = stats.pages_by_host.get(host, 0) + 1
+                            open_pages[slot] -= 1
+                            in_flight -= 1
+
                 try:
-                    for url, opts, err in entries:
-                        if opts is None or err is not None:
-                            results.append(
-                                ExtractedContent(url=url, error=err or "Invalid URL")
-                            )
-                            continue
-                        context.set_default_navigation_timeout(
-                            opts.timeout_seconds * 1000
-                        )
-                        results.append(await self._extract_one(context, opts))
+                    await asyncio.gather(*(run(index, opts) for index, opts in jobs))
                 finally:
-                    await context.close()
+                    for context in contexts:
+                        await context.close()
             finally:
                 await browser.close()
-        return results
+
+        stats.wall_seconds = time.perf_counter() - batch_start
+        self.last_batch_stats = stats
+        self._logger.info(
+            "Playwright batch: %d URLs in %.1fs (%d pages x %d contexts, utilization %.0f%%)",
+            stats.urls,
+            stats.wall_seconds,
+            stats.max_pages,
+            stats.contexts,
+            stats.utilization * 100,
+        )
+        return [
+            result if result is not None else ExtractedContent(url=url, error="Extraction did not run")
+            for result, (url, _, _) in zip(results, entries)
+        ]
 
     # ------------------------------------------------------------------
     # Single-URL extraction (unchanged API, now routed through shared helpers)
@@ -281,6 +414,11 @@ class PlaywrightExtractor:
         html = ""
         try:
             page = await context.new_page()
+            if self.resource_blocking.applies_to(str(options.url)):
+                await install_blocking(page, self.resource_blocking, self.block_stats)
+            # Contexts are shared by concurrent batch pages, so the timeout
+            # is set per page rather than on the context.
+            page.set_default_navigation_timeout(options.timeout_seconds * 1000)
             await self._navigate(page, str(options.url), options)
 
             try:
@@ -289,24 +427,30 @@ class PlaywrightExtractor:
                 pass
 
             await consent_handler.solve_consent(page, logger=self._logger)
-            await page.wait_for_timeout(500)
 
-            # Gated scroll: only hosts that lazy-render articles pay the
-            # ~1-2s scroll cost.
+            # Readiness is adaptive: each wait returns once paragraph text
+            # stops growing, with the previous fixed sleeps as upper bounds.
+            ready_ms = 0
+            # Gated scroll: only hosts that lazy-render articles scroll.
             from .extractor_factory import is_heavy_url
 
             if is_heavy_url(str(options.url)):
                 try:
                     for _ in range(3):
                         await page.mouse.wheel(0, 800)
-                        await page.wait_for_timeout(250)
+                        ready_ms += (
+                            await self._wait_for_content(page, max_ms=250, quiet_ms=100)
+                        ).elapsed_ms
                 except PlaywrightError:
                     pass
 
+            budget_ms = 500
             url_lower = str(options.url).lower()
             if "espn.com" in url_lower or "nbcsports" in url_lower:
-                self._logger.debug("JS-heavy host detected — waiting 3s")
-                await page.wait_for_timeout(3000)
+                self._logger.debug("JS-heavy host detected — waiting up to 3.5s for content")
+                budget_ms += 3000
+            ready = await self._wait_for_content(page, max_ms=budget_ms, logger=self._logger)
+            self.readiness.record(str(options.url), ready_ms + ready.elapsed_ms, ready.stable)
 
             html = await page.content()
 
@@ -321,7 +465,7 @@ class PlaywrightExtractor:
                     pass
                 try:
                     await page.mouse.wheel(0, 500)
-                    await page.wait_for_timeout(300)
+                    await self._wait_for_content(page, max_ms=300, quiet_ms=100)
                 except PlaywrightError:
                     pass
                 await consent_handler.solve_consent(page, logger=self._logger)
@@ -344,7 +488,7 @@ class PlaywrightExtractor:
                 )
                 for _ in range(2):
                     await page.mouse.wheel(0, 1000)
-                    await page.wait_for_timeout(300)
+                    await wait_for_content(page, max_ms=300, quiet_ms=100)
                 html = await page.content()
                 content = self._parse_html(html, page.url)
                 if not content.paragraphs or len(content.paragraphs) < 2:
@@ -355,6 +499,9 @@ class PlaywrightExtractor:
             self._logger.exception(
                 "Playwright extraction failed for %s", options.url
             )
+            get_host_routing().record_playwright(
+                str(options.url), success=False, seconds=time.perf_counter() - start
+            )
             if page is not None:
                 try:
                     await page.close()
@@ -367,6 +514,12 @@ class PlaywrightExtractor:
         except Exception:
             self._logger.debug("Page close error", exc_info=True)
 
+        archive = get_html_archive()
+        if archive is not None:
+            await asyncio.to_thread(
+                archive.record, str(options.url), html, final_url=content.url, extractor="playwright"
+            )
+
         elapsed = time.perf_counter() - start
         metadata = content.metadata or ExtractionMetadata(
             fetched_at=datetime.now(timezone.utc),
@@ -384,6 +537,9 @@ class PlaywrightExtractor:
         content.trim(max_paragraphs=options.max_paragraphs)
         if not content.is_valid():
             content.error = content.error or "Insufficient content extracted"
+        get_host_routing().record_playwright(
+            str(options.url), success=content.is_valid(), seconds=elapsed
+        )
         return content
 
     # Anti-detection init script (shared across all contexts).
@@ -524,6 +680,15 @@ class PlaywrightExtractor:
         except PlaywrightError:
             return []
 
+    async def _wait_for_content(self, page, **kwargs):
+        """Readiness probe over the same selectors :meth:`_parse_html` reads."""
+        return await wait_for_content(
+            page,
+            content_selectors=self._CONTENT_SELECTORS,
+            paragraph_selectors=self._PARAGRAPH_SELECTORS,
+            **kwargs,
+        )
+
     def _parse_html(self, html: str, url: str) -> ExtractedContent:
         soup = BeautifulSoup(html, "lxml")
         article = self._locate_article_root(soup)
@@ -0,0 +1,172 @@
+"""Adaptive page-readiness detection for Playwright extraction.
+
+Instead of fixed sleeps, :func:`wait_for_content` injects a probe that watches
+DOM mutations and resolves once the page's paragraph text has stopped growing
+for ``quiet_ms`` (and is at least ``min_chars`` long), or once ``max_ms`` has
+passed. Text is measured with the same article-root and paragraph selectors
+the extractor parses with, so boilerplate outside the body cannot look
+"ready" before the body renders. The old fixed waits become the ``max_ms`` upper bounds, so pages that
+are ready early stop paying for the slow ones.
+
+:class:`ReadinessTimings` keeps the observed time-to-content per host so batch
+callers can report p50/p95 by domain.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+from urllib.parse import urlparse
+
+DEFAULT_QUIET_MS = 300
+DEFAULT_MIN_CHARS = 400
+DEFAULT_PARAGRAPH_SELECTORS = ("p",)
+
+_PROBE_SCRIPT = """({ maxMs, quietMs, minChars, contentSelectors, paragraphSelectors }) => new Promise((resolve) => {
+    const start = performance.now();
+    const query = (root, selector) => {
+        try { return root.querySelectorAll(selector); } catch (e) { return []; }
+    };
+    const findRoot = () => {
+        for (const selector of contentSelectors) {
+            const match = query(document, selector)[0];
+            if (match) return match;
+        }
+        return document.querySelector('article') || document.querySelector('main') || document.body;
+    };
+    const measure = () => {
+        const root = findRoot();
+        if (!root) return 0;
+        let total = 0;
+        for (const selector of paragraphSelectors) {
+            for (const node of query(root, selector)) {
+                total += (node.textContent || '').length;
+            }
+        }
+        return total;
+    };
+    let chars = measure();
+    let lastChange = start;
+    let dirty = false;
+    const observer = new MutationObserver(() => { dirty = true; });
+    observer.observe(document.documentElement, { childList: true, subtree: true, characterData: true });
+    let timer = null;
+    const finish = (stable) => {
+        observer.disconnect();
+        clearInterval(timer);
+        resolve({ ms: Math.round(performance.now() - start), chars, stable });
+    };
+    const check = () => {
+        const now = performance.now();
+        if (dirty) {
+            dirty = false;
+            const next = measure();
+            if (next !== chars) {
+                chars = next;
+                lastChange = now;
+            }
+        }
+        if (chars >= minChars && now - lastChange >= quietMs) return finish(true);
+        if (now - start >= maxMs) return finish(false);
+    };
+    timer = setInterval(check, 50);
+    check();
+})"""
+
+
+@dataclass
+class ReadinessResult:
+    """Outcome of one readiness probe."""
+
+    elapsed_ms: int
+    chars: int
+    stable: bool
+
+
+async def wait_for_content(
+    page: Any,
+    *,
+    max_ms: int,
+    quiet_ms: int = DEFAULT_QUIET_MS,
+    min_chars: int = DEFAULT_MIN_CHARS,
+    content_selectors: Sequence[str] = (),
+    paragraph_selectors: Sequence[str] = DEFAULT_PARAGRAPH_SELECTORS,
+    logger: Optional[logging.Logger] = None,
+) -> ReadinessResult:
+    """Wait until article text stops growing, at most ``max_ms``.
+
+    Text is summed over ``paragraph_selectors`` inside the first element
+    matching ``content_selectors`` (falling back to ``article``, ``main``,
+    then ``body``), mirroring how the extractor locates the article body.
+
+    If the probe cannot run (navigation in progress, CSP, closed page) the
+    full ``max_ms`` is waited so behaviour degrades to the old fixed sleep.
+    """
+    try:
+        outcome = await page.evaluate(
+            _PROBE_SCRIPT,
+            {
+                "maxMs": max_ms,
+                "quietMs": quiet_ms,
+                "minChars": min_chars,
+                "contentSelectors": list(content_selectors),
+                "paragraphSelectors": list(paragraph_selectors),
+            },
+        )
+        return ReadinessResult(
+            elapsed_ms=int(outcome.get("ms", max_ms)),
+            chars=int(outcome.get("chars", 0)),
+            stable=bool(outcome.get("stable")),
+        )
+    except Exception as exc:
+        if logger:
+            logger.debug("Readiness probe failed (%s); waiting %dms", exc, max_ms)
+        try:
+            await page.wait_for_timeout(max_ms)
+        except Exception:
+            pass
+        return ReadinessResult(elapsed_ms=max_ms, chars=0, stable=False)
+
+
+def _percentile(sorted_values: List[int], fraction: float) -> int:
+    index = min(len(sorted_values) - 1, max(0, round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class ReadinessTimings:
+    """Per-host time-to-content samples, safe to share between threads."""
+
+    def __init__(self, max_samples_per_host: int = 1000):
+        self.max_samples_per_host = max_samples_per_host
+        self._samples: Dict[str, List[int]] = {}
+        self._capped: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, url: str, elapsed_ms: int, stable: bool) -> None:
+        host = (urlparse(url).hostname or "").lower()
+        with self._lock:
+            samples = self._samples.setdefault(host, [])
+            if len(samples) < self.max_samples_per_host:
+                samples.append(elapsed_ms)
+            if not stable:
+                self._capped[host] = self._capped.get(host, 0) + 1
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """``{host: {count, p50_ms, p95_ms, capped}}``; capped counts hit the upper bound."""
+        with self._lock:
+            snapshot = {host: sorted(values) for host, values in self._samples.items() if values}
+            capped = dict(self._capped)
+        return {
+            host: {
+                "count": len(values),
+                "p50_ms": _percentile(values, 0.5),
+                "p95_ms": _percentile(values, 0.95),
+                "capped": capped.get(host, 0),
+            }
+            for host, values in sorted(snapshot.items())
+        }
+
+
+__all__ = ["ReadinessResult", "ReadinessTimings", "wait_for_content"]
@@ -0,0 +1,165 @@
+"""Request-interception profile for Playwright extraction.
+
+Extraction only reads DOM text, so images, media, fonts and ad/analytics
+scripts are pure cost: on ESPN/NBC-style pages they dominate load time,
+bandwidth and Chromium memory. :class:`ResourceBlockingProfile` decides which
+subresource requests a page may make; :class:`ResourceBlockStats` counts what
+was blocked.
+
+Aborted requests never report a size, so ``estimated_bytes_saved`` uses a
+typical transfer size per resource type rather than measured bytes.
+
+Environment:
+    PLAYWRIGHT_BLOCK_RESOURCES      "0"/"false" disables blocking entirely
+    PLAYWRIGHT_BLOCK_ALLOW_HOSTS    comma-separated page hosts that load everything
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, Optional
+from urllib.parse import urlparse
+
+DEFAULT_BLOCKED_TYPES: FrozenSet[str] = frozenset({"image", "media", "font"})
+
+DEFAULT_BLOCKED_HOSTS: FrozenSet[str] = frozenset(
+    {
+        # Ad serving
+        "doubleclick.net",
+        "googlesyndication.com",
+        "googletagservices.com",
+        "googleadservices.com",
+        "adservice.google.com",
+        "imasdk.googleapis.com",
+        "2mdn.net",
+        "amazon-adsystem.com",
+        "adnxs.com",
+        "rubiconproject.com",
+        "pubmatic.com",
+        "casalemedia.com",
+        "criteo.com",
+        "criteo.net",
+        "moatads.com",
+        "taboola.com",
+        "outbrain.com",
+        # Analytics / tag managers
+        "googletagmanager.com",
+        "google-analytics.com",
+        "scorecardresearch.com",
+        "chartbeat.com",
+        "chartbeat.net",
+        "quantserve.com",
+        "omtrdc.net",
+        "demdex.net",
+        "krxd.net",
+        "hotjar.com",
+        "nr-data.net",
+        "facebook.net",
+        "segment.io",
+    }
+)
+
+# Rough per-request transfer sizes used for the bytes-saved estimate.
+_TYPICAL_BYTES: Dict[str, int] = {
+    "image": 60_000,
+    "media": 500_000,
+    "font": 40_000,
+    "script": 30_000,
+}
+_DEFAULT_TYPICAL_BYTES = 10_000
+
+
+def _host_matches(host: str, suffixes: Iterable[str]) -> bool:
+    return any(host == suffix or host.endswith("." + suffix) for suffix in suffixes)
+
+
+@dataclass(frozen=True)
+class ResourceBlockingProfile:
+    """Which subresources a page is allowed to load."""
+
+    enabled: bool = True
+    blocked_types: FrozenSet[str] = DEFAULT_BLOCKED_TYPES
+    blocked_hosts: FrozenSet[str] = DEFAULT_BLOCKED_HOSTS
+    allow_hosts: FrozenSet[str] = frozenset()
+
+    @classmethod
+    def from_env(cls) -> "ResourceBlockingProfile":
+        flag = (os.getenv("PLAYWRIGHT_BLOCK_RESOURCES") or "1").strip().lower()
+        allow = os.getenv("PLAYWRIGHT_BLOCK_ALLOW_HOSTS") or ""
+        return cls(
+            enabled=flag not in {"0", "false", "no", "off"},
+            allow_hosts=frozenset(h.strip().lower() for h in allow.split(",") if h.strip()),
+        )
+
+    def applies_to(self, page_url: str) -> bool:
+        """False when blocking is off or the page's host is allowlisted."""
+        if not self.enabled:
+            return False
+        host = (urlparse(page_url).hostname or "").lower()
+        return not _host_matches(host, self.allow_hosts)
+
+    def block_reason(self, resource_type: str, request_url: str) -> Optional[str]:
+        """Return why a request should be aborted, or None to let it through."""
+        if resource_type in self.blocked_types:
+            return resource_type
+        host = (urlparse(request_url).hostname or "").lower()
+        if host and _host_matches(host, self.blocked_hosts):
+            return "tracker"
+        return None
+
+
+@dataclass
+class ResourceBlockStats:
+    """Counters for blocked requests, safe to update from several threads."""
+
+    requests_seen: int = 0
+    requests_blocked: int = 0
+    estimated_bytes_saved: int = 0
+    blocked_by_reason: Dict[str, int] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, resource_type: str, reason: Optional[str]) -> None:
+        with self._lock:
+            self.requests_seen += 1
+            if reason is None:
+                return
+            self.requests_blocked += 1
+            self.blocked_by_reason[reason] = self.blocked_by_reason.get(reason, 0) + 1
+            self.estimated_bytes_saved += _TYPICAL_BYTES.get(resource_type, _DEFAULT_TYPICAL_BYTES)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests_seen": self.requests_seen,
+                "requests_blocked": self.requests_blocked,
+                "estimated_bytes_saved": self.estimated_bytes_saved,
+                "blocked_by_reason": dict(self.blocked_by_reason),
+            }
+
+
+async def install_blocking(page: Any, profile: ResourceBlockingProfile, stats: ResourceBlockStats) -> None:
+    """Route *page*'s requests through *profile*. Navigations always pass."""
+
+    async def handle(route: Any) -> None:
+        request = route.request
+        reason = None
+        if not request.is_navigation_request():
+            reason = profile.block_reason(request.resource_type, request.url)
+        stats.record(request.resource_type, reason)
+        if reason is None:
+            await route.continue_()
+        else:
+            await route.abort()
+
+    await page.route("**/*", handle)
+
+
+__all__ = [
+    "DEFAULT_BLOCKED_HOSTS",
+    "DEFAULT_BLOCKED_TYPES",
+    "ResourceBlockStats",
+    "ResourceBlockingProfile",
+    "install_blocking",
+]
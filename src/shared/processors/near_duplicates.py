@@ -0,0 +1,134 @@
+"""Near-duplicate detection for cleaned article text.
+
+Wire stories (AP, team press releases) are republished by many outlets with
+small edits: a dateline, an extra intro sentence, trimmed paragraphs. Exact
+hashing misses them; MinHash signatures over word shingles estimate the
+Jaccard similarity of two articles, and banded LSH finds candidate matches
+without comparing every pair.
+
+Signatures are plain integer lists so they can be stored as JSON alongside
+the URL and reloaded into a :class:`NearDuplicateIndex` on the next run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+DEFAULT_NUM_PERM = 64
+DEFAULT_BANDS = 16
+DEFAULT_THRESHOLD = 0.8
+SHINGLE_SIZE = 5
+# Shorter texts are too generic to fingerprint reliably.
+MIN_SHINGLES = 20
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_SEED = 1
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _shingles(text: str, size: int = SHINGLE_SIZE) -> Set[int]:
+    tokens = _TOKEN_RE.findall(text.lower())
+    return {
+        int.from_bytes(
+            hashlib.blake2b(" ".join(tokens[i : i + size]).encode("utf-8"), digest_size=4).digest(),
+            "big",
+        )
+        for i in range(max(0, len(tokens) - size + 1))
+    }
+
+
+@lru_cache(maxsize=4)
+def _permutations(num_perm: int) -> Tuple[Tuple[int, int], ...]:
+    rng = random.Random(_SEED)
+    return tuple(
+        (rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME - 1))
+        for _ in range(num_perm)
+    )
+
+
+def minhash_signature(
+    paragraphs: Sequence[str] | str,
+    *,
+    num_perm: int = DEFAULT_NUM_PERM,
+) -> Optional[List[int]]:
+    """MinHash signature of *paragraphs*, or None when the text is too short."""
+    text = paragraphs if isinstance(paragraphs, str) else "\n".join(paragraphs)
+    shingles = _shingles(text)
+    if len(shingles) < MIN_SHINGLES:
+        return None
+    return [
+        min(((a * shingle + b) % _MERSENNE_PRIME) & _MAX_HASH for shingle in shingles)
+        for a, b in _permutations(num_perm)
+    ]
+
+
+def estimate_jaccard(first: Sequence[int], second: Sequence[int]) -> float:
+    """Fraction of matching signature slots (an estimate of Jaccard similarity)."""
+    if not first or len(first) != len(second):
+        return 0.0
+    return sum(1 for a, b in zip(first, second) if a == b) / len(first)
+
+
+class NearDuplicateIndex:
+    """Banded MinHash LSH index mapping keys to signatures."""
+
+    def __init__(
+        self,
+        *,
+        threshold: float = DEFAULT_THRESHOLD,
+        bands: int = DEFAULT_BANDS,
+        num_perm: int = DEFAULT_NUM_PERM,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.bands = bands
+        self.num_perm = num_perm
+        self._rows = num_perm // bands
+        self._buckets: List[Dict[Tuple[int, ...], List[str]]] = [defaultdict(list) for _ in range(bands)]
+        self._signatures: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._signatures
+
+    def add(self, key: str, signature: Sequence[int]) -> None:
+        if len(signature) != self.num_perm or key in self._signatures:
+            return
+        self._signatures[key] = list(signature)
+        for band, bucket in zip(self._bands(signature), self._buckets):
+            bucket[band].append(key)
+
+    def query(self, signature: Sequence[int]) -> Optional[Tuple[str, float]]:
+        """Best indexed match at or above the threshold as ``(key, similarity)``."""
+        if len(signature) != self.num_perm:
+            return None
+        candidates: Set[str] = set()
+        for band, bucket in zip(self._bands(signature), self._buckets):
+            candidates.update(bucket.get(band, ()))
+        best: Optional[Tuple[str, float]] = None
+        for key in candidates:
+            similarity = estimate_jaccard(signature, self._signatures[key])
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (key, similarity)
+        return best
+
+    def _bands(self, signature: Sequence[int]) -> Iterable[Tuple[int, ...]]:
+        rows = self._rows
+        return (tuple(signature[i * rows : (i + 1) * rows]) for i in range(self.bands))
+
+
+__all__ = [
+    "DEFAULT_THRESHOLD",
+    "NearDuplicateIndex",
+    "estimate_jaccard",
+    "minhash_signature",
+]
@@ -0,0 +1,495 @@
+"""Cross-process adaptive rate limiter for LLM and embedding APIs.
+
+Every CLI, backlog worker and service on a host that talks to the same
+provider/model shares one token bucket, stored in a small SQLite file
+(``LLM_RATE_LIMIT_PATH``, default ``<tmpdir>/llm_rate_limits.db``). Each
+``acquire`` is a single ``BEGIN IMMEDIATE`` transaction, so threads and
+processes coordinate without a lock server or a long-held file lock.
+
+Buckets budget requests and, optionally, tokens per minute. The refill rate
+adapts AIMD-style: a 429 halves the shared rate factor (at most once per
+``DECREASE_INTERVAL_SECONDS`` so a burst of concurrent 429s counts once),
+empties the request bucket and pauses everyone until ``retry-after``; each
+success adds a small step back towards the configured limit. OpenAI
+``x-ratelimit-*`` response headers tighten the bucket to what the provider
+reports as remaining.
+
+Environment:
+    LLM_RATE_LIMIT_PATH   SQLite file holding the shared buckets
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REQUESTS_PER_MINUTE = 60
+# Tier-1 OpenAI limits for text-embedding-3-* models.
+DEFAULT_EMBEDDING_REQUESTS_PER_MINUTE = 3000
+DEFAULT_EMBEDDING_TOKENS_PER_MINUTE = 1_000_000
+DECREASE_INTERVAL_SECONDS = 5.0
+# Longest single sleep while waiting, so limiters notice other processes'
+# releases and rate changes.
+MAX_SLEEP_SECONDS = 5.0
+MIN_SLEEP_SECONDS = 0.01
+MAX_BACKOFF_SECONDS = 30.0
+_CHARS_PER_TOKEN = 4
+_BUSY_TIMEOUT_SECONDS = 10.0
+_DURATION_PART_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_OPENAI_PREFIXES = ("gpt-", "o1", "o3", "o4", "chatgpt-", "text-embedding-")
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS buckets ("
+    "key TEXT PRIMARY KEY, requests REAL NOT NULL, tokens REAL NOT NULL, updated_at REAL NOT NULL, "
+    "rate_factor REAL NOT NULL, cooldown_until REAL NOT NULL, last_decrease REAL NOT NULL, "
+    "observed_rpm REAL, observed_tpm REAL, "
+    "total_requests INTEGER NOT NULL DEFAULT 0, rate_limited INTEGER NOT NULL DEFAULT 0)"
+)
+_COLUMNS = (
+    "requests",
+    "tokens",
+    "updated_at",
+    "rate_factor",
+    "cooldown_until",
+    "last_decrease",
+    "observed_rpm",
+    "observed_tpm",
+    "total_requests",
+    "rate_limited",
+)
+
+
+class RateLimitTimeout(TimeoutError):
+    """Raised when a slot does not free up within the caller's timeout."""
+
+
+@dataclass
+class RateLimitHeaders:
+    """Rate-limit hints parsed from a provider response."""
+
+    limit_requests: Optional[int] = None
+    remaining_requests: Optional[int] = None
+    reset_requests: Optional[float] = None
+    limit_tokens: Optional[int] = None
+    remaining_tokens: Optional[int] = None
+    reset_tokens: Optional[float] = None
+    retry_after: Optional[float] = None
+
+
+def parse_duration(value: Any) -> Optional[float]:
+    """Seconds in ``"20"``, ``"1.5s"``, ``"20ms"`` or ``"6m0s"``; None if unparseable."""
+    if value is None:
+        return None
+    text = str(value).strip().lower()
+    try:
+        return max(0.0, float(text))
+    except ValueError:
+        pass
+    parts = _DURATION_PART_RE.findall(text)
+    if not parts or "".join(number + unit for number, unit in parts) != text:
+        return None
+    scale = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+    return sum(float(number) * scale[unit] for number, unit in parts)
+
+
+def parse_rate_limit_headers(headers: Optional[Mapping[str, Any]]) -> RateLimitHeaders:
+    """Parse ``retry-after`` and OpenAI-style ``x-ratelimit-*`` headers."""
+    if not headers:
+        return RateLimitHeaders()
+    lowered = {str(name).lower(): value for name, value in headers.items()}
+
+    def _int(name: str) -> Optional[int]:
+        try:
+            return int(float(lowered[name]))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    retry_after = parse_duration(lowered.get("retry-after"))
+    if retry_after is None and lowered.get("retry-after-ms") is not None:
+        retry_after_ms = parse_duration(lowered["retry-after-ms"])
+        retry_after = retry_after_ms / 1000.0 if retry_after_ms is not None else None
+    return RateLimitHeaders(
+        limit_requests=_int("x-ratelimit-limit-requests"),
+        remaining_requests=_int("x-ratelimit-remaining-requests"),
+        reset_requests=parse_duration(lowered.get("x-ratelimit-reset-requests")),
+        limit_tokens=_int("x-ratelimit-limit-tokens"),
+        remaining_tokens=_int("x-ratelimit-remaining-tokens"),
+        reset_tokens=parse_duration(lowered.get("x-ratelimit-reset-tokens")),
+        retry_after=retry_after,
+    )
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count used to pre-charge the token bucket."""
+    return len(text) // _CHARS_PER_TOKEN + 1 if text else 0
+
+
+def provider_for_model(model: str) -> str:
+    """Provider name used in limiter keys: ``"openai"`` or ``"gemini"``."""
+    return "openai" if model.startswith(_OPENAI_PREFIXES) else "gemini"
+
+
+def default_state_path() -> str:
+    return os.getenv("LLM_RATE_LIMIT_PATH") or os.path.join(tempfile.gettempdir(), "llm_rate_limits.db")
+
+
+@dataclass
+class _Bucket:
+    now: float
+    requests: float
+    tokens: float
+    rate_factor: float
+    cooldown_until: float
+    last_decrease: float
+    observed_rpm: Optional[float]
+    observed_tpm: Optional[float]
+    total_requests: int
+    rate_limited: int
+
+
+class AdaptiveRateLimiter:
+    """Token bucket for one ``provider:model`` shared across threads and processes."""
+
+    def __init__(
+        self,
+        provider: str,
+        model: str,
+        *,
+        requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+        tokens_per_minute: Optional[float] = None,
+        path: Optional[str] = None,
+        increase_step: float = 0.05,
+        decrease_factor: float = 0.5,
+        min_factor: float = 0.1,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        if tokens_per_minute is not None and tokens_per_minute <= 0:
+            raise ValueError("tokens_per_minute must be positive")
+        self.provider = provider
+        self.model = model
+        self.key = f"{provider}:{model}"
+        self.requests_per_minute = float(requests_per_minute)
+        self.tokens_per_minute = float(tokens_per_minute) if tokens_per_minute else None
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.min_factor = min_factor
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._conn = self._connect(path or default_state_path())
+        self._total_requests = 0
+        self._rate_limit_hits = 0
+
+    # ------------------------------------------------------------------
+    # Acquiring slots
+    # ------------------------------------------------------------------
+
+    def acquire(self, tokens: int = 0, timeout: Optional[float] = None) -> None:
+        """Block until one request (and *tokens* tokens) fit in the budget.
+
+        Raises:
+            RateLimitTimeout: If *timeout* seconds pass without a slot.
+        """
+        deadline = self._clock() + timeout if timeout is not None else None
+        while True:
+            wait = self._try_acquire(tokens)
+            if wait <= 0:
+                return
+            self._sleep(self._next_sleep(wait, deadline))
+
+    async def acquire_async(self, tokens: int = 0, timeout: Optional[float] = None) -> None:
+        """Async variant of :meth:`acquire`."""
+        deadline = self._clock() + timeout if timeout is not None else None
+        while True:
+            wait = self._try_acquire(tokens)
+            if wait <= 0:
+                return
+            await asyncio.sleep(self._next_sleep(wait, deadline))
+
+    def release(self, tokens: int = 0) -> None:
+        """Refund a slot for a request that never reached the provider."""
+        with self._bucket() as bucket:
+            rpm, tpm = self._effective_limits(bucket)
+            bucket.requests = min(max(1.0, rpm), bucket.requests + 1.0)
+            if tpm is not None:
+                bucket.tokens = min(tpm, bucket.tokens + tokens)
+
+    # ------------------------------------------------------------------
+    # Feedback from responses
+    # ------------------------------------------------------------------
+
+    def record_success(
+        self,
+        headers: Optional[Mapping[str, Any]] = None,
+        *,
+        tokens_used: Optional[int] = None,
+        estimated_tokens: int = 0,
+    ) -> None:
+        """Additive increase, plus corrections from usage and response headers."""
+        hints = parse_rate_limit_headers(headers)
+        with self._bucket() as bucket:
+            bucket.rate_factor = min(1.0, bucket.rate_factor + self.increase_step)
+            if hints.limit_requests:
+                bucket.observed_rpm = float(hints.limit_requests)
+            if hints.limit_tokens:
+                bucket.observed_tpm = float(hints.limit_tokens)
+            if self.tokens_per_minute is not None and tokens_used is not None:
+                # Settle the difference between the pre-charged estimate and actual usage.
+                bucket.tokens -= tokens_used - estimated_tokens
+            if hints.remaining_requests is not None:
+                bucket.requests = min(bucket.requests, float(hints.remaining_requests))
+                if hints.remaining_requests <= 0 and hints.reset_requests:
+                    bucket.cooldown_until = max(bucket.cooldown_until, bucket.now + hints.reset_requests)
+            if hints.remaining_tokens is not None and self.tokens_per_minute is not None:
+                bucket.tokens = min(bucket.tokens, float(hints.remaining_tokens))
+                if hints.remaining_tokens <= 0 and hints.reset_tokens:
+                    bucket.cooldown_until = max(bucket.cooldown_until, bucket.now + hints.reset_tokens)
+
+    def record_rate_limited(
+        self,
+        retry_after: Optional[float] = None,
+        headers: Optional[Mapping[str, Any]] = None,
+        *,
+        attempt: int = 0,
+    ) -> float:
+        """Multiplicative decrease after a 429; returns the delay before retrying."""
+        hints = parse_rate_limit_headers(headers)
+        if retry_after is None:
+            retry_after = hints.retry_after
+        delay = retry_after if retry_after is not None else min(MAX_BACKOFF_SECONDS, 2 ** attempt)
+        with self._bucket() as bucket:
+            if bucket.now - bucket.last_decrease >= DECREASE_INTERVAL_SECONDS:
+                bucket.rate_factor = max(self.min_factor, bucket.rate_factor * self.decrease_factor)
+                bucket.last_decrease = bucket.now
+            bucket.requests = min(bucket.requests, 0.0)
+            bucket.cooldown_until = max(bucket.cooldown_until, bucket.now + delay)
+            bucket.rate_limited += 1
+            factor = bucket.rate_factor
+        with self._lock:
+            self._rate_limit_hits += 1
+        logger.info(
+            "Rate limited by %s; pausing %.1fs at %.0f%% of the configured rate",
+            self.key,
+            delay,
+            factor * 100,
+        )
+        return delay
+
+    def handle_429(self, attempt: int) -> float:
+        """Record a 429 without headers and return the backoff delay."""
+        return self.record_rate_limited(attempt=attempt)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._bucket() as bucket:
+            rpm, tpm = self._effective_limits(bucket)
+            shared = {
+                "rate_per_minute": round(rpm, 2),
+                "tokens_per_minute": round(tpm) if tpm is not None else None,
+                "rate_factor": round(bucket.rate_factor, 3),
+                "available_requests": round(max(0.0, bucket.requests), 2),
+                "cooldown_seconds": round(max(0.0, bucket.cooldown_until - bucket.now), 2),
+                "shared_total_requests": bucket.total_requests,
+                "shared_rate_limit_hits": bucket.rate_limited,
+            }
+        with self._lock:
+            total, hits = self._total_requests, self._rate_limit_hits
+        return {
+            "key": self.key,
+            **shared,
+            "total_requests": total,
+            "rate_limit_hits": hits,
+            "hit_rate": (hits / total * 100) if total else 0.0,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _try_acquire(self, tokens: int) -> float:
+        """Take a slot and return 0, or return how long to wait."""
+        with self._bucket() as bucket:
+            if bucket.cooldown_until > bucket.now:
+                return bucket.cooldown_until - bucket.now
+            rpm, tpm = self._effective_limits(bucket)
+            # A request larger than the whole budget goes out once the bucket is full.
+            needed = min(float(tokens), tpm) if tpm is not None else 0.0
+            if bucket.requests < 1.0 or (tpm is not None and bucket.tokens < needed):
+                waits = [(1.0 - bucket.requests) * 60.0 / rpm] if bucket.requests < 1.0 else []
+                if tpm is not None and bucket.tokens < needed:
+                    waits.append((needed - bucket.tokens) * 60.0 / tpm)
+                return max(waits)
+            bucket.requests -= 1.0
+            if tpm is not None:
+                bucket.tokens -= tokens
+            bucket.total_requests += 1
+        with self._lock:
+            self._total_requests += 1
+        return 0.0
+
+    def _next_sleep(self, wait: float, deadline: Optional[float]) -> float:
+        if deadline is not None and self._clock() + wait > deadline:
+            raise RateLimitTimeout(f"No {self.key} rate-limit slot within the timeout")
+        return min(max(wait, MIN_SLEEP_SECONDS), MAX_SLEEP_SECONDS)
+
+    def _effective_limits(self, bucket: _Bucket) -> Tuple[float, Optional[float]]:
+        rpm = self.requests_per_minute
+        if bucket.observed_rpm:
+            rpm = min(rpm, bucket.observed_rpm)
+        tpm = self.tokens_per_minute
+        if tpm is not None and bucket.observed_tpm:
+            tpm = min(tpm, bucket.observed_tpm)
+        factor = bucket.rate_factor
+        return rpm * factor, tpm * factor if tpm is not None else None
+
+    @contextmanager
+    def _bucket(self) -> Iterator[_Bucket]:
+        """Load, refill and save this key's bucket in one write transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                bucket = self._load()
+                yield bucket
+                self._store(bucket)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _load(self) -> _Bucket:
+        now = self._clock()
+        row = self._conn.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM buckets WHERE key = ?", (self.key,)
+        ).fetchone()
+        if row is None:
+            bucket = _Bucket(now, 0.0, 0.0, 1.0, 0.0, 0.0, None, None, 0, 0)
+            rpm, tpm = self._effective_limits(bucket)
+            bucket.requests = max(1.0, rpm)
+            bucket.tokens = tpm or 0.0
+            return bucket
+        values = dict(zip(_COLUMNS, row))
+        updated_at = values.pop("updated_at")
+        bucket = _Bucket(now=now, **values)
+        rpm, tpm = self._effective_limits(bucket)
+        elapsed = max(0.0, now - updated_at)
+        bucket.requests = min(max(1.0, rpm), bucket.requests + elapsed * rpm / 60.0)
+        if tpm is not None:
+            bucket.tokens = min(tpm, bucket.tokens + elapsed * tpm / 60.0)
+        return bucket
+
+    def _store(self, bucket: _Bucket) -> None:
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO buckets (key, {', '.join(_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * (len(_COLUMNS) + 1))})",
+            (
+                self.key,
+                bucket.requests,
+                bucket.tokens,
+                bucket.now,
+                bucket.rate_factor,
+                bucket.cooldown_until,
+                bucket.last_decrease,
+                bucket.observed_rpm,
+                bucket.observed_tpm,
+                bucket.total_requests,
+                bucket.rate_limited,
+            ),
+        )
+
+    @staticmethod
+    def _connect(path: str) -> sqlite3.Connection:
+        try:
+            conn = sqlite3.connect(
+                path, timeout=_BUSY_TIMEOUT_SECONDS, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            return conn
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("Shared rate-limit store %s unavailable (%s); limiting in-process only", path, exc)
+            conn = sqlite3.connect(":memory:", isolation_level=None, check_same_thread=False)
+            conn.execute(_SCHEMA)
+            return conn
+
+
+_limiters: Dict[str, AdaptiveRateLimiter] = {}
+# Limits callers asked for explicitly, per key; defaults never count as a request.
+_requested_limits: Dict[str, Dict[str, float]] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    provider: str,
+    model: str,
+    *,
+    requests_per_minute: Optional[float] = None,
+    tokens_per_minute: Optional[float] = None,
+) -> AdaptiveRateLimiter:
+    """Return the process-wide limiter for ``provider:model``.
+
+    Callers that pass no limits share whatever is configured. When two callers
+    ask for different explicit limits, a warning is logged and the lower one
+    applies, so no caller's budget is silently exceeded.
+    """
+    key = f"{provider}:{model}"
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(
+                provider,
+                model,
+                requests_per_minute=requests_per_minute or DEFAULT_REQUESTS_PER_MINUTE,
+                tokens_per_minute=tokens_per_minute,
+            )
+            _limiters[key] = limiter
+        requested = _requested_limits.setdefault(key, {})
+        for name, value in (
+            ("requests_per_minute", requests_per_minute),
+            ("tokens_per_minute", tokens_per_minute),
+        ):
+            if not value:
+                continue
+            current = requested.get(name)
+            if current is not None and current != value:
+                logger.warning(
+                    "Conflicting %s for %s (%s and %s); using the lower limit",
+                    name,
+                    key,
+                    current,
+                    value,
+                )
+                value = min(current, value)
+            requested[name] = float(value)
+            setattr(limiter, name, float(value))
+        return limiter
+
+
+__all__ = [
+    "AdaptiveRateLimiter",
+    "DEFAULT_EMBEDDING_REQUESTS_PER_MINUTE",
+    "DEFAULT_EMBEDDING_TOKENS_PER_MINUTE",
+    "RateLimitHeaders",
+    "RateLimitTimeout",
+    "estimate_tokens",
+    "get_rate_limiter",
+    "parse_duration",
+    "parse_rate_limit_headers",
+    "provider_for_model",
+]
@@ -146,3 +146,35 @@ def test_pipeline_without_resolver_still_returns_entities():
     assert len(result["entities"]) == 3
     assert result["unresolved_entities"] == []
     assert all("entity_id" not in e or e.get("entity_id") is None for e in result["entities"])
+
+
+def test_topics_run_concurrently_with_entity_resolution():
+    import threading
+
+    resolving = threading.Event()
+
+    class _WaitingTopicExtractor(_FakeTopicExtractor):
+        def extract(self, text: str, max_topics: int) -> List[ExtractedTopic]:
+            # Only completes if resolution starts while topics are in flight.
+            assert resolving.wait(timeout=5)
+            return super().extract(text, max_topics)
+
+    class _SignallingResolver(_FakeResolver):
+        def resolve_all(self, extracted):
+            resolving.set()
+            return super().resolve_all(extracted)
+
+    pipeline = ArticleExtractionPipeline(
+        PipelineDeps(
+            topic_extractor=_WaitingTopicExtractor(),
+            entity_extractor=_FakeEntityExtractor(),
+            resolver=_SignallingResolver(),
+        )
+    )
+
+    result = pipeline.run(ArticleInput(text="Sample body."), ExtractionOptions()).to_dict()
+
+    assert len(result["topics"]) == 2
+    metrics = result["metrics"]
+    assert {"topic_extraction_ms", "entity_extraction_ms", "resolution_ms", "critical_path_ms"} <= set(metrics)
+    assert metrics["critical_path_ms"] <= metrics["total_ms"]
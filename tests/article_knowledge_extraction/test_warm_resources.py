@@ -0,0 +1,98 @@
+"""WarmResourceRegistry reuse, keying and expiry — builders are faked."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.functions.article_knowledge_extraction.core.config import (
+    ExtractionOptions,
+    LLMConfig,
+    SupabaseConfig,
+)
+from src.functions.article_knowledge_extraction.core.pipelines.article_extraction_pipeline import (
+    ArticleExtractionPipeline,
+)
+from src.functions.article_knowledge_extraction.core.worker.warm_resources import (
+    WarmResourceRegistry,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def builds(monkeypatch):
+    counts = {"extractors": 0, "resolvers": 0}
+
+    def build_extractors(llm):
+        counts["extractors"] += 1
+        return object(), object()
+
+    def build_resolver(options, supabase):
+        counts["resolvers"] += 1
+        return object()
+
+    monkeypatch.setattr(ArticleExtractionPipeline, "build_extractors", staticmethod(build_extractors))
+    monkeypatch.setattr(ArticleExtractionPipeline, "build_resolver", staticmethod(build_resolver))
+    return counts
+
+
+def _llm(key: str = "sk-a", model: str = "gpt-5.4-mini") -> LLMConfig:
+    return LLMConfig(model=model, api_key=key)
+
+
+SUPABASE = SupabaseConfig(url="https://a.supabase.co", key="service-a")
+
+
+def test_back_to_back_jobs_reuse_extractors_and_resolver(builds):
+    registry = WarmResourceRegistry()
+
+    first = registry.pipeline_for(_llm(), ExtractionOptions(), SUPABASE)
+    second = registry.pipeline_for(_llm(), ExtractionOptions(), SUPABASE)
+
+    assert builds == {"extractors": 1, "resolvers": 1}
+    assert first._deps.resolver is second._deps.resolver
+    assert first._deps.topic_extractor is second._deps.topic_extractor
+    assert registry.get_stats()["resolver_hits"] == 1
+
+
+def test_credentials_and_projects_get_separate_entries(builds):
+    registry = WarmResourceRegistry()
+
+    registry.pipeline_for(_llm("sk-a"), ExtractionOptions(), SUPABASE)
+    registry.pipeline_for(_llm("sk-b"), ExtractionOptions(), SUPABASE)
+    registry.pipeline_for(
+        _llm("sk-a"), ExtractionOptions(), SupabaseConfig(url="https://b.supabase.co", key="service-b")
+    )
+
+    assert builds == {"extractors": 2, "resolvers": 2}
+
+
+def test_entries_are_rebuilt_after_ttl(builds):
+    clock = _Clock()
+    registry = WarmResourceRegistry(ttl_seconds=60, clock=clock)
+
+    registry.pipeline_for(_llm(), ExtractionOptions(), SUPABASE)
+    clock.now = 59
+    registry.pipeline_for(_llm(), ExtractionOptions(), SUPABASE)
+    clock.now = 121
+    registry.pipeline_for(_llm(), ExtractionOptions(), SUPABASE)
+
+    assert builds == {"extractors": 2, "resolvers": 2}
+
+
+def test_entry_cap_evicts_least_recently_used(builds):
+    registry = WarmResourceRegistry(max_entries=2)
+
+    for model in ("m1", "m2", "m1", "m3", "m1"):
+        registry.pipeline_for(_llm(model=model), ExtractionOptions(resolve_entities=False))
+
+    # m1 stays hot; m2 is evicted when m3 arrives.
+    assert builds["extractors"] == 3
+    assert registry.get_stats()["extractors"] == 2
+    assert builds["resolvers"] == 0
@@ -0,0 +1,105 @@
+import asyncio
+from types import SimpleNamespace
+
+from src.functions.article_validation.core.llm import ClaimVerificationResult
+from src.functions.article_validation.core.processors.claim_cache import (
+    ClaimVerdictCache,
+    VerdictLRU,
+    normalise_claim_text,
+)
+from src.functions.article_validation.core.processors.fact_checker import FactChecker
+
+
+ARTICLE = {
+    "headline": "Chiefs beat Bills 27-24",
+    "content": (
+        "Patrick Mahomes threw for 320 yards and three touchdowns on Sunday. "
+        "The Chiefs improved to 10-2 this season. "
+        "Travis Kelce caught 8 passes for 110 yards."
+    ),
+}
+
+
+class FakeLLMClient:
+    def __init__(self):
+        self.config = SimpleNamespace(model="gemini-test")
+        self.batches = []
+
+    async def verify_claims_batch(self, claims, *, shared_context=None, source_summaries=None):
+        self.batches.append([claim["text"] for claim in claims])
+        return [
+            ClaimVerificationResult(claim=claim["text"], verdict="verified", confidence=0.9, reasoning="ok")
+            for claim in claims
+        ]
+
+
+def _checker(client, store=None):
+    return FactChecker(client, verdict_cache=ClaimVerdictCache(store=store, lru=VerdictLRU()))
+
+
+def test_repeated_article_is_served_from_cache():
+    client = FakeLLMClient()
+    checker = _checker(client)
+
+    first = asyncio.run(checker.verify_facts(ARTICLE, source_summaries=["Recap"]))
+    second = asyncio.run(checker.verify_facts(ARTICLE, source_summaries=["Recap"]))
+
+    assert len(client.batches) == 1
+    assert first.score == second.score
+    assert second.details["cache"]["hits"] == len(client.batches[0])
+
+
+def test_only_new_claims_reach_the_llm():
+    client = FakeLLMClient()
+    checker = _checker(client)
+    asyncio.run(checker.verify_facts(ARTICLE, source_summaries=["Recap"]))
+
+    revised = dict(ARTICLE, content=ARTICLE["content"] + " Isiah Pacheco ran for 95 yards.")
+    dimension = asyncio.run(checker.verify_facts(revised, source_summaries=["Recap"]))
+
+    assert client.batches[1] == ["Isiah Pacheco ran for 95 yards."]
+    assert dimension.details["claims_checked"] == len(client.batches[0]) + 1
+    assert dimension.details["verified"] == dimension.details["claims_checked"]
+    assert dimension.details["errors"] == 0
+
+
+def test_different_sources_do_not_share_verdicts():
+    client = FakeLLMClient()
+    checker = _checker(client)
+
+    asyncio.run(checker.verify_facts(ARTICLE, source_summaries=["Recap"]))
+    asyncio.run(checker.verify_facts(ARTICLE, source_summaries=["Injury report"]))
+
+    assert len(client.batches) == 2
+
+
+def test_different_additional_context_does_not_share_verdicts():
+    client = FakeLLMClient()
+    checker = _checker(client)
+
+    asyncio.run(checker.verify_facts(ARTICLE, source_summaries=["Recap"], additional_context="Week 12"))
+    asyncio.run(checker.verify_facts(ARTICLE, source_summaries=["Recap"], additional_context="Week 13"))
+    asyncio.run(checker.verify_facts(ARTICLE, source_summaries=["Recap"], additional_context="Week 13"))
+
+    assert len(client.batches) == 2
+
+
+def test_shared_store_failures_do_not_break_validation():
+    class BrokenStore:
+        def get_many(self, keys):
+            raise RuntimeError("supabase down")
+
+        def set_many(self, entries, ttl_seconds):
+            raise RuntimeError("supabase down")
+
+    client = FakeLLMClient()
+    dimension = asyncio.run(_checker(client, store=BrokenStore()).verify_facts(ARTICLE))
+
+    assert dimension.passed
+    assert len(client.batches) == 1
+
+
+def test_normalise_claim_text_ignores_case_spacing_and_trailing_punctuation():
+    assert normalise_claim_text("  The Chiefs   improved to 10-2. ") == normalise_claim_text(
+        "the chiefs improved to 10-2"
+    )
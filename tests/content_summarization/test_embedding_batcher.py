@@ -0,0 +1,65 @@
+import threading
+
+from src.functions.content_summarization.core.embedding_batcher import EmbeddingMicroBatcher
+
+
+class RecordingSender:
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+        self.lock = threading.Lock()
+
+    def __call__(self, texts):
+        with self.lock:
+            self.batches.append(list(texts))
+        if self.fail:
+            raise RuntimeError("boom")
+        return [[float(len(text))] for text in texts]
+
+
+def test_concurrent_callers_share_requests():
+    sender = RecordingSender()
+    batcher = EmbeddingMicroBatcher(sender, max_batch_size=64, max_wait_ms=100)
+    results = {}
+    start = threading.Barrier(8)
+
+    def worker(idx):
+        start.wait()
+        texts = [f"thread {idx} fact {n}" for n in range(4)]
+        results[idx] = (texts, batcher.embed(texts, timeout=5))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    batcher.close()
+
+    assert sum(len(batch) for batch in sender.batches) == 32
+    assert len(sender.batches) < 8
+    for texts, vectors in results.values():
+        assert vectors == [[float(len(text))] for text in texts]
+
+
+def test_identical_pending_texts_are_sent_once():
+    sender = RecordingSender()
+    batcher = EmbeddingMicroBatcher(sender, max_batch_size=10, max_wait_ms=50)
+
+    futures = batcher.submit(["same", "same", "other"])
+    vectors = [future.result(timeout=5) for future in futures]
+    batcher.close()
+
+    assert vectors == [[4.0], [4.0], [5.0]]
+    assert sender.batches == [["same", "other"]]
+    assert batcher.get_stats()["texts_deduplicated"] == 1
+
+
+def test_size_threshold_splits_batches_and_failures_resolve_empty():
+    sender = RecordingSender(fail=True)
+    batcher = EmbeddingMicroBatcher(sender, max_batch_size=2, max_wait_ms=1000)
+
+    vectors = batcher.embed(["a", "b", "c", "d"], timeout=5)
+    batcher.close()
+
+    assert vectors == [[], [], [], []]
+    assert sorted(len(batch) for batch in sender.batches) == [2, 2]
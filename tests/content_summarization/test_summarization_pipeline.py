@@ -0,0 +1,120 @@
+import threading
+import time
+
+import pytest
+
+from src.functions.content_summarization.core.contracts import NewsUrlRecord
+from src.functions.content_summarization.core.pipelines import SummarizationPipeline
+
+
+class FakeGemini:
+    def __init__(self, fail_urls=()):
+        self.fail_urls = set(fail_urls)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.calls = []
+
+    def summarize_url(self, url, title=None):
+        with self.lock:
+            self.calls.append(url)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.02)
+        with self.lock:
+            self.active -= 1
+        if url in self.fail_urls:
+            raise RuntimeError("quota")
+        return {
+            "summary": f"Summary of {url}",
+            "key_points": [],
+            "players_mentioned": [],
+            "teams_mentioned": [],
+            "game_references": [],
+            "article_type": "news",
+            "sentiment": "neutral",
+            "content_quality": "high",
+            "injury_updates": None,
+            "metadata": {
+                "model_used": "gemini-test",
+                "tokens_used": 10,
+                "processing_time_seconds": 0.02,
+                "url_retrieval_status": "SUCCESS",
+            },
+        }
+
+
+class FakeWriter:
+    def __init__(self, existing=()):
+        self.existing = set(existing)
+        self.lookups = []
+        self.batches = []
+
+    def fetch_existing_ids(self, news_url_ids):
+        self.lookups.append(list(news_url_ids))
+        return self.existing & set(news_url_ids)
+
+    def write_summaries(self, summaries):
+        self.batches.append([summary.news_url_id for summary in summaries])
+        return {"total": len(summaries), "successful": len(summaries), "failed": 0, "errors": []}
+
+
+def _urls(count):
+    return [NewsUrlRecord(id=f"id-{i}", url=f"https://example.com/{i}") for i in range(count)]
+
+
+def test_concurrent_batch_checks_existence_once_and_writes_behind():
+    gemini, writer = FakeGemini(fail_urls={"https://example.com/3"}), FakeWriter(existing={"id-0"})
+    pipeline = SummarizationPipeline(gemini, None, writer, max_workers=4, write_batch_size=2)
+
+    stats = pipeline.process_url_batch(_urls(8))
+
+    assert len(writer.lookups) == 1
+    assert "https://example.com/0" not in gemini.calls
+    assert 1 < gemini.max_active <= 4
+    assert (stats["skipped"], stats["successful"], stats["failed"]) == (1, 6, 1)
+    assert all(len(batch) <= 2 for batch in writer.batches)
+    assert sorted(i for batch in writer.batches for i in batch) == [f"id-{i}" for i in (1, 2, 4, 5, 6, 7)]
+
+
+def test_stop_on_error_keeps_finished_summaries():
+    gemini, writer = FakeGemini(fail_urls={"https://example.com/1"}), FakeWriter()
+    pipeline = SummarizationPipeline(gemini, None, writer, continue_on_error=False, write_batch_size=5)
+
+    stats = pipeline.process_url_batch(_urls(5))
+
+    assert gemini.calls == ["https://example.com/0", "https://example.com/1"]
+    assert writer.batches == [["id-0"]]
+    assert (stats["successful"], stats["failed"]) == (1, 1)
+
+
+def test_interrupt_keeps_in_flight_summaries_and_drops_queued_urls(monkeypatch):
+    from src.functions.content_summarization.core import pipelines
+
+    real_wait = pipelines.wait
+    calls = []
+
+    def interrupting_wait(futures, **kwargs):
+        calls.append(len(futures))
+        if len(calls) == 2:
+            raise KeyboardInterrupt
+        return real_wait(futures, **kwargs)
+
+    monkeypatch.setattr(pipelines, "wait", interrupting_wait)
+    gemini, writer = FakeGemini(), FakeWriter()
+    pipeline = SummarizationPipeline(gemini, None, writer, max_workers=2, write_batch_size=10)
+
+    with pytest.raises(KeyboardInterrupt):
+        pipeline.process_url_batch(_urls(6))
+
+    written = sorted(i for batch in writer.batches for i in batch)
+    assert written == sorted(f"id-{url.rsplit('/', 1)[1]}" for url in gemini.calls)
+    assert len(gemini.calls) < 6
+
+
+def test_summaries_are_only_returned_when_asked_for():
+    plain = SummarizationPipeline(FakeGemini(), None, FakeWriter()).process_url_batch(_urls(2))
+    kept = SummarizationPipeline(FakeGemini(), None, FakeWriter(), keep_summaries=True).process_url_batch(_urls(2))
+
+    assert "summaries" not in plain
+    assert [summary.news_url_id for summary in kept["summaries"]] == ["id-0", "id-1"]
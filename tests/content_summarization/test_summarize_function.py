@@ -0,0 +1,44 @@
+import flask
+import pytest
+
+from src.functions.content_summarization.functions import main
+
+
+class FakePipeline:
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.max_workers = kwargs["max_workers"]
+        FakePipeline.instances.append(self)
+
+    def process_unsummarized_urls(self, limit=None):
+        return {"total": 0, "successful": 0, "failed": 0, "skipped": 0, "errors": []}
+
+
+@pytest.fixture
+def call(monkeypatch):
+    monkeypatch.setenv("GEMINI_API_KEY", "test")
+    monkeypatch.setattr(main, "GeminiClient", lambda **_kwargs: None)
+    monkeypatch.setattr(main, "NewsUrlReader", lambda: None)
+    monkeypatch.setattr(main, "SummaryWriter", lambda **_kwargs: None)
+    monkeypatch.setattr(main, "SummarizationPipeline", FakePipeline)
+    FakePipeline.instances = []
+    app = flask.Flask(__name__)
+
+    def _call(body):
+        with app.test_request_context(json=body):
+            _response, status = main.summarize_content(flask.request)
+        return status
+
+    return _call
+
+
+def test_max_workers_is_clamped(call):
+    assert call({"max_workers": 500}) == 200
+    assert FakePipeline.instances[0].max_workers == main.MAX_WORKERS
+
+
+@pytest.mark.parametrize("value", ["lots", -1, [4]])
+def test_invalid_max_workers_is_rejected(call, value):
+    assert call({"max_workers": value}) == 400
+    assert FakePipeline.instances == []
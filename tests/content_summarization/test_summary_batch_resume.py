@@ -0,0 +1,122 @@
+"""Replaying an uncommitted summary-batch window finishes half-written articles."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.functions.content_summarization.core.summary_batch import result_processor
+from src.functions.content_summarization.core.summary_batch.result_processor import (
+    SummaryBatchResultProcessor,
+)
+
+
+class FakeQuery:
+    def __init__(self, db, table):
+        self.db, self.table = db, table
+        self.action, self.payload, self.filters = "select", None, []
+
+    def select(self, _columns):
+        return self
+
+    def insert(self, rows):
+        self.action, self.payload = "insert", rows
+        return self
+
+    def update(self, values):
+        self.action, self.payload = "update", values
+        return self
+
+    def delete(self):
+        self.action = "delete"
+        return self
+
+    def in_(self, column, values):
+        self.filters.append(lambda row: row.get(column) in values)
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def is_(self, column, _null):
+        self.filters.append(lambda row: row.get(column) is None)
+        return self
+
+    def execute(self):
+        rows = self.db.setdefault(self.table, [])
+        if self.action == "insert":
+            rows.extend(dict(row) for row in self.payload)
+            return SimpleNamespace(data=self.payload)
+        matched = [row for row in rows if all(match(row) for match in self.filters)]
+        if self.action == "delete":
+            self.db[self.table] = [row for row in rows if row not in matched]
+        elif self.action == "update":
+            for row in matched:
+                row.update(self.payload)
+        return SimpleNamespace(data=matched)
+
+
+class FakeClient:
+    def __init__(self, article_ids):
+        self.db = {"news_urls": [{"id": article_id, "summary_created_at": None} for article_id in article_ids]}
+
+    def table(self, name):
+        return FakeQuery(self.db, name)
+
+
+def _write_output(path, article_ids):
+    with path.open("w") as f:
+        for article_id in article_ids:
+            content = json.dumps({"summary": f"Summary of {article_id}"})
+            response = {"status_code": 200, "body": {"choices": [{"message": {"content": content}}]}}
+            f.write(json.dumps({"custom_id": f"easy_{article_id}", "response": response}) + "\n")
+
+
+def test_article_inserted_before_a_crash_is_finished_on_resume(tmp_path, monkeypatch):
+    output = tmp_path / "output.jsonl"
+    _write_output(output, ["a", "b"])
+    client = FakeClient(["a", "b", "done"])
+    monkeypatch.setattr(result_processor, "get_supabase_client", lambda: client)
+    processor = SummaryBatchResultProcessor(embedding_api_key="test", continue_on_error=False)
+
+    def crash(easy_summaries, hard_summaries):
+        raise RuntimeError("embedding service down")
+
+    processor._bulk_create_embeddings = crash
+    with pytest.raises(RuntimeError):
+        processor.process(output, model="gpt-test")
+    assert {row["news_url_id"] for row in client.db["context_summaries"]} == {"a", "b"}
+
+    embedded = []
+
+    def embed(easy_summaries, hard_summaries):
+        embedded.extend(easy_summaries)
+        return len(easy_summaries)
+
+    processor._bulk_create_embeddings = embed
+    result = processor.process(output, model="gpt-test", skip_existing=True)
+
+    assert sorted(embedded) == ["a", "b"]
+    assert result.articles_resumed == 2
+    assert result.articles_skipped_existing == 0
+    assert [row["news_url_id"] for row in client.db["context_summaries"]] == ["a", "b"]
+    marked = {row["id"] for row in client.db["news_urls"] if row["summary_created_at"]}
+    assert marked == {"a", "b"}
+
+
+def test_fresh_run_still_skips_existing_articles(tmp_path, monkeypatch):
+    output = tmp_path / "output.jsonl"
+    _write_output(output, ["a"])
+    client = FakeClient(["a"])
+    client.db["context_summaries"] = [{"news_url_id": "a", "summary_text": "older"}]
+    monkeypatch.setattr(result_processor, "get_supabase_client", lambda: client)
+    processor = SummaryBatchResultProcessor(embedding_api_key="test")
+    processor._bulk_create_embeddings = lambda easy, hard: 0
+
+    result = processor.process(output, model="gpt-test", skip_existing=True)
+
+    assert (result.articles_skipped_existing, result.articles_resumed) == (1, 0)
+    assert client.db["context_summaries"] == [{"news_url_id": "a", "summary_text": "older"}]
@@ -0,0 +1,147 @@
+import threading
+
+from src.functions.daily_team_update.core.contracts.config import PipelineConfig
+from src.functions.daily_team_update.core.contracts.pipeline_result import TeamProcessingResult
+from src.functions.daily_team_update.core.db.team_reader import TeamRecord
+from src.functions.daily_team_update.core.integration.service_coordinator import (
+    ArticleValidationReport,
+    GeneratedArticle,
+    SelectedImage,
+    ServiceInvocationError,
+    TranslatedArticle,
+)
+from src.functions.daily_team_update.core.monitoring.error_handler import ErrorHandler
+from src.functions.daily_team_update.core.monitoring.metrics_collector import MetricsCollector
+from src.functions.daily_team_update.core.orchestration.team_processor import TeamProcessor
+
+
+TEAM = TeamRecord(
+    identifier="1",
+    abbreviation="BUF",
+    name="Buffalo Bills",
+    conference="AFC",
+    division="East",
+    metadata={},
+)
+
+
+def _article(headline: str) -> GeneratedArticle:
+    return GeneratedArticle(
+        headline=headline,
+        sub_header="Sub",
+        introduction_paragraph="Intro",
+        content=["Paragraph"],
+    )
+
+
+class FakeService:
+    def __init__(self, decisions, *, translation_error=None):
+        self._decisions = list(decisions)
+        self._translation_error = translation_error
+        self._lock = threading.Lock()
+        self.generated = []
+        self.translated = []
+        self.image_calls = []
+        self.validation_started = threading.Event()
+
+    def has_article_validation(self):
+        return bool(self._decisions)
+
+    def generate_article(self, team, summaries, *, feedback=None, previous_article=None):
+        article = _article(f"draft-{len(self.generated) + 1}")
+        self.generated.append(article)
+        return article
+
+    def validate_article(self, **kwargs):
+        decision = self._decisions.pop(0)
+        return ArticleValidationReport(
+            status="success",
+            decision=decision,
+            is_releasable=decision != "reject",
+            rejection_reasons=["wrong score"] if decision == "reject" else [],
+            review_reasons=[],
+        )
+
+    def translate_article(self, article):
+        with self._lock:
+            self.translated.append(article.headline)
+        if self._translation_error is not None:
+            raise self._translation_error
+        return TranslatedArticle(
+            headline=f"de-{article.headline}",
+            sub_header="",
+            introduction_paragraph="",
+            content=["Absatz"],
+            language="de",
+        )
+
+    def select_images(self, *, article, translated):
+        with self._lock:
+            self.image_calls.append((article.headline, translated))
+        return [
+            SelectedImage(
+                image_url="https://example.com/a.jpg",
+                original_url=None,
+                title=None,
+                source=None,
+                author=None,
+                width=None,
+                height=None,
+            )
+        ]
+
+
+def _cached_result() -> TeamProcessingResult:
+    return TeamProcessingResult(
+        team_id="1",
+        team_abbr="BUF",
+        cached_urls=[{"url": "https://example.com/story"}],
+        cached_extracted=[{"url": "https://example.com/story", "content": "Body"}],
+        cached_summaries=[{"source_url": "https://example.com/story", "content": "Summary"}],
+    )
+
+
+def _processor(service, **config) -> TeamProcessor:
+    return TeamProcessor(
+        supabase=None,
+        service_coordinator=service,
+        pipeline_config=PipelineConfig(dry_run=True, **config),
+        metrics=MetricsCollector(),
+        error_handler=ErrorHandler(),
+    )
+
+
+def test_fan_out_uses_translation_and_images_of_accepted_draft():
+    service = FakeService(["reject", "release"])
+
+    result = _processor(service).process(TEAM, _cached_result())
+
+    assert result.status == "success"
+    assert result.validation_attempts == 2
+    assert "draft-2" in service.translated
+    # Image selection only runs for the accepted draft and does not wait on translation.
+    assert service.image_calls == [("draft-2", None)]
+    assert result.images_selected == 1
+
+
+def test_sequential_mode_passes_translation_to_image_selection():
+    service = FakeService([])
+
+    result = _processor(service, parallel_post_generation=False).process(TEAM, _cached_result())
+
+    assert result.status == "success"
+    assert service.translated == ["draft-1"]
+    assert service.image_calls[0][1].headline == "de-draft-1"
+
+
+def test_translation_failure_marks_team_incomplete():
+    service = FakeService(
+        ["release"],
+        translation_error=ServiceInvocationError("translation", "boom", retryable=True),
+    )
+
+    result = _processor(service).process(TEAM, _cached_result())
+
+    assert result.status == "incomplete"
+    assert "translation" in [error.stage for error in result.errors]
+    assert "translation" in result.durations
@@ -615,3 +615,75 @@ def test_download_file_text_handles_string_response(service: TTSBatchService):
                 return "already a string"
 
     assert service._download_file_text(StringClient(), "files/x") == "already a string"
+
+
+# ---------------------------------------------------------------------------
+# process_batch pipeline
+# ---------------------------------------------------------------------------
+
+
+def test_process_batch_pipeline_keeps_output_order(monkeypatch, tmp_path, batch_job):
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    service = TTSBatchService(work_dir=tmp_path, upload_concurrency=4, max_in_flight_bytes=8)
+    request = ProcessBatchRequest(
+        action="process",
+        batch_id="batches/123",
+        credentials={"gemini": "key"},
+        supabase={"url": "https://example.supabase.co", "key": "supabase-key"},
+    )
+    lines = []
+    for index in range(6):
+        mime = "audio/wav" if index % 2 else "audio/mpeg"
+        lines.append(
+            json.dumps(
+                {
+                    "key": f"story-{index}",
+                    "response": {
+                        "candidates": [
+                            {"content": {"parts": [{"inlineData": {"mimeType": mime, "data": "QUJD"}}]}}
+                        ]
+                    },
+                }
+            )
+        )
+    lines.insert(3, json.dumps({"key": "story-x", "error": {"message": "failed"}}))
+    client = FakeBatchClient(batch_job)
+    client.download_payload = ("\n".join(lines) + "\n").encode("utf-8")
+
+    class SlowBucket(FakeStorageBucket):
+        def upload(self, *, path, file, file_options):
+            # Earlier items finish last to exercise out-of-order completion.
+            if path.endswith(".mp3"):
+                time.sleep(0.02 * (6 - int(path.rsplit("-", 1)[1].split(".")[0])))
+            return super().upload(path=path, file=file, file_options=file_options)
+
+    fake_supabase = FakeSupabase()
+    fake_supabase.storage.bucket = SlowBucket()
+    encoded = []
+
+    def fake_encode(data_b64, mime_type):
+        encoded.append(mime_type)
+        return b"mp3"
+
+    monkeypatch.setattr(
+        "src.functions.gemini_tts_batch.core.service.decode_and_encode_audio", fake_encode
+    )
+    service._create_genai_client = lambda api_key: client  # type: ignore[method-assign]
+    service._create_supabase_client = lambda url, key: fake_supabase  # type: ignore[method-assign]
+    service._create_encode_pool = lambda: ThreadPoolExecutor(max_workers=2)  # type: ignore[method-assign]
+
+    result = asyncio.run(service.process_batch(request))
+
+    assert [item["id"] for item in result["items"]] == [f"story-{i}" for i in range(6)]
+    assert [item["id"] for item in result["failures"]] == ["story-x"]
+    assert encoded == ["audio/wav"] * 3
+    assert set(result["timings"]) == {
+        "download_seconds",
+        "parse_seconds",
+        "encode_seconds",
+        "upload_seconds",
+        "pipeline_seconds",
+    }
+    assert not (tmp_path / "batches_123_output.jsonl").exists()
@@ -0,0 +1,16 @@
+import pytest
+
+from src.functions.image_selection.core.factory import request_from_payload
+from src.functions.image_selection.core.vision_validator import DEFAULT_CLIP_MODEL
+
+
+@pytest.mark.parametrize("vision", [None, {"enable_clip": True}])
+def test_clip_model_follows_preload_env(monkeypatch, vision):
+    payload = {"query": "Bills quarterback", "enable_llm": False}
+    if vision is not None:
+        payload["vision"] = vision
+
+    assert request_from_payload(payload).vision_config.clip_model == DEFAULT_CLIP_MODEL
+
+    monkeypatch.setenv("IMAGE_SELECTION_CLIP_MODEL", "openai/clip-vit-large-patch14")
+    assert request_from_payload(payload).vision_config.clip_model == "openai/clip-vit-large-patch14"
@@ -0,0 +1,107 @@
+import io
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from src.functions.image_selection.core.image_hash import (
+    BKTree,
+    PerceptualHashIndex,
+    compute_dhash,
+    format_hash,
+    hamming_distance,
+    load_phash_index,
+    parse_hash,
+)
+
+
+def test_bk_tree_matches_linear_scan():
+    rng = random.Random(7)
+    keys = [rng.getrandbits(64) for _ in range(500)]
+    tree = BKTree()
+    for position, key in enumerate(keys):
+        tree.add(key, position)
+
+    probe = keys[42] ^ 0b101  # two bits flipped
+    expected = sorted(
+        (hamming_distance(probe, key), position)
+        for position, key in enumerate(keys)
+        if hamming_distance(probe, key) <= 6
+    )
+
+    assert sorted(tree.search(probe, 6)) == expected
+    assert tree.search(probe, 6)[0] == (2, 42)
+
+
+def test_index_ignores_rows_without_hash():
+    index = PerceptualHashIndex(
+        [
+            {"id": "1", "phash": format_hash(0xFF)},
+            {"id": "2", "phash": None},
+            {"id": "3", "phash": "not-hex"},
+        ]
+    )
+
+    assert len(index) == 1
+    assert [record["id"] for _, record in index.find(0xFE, 1)] == ["1"]
+    assert parse_hash(format_hash(0xABC)) == 0xABC
+
+
+def test_dhash_is_stable_across_resizes():
+    Image = pytest.importorskip("PIL.Image")
+    pytest.importorskip("numpy")
+
+    image = Image.new("L", (320, 200))
+    image.putdata([(x * 3 + y) % 256 for y in range(200) for x in range(320)])
+
+    def encode(img):
+        buffer = io.BytesIO()
+        img.convert("RGB").save(buffer, format="JPEG", quality=85)
+        return buffer.getvalue()
+
+    original = compute_dhash(encode(image))
+    resized = compute_dhash(encode(image.resize((160, 100))))
+
+    assert original is not None and resized is not None
+    assert hamming_distance(original, resized) <= 6
+    assert compute_dhash(b"not an image") is None
+
+
+class FakeTable:
+    """Pages rows by ``range``; records the order column each page asked for."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.orders = []
+        self.not_ = self
+
+    def select(self, _columns):
+        self.order_by = None
+        return self
+
+    def is_(self, *_args):
+        return self
+
+    def order(self, column):
+        self.order_by = column
+        return self
+
+    def range(self, start, end):
+        self.orders.append(self.order_by)
+        self.page = sorted(self.rows, key=lambda row: row[self.order_by])[start : end + 1]
+        return self
+
+    def execute(self):
+        return SimpleNamespace(data=self.page)
+
+
+def test_phash_index_pages_in_a_stable_order():
+    rows = [{"id": f"{i:05d}", "image_url": f"u{i}", "original_url": None, "phash": format_hash(i)} for i in range(2500)]
+    random.Random(3).shuffle(rows)
+    table = FakeTable(rows)
+    supabase = SimpleNamespace(table=lambda _name: table)
+
+    index = load_phash_index(supabase, "images", ("test-stable-order", "", ""))
+
+    assert table.orders == ["id", "id", "id"]
+    assert len(index) == 2500
@@ -0,0 +1,191 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.functions.image_selection.core.config import ImageSelectionRequest
+from src.functions.image_selection.core.service import ImageCandidate, ImageSelectionService
+
+
+class FakeQuery:
+    def __init__(self, rows, calls):
+        self._rows = rows
+        self._calls = calls
+        self._urls = []
+
+    def select(self, _columns):
+        return self
+
+    def in_(self, column, values):
+        self._calls.append((column, list(values)))
+        self._urls = list(values)
+        return self
+
+    def execute(self):
+        return SimpleNamespace(data=[row for row in self._rows if row["original_url"] in self._urls])
+
+
+class FakeSupabase:
+    def __init__(self, rows):
+        self.rows = rows
+        self.lookups = []
+
+    def table(self, _name):
+        return FakeQuery(self.rows, self.lookups)
+
+
+def _candidate(url: str) -> ImageCandidate:
+    return ImageCandidate(
+        url=url,
+        title=url,
+        context_url=None,
+        source=None,
+        author=None,
+        width=None,
+        height=None,
+        byte_size=None,
+        mime_type=None,
+        license=None,
+        original_data={},
+    )
+
+
+def _service(num_images: int, rows=None) -> ImageSelectionService:
+    request = ImageSelectionRequest(
+        explicit_query="Bills quarterback",
+        num_images=num_images,
+        enable_llm=False,
+        vision_config=None,
+    )
+    service = ImageSelectionService(request)
+    if rows is not None:
+        service.supabase = FakeSupabase(rows)
+        service.supabase_table = "article_images"
+    return service
+
+
+def test_warm_candidates_are_reused_without_downloads():
+    rows = [
+        {"id": "1", "image_url": "https://store/a.jpg", "original_url": "https://a.example/a.jpg"},
+        {"id": "2", "image_url": "https://store/b.jpg", "original_url": "https://b.example/b.jpg"},
+    ]
+    service = _service(2, rows)
+    downloads = []
+
+    async def fake_download(session, url, max_retries=3):
+        downloads.append(url)
+        return b"bytes"
+
+    service._download_image = fake_download
+    candidates = [
+        _candidate("https://a.example/a.jpg"),
+        _candidate("https://c.example/c.jpg"),
+        _candidate("https://b.example/b.jpg"),
+    ]
+
+    results = asyncio.run(service._process_candidates(None, candidates))
+
+    assert [image.record_id for image in results] == ["1", "2"]
+    assert downloads == []
+    assert len(service.supabase.lookups) == 1
+
+
+def test_cold_candidates_stop_once_enough_are_accepted():
+    service = _service(1)
+    started = []
+
+    async def fake_validate(session, candidate):
+        started.append(candidate.url)
+        if candidate.url.endswith("slow.jpg"):
+            await asyncio.sleep(10)
+        return True
+
+    async def fake_download(session, url, max_retries=3):
+        return b"bytes"
+
+    service._validate_candidate = fake_validate
+    service._download_image = fake_download
+    candidates = [_candidate("https://a.example/slow.jpg"), _candidate("https://b.example/fast.jpg")]
+
+    results = asyncio.run(asyncio.wait_for(service._process_candidates(None, candidates), timeout=2))
+
+    assert [image.original_url for image in results] == ["https://b.example/fast.jpg"]
+    assert len(started) == 2
+
+
+def test_near_duplicate_reuses_stored_record(monkeypatch):
+    from src.functions.image_selection.core.image_hash import PerceptualHashIndex, format_hash
+
+    service = _service(1)
+    service.supabase = FakeSupabase([])
+    service.supabase_table = "article_images"
+    stored = {"id": "7", "image_url": "https://store/seven.jpg", "original_url": "https://cdn-a/x.jpg"}
+    index = PerceptualHashIndex([{**stored, "phash": format_hash(0b1011)}])
+    uploads = []
+
+    async def fake_index():
+        return index
+
+    async def fake_validate(session, candidate):
+        return True
+
+    async def fake_download(session, url, max_retries=3):
+        return b"bytes"
+
+    async def fake_upload(image_bytes, candidate):
+        uploads.append(candidate.url)
+        return "https://store/new.jpg"
+
+    service._load_phash_index = fake_index
+    service._validate_candidate = fake_validate
+    service._download_image = fake_download
+    service._upload_image = fake_upload
+
+    monkeypatch.setattr(
+        "src.functions.image_selection.core.service.compute_dhash", lambda image_bytes: 0b1001
+    )
+
+    results = asyncio.run(service._process_candidates(None, [_candidate("https://cdn-b/x-small.jpg")]))
+
+    assert [image.record_id for image in results] == ["7"]
+    assert results[0].public_url == "https://store/seven.jpg"
+    assert uploads == []
+
+
+@pytest.mark.parametrize("warm_has_phash", [True, False])
+def test_cold_variant_of_reused_image_is_skipped(monkeypatch, warm_has_phash):
+    from src.functions.image_selection.core.image_hash import PerceptualHashIndex, format_hash
+
+    stored = {"id": "7", "image_url": "https://store/seven.jpg", "original_url": "https://cdn-a/x.jpg"}
+    warm_row = {**stored, "phash": format_hash(0b1011) if warm_has_phash else None}
+    service = _service(2, [warm_row])
+    # Without a stored hash on the warm row, the index hit on the selected image must skip it.
+    index = PerceptualHashIndex([] if warm_has_phash else [{**stored, "phash": format_hash(0b1011)}])
+    uploads = []
+
+    async def fake_index():
+        return index
+
+    async def fake_validate(session, candidate):
+        return True
+
+    async def fake_download(session, url, max_retries=3):
+        return b"bytes"
+
+    async def fake_upload(image_bytes, candidate):
+        uploads.append(candidate.url)
+        return "https://store/new.jpg"
+
+    service._load_phash_index = fake_index
+    service._validate_candidate = fake_validate
+    service._download_image = fake_download
+    service._upload_image = fake_upload
+    monkeypatch.setattr(
+        "src.functions.image_selection.core.service.compute_dhash", lambda image_bytes: 0b1001
+    )
+
+    candidates = [_candidate("https://cdn-a/x.jpg"), _candidate("https://cdn-b/x-small.jpg")]
+    results = asyncio.run(service._process_candidates(None, candidates))
+
+    assert [image.record_id for image in results] == ["7"]
+    assert uploads == []
@@ -0,0 +1,52 @@
+import asyncio
+
+from src.functions.image_selection.core.config import VisionConfig
+from src.functions.image_selection.core.vision_validator import VisionValidator
+
+
+def _validator(**overrides) -> VisionValidator:
+    validator = VisionValidator(VisionConfig(enable_ocr=False, enable_clip=False, **overrides))
+    validator._clip_model = object()
+    validator._clip_processor = object()
+    return validator
+
+
+def test_concurrent_clip_requests_share_one_forward_pass(monkeypatch):
+    validator = _validator(clip_batch_size=8, clip_batch_window_ms=5)
+    batches = []
+
+    def fake_score_batch(images, query):
+        batches.append((list(images), query))
+        return [len(image) / 10 for image in images]
+
+    monkeypatch.setattr(validator, "_score_batch", fake_score_batch)
+
+    async def run():
+        return await asyncio.gather(
+            validator.compute_clip_similarity(b"a", "bills"),
+            validator.compute_clip_similarity(b"bb", "bills"),
+            validator.compute_clip_similarity(b"ccc", "bills"),
+        )
+
+    scores = asyncio.run(run())
+
+    assert scores == [0.1, 0.2, 0.3]
+    assert batches == [([b"a", b"bb", b"ccc"], "bills")]
+
+
+def test_batches_are_split_by_size_and_failures_score_neutral(monkeypatch):
+    validator = _validator(clip_batch_size=2)
+    calls = []
+
+    def fake_score_batch(images, query):
+        calls.append(len(images))
+        if len(calls) == 2:
+            raise RuntimeError("boom")
+        return [0.9] * len(images)
+
+    monkeypatch.setattr(validator, "_score_batch", fake_score_batch)
+
+    scores = asyncio.run(validator.compute_clip_similarities([b"1", b"2", b"3"], "bills"))
+
+    assert calls == [2, 1]
+    assert scores == [0.9, 0.9, 0.5]
@@ -0,0 +1,78 @@
+import json
+from types import SimpleNamespace
+
+from src.functions.knowledge_extraction.core.batch.result_processor import BatchResultProcessor
+
+
+class FakeWriter:
+    client = None
+
+    def __init__(self):
+        self.topics = []
+        self.entities = []
+
+    def write_fact_topics(self, news_fact_id, topics, llm_model, dry_run):
+        self.topics.append(news_fact_id)
+        return len(topics)
+
+    def write_fact_entities(self, news_fact_id, entities, llm_model, dry_run):
+        self.entities.append(news_fact_id)
+        return len(entities)
+
+    def update_article_metrics(self, news_url_id, dry_run):
+        pass
+
+
+class FakeReader:
+    def get_facts_for_url(self, group_id):
+        return [{"id": f"{group_id}-fact"}]
+
+    def get_existing_topic_fact_ids(self, fact_ids):
+        return []
+
+    def get_existing_entity_fact_ids(self, fact_ids):
+        return []
+
+
+class FakeResolver:
+    def resolve_team(self, mention_text, context=None):
+        return SimpleNamespace(mention_text=mention_text)
+
+
+class FakeTracker:
+    def __init__(self):
+        self.completed = []
+
+    def mark_complete_for_url_ids(self, url_ids):
+        self.completed.extend(url_ids)
+
+
+def _line(request_type, group_id):
+    if request_type == "topic":
+        text = json.dumps({"topics": [{"topic": "Defense & Turnovers", "confidence": 0.9, "rank": 1}]})
+    else:
+        text = json.dumps({"entities": [{"entity_type": "team", "mention_text": "Bills"}]})
+    body = {"model": "gpt-test", "output_text": text}
+    return json.dumps({"custom_id": f"{request_type}_{group_id}", "response": {"status_code": 200, "body": body}})
+
+
+def test_group_split_across_windows_is_processed_once_with_both_halves(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "src.functions.knowledge_extraction.core.batch.result_processor.KnowledgeCompletionTracker",
+        lambda client=None: FakeTracker(),
+    )
+    output = tmp_path / "output.jsonl"
+    output.write_text(
+        "\n".join([_line("topic", "g1"), _line("topic", "g2"), _line("entity", "g2"), _line("entity", "g1")]) + "\n"
+    )
+    writer = FakeWriter()
+    processor = BatchResultProcessor(
+        writer=writer, entity_resolver=FakeResolver(), reader=FakeReader(), window_size=1
+    )
+
+    result = processor.process(output)
+
+    assert result.groups_processed == 2
+    assert sorted(processor.completion_tracker.completed) == ["g1", "g2"]
+    assert sorted(writer.topics) == sorted(writer.entities) == ["g1-fact", "g2-fact"]
+    assert (result.topics_extracted, result.entities_extracted) == (2, 2)
@@ -0,0 +1,162 @@
+import json
+import re
+import threading
+import time
+from types import SimpleNamespace
+
+import httpx
+from openai import RateLimitError
+
+from src.functions.knowledge_extraction.core.extraction import entity_extractor
+from src.functions.knowledge_extraction.core.extraction.entity_extractor import (
+    EntityExtractor,
+    pack_facts,
+)
+
+_FACT_LINE = re.compile(r"^(\d+)\. (.*)$", re.MULTILINE)
+
+
+class FakeResponses:
+    """Answers batched prompts; truncates replies for more than *max_ok* facts."""
+
+    def __init__(self, max_ok=100, skip=()):
+        self.max_ok = max_ok
+        self.skip = set(skip)
+        self.sizes = []
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def create(self, input, **_kwargs):
+        facts = _FACT_LINE.findall(input)
+        with self.lock:
+            self.sizes.append(len(facts))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.01)
+        with self.lock:
+            self.active -= 1
+        items = [
+            {"fact_index": int(index), "entities": [{"type": "team", "mention_text": text.split()[0]}]}
+            for index, text in facts
+            if text.split()[0] not in self.skip
+        ]
+        output = json.dumps(items)
+        if len(facts) > self.max_ok:
+            output = output[: len(output) // 2]
+        return SimpleNamespace(output_text=output, usage=SimpleNamespace(total_tokens=100))
+
+
+def _extractor(monkeypatch, responses):
+    monkeypatch.setattr(entity_extractor, "openai", SimpleNamespace(responses=responses, api_key=None))
+    return EntityExtractor(api_key="test", max_retries=2)
+
+
+def _facts(count, words=6):
+    return [{"id": f"f{i}", "fact_text": f"Team{i} " + "word " * words} for i in range(count)]
+
+
+def test_pack_facts_fills_token_budget():
+    short = pack_facts(_facts(60, words=4))
+    long = pack_facts(_facts(20, words=120))
+
+    assert [len(chunk) for chunk in short] == [40, 20]
+    assert all(len(chunk) < 15 for chunk in long)
+    assert pack_facts(_facts(1, words=5000)) == [_facts(1, words=5000)]
+
+
+def test_extract_multi_runs_chunks_concurrently_and_splits_unparseable_ones(monkeypatch):
+    responses = FakeResponses(max_ok=5)
+    extractor = _extractor(monkeypatch, responses)
+    facts = _facts(24) + [{"id": "empty", "fact_text": ""}]
+
+    results = extractor.extract_multi(facts, chunk_size=12, max_workers=2)
+
+    assert set(results) == {f"f{i}" for i in range(24)}
+    assert all(results[f"f{i}"][0].mention_text == f"Team{i}" for i in range(24))
+    assert responses.sizes.count(12) == 2
+    assert sorted(set(responses.sizes)) == [3, 6, 12]
+    assert responses.max_active == 2
+
+
+def test_facts_missing_from_a_response_are_requested_again(monkeypatch):
+    responses = FakeResponses(skip={"Team3"})
+    extractor = _extractor(monkeypatch, responses)
+
+    results = extractor.extract_multi(_facts(5))
+
+    assert responses.sizes == [5, 1]
+    assert results["f3"] == []
+    assert len(results["f0"]) == 1
+
+
+class FakeLimiter:
+    def __init__(self):
+        self.rate_limited = []
+
+    def acquire(self, tokens=0, timeout=None):
+        pass
+
+    def record_success(self, headers=None, *, tokens_used=None, estimated_tokens=0):
+        pass
+
+    def record_rate_limited(self, retry_after=None, headers=None, *, attempt=0):
+        self.rate_limited.append(attempt)
+        return 2.0
+
+
+def test_rate_limit_retries_on_the_shared_cooldown_without_sleeping(monkeypatch):
+    responses = FakeResponses()
+    calls = []
+
+    def create(input, **kwargs):
+        calls.append(input)
+        if len(calls) == 1:
+            request = httpx.Request("POST", "https://api.openai.com/v1/responses")
+            raise RateLimitError("429", response=httpx.Response(429, request=request), body=None)
+        return FakeResponses.create(responses, input, **kwargs)
+
+    responses.create = create
+    extractor = _extractor(monkeypatch, responses)
+    extractor._rate_limiter = FakeLimiter()
+    sleeps = []
+    monkeypatch.setattr(entity_extractor, "time", SimpleNamespace(time=time.time, sleep=sleeps.append))
+
+    results = extractor.extract_multi(_facts(3))
+
+    assert len(results) == 3 and all(results.values())
+    assert extractor._rate_limiter.rate_limited == [0]
+    assert sleeps == []
+
+
+def test_open_breaker_stops_splitting_and_re_requests(monkeypatch):
+    responses = FakeResponses(max_ok=0)
+    extractor = _extractor(monkeypatch, responses)
+
+    results = extractor.extract_multi(_facts(40))
+
+    assert results == {f"f{i}": [] for i in range(40)}
+    # 40 -> 20 -> 10 -> 5, retried whole at the depth cap, then the breaker opens.
+    assert responses.sizes == [40, 20, 10, 5, 5]
+    assert len(responses.sizes) == extractor.circuit_breaker_threshold
+
+
+
+class FirstFactOnly(FakeResponses):
+    """Answers only the first fact of every request."""
+
+    def create(self, input, **kwargs):
+        first = _FACT_LINE.search(input)
+        self.skip = {text.split()[0] for _, text in _FACT_LINE.findall(input)} - {first.group(2).split()[0]}
+        return super().create(input, **kwargs)
+
+
+def test_re_requests_stop_at_the_split_depth(monkeypatch):
+    responses = FirstFactOnly()
+    extractor = _extractor(monkeypatch, responses)
+
+    results = extractor.extract_multi(_facts(6))
+
+    assert responses.sizes == [6, 5, 4, 3]
+    assert [fid for fid, entities in results.items() if entities] == ["f0", "f1", "f2", "f3"]
+    assert set(results) == {f"f{i}" for i in range(6)}
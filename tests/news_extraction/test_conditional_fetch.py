@@ -0,0 +1,134 @@
+"""Conditional GETs against the persistent HTTP validator cache."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import pytest
+
+from src.functions.news_extraction.core.extractors.rss import RssExtractor
+from src.functions.news_extraction.core.extractors.sitemap import SitemapExtractor
+from src.functions.news_extraction.core.utils.client import HttpClient
+from src.functions.news_extraction.core.utils.validators import LocalValidatorStore
+
+FEED = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>t</title>
+<item><title>Story</title><link>https://example.com/nfl/story</link></item>
+</channel></rss>"""
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, content: bytes = b"", headers: Optional[Dict[str, str]] = None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+class ScriptedSession:
+    """Replays responses and records the headers each request carried."""
+
+    def __init__(self, responses: List[FakeResponse]):
+        self.responses = list(responses)
+        self.sent_headers: List[Dict[str, str]] = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.sent_headers.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+    def close(self):
+        pass
+
+
+@dataclass
+class FakeSource:
+    name: str = "Example"
+    url: str = "https://example.com/feed"
+    type: str = "rss"
+    publisher: str = "Example"
+    nfl_only: bool = False
+    max_articles: Optional[int] = None
+    days_back: Optional[int] = None
+
+    def get_url(self, **kwargs):
+        return self.url
+
+
+def _client(tmp_path, responses):
+    store = LocalValidatorStore(str(tmp_path / "validators.db"))
+    client = HttpClient(validator_store=store)
+    client.session = ScriptedSession(responses)
+    return client, store
+
+
+def test_validators_are_sent_back_and_304_skips_the_feed(tmp_path):
+    client, store = _client(
+        tmp_path,
+        [
+            FakeResponse(200, FEED, {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+            FakeResponse(304),
+        ],
+    )
+    extractor = RssExtractor(client)
+
+    assert len(extractor.extract(FakeSource())) == 1
+    assert client.commit_validators() == 1
+
+    assert extractor.extract(FakeSource()) == []
+    assert client.session.sent_headers[1] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }
+    assert client.get_conditional_stats()["not_modified"] == 1
+    assert store.get("https://example.com/feed").etag == '"v1"'
+
+
+def test_identical_body_is_skipped_without_server_validators(tmp_path):
+    client, _ = _client(tmp_path, [FakeResponse(200, FEED), FakeResponse(200, FEED)])
+    extractor = RssExtractor(client)
+
+    assert len(extractor.extract(FakeSource())) == 1
+    client.commit_validators()
+
+    assert extractor.extract(FakeSource()) == []
+    assert client.get_conditional_stats()["unchanged_body"] == 1
+
+
+def test_discarded_validators_do_not_suppress_the_next_fetch(tmp_path):
+    client, store = _client(tmp_path, [FakeResponse(200, FEED), FakeResponse(200, FEED)])
+    extractor = RssExtractor(client)
+
+    extractor.extract(FakeSource())
+    client.discard_validators()  # e.g. the database write failed
+
+    assert store.get("https://example.com/feed") is None
+    assert len(extractor.extract(FakeSource())) == 1
+
+
+def test_failed_extraction_does_not_commit_its_validators(tmp_path):
+    client, store = _client(tmp_path, [FakeResponse(200, b"<urlset"), FakeResponse(200, b"<urlset")])
+    extractor = SitemapExtractor(client)
+    source = FakeSource(type="sitemap", url="https://example.com/sitemap.xml")
+
+    with pytest.raises(RuntimeError):
+        extractor.extract(source)
+    assert client.commit_validators() == 0
+
+    with pytest.raises(RuntimeError):
+        extractor.extract(source)
+    assert client.session.sent_headers[1] == {}
+    assert store.get("https://example.com/sitemap.xml") is None
+
+
+def test_unchanged_body_read_with_other_limits_is_extracted_again(tmp_path):
+    client, _ = _client(tmp_path, [FakeResponse(200, FEED), FakeResponse(200, FEED), FakeResponse(200, FEED)])
+    extractor = RssExtractor(client)
+
+    assert len(extractor.extract(FakeSource(), max_articles=1)) == 1
+    client.commit_validators()
+
+    assert len(extractor.extract(FakeSource(), max_articles=5)) == 1
+    assert extractor.extract(FakeSource(), max_articles=1) == []
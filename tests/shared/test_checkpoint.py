@@ -0,0 +1,87 @@
+import json
+
+from src.shared.batch.checkpoint import CheckpointManager
+
+
+def test_marks_are_journaled_and_replayed_without_flush(tmp_path):
+    path = tmp_path / "run.json"
+    checkpoint = CheckpointManager(str(path))
+    checkpoint.mark_stage_complete("a1", "facts")
+    checkpoint.mark_stage_complete("a2", "content")
+
+    assert not path.exists()
+    assert len(checkpoint.journal_path.read_text().splitlines()) == 2
+
+    resumed = CheckpointManager(str(path))
+    assert resumed.is_stage_complete("a1", "facts")
+    assert resumed.is_stage_complete("a2", "content")
+    assert not resumed.is_stage_complete("a1", "summary")
+    assert resumed.get_incomplete_articles("facts", ["a1", "a2", "a3"]) == ["a2", "a3"]
+
+
+def test_flush_compacts_journal_into_snapshot(tmp_path):
+    path = tmp_path / "run.json"
+    checkpoint = CheckpointManager(str(path), compact_every=3)
+    for article_id in ("a1", "a2", "a3"):
+        checkpoint.mark_stage_complete(article_id, "content")
+    checkpoint.flush()
+
+    snapshot = json.loads(path.read_text())
+    assert set(snapshot["articles"]) == {"a1", "a2", "a3"}
+    assert checkpoint.journal_path.read_text() == ""
+
+    checkpoint.mark_stage_complete("a4", "content")
+    resumed = CheckpointManager(str(path))
+    assert resumed.get_stats()["stage_counts"]["content"] == 4
+
+
+def test_torn_journal_tail_and_clear_are_handled(tmp_path):
+    path = tmp_path / "run.json"
+    checkpoint = CheckpointManager(str(path))
+    checkpoint.mark_stage_complete("old", "facts")
+    checkpoint.clear()
+    checkpoint.mark_stage_complete("new", "facts")
+    with open(checkpoint.journal_path, "a") as handle:
+        handle.write('{"a": "partial", "s": "fa')
+
+    resumed = CheckpointManager(str(path))
+    assert not resumed.is_stage_complete("old", "facts")
+    assert resumed.is_stage_complete("new", "facts")
+    assert not resumed.is_stage_complete("partial", "facts")
+
+
+def test_archive_includes_journaled_entries(tmp_path):
+    path = tmp_path / "run.json"
+    checkpoint = CheckpointManager(str(path))
+    checkpoint.mark_stage_complete("a1", "summary")
+
+    archive = checkpoint.archive("20260101")
+
+    assert archive is not None
+    assert "a1" in json.loads(archive.read_text())["articles"]
+
+
+def test_first_flush_writes_snapshot_so_a_crashed_run_resumes(tmp_path):
+    path = tmp_path / "run.json"
+    checkpoint = CheckpointManager(str(path))
+    assert not checkpoint.exists()
+
+    checkpoint.mark_stage_complete("a1", "content")
+    checkpoint.flush()
+    checkpoint.mark_stage_complete("a2", "content")
+    checkpoint.flush()
+    # Crash: close() is never called.
+
+    assert set(json.loads(path.read_text())["articles"]) == {"a1"}
+    resumed = CheckpointManager(str(path))
+    assert resumed.exists()
+    assert resumed.get_incomplete_articles("content", ["a1", "a2", "a3"]) == ["a3"]
+
+
+def test_exists_counts_a_journal_without_snapshot(tmp_path):
+    path = tmp_path / "run.json"
+    CheckpointManager(str(path)).mark_stage_complete("a1", "facts")
+
+    resumed = CheckpointManager(str(path))
+    assert not path.exists()
+    assert resumed.exists()
@@ -0,0 +1,109 @@
+"""Shared adaptive rate limiter: cross-instance budget, AIMD and header hints."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.shared.utils.rate_limiter import (
+    AdaptiveRateLimiter,
+    RateLimitTimeout,
+    parse_duration,
+    parse_rate_limit_headers,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _limiter(path, clock, **kwargs) -> AdaptiveRateLimiter:
+    kwargs.setdefault("requests_per_minute", 2)
+    return AdaptiveRateLimiter("openai", "gpt-test", path=str(path), clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_instances_on_one_store_share_the_budget(tmp_path) -> None:
+    clock = FakeClock()
+    first = _limiter(tmp_path / "limits.db", clock)
+    second = _limiter(tmp_path / "limits.db", clock)
+
+    first.acquire()
+    second.acquire()
+    with pytest.raises(RateLimitTimeout):
+        first.acquire(timeout=0)
+
+    second.acquire()
+    assert clock.now == pytest.approx(1_030.0, abs=0.05)
+    assert first.get_stats()["shared_total_requests"] == 3
+
+
+def test_rate_limit_halves_rate_once_per_burst_and_recovers(tmp_path) -> None:
+    clock = FakeClock()
+    limiter = _limiter(tmp_path / "limits.db", clock, requests_per_minute=60)
+    other = _limiter(tmp_path / "limits.db", clock, requests_per_minute=60)
+
+    assert limiter.record_rate_limited(retry_after=3) == 3
+    other.handle_429(attempt=0)
+    stats = other.get_stats()
+    assert stats["rate_factor"] == 0.5
+    assert stats["rate_per_minute"] == 30
+    assert stats["shared_rate_limit_hits"] == 2
+
+    limiter.acquire()
+    assert clock.now >= 1_003.0
+
+    for _ in range(20):
+        limiter.record_success()
+    assert limiter.get_stats()["rate_factor"] == 1.0
+
+
+def test_token_budget_and_response_headers(tmp_path) -> None:
+    clock = FakeClock()
+    limiter = _limiter(tmp_path / "limits.db", clock, requests_per_minute=100, tokens_per_minute=100)
+
+    limiter.acquire(tokens=80)
+    with pytest.raises(RateLimitTimeout):
+        limiter.acquire(tokens=50, timeout=1)
+    # Actual usage was lower than estimated, so the difference is refunded.
+    limiter.record_success(tokens_used=40, estimated_tokens=80)
+    limiter.acquire(tokens=50, timeout=0)
+
+    limiter.record_success({"X-RateLimit-Remaining-Requests": "0", "X-RateLimit-Reset-Requests": "2s"})
+    assert limiter.get_stats()["cooldown_seconds"] == pytest.approx(2.0)
+
+
+def test_header_parsing() -> None:
+    assert parse_duration("6m0s") == 360.0
+    assert parse_duration("20ms") == pytest.approx(0.02)
+    assert parse_duration("soon") is None
+
+    hints = parse_rate_limit_headers({"retry-after-ms": "1500", "x-ratelimit-limit-tokens": "200000"})
+    assert hints.retry_after == 1.5
+    assert hints.limit_tokens == 200_000
+
+
+def test_conflicting_limits_for_one_model_use_the_lower(monkeypatch, tmp_path, caplog) -> None:
+    from src.shared.utils import rate_limiter
+
+    monkeypatch.setattr(rate_limiter, "_limiters", {})
+    monkeypatch.setattr(rate_limiter, "_requested_limits", {})
+    monkeypatch.setenv("LLM_RATE_LIMIT_PATH", str(tmp_path / "limits.db"))
+
+    shared = rate_limiter.get_rate_limiter("gemini", "flash")
+    assert shared.requests_per_minute == rate_limiter.DEFAULT_REQUESTS_PER_MINUTE
+
+    # An explicit limit replaces the default without a conflict.
+    assert rate_limiter.get_rate_limiter("gemini", "flash", requests_per_minute=100) is shared
+    assert shared.requests_per_minute == 100
+    assert not caplog.records
+
+    rate_limiter.get_rate_limiter("gemini", "flash", requests_per_minute=30)
+    rate_limiter.get_rate_limiter("gemini", "flash", requests_per_minute=100)
+    assert shared.requests_per_minute == 30
+    assert "Conflicting requests_per_minute" in caplog.text
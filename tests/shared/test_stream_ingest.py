@@ -0,0 +1,126 @@
+import json
+
+import pytest
+
+from src.shared.batch.stream_ingest import IngestProgress, StreamingIngestor
+
+
+def _write_output(path, custom_ids):
+    with path.open("w") as f:
+        for custom_id in custom_ids:
+            f.write(json.dumps({"custom_id": custom_id, "response": {"status_code": 200}}) + "\n")
+
+
+def _key(record):
+    return record["custom_id"].split("_", 1)[0]
+
+
+def test_windows_group_records_by_key(tmp_path):
+    output = tmp_path / "output.jsonl"
+    _write_output(output, ["a_1", "a_2", "b_1", "c_1", "c_2", "d_1", "e_1"])
+
+    windows = []
+    stats = StreamingIngestor(output, key_fn=_key, window_size=2).run(
+        lambda window: windows.append(window)
+    )
+
+    assert [w.keys for w in windows] == [["a", "b"], ["c", "d"], ["e"]]
+    assert [len(w.records) for w in windows] == [3, 3, 1]
+    assert stats.lines_read == 7
+    assert stats.windows_committed == 3
+    # A clean run leaves nothing behind to resume from.
+    assert not IngestProgress(output).path.exists()
+
+
+def test_finish_overlaps_next_write_and_keeps_order(tmp_path):
+    output = tmp_path / "output.jsonl"
+    _write_output(output, [f"k{i}_x" for i in range(6)])
+
+    events = []
+
+    def write(window):
+        events.append(("write", window.index))
+        return window.index
+
+    def finish(window, handoff):
+        assert handoff == window.index
+        events.append(("finish", window.index))
+
+    StreamingIngestor(output, key_fn=_key, window_size=2).run(write, finish)
+
+    finished = [index for kind, index in events if kind == "finish"]
+    assert finished == [0, 1, 2]
+    assert [index for kind, index in events if kind == "write"] == [0, 1, 2]
+
+
+def test_resume_after_failure_skips_committed_windows(tmp_path):
+    output = tmp_path / "output.jsonl"
+    _write_output(output, ["a_1", "b_1", "b_2", "c_1", "d_1"])
+
+    def failing_finish(window, _):
+        if "c" in window.keys:
+            raise RuntimeError("embedding service down")
+
+    with pytest.raises(RuntimeError):
+        StreamingIngestor(output, key_fn=_key, window_size=1, max_pending_windows=1).run(
+            lambda window: None, failing_finish
+        )
+
+    progress = IngestProgress(output)
+    assert progress.load(output.stat().st_size)
+    assert progress.keys == {"a", "b"}
+
+    seen = []
+    stats = StreamingIngestor(output, key_fn=_key, window_size=1).run(
+        lambda window: seen.append((window.keys, sorted(window.new_keys), window.replayed))
+    )
+
+    assert seen == [(["c"], ["c"], True), (["d"], ["d"], True)]
+    assert stats.resumed_from_line == 3
+
+    windows = []
+    StreamingIngestor(output, key_fn=_key).run(windows.append)
+    assert not windows[0].replayed
+
+
+def test_key_revisited_after_its_window_is_a_continuation(tmp_path):
+    output = tmp_path / "output.jsonl"
+    _write_output(output, ["a_1", "b_1", "a_2"])
+
+    windows = []
+    StreamingIngestor(output, key_fn=_key, window_size=1).run(windows.append)
+
+    assert windows[2].keys == ["a"]
+    assert windows[2].is_continuation("a")
+    assert not windows[0].is_continuation("a")
+
+
+def test_invalid_lines_are_reported_and_skipped(tmp_path):
+    output = tmp_path / "output.jsonl"
+    output.write_text('{"custom_id": "a_1"}\nnot json\n{"custom_id": "b_1"}\n')
+
+    invalid = []
+    windows = []
+    stats = StreamingIngestor(
+        output,
+        key_fn=_key,
+        on_invalid_line=lambda line, error: invalid.append(line),
+    ).run(windows.append)
+
+    assert invalid == [2]
+    assert stats.lines_invalid == 1
+    assert [line for line, _ in windows[0].records] == [1, 3]
+
+
+def test_stale_progress_is_discarded_when_file_changes(tmp_path):
+    output = tmp_path / "output.jsonl"
+    _write_output(output, ["a_1", "b_1"])
+
+    progress = IngestProgress(output)
+    progress.start(file_size=1)
+    progress.close()
+
+    windows = []
+    StreamingIngestor(output, key_fn=_key).run(windows.append)
+
+    assert windows[0].keys == ["a", "b"]
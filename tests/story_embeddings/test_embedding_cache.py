@@ -0,0 +1,76 @@
+from types import SimpleNamespace
+
+from src.functions.story_embeddings.core.llm.embedding_cache import (
+    EmbeddingCache,
+    LocalEmbeddingStore,
+    embedding_cache_key,
+)
+from src.functions.story_embeddings.core.llm.openai_client import OpenAIEmbeddingClient
+
+
+class FakeEmbeddings:
+    def __init__(self):
+        self.calls = []
+
+    def create(self, input, model):
+        inputs = [input] if isinstance(input, str) else list(input)
+        self.calls.append(inputs)
+        data = [SimpleNamespace(index=i, embedding=[float(len(text))]) for i, text in enumerate(inputs)]
+        return SimpleNamespace(data=data, usage=SimpleNamespace(total_tokens=10 * len(inputs)))
+
+
+def _client(cache):
+    client = OpenAIEmbeddingClient(api_key="test", cache=cache, batch_size=2)
+    client.client = SimpleNamespace(embeddings=FakeEmbeddings())
+    return client
+
+
+def test_batch_sends_only_deduplicated_misses_in_multi_input_requests(tmp_path):
+    cache = EmbeddingCache([LocalEmbeddingStore(str(tmp_path / "cache.db"))])
+    client = _client(cache)
+    client.generate_embedding("alpha")
+
+    results = client.generate_embeddings_batch(["alpha", "beta", "beta ", "gamma", "delta", ""])
+
+    calls = client.client.embeddings.calls
+    assert calls[0] == ["alpha"]
+    assert calls[1:] == [["beta", "gamma"], ["delta"]]
+    assert [r["embedding"] for r in results[:5]] == [[5.0], [4.0], [4.0], [5.0], [5.0]]
+    assert results[0]["cached"] is True
+    assert results[5]["embedding"] is None
+
+    stats = client.get_usage_stats()
+    assert stats["cache_hits"] == 1
+    assert stats["cache_misses"] == 4
+    assert stats["total_requests"] == 3
+
+
+def test_local_store_persists_across_instances(tmp_path):
+    path = str(tmp_path / "cache.db")
+    _client(EmbeddingCache([LocalEmbeddingStore(path)])).generate_embedding("same text")
+
+    client = _client(EmbeddingCache([LocalEmbeddingStore(path)]))
+    result = client.generate_embedding("same   text")
+
+    assert result["cached"] is True
+    assert client.client.embeddings.calls == []
+
+
+def test_hits_from_slower_store_backfill_faster_store(tmp_path):
+    class DictStore:
+        def __init__(self, data=None):
+            self.data = dict(data or {})
+
+        def get_many(self, keys):
+            return {key: self.data[key] for key in keys if key in self.data}
+
+        def set_many(self, entries):
+            self.data.update(entries)
+
+    key = embedding_cache_key("m", "text")
+    fast, slow = DictStore(), DictStore({key: [1.0]})
+    cache = EmbeddingCache([fast, slow])
+
+    assert cache.get_many([key]) == {key: [1.0]}
+    assert fast.data == {key: [1.0]}
+    assert cache.get_stats()["cache_hit_rate"] == 1.0
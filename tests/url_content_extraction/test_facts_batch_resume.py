@@ -0,0 +1,95 @@
+"""Replaying an uncommitted facts-batch window finishes half-written articles."""
+
+from __future__ import annotations
+
+import json
+
+from src.functions.url_content_extraction.core.facts_batch import result_processor
+from src.functions.url_content_extraction.core.facts_batch.result_processor import (
+    FactsBatchResultProcessor,
+)
+from src.shared.batch.stream_ingest import IngestProgress
+
+_FACTS = ["Josh Allen threw for 290 yards against Miami.", "James Cook ran for 95 yards on Sunday."]
+
+
+class FakeStore:
+    """Facts already inserted by a run that stopped before embedding article ``a``."""
+
+    def __init__(self) -> None:
+        self.facts = {"a": [{"id": "a-0", "fact_text": _FACTS[0]}, {"id": "a-1", "fact_text": _FACTS[1]}]}
+        self.embedded = {"a-0"}
+        self.marked = {}
+
+    # FactsReader
+    def check_existing_facts(self, article_ids, *, chunk_size):
+        return {article_id for article_id in article_ids if article_id in self.facts}
+
+    def fetch_facts_for_articles(self, article_ids, *, chunk_size):
+        return {article_id: self.facts[article_id] for article_id in article_ids if article_id in self.facts}
+
+    def check_existing_embeddings(self, fact_ids):
+        return self.embedded & set(fact_ids)
+
+    # FactsWriter
+    def insert_facts(self, facts_by_article, model, *, chunk_size):
+        ids, texts = {}, {}
+        for article_id, facts in facts_by_article.items():
+            ids[article_id] = [f"{article_id}-{i}" for i in range(len(facts))]
+            texts.update(zip(ids[article_id], facts))
+        return ids, texts
+
+    def mark_facts_extracted(self, facts_by_article, *, chunk_size):
+        self.marked.update({article_id: len(facts) for article_id, facts in facts_by_article.items()})
+
+
+def _processor(monkeypatch, store):
+    monkeypatch.setattr(result_processor, "get_supabase_client", lambda: object())
+    processor = FactsBatchResultProcessor(embedding_api_key="test")
+    processor._reader = processor._writer = store
+    embedded = []
+
+    def fake_embed(fact_ids, *, texts_by_id=None):
+        embedded.extend(fact_ids)
+        return len(fact_ids)
+
+    processor._bulk_create_embeddings = fake_embed
+    return processor, embedded
+
+
+def _write_output(path, article_ids):
+    content = json.dumps({"facts": _FACTS})
+    with path.open("w") as f:
+        for article_id in article_ids:
+            body = {"choices": [{"message": {"content": content}}]}
+            f.write(json.dumps({"custom_id": f"facts_{article_id}", "response": {"body": body}}) + "\n")
+
+
+def test_replayed_window_finishes_articles_written_before_the_crash(tmp_path, monkeypatch):
+    output = tmp_path / "output.jsonl"
+    _write_output(output, ["a", "b"])
+    # The failed run left a progress log without committing any window.
+    progress = IngestProgress(output)
+    progress.start(output.stat().st_size)
+    progress.close()
+    store = FakeStore()
+    processor, embedded = _processor(monkeypatch, store)
+
+    result = processor.process(output, model="gpt-test")
+
+    assert sorted(embedded) == ["a-1", "b-0", "b-1"]
+    assert store.marked == {"a": 2, "b": 2}
+    assert (result.articles_resumed, result.articles_processed, result.articles_skipped_existing) == (1, 1, 0)
+
+
+def test_fresh_run_still_skips_articles_with_facts(tmp_path, monkeypatch):
+    output = tmp_path / "output.jsonl"
+    _write_output(output, ["a", "b"])
+    store = FakeStore()
+    processor, embedded = _processor(monkeypatch, store)
+
+    result = processor.process(output, model="gpt-test")
+
+    assert sorted(embedded) == ["b-0", "b-1"]
+    assert store.marked == {"b": 2}
+    assert result.articles_skipped_existing == 1
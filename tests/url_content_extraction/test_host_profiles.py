@@ -0,0 +1,77 @@
+"""Learned host routing used by the shared extractor factory."""
+
+from __future__ import annotations
+
+from src.shared.extractors import extractor_factory
+from src.shared.extractors.host_profiles import HostRoutingTable
+from src.shared.extractors.light_extractor import LightExtractor
+from src.shared.extractors.playwright_extractor import PlaywrightExtractor
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_routing_learns_from_light_failures_and_forgets_after_decay() -> None:
+    clock = _Clock()
+    table = HostRoutingTable(half_life_hours=1, clock=clock)
+    url = "https://js.example.com/story"
+
+    assert table.prefers_playwright(url) is None
+    for _ in range(4):
+        table.record_light(url, success=False, paragraphs=0, seconds=0.4)
+    assert table.prefers_playwright(url) is True
+
+    # A day later the evidence has decayed below the threshold: try light again.
+    clock.now += 24 * 3600
+    assert table.prefers_playwright(url) is None
+
+
+def test_mostly_successful_light_host_stays_on_light() -> None:
+    table = HostRoutingTable(clock=_Clock())
+    url = "https://static.example.com/story"
+    for success in (True, True, True, False):
+        table.record_light(url, success=success, paragraphs=12 if success else 0, seconds=0.3)
+    table.record_playwright(url, success=True, seconds=6.0)
+
+    assert table.prefers_playwright(url) is False
+    assert table.get("static.example.com").light_paragraphs > 0
+
+
+def test_profiles_persist_across_instances(tmp_path) -> None:
+    path = str(tmp_path / "hosts.db")
+    first = HostRoutingTable(path, clock=_Clock())
+    for _ in range(3):
+        first.record_amp_probe("https://noamp.example.com/a", found=False)
+
+    second = HostRoutingTable(path, clock=_Clock())
+
+    assert second.should_probe_amp("https://noamp.example.com/b") is False
+    assert second.should_probe_amp("https://other.example.com/b") is True
+
+
+def test_factory_uses_learned_route_and_skips_known_no_amp_hosts(monkeypatch) -> None:
+    table = HostRoutingTable(clock=_Clock())
+    monkeypatch.setattr(extractor_factory, "get_host_routing", lambda: table)
+    probes: list[str] = []
+
+    def fake_probe(url, **_kwargs):
+        probes.append(url)
+        return url, False
+
+    monkeypatch.setattr(extractor_factory.amp_detector, "probe_for_amp", fake_probe)
+
+    url = "https://newsite.example.com/nfl/story"
+    assert isinstance(extractor_factory.get_extractor(url), LightExtractor)
+    for _ in range(3):
+        table.record_light(url, success=False, paragraphs=0, seconds=1.0)
+    assert isinstance(extractor_factory.get_extractor(url), PlaywrightExtractor)
+    assert extractor_factory.is_heavy_url(url)
+
+    for _ in range(4):
+        extractor_factory.probe_amp(url)
+    assert len(probes) == 3
@@ -0,0 +1,56 @@
+"""HTML archive recording and offline replay through the shared extractors."""
+
+from __future__ import annotations
+
+import httpx
+
+from src.shared.extractors import extractor_factory, light_extractor
+from src.shared.extractors.html_archive import HtmlArchive
+from src.shared.extractors.light_extractor import LightExtractor
+
+_ARTICLE = (
+    "<html><head><title>Bills win</title></head><body><article>"
+    + "".join(f"<p>Paragraph {i} describes the game in plenty of useful detail for readers.</p>" for i in range(6))
+    + "</article></body></html>"
+)
+
+
+def test_archive_deduplicates_blobs_and_returns_latest(tmp_path) -> None:
+    archive = HtmlArchive(str(tmp_path))
+    first = archive.put("https://a.example.com/x", _ARTICLE, extractor="light")
+    second = archive.put("https://b.example.com/y", _ARTICLE, extractor="playwright")
+
+    assert first == second
+    assert len(list((tmp_path / "blobs").rglob("*.html.*"))) == 1
+    page = archive.latest("https://b.example.com/y")
+    assert page is not None and page.html == _ARTICLE and page.extractor == "playwright"
+    assert archive.latest("https://missing.example.com/") is None
+
+
+def test_recorded_page_replays_without_network(tmp_path, monkeypatch) -> None:
+    url = "https://news.example.com/story"
+    recorder = HtmlArchive(str(tmp_path))
+    monkeypatch.setattr(light_extractor, "get_html_archive", lambda: recorder)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=_ARTICLE)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(light_extractor, "_get_shared_client", lambda: client)
+    recorded = LightExtractor().extract(url)
+    assert recorded.is_valid()
+
+    replayer = HtmlArchive(str(tmp_path), mode="replay")
+    monkeypatch.setattr(light_extractor, "get_html_archive", lambda: replayer)
+    monkeypatch.setattr(extractor_factory, "get_html_archive", lambda: replayer)
+
+    def no_network():
+        raise AssertionError("replay must not fetch")
+
+    monkeypatch.setattr(light_extractor, "_get_shared_client", no_network)
+    replayed = LightExtractor().extract(url)
+
+    assert replayed.paragraphs == recorded.paragraphs
+    assert replayed.metadata.extractor == "replay:light"
+    assert LightExtractor().extract_many([url, "https://news.example.com/other"])[1].error == "Not in HTML archive"
+    assert extractor_factory.probe_amp(url) == (url, False)
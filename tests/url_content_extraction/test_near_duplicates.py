@@ -0,0 +1,94 @@
+"""Near-duplicate detection and fact linking for the facts batch."""
+
+from __future__ import annotations
+
+from src.functions.url_content_extraction.core.facts_batch.near_duplicates import (
+    find_near_duplicates,
+    link_near_duplicates,
+)
+from src.shared.processors.near_duplicates import NearDuplicateIndex, minhash_signature
+
+_WIRE = "\n\n".join(
+    [
+        "The Buffalo Bills beat the Miami Dolphins 31-10 on Sunday behind three touchdown passes from Josh Allen.",
+        "Allen completed 24 of 33 attempts for 290 yards and ran for another 41 yards in the second half.",
+        "James Cook added 95 rushing yards as Buffalo improved to 6-2 and stayed atop the AFC East standings.",
+        "Miami lost its third straight game and will host the New York Jets next week at Hard Rock Stadium.",
+    ]
+)
+_OTHER = "\n\n".join(
+    [
+        "The Kansas City Chiefs signed a veteran linebacker to the practice squad on Tuesday morning.",
+        "Coach Andy Reid said the team needed depth after injuries piled up during the last two games.",
+        "The linebacker spent four seasons with the Denver Broncos and started eleven games last year.",
+    ]
+)
+
+
+def test_minhash_index_matches_lightly_edited_copy_only() -> None:
+    index = NearDuplicateIndex()
+    index.add("original", minhash_signature(_WIRE))
+
+    copy = "MIAMI GARDENS, Fla. (AP) — " + _WIRE
+    match = index.query(minhash_signature(copy))
+    assert match is not None and match[0] == "original" and match[1] >= 0.8
+    assert index.query(minhash_signature(_OTHER)) is None
+    assert minhash_signature("Too short to fingerprint.") is None
+
+
+def test_find_near_duplicates_links_to_prior_and_in_batch_canonicals() -> None:
+    articles = [{"id": "a"}, {"id": "b"}, {"id": "c"}, {"id": "d"}]
+    contents = {"a": _OTHER, "b": _OTHER + "\n\nStory via team release.", "c": _WIRE, "d": "Short."}
+
+    report, rows = find_near_duplicates(
+        articles,
+        contents,
+        prior={"old": minhash_signature(_WIRE)},
+        threshold=0.8,
+        prompt="Extract facts.",
+    )
+
+    assert report.links == {"b": "a", "c": "old"}
+    assert report.pending_links == {"b": "a"}
+    assert report.existing_links == {"c": "old"}
+    assert report.estimated_tokens_avoided > 0
+    assert {row["news_url_id"]: row["canonical_news_url_id"] for row in rows} == {"a": None, "b": "a", "c": "old"}
+
+
+class _Reader:
+    def fetch_facts_for_articles(self, article_ids, **_kwargs):
+        return {"canon": [{"id": "f1", "fact_text": "Bills won.", "llm_model": "gpt-5-nano"},
+                          {"id": "f2", "fact_text": "Allen threw 3 TDs.", "llm_model": "gpt-5-nano"}]}
+
+    def fetch_fact_embedding_rows(self, fact_ids, **_kwargs):
+        return {"f1": {"embedding_vector": [0.1, 0.2], "model_name": "emb"}}
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self.inserted = {}
+        self.embeddings = []
+        self.marked = {}
+
+    def insert_facts(self, facts_by_article, model, **_kwargs):
+        self.inserted.update(facts_by_article)
+        ids = {aid: [f"{aid}-{i}" for i in range(len(facts))] for aid, facts in facts_by_article.items()}
+        return ids, {}
+
+    def insert_fact_embeddings(self, records, **_kwargs):
+        self.embeddings.extend(records)
+        return len(records)
+
+    def mark_facts_extracted(self, facts_by_article, **_kwargs):
+        self.marked.update(facts_by_article)
+
+
+def test_link_copies_facts_and_embeddings_but_skips_canonicals_without_facts() -> None:
+    writer = _Writer()
+
+    linked = link_near_duplicates(_Reader(), writer, {"dup": "canon", "orphan": "missing"})
+
+    assert linked == 1
+    assert writer.inserted == {"dup": ["Bills won.", "Allen threw 3 TDs."]}
+    assert writer.embeddings == [{"news_fact_id": "dup-0", "embedding_vector": [0.1, 0.2], "model_name": "emb"}]
+    assert set(writer.marked) == {"dup"}
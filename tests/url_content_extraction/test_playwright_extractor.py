@@ -2,7 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
+
+from src.shared.contracts.extracted_content import ExtractedContent
+from src.shared.extractors import playwright_extractor as playwright_module
 from src.shared.extractors.playwright_extractor import PlaywrightExtractor
+from src.shared.extractors.readiness import ReadinessTimings, wait_for_content
+from src.shared.extractors.resource_blocking import (
+    ResourceBlockingProfile,
+    ResourceBlockStats,
+    install_blocking,
+)
 from src.shared.processors.content_cleaner import clean_content
 
 
@@ -42,3 +54,172 @@ def test_parse_html_handles_espn_like_markup() -> None:
     assert len(cleaned.paragraphs) == 3
     assert cleaned.paragraphs[0].startswith("Atlanta Falcons coach Raheem Morris")
     assert cleaned.quotes == ['"We believe in what we\'re building," Morris said.']
+
+
+class _FakeClosable:
+    async def close(self) -> None:
+        pass
+
+
+def test_extract_many_overlaps_pages_and_respects_host_limit(monkeypatch) -> None:
+    @asynccontextmanager
+    async def fake_async_playwright():
+        yield object()
+
+    monkeypatch.setattr(playwright_module, "async_playwright", fake_async_playwright)
+
+    extractor = PlaywrightExtractor(max_pages=3, max_contexts=2, max_pages_per_host=1)
+    active: dict[str, int] = {}
+    peak_per_host: dict[str, int] = {}
+
+    async def launch(_playwright):
+        return _FakeClosable()
+
+    async def new_context(_browser):
+        return _FakeClosable()
+
+    async def extract_one(_context, options):
+        host = urlparse(str(options.url)).hostname
+        active[host] = active.get(host, 0) + 1
+        peak_per_host[host] = max(peak_per_host.get(host, 0), active[host])
+        await asyncio.sleep(0.01)
+        active[host] -= 1
+        return ExtractedContent(url=str(options.url), paragraphs=[host])
+
+    monkeypatch.setattr(extractor, "_launch_browser", launch)
+    monkeypatch.setattr(extractor, "_new_context", new_context)
+    monkeypatch.setattr(extractor, "_extract_one", extract_one)
+
+    urls = [
+        "https://a.example.com/1",
+        "https://b.example.com/1",
+        "https://a.example.com/2",
+        "https://c.example.com/1",
+        "not a url",
+    ]
+    results = extractor.extract_many(urls, timeout=10)
+
+    assert [r.url for r in results[:4]] == urls[:4]
+    assert results[4].error
+    assert max(peak_per_host.values()) == 1
+    stats = extractor.last_batch_stats
+    assert stats.peak_pages == 3
+    assert stats.contexts == 2
+    assert stats.pages_by_host["a.example.com"] == 2
+
+
+class _FakeRequest:
+    def __init__(self, url: str, resource_type: str, navigation: bool = False):
+        self.url = url
+        self.resource_type = resource_type
+        self._navigation = navigation
+
+    def is_navigation_request(self) -> bool:
+        return self._navigation
+
+
+class _FakeRoute:
+    def __init__(self, request: _FakeRequest):
+        self.request = request
+        self.outcome = None
+
+    async def continue_(self) -> None:
+        self.outcome = "continue"
+
+    async def abort(self) -> None:
+        self.outcome = "abort"
+
+
+class _FakePage:
+    def __init__(self):
+        self.handler = None
+
+    async def route(self, _pattern, handler) -> None:
+        self.handler = handler
+
+
+def test_resource_blocking_aborts_heavy_subresources_only() -> None:
+    profile = ResourceBlockingProfile(allow_hosts=frozenset({"fragile.example.com"}))
+    stats = ResourceBlockStats()
+    page = _FakePage()
+
+    requests = [
+        _FakeRequest("https://www.espn.com/nfl/story", "document", navigation=True),
+        _FakeRequest("https://a.espncdn.com/photo.jpg", "image"),
+        _FakeRequest("https://securepubads.g.doubleclick.net/tag.js", "script"),
+        _FakeRequest("https://a.espncdn.com/app.js", "script"),
+        _FakeRequest("https://fonts.gstatic.com/roboto.woff2", "font"),
+    ]
+
+    async def drive():
+        await install_blocking(page, profile, stats)
+        routes = [_FakeRoute(request) for request in requests]
+        for route in routes:
+            await page.handler(route)
+        return [route.outcome for route in routes]
+
+    outcomes = asyncio.run(drive())
+
+    assert outcomes == ["continue", "abort", "abort", "continue", "abort"]
+    summary = stats.to_dict()
+    assert summary["requests_blocked"] == 3
+    assert summary["blocked_by_reason"] == {"image": 1, "tracker": 1, "font": 1}
+    assert summary["estimated_bytes_saved"] > 0
+    assert profile.applies_to("https://www.espn.com/nfl/story")
+    assert not profile.applies_to("https://fragile.example.com/story")
+
+
+class _ProbePage:
+    def __init__(self, outcome=None, error: Exception | None = None):
+        self.outcome = outcome
+        self.error = error
+        self.slept_ms: list[int] = []
+        self.probe_args = None
+
+    async def evaluate(self, _script, args):
+        self.probe_args = args
+        if self.error:
+            raise self.error
+        return self.outcome
+
+    async def wait_for_timeout(self, ms):
+        self.slept_ms.append(ms)
+
+
+def test_wait_for_content_returns_probe_result_and_caps_on_failure() -> None:
+    ready_page = _ProbePage({"ms": 420, "chars": 3200, "stable": True})
+    result = asyncio.run(wait_for_content(ready_page, max_ms=3500))
+
+    assert (result.elapsed_ms, result.stable) == (420, True)
+    assert ready_page.probe_args["maxMs"] == 3500
+    assert ready_page.probe_args["paragraphSelectors"] == ["p"]
+    assert ready_page.slept_ms == []
+
+    broken_page = _ProbePage(error=RuntimeError("Execution context was destroyed"))
+    fallback = asyncio.run(wait_for_content(broken_page, max_ms=500))
+
+    assert broken_page.slept_ms == [500]
+    assert (fallback.elapsed_ms, fallback.stable) == (500, False)
+
+
+def test_extractor_probes_readiness_with_its_parsing_selectors() -> None:
+    page = _ProbePage({"ms": 300, "chars": 900, "stable": True})
+    extractor = PlaywrightExtractor()
+
+    asyncio.run(extractor._wait_for_content(page, max_ms=3500))
+
+    assert page.probe_args["contentSelectors"] == list(PlaywrightExtractor._CONTENT_SELECTORS)
+    assert page.probe_args["paragraphSelectors"] == list(PlaywrightExtractor._PARAGRAPH_SELECTORS)
+    assert "div[data-testid='Paragraph']" in page.probe_args["paragraphSelectors"]
+
+
+def test_readiness_timings_report_percentiles_per_host() -> None:
+    timings = ReadinessTimings()
+    for ms in (100, 200, 300, 400, 3500):
+        timings.record("https://www.espn.com/nfl/story/1", ms, stable=ms < 3500)
+    timings.record("https://apnews.com/article/x", 250, stable=True)
+
+    summary = timings.summary()
+
+    assert summary["www.espn.com"] == {"count": 5, "p50_ms": 300, "p95_ms": 3500, "capped": 1}
+    assert summary["apnews.com"]["p50_ms"] == 250
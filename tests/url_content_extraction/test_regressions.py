@@ -376,6 +376,56 @@ def test_light_extractor_uses_shared_httpx_client():
     light_extractor.close_shared_client()
 
 
+def test_light_extract_many_limits_per_host_and_keeps_order(monkeypatch):
+    """`extract_many` fetches concurrently but never exceeds the per-host cap."""
+    import asyncio
+    import functools
+
+    import httpx
+
+    from src.shared.extractors import light_extractor
+
+    article = "<html><head><title>T</title></head><body><article>%s</article></body></html>" % (
+        "<p>" + "Quarterback play carried the offense through the fourth quarter. " * 6 + "</p>"
+    ) * 3
+    active: Dict[str, int] = {}
+    peak: Dict[str, int] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        active[host] = active.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), active[host])
+        await asyncio.sleep(0.01)
+        active[host] -= 1
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        return httpx.Response(200, text=article)
+
+    monkeypatch.setattr(
+        light_extractor.httpx,
+        "AsyncClient",
+        functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler)),
+    )
+
+    extractor = light_extractor.LightExtractor(max_per_host=1, host_delay_seconds=0, parse_workers=1)
+    urls = [
+        "https://a.example.com/1",
+        "https://b.example.com/1",
+        "https://a.example.com/2",
+        "https://a.example.com/missing",
+    ]
+    results = extractor.extract_many(urls)
+
+    assert [r.url for r in results[:3]] == urls[:3]
+    assert all(r.paragraphs and not r.error for r in results[:3])
+    assert results[3].error
+    assert peak["a.example.com"] == 1
+    stats = extractor.last_batch_stats
+    assert stats.requests_by_host == {"a.example.com": 3, "b.example.com": 1}
+    assert stats.fetch_errors == 1
+    assert stats.playwright_fallbacks == 0
+
+
 # ---------------------------------------------------------------------------
 # FactsWriter / FactsReader (Phase 3: core/db consolidation)
 # ---------------------------------------------------------------------------